@@ -2,21 +2,86 @@
 """
 Script para analizar y detectar problemas de claves duplicadas en archivos OpenAPI.
 Especialmente útil para detectar problemas que Mintlify reporta pero que JSON estándar ignora.
+
+Uso:
+    python scripts/analyze_openapi_duplicates.py [archivos...] [-q key:dte_type_code]
+        [-q line:1695] [-q same:120,140] [--queries-file consultas.txt] [--json]
 """
 
+import argparse
 import json
-import re
 import sys
-from collections import defaultdict, Counter
+from collections import defaultdict
 from pathlib import Path
 
+from openapi_engine import DEFAULT_BASE_DIR, DEFAULT_CACHE_DIR, SpecWorkspace
+from openapi_loader import LoadedJSON, SpanIndex, loads_with_positions, resolve_pointer
+
+
+DEFAULT_FILE = 'api-reference/openapi-combined.json'
+
+# Consultas por defecto cuando no se indica ninguna
+DEFAULT_QUERIES = [('key', 'dte_type_code')]
+
+
+def parse_query(text):
+    """
+    Parsear una consulta de la forma:
+    - key:NOMBRE     ocurrencias de una clave y repeticiones en el mismo objeto
+    - line:N         objeto que contiene la línea N y su contexto
+    - same:N,M       si las líneas N y M están en el mismo objeto
+    """
+    kind, _, argument = text.strip().partition(':')
+    if kind == 'key' and argument:
+        return ('key', argument)
+    if kind == 'line' and argument.isdigit():
+        return ('line', int(argument))
+    if kind == 'same':
+        lines = argument.split(',')
+        if len(lines) == 2 and all(line.strip().isdigit() for line in lines):
+            return ('same', int(lines[0]), int(lines[1]))
+    raise ValueError(f"Consulta inválida: '{text}' (usa key:NOMBRE, line:N o same:N,M)")
+
+
+def read_queries_file(path):
+    """Leer consultas desde un archivo (una por línea, '#' para comentarios)"""
+    queries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                queries.append(parse_query(line))
+    return queries
+
 
 class OpenAPIAnalyzer:
-    def __init__(self, file_path):
+    def __init__(self, file_path, quiet=False):
         self.file_path = Path(file_path)
+        self.quiet = quiet
         self.content = None
         self.lines = None
         self.data = None
+        self.loaded = None
+        self.index = None
+
+    @classmethod
+    def from_source(cls, file_path, source, quiet=False):
+        """
+        Crear un analizador a partir de un resultado de SpecWorkspace (cargado
+        con record_spans=True): reutiliza el árbol, las claves duplicadas y las
+        extensiones de objetos ya calculadas, sin volver a parsear el archivo.
+        """
+        analyzer = cls(file_path, quiet=quiet)
+        if not analyzer.load_file():
+            return None
+        analyzer.loaded = LoadedJSON(source["data"], source["duplicates"], source["source_map"])
+        analyzer.data = analyzer.loaded.data
+        analyzer.index = SpanIndex(analyzer.loaded.source_map.spans)
+        return analyzer
+
+    def _log(self, message):
+        if not self.quiet:
+            print(message)
         
     def load_file(self):
         """Cargar el archivo"""
@@ -24,85 +89,74 @@ class OpenAPIAnalyzer:
             with open(self.file_path, 'r', encoding='utf-8') as f:
                 self.content = f.read()
             self.lines = self.content.split('\n')
-            print(f"✅ Archivo cargado: {self.file_path}")
-            print(f"   Total de líneas: {len(self.lines)}")
+            self._log(f"✅ Archivo cargado: {self.file_path}")
+            self._log(f"   Total de líneas: {len(self.lines)}")
             return True
         except FileNotFoundError:
-            print(f"❌ Archivo no encontrado: {self.file_path}")
+            self._log(f"❌ Archivo no encontrado: {self.file_path}")
             return False
         except Exception as e:
-            print(f"❌ Error al cargar archivo: {e}")
+            self._log(f"❌ Error al cargar archivo: {e}")
             return False
     
     def parse_json(self):
-        """Parsear como JSON"""
+        """
+        Parsear como JSON registrando claves duplicadas y posiciones, e indexar
+        la extensión de cada objeto una sola vez para las consultas posteriores.
+        """
         try:
-            self.data = json.loads(self.content)
-            print("✅ JSON válido según parser estándar de Python")
+            self.loaded = loads_with_positions(self.content, record_spans=True)
+            self.data = self.loaded.data
+            self.index = SpanIndex(self.loaded.source_map.spans)
+            self._log("✅ JSON válido según parser estándar de Python")
             return True
         except json.JSONDecodeError as e:
-            print(f"❌ Error al parsear JSON: {e}")
-            print(f"   Línea {e.lineno}, columna {e.colno}")
+            self._log(f"❌ Error al parsear JSON: {e}")
+            self._log(f"   Línea {e.lineno}, columna {e.colno}")
             return False
+
+    def _line_of(self, offset):
+        """Línea 1-based de un offset del texto"""
+        return self.loaded.source_map.position_of_offset(offset)[0]
+
+    def _line_offset(self, line_num):
+        """Offset del primer carácter no blanco de una línea"""
+        line = self.lines[line_num - 1]
+        return self.loaded.source_map.line_starts[line_num - 1] + len(line) - len(line.lstrip())
+
+    def _object_at_line(self, line_num):
+        """Índice del objeto más interno que contiene la línea, o None"""
+        if self.index is None or line_num < 1 or line_num > len(self.lines):
+            return None
+        return self.index.object_at(self._line_offset(line_num))
     
     def find_duplicate_keys_in_objects(self):
-        """Encontrar claves duplicadas en objetos usando análisis de texto"""
+        """
+        Encontrar claves duplicadas en objetos.
+        Usa las repeticiones que registra el cargador al parsear, por lo que no
+        depende de contar llaves por línea (que falla con llaves dentro de strings).
+        """
         print("\n" + "=" * 70)
         print("ANÁLISIS DE CLAVES DUPLICADAS EN OBJETOS")
         print("=" * 70)
-        
+
+        if self.loaded is None:
+            print("   ⚠️ El JSON no es válido: no se pueden analizar sus objetos")
+            return []
+
+        source_map = self.loaded.source_map
         duplicates = []
-        stack = []  # Stack para rastrear objetos anidados
-        object_keys = defaultdict(list)  # Claves por objeto
-        object_starts = {}  # Línea de inicio de cada objeto
-        
-        for i, line in enumerate(self.lines, 1):
-            # Contar llaves abiertas y cerradas
-            open_braces = line.count('{')
-            close_braces = line.count('}')
-            
-            # Procesar llaves abiertas
-            for _ in range(open_braces):
-                stack.append(i)
-                object_keys[i] = []
-                object_starts[i] = i
-            
-            # Buscar claves en esta línea
-            # Patrón: "clave": (con posibles espacios)
-            key_pattern = r'"([^"]+)"\s*:'
-            key_matches = re.findall(key_pattern, line)
-            
-            for key in key_matches:
-                if stack:
-                    obj_line = stack[-1]
-                    if key in object_keys[obj_line]:
-                        # ¡Duplicado encontrado!
-                        first_occurrence_line = None
-                        # Buscar la primera ocurrencia
-                        for j in range(object_starts[obj_line], i):
-                            if f'"{key}"' in self.lines[j-1]:
-                                first_occurrence_line = j
-                                break
-                        
-                        duplicates.append({
-                            'line': i,
-                            'key': key,
-                            'object_start': object_starts[obj_line],
-                            'first_occurrence': first_occurrence_line or object_starts[obj_line],
-                            'context': self._get_context(i, 5)
-                        })
-                    object_keys[obj_line].append(key)
-            
-            # Procesar llaves cerradas
-            for _ in range(close_braces):
-                if stack:
-                    obj_line = stack.pop()
-                    # Limpiar cuando se cierra el objeto
-                    if obj_line in object_keys:
-                        del object_keys[obj_line]
-                    if obj_line in object_starts:
-                        del object_starts[obj_line]
-        
+        for duplicate in self.loaded.duplicates:
+            duplicates.append({
+                'line': duplicate.line,
+                'column': duplicate.column,
+                'key': duplicate.key,
+                'pointer': duplicate.pointer,
+                'object_start': source_map.line(duplicate.pointer),
+                'first_occurrence': duplicate.first_line,
+                'context': self._get_context(duplicate.line, 5)
+            })
+
         return duplicates
     
     def _get_context(self, line_num, context_lines=5):
@@ -111,38 +165,51 @@ class OpenAPIAnalyzer:
         end = min(len(self.lines), line_num + context_lines)
         return [(i+1, self.lines[i]) for i in range(start, end)]
     
+    def key_occurrences(self, key_name):
+        """
+        Ocurrencias de una clave y sus repeticiones dentro del mismo objeto.
+        Agrupa por objeto usando el índice, en O(k) para k ocurrencias.
+        """
+        occurrences = []
+        lines_by_object = defaultdict(list)
+        for offset, object_index in self.index.occurrences(key_name):
+            line = self._line_of(offset)
+            occurrences.append({
+                'line': line,
+                'content': self.lines[line - 1].strip(),
+                'pointer': self.index.spans[object_index].pointer
+            })
+            lines_by_object[object_index].append(line)
+
+        duplicates_in_same_object = []
+        for object_index, lines in lines_by_object.items():
+            for line in lines[1:]:
+                duplicates_in_same_object.append({
+                    'key': key_name,
+                    'line1': lines[0],
+                    'line2': line,
+                    'pointer': self.index.spans[object_index].pointer
+                })
+
+        return occurrences, duplicates_in_same_object
+
     def find_specific_key_duplicates(self, key_name):
         """Buscar duplicaciones específicas de una clave"""
         print(f"\n" + "=" * 70)
         print(f"BUSCANDO DUPLICACIONES ESPECÍFICAS DE '{key_name}'")
         print("=" * 70)
+
+        if self.index is None:
+            print("   ⚠️ El JSON no es válido: no se pueden ubicar las claves en sus objetos")
+            return [], []
         
-        occurrences = []
-        for i, line in enumerate(self.lines, 1):
-            if f'"{key_name}"' in line:
-                occurrences.append({
-                    'line': i,
-                    'content': line.strip(),
-                    'context': self._get_context(i, 3)
-                })
+        occurrences, duplicates_in_same_object = self.key_occurrences(key_name)
         
         print(f"   Encontradas {len(occurrences)} ocurrencias de '{key_name}':")
         for occ in occurrences:
             print(f"\n   📍 Línea {occ['line']}:")
             print(f"      {occ['content'][:100]}")
         
-        # Verificar si hay duplicados en el mismo objeto
-        duplicates_in_same_object = []
-        for i, occ1 in enumerate(occurrences):
-            for occ2 in occurrences[i+1:]:
-                # Verificar si están en el mismo objeto
-                if self._are_in_same_object(occ1['line'], occ2['line']):
-                    duplicates_in_same_object.append({
-                        'key': key_name,
-                        'line1': occ1['line'],
-                        'line2': occ2['line']
-                    })
-        
         if duplicates_in_same_object:
             print(f"\n   ⚠️ DUPLICADOS EN EL MISMO OBJETO:")
             for dup in duplicates_in_same_object:
@@ -153,31 +220,9 @@ class OpenAPIAnalyzer:
         return occurrences, duplicates_in_same_object
     
     def _are_in_same_object(self, line1, line2):
-        """Verificar si dos líneas están en el mismo objeto JSON"""
-        # Encontrar el objeto más cercano que contiene ambas líneas
-        start = min(line1, line2) - 1
-        end = max(line1, line2)
-        
-        brace_count = 0
-        object_start = None
-        
-        for i in range(start, -1, -1):
-            brace_count += self.lines[i].count('}') - self.lines[i].count('{')
-            if brace_count < 0:
-                object_start = i
-                break
-        
-        if object_start is None:
-            return False
-        
-        # Verificar que ambas líneas estén dentro del mismo objeto
-        brace_count = 0
-        for i in range(object_start, end):
-            brace_count += self.lines[i].count('{') - self.lines[i].count('}')
-            if brace_count == 0 and i < end - 1:
-                return False
-        
-        return True
+        """Verificar si dos líneas están en el mismo objeto JSON (O(log n))"""
+        object1 = self._object_at_line(line1)
+        return object1 is not None and object1 == self._object_at_line(line2)
     
     def analyze_schema_structure(self):
         """Analizar la estructura de los schemas"""
@@ -233,11 +278,6 @@ class OpenAPIAnalyzer:
         print(f"\n   Contenido de la línea {line_num}:")
         print(f"   '{line}'")
         
-        # Buscar claves en esta línea
-        key_matches = re.findall(r'"([^"]+)"\s*:', line)
-        if key_matches:
-            print(f"\n   Claves encontradas en esta línea: {key_matches}")
-        
         # Contexto amplio
         print(f"\n   Contexto (10 líneas antes y después):")
         context = self._get_context(line_num, 10)
@@ -251,58 +291,44 @@ class OpenAPIAnalyzer:
         if obj_info:
             print(f"      Inicia en línea: {obj_info['start']}")
             print(f"      Termina en línea: {obj_info['end']}")
-            print(f"      Tipo: {obj_info.get('type', 'desconocido')}")
+            print(f"      JSON pointer: {obj_info['pointer'] or '/'}")
+            print(f"      Tipo: {obj_info.get('type') or 'desconocido'}")
             print(f"      Claves en el objeto: {obj_info.get('keys', [])}")
+        else:
+            print("      (ninguno)")
     
     def _find_containing_object(self, line_num):
-        """Encontrar el objeto JSON que contiene una línea específica"""
-        # Buscar hacia atrás para encontrar el inicio del objeto
-        brace_count = 0
-        start = None
-        
-        for i in range(line_num - 1, -1, -1):
-            brace_count += self.lines[i].count('}') - self.lines[i].count('{')
-            if brace_count < 0:
-                start = i + 1
-                break
-        
-        if start is None:
+        """Encontrar el objeto JSON que contiene una línea específica (O(log n))"""
+        object_index = self._object_at_line(line_num)
+        if object_index is None:
             return None
-        
-        # Buscar hacia adelante para encontrar el final
-        brace_count = 0
-        end = None
-        
-        for i in range(start - 1, len(self.lines)):
-            brace_count += self.lines[i].count('{') - self.lines[i].count('}')
-            if brace_count == 0:
-                end = i + 1
-                break
-        
-        # Extraer información del objeto
-        obj_lines = self.lines[start-1:end] if end else self.lines[start-1:start+50]
-        obj_text = '\n'.join(obj_lines)
-        
-        # Buscar tipo y claves
-        obj_type = None
-        keys = []
-        
-        if '"type"' in obj_text:
-            type_match = re.search(r'"type"\s*:\s*"([^"]+)"', obj_text)
-            if type_match:
-                obj_type = type_match.group(1)
-        
-        key_matches = re.findall(r'"([^"]+)"\s*:', obj_text)
-        keys = list(set(key_matches))  # Eliminar duplicados
-        
+
+        span = self.index.spans[object_index]
+        try:
+            obj_type = resolve_pointer(self.data, span.pointer).get('type')
+        except (KeyError, IndexError, ValueError, AttributeError):
+            obj_type = None
+
         return {
-            'start': start,
-            'end': end,
-            'type': obj_type,
-            'keys': keys
+            'start': self._line_of(span.start),
+            'end': self._line_of(span.end - 1),
+            'pointer': span.pointer,
+            'type': obj_type if isinstance(obj_type, str) else None,
+            'keys': list(dict.fromkeys(key for key, _offset in span.keys))
         }
+
+    def check_same_object(self, line1, line2):
+        """Verificar si dos líneas pertenecen al mismo objeto"""
+        print(f"\n" + "=" * 70)
+        print(f"¿LÍNEAS {line1} Y {line2} EN EL MISMO OBJETO?")
+        print("=" * 70)
+        if self._are_in_same_object(line1, line2):
+            obj_info = self._find_containing_object(line1)
+            print(f"   ✅ Sí: objeto {obj_info['pointer'] or '/'} (líneas {obj_info['start']}-{obj_info['end']})")
+        else:
+            print("   ❌ No")
     
-    def generate_report(self):
+    def generate_report(self, queries=None):
         """Generar reporte completo"""
         print("\n" + "=" * 70)
         print("REPORTE COMPLETO")
@@ -319,40 +345,177 @@ class OpenAPIAnalyzer:
         else:
             print("\n✅ No se encontraron claves duplicadas en objetos")
         
-        # 2. Buscar específicamente dte_type_code
-        self.find_specific_key_duplicates('dte_type_code')
+        # 2. Consultas solicitadas (claves, líneas, pares de líneas)
+        for query in DEFAULT_QUERIES if queries is None else queries:
+            if query[0] == 'key':
+                self.find_specific_key_duplicates(query[1])
+            elif query[0] == 'line':
+                self.check_line_specific(query[1])
+            elif query[0] == 'same':
+                self.check_same_object(query[1], query[2])
         
         # 3. Analizar estructura
         self.analyze_schema_structure()
         
-        # 4. Verificar línea problemática (1695)
-        self.check_line_specific(1695)
-        
         return duplicates
 
+    def build_report(self, queries=None):
+        """Generar el reporte como dict serializable (para --json)"""
+        report = {
+            'file': str(self.file_path),
+            'lines': len(self.lines) if self.lines is not None else None,
+            'valid_json': self.index is not None,
+            'duplicates': [],
+            'queries': []
+        }
+        if self.index is None:
+            return report
+
+        for duplicate in self.loaded.duplicates:
+            report['duplicates'].append(duplicate._asdict())
+
+        for query in DEFAULT_QUERIES if queries is None else queries:
+            if query[0] == 'key':
+                occurrences, duplicates = self.key_occurrences(query[1])
+                report['queries'].append({
+                    'query': f"key:{query[1]}",
+                    'occurrences': occurrences,
+                    'duplicates_in_same_object': duplicates
+                })
+            elif query[0] == 'line':
+                report['queries'].append({
+                    'query': f"line:{query[1]}",
+                    'object': self._find_containing_object(query[1])
+                })
+            elif query[0] == 'same':
+                report['queries'].append({
+                    'query': f"same:{query[1]},{query[2]}",
+                    'same_object': self._are_in_same_object(query[1], query[2])
+                })
+
+        return report
 
-def main():
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Analizar claves duplicadas y estructura de archivos OpenAPI"
+    )
+    parser.add_argument(
+        'files',
+        nargs='*',
+        default=[DEFAULT_FILE],
+        help=f"Archivos a analizar (por defecto: {DEFAULT_FILE})"
+    )
+    parser.add_argument(
+        '-q', '--query',
+        action='append',
+        default=[],
+        help="Consulta: key:NOMBRE, line:N o same:N,M (se puede repetir)"
+    )
+    parser.add_argument(
+        '--queries-file',
+        help="Archivo con una consulta por línea"
+    )
+    parser.add_argument(
+        '--sources',
+        action='store_true',
+        help="Analizar los archivos fuente del manifiesto (usa el caché compartido)"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Imprimir un reporte JSON en lugar del reporte legible"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        queries = [parse_query(query) for query in args.query]
+        if args.queries_file:
+            queries.extend(read_queries_file(args.queries_file))
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    args.queries = queries or None
+    return args
+
+
+def load_source_analyzers(quiet=False):
+    """
+    Analizadores para los archivos fuente del manifiesto, cargados una sola vez
+    con SpecWorkspace (sin escribir correcciones, para que las líneas coincidan
+    con el archivo en disco).
+    Retorna una lista de (ruta, analizador o None si no se pudo cargar).
+    """
+    workspace = SpecWorkspace(
+        DEFAULT_BASE_DIR, cache_dir=DEFAULT_CACHE_DIR, write_fixes=False, record_spans=True
+    )
+    workspace.load()
+    analyzers = []
+    for file_path in workspace.all_files:
+        source = workspace.sources.get(file_path)
+        analyzer = OpenAPIAnalyzer.from_source(file_path, source, quiet) if source else None
+        analyzers.append((str(file_path), analyzer))
+    return analyzers
+
+
+def load_file_analyzer(file_path, quiet=False):
+    """Analizador para un archivo suelto (None si no se pudo leer)"""
+    analyzer = OpenAPIAnalyzer(file_path, quiet=quiet)
+    if not analyzer.load_file():
+        return None
+    if not analyzer.parse_json() and not quiet:
+        print("\n⚠️ Continuando con análisis de texto aunque JSON tenga errores...")
+    return analyzer
+
+
+def main(argv=None):
     """Función principal"""
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
+    args = parse_args(argv)
+
+    if args.json:
+        if args.sources:
+            analyzers = load_source_analyzers(quiet=True)
+        else:
+            analyzers = [(path, load_file_analyzer(path, quiet=True)) for path in args.files]
+        reports = []
+        all_loaded = True
+        for file_path, analyzer in analyzers:
+            if analyzer is None:
+                all_loaded = False
+                reports.append({'file': file_path, 'error': 'Archivo no encontrado o ilegible'})
+                continue
+            reports.append(analyzer.build_report(args.queries))
+        print(json.dumps({'files': reports}, indent=2, ensure_ascii=False))
+        sys.exit(0 if all_loaded else 1)
+
+    all_loaded = True
+    if args.sources:
+        for file_path, analyzer in load_source_analyzers():
+            all_loaded = analyze_file(file_path, args.queries, analyzer) and all_loaded
     else:
-        file_path = 'api-reference/openapi-complete.json'
-    
+        for file_path in args.files:
+            all_loaded = analyze_file(file_path, args.queries) and all_loaded
+
+    sys.exit(0 if all_loaded else 1)
+
+
+def analyze_file(file_path, queries=None, analyzer=None):
+    """
+    Analizar un archivo e imprimir el reporte legible. Retorna False si no se pudo leer.
+    Si se pasa `analyzer` (ver load_source_analyzers) se usa en lugar de parsear.
+    """
     print("=" * 70)
     print("ANALIZADOR DE OPENAPI - DETECCIÓN DE DUPLICADOS")
     print("=" * 70)
     print(f"\nArchivo a analizar: {file_path}")
     
-    analyzer = OpenAPIAnalyzer(file_path)
-    
-    if not analyzer.load_file():
-        sys.exit(1)
-    
-    if not analyzer.parse_json():
-        print("\n⚠️ Continuando con análisis de texto aunque JSON tenga errores...")
+    if analyzer is None:
+        analyzer = load_file_analyzer(file_path)
+    if analyzer is None:
+        return False
     
     # Generar reporte completo
-    duplicates = analyzer.generate_report()
+    duplicates = analyzer.generate_report(queries)
     
     print("\n" + "=" * 70)
     print("RESUMEN")
@@ -366,8 +529,9 @@ def main():
         print("   - Mintlify parseando JSON como YAML (más estricto)")
         print("   - Problema de caché de Mintlify")
         print("   - Conflicto entre schemas con allOf")
+    print()
+    return True
 
 
 if __name__ == '__main__':
     main()
-
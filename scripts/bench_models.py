@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los modelos generados (openapi_models.py) contra dicts planos.
+
+Para cada schema arma un payload de ejemplo (openapi_mock.synthesize), lo
+serializa y mide sobre -n copias:
+- load: json.loads (dicts) contra json.loads + from_dict (modelos)
+- dump: json.dumps del dict contra json.dumps(modelo.to_dict())
+- access: leer todos los campos de primer nivel (d["campo"] contra o.campo)
+- memoria retenida por las -n instancias (tracemalloc), dicts contra modelos
+
+Uso:
+    python3 scripts/bench_models.py
+    python3 scripts/bench_models.py --schemas DocumentBatch,Document -n 50000 --json modelos.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import types
+
+from bench_openapi import measure
+from openapi_engine import DEFAULT_OUTPUT
+from openapi_mock import synthesize
+from openapi_models import class_name, render_models
+
+DEFAULT_SCHEMAS = "DocumentBatch,Document,DetailItem,DocumentListResponse,DocumentDetailWithFiles"
+DEFAULT_COUNT = 1000
+DEFAULT_REPEAT = 5
+# Elementos de los arrays de ejemplo (un lote de 1 documento no es representativo)
+SAMPLE_ARRAY_ITEMS = 20
+
+
+def load_models(document):
+    """Módulo con los modelos generados para el documento (sin escribirlo a disco)"""
+    module = types.ModuleType("models")
+    exec(compile(render_models(document), "models.py", "exec"), module.__dict__)
+    return module
+
+
+def sample_payload(document, name):
+    """Payload de ejemplo de un schema; sus arrays de objetos de primer nivel (lotes, `results`) tienen SAMPLE_ARRAY_ITEMS elementos"""
+    value = synthesize({"$ref": f"#/components/schemas/{name}"}, document)
+    if not isinstance(value, dict):
+        return value
+    for key, items in value.items():
+        if isinstance(items, list) and items and isinstance(items[0], dict):
+            value[key] = [json.loads(json.dumps(items[index % len(items)])) for index in range(SAMPLE_ARRAY_ITEMS)]
+    return value
+
+
+def retained_bytes(build):
+    """Bytes que siguen asignados tras construir (y conservar) el resultado de build()"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def bench_schema(module, document, name, count, repeat):
+    """Mediciones de un schema: {caso: {'dict': ..., 'model': ...}}"""
+    model = getattr(module, class_name(name))
+    payload = json.dumps(sample_payload(document, name), ensure_ascii=False)
+    dicts = [json.loads(payload) for _ in range(count)]
+    objects = [model.from_dict(data) for data in dicts]
+    fields = list(model.FIELDS)
+    wires = list(dicts[0]) if dicts else []
+
+    def access_dicts():
+        for data in dicts:
+            for wire in wires:
+                data.get(wire)
+
+    def access_objects():
+        for obj in objects:
+            for field in fields:
+                getattr(obj, field)
+
+    results = {
+        "load": {
+            "dict": measure(lambda: [json.loads(payload) for _ in range(count)], repeat),
+            "model": measure(lambda: [model.from_dict(json.loads(payload)) for _ in range(count)], repeat),
+        },
+        "dump": {
+            "dict": measure(lambda: [json.dumps(data) for data in dicts], repeat),
+            "model": measure(lambda: [json.dumps(obj.to_dict()) for obj in objects], repeat),
+        },
+        "access": {
+            "dict": measure(access_dicts, repeat),
+            "model": measure(access_objects, repeat),
+        },
+    }
+    del dicts, objects
+    results["memory"] = {
+        "dict": retained_bytes(lambda: [json.loads(payload) for _ in range(count)]),
+        "model": retained_bytes(lambda: [model.from_dict(json.loads(payload)) for _ in range(count)]),
+    }
+    return results
+
+
+def print_results(name, count, results):
+    """Tabla de un schema: mediana en ms (o memoria) para dicts y modelos"""
+    print(f"\n📊 {name} ({count} instancias)")
+    for case in ("load", "dump", "access"):
+        dict_ms = results[case]["dict"]["median_ms"]
+        model_ms = results[case]["model"]["median_ms"]
+        ratio = model_ms / dict_ms if dict_ms else 0
+        print(f"   {case:<8} dict {dict_ms:>9.1f} ms   modelo {model_ms:>9.1f} ms   x{ratio:.2f}")
+    dict_mb = results["memory"]["dict"] / 1e6
+    model_mb = results["memory"]["model"] / 1e6
+    saved = 1 - model_mb / dict_mb if dict_mb else 0
+    print(f"   {'memoria':<8} dict {dict_mb:>9.1f} MB   modelo {model_mb:>9.1f} MB   {saved:+.0%} ahorro")
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmark de los modelos generados contra dicts planos")
+    parser.add_argument(
+        "--spec",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento combinado (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--schemas", default=DEFAULT_SCHEMAS, help=f"Schemas a medir, separados por coma (por defecto: {DEFAULT_SCHEMAS})"
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=DEFAULT_COUNT, help=f"Instancias por schema (por defecto: {DEFAULT_COUNT})"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help=f"Repeticiones por caso (por defecto: {DEFAULT_REPEAT})"
+    )
+    parser.add_argument("--json", metavar="ARCHIVO", help="Guardar los resultados como JSON")
+    args = parser.parse_args(argv)
+    if args.count < 1 or args.repeat < 1:
+        parser.error("--count y --repeat deben ser >= 1")
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    try:
+        with open(args.spec, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar {args.spec}: {e}")
+        return 1
+
+    module = load_models(document)
+    schemas = (document.get("components") or {}).get("schemas") or {}
+    names = [name.strip() for name in args.schemas.split(",") if name.strip()]
+    missing = [name for name in names if name not in schemas or not hasattr(module, class_name(name))]
+    if missing:
+        print(f"❌ Schemas sin modelo: {', '.join(missing)}")
+        return 1
+
+    print(f"🚀 Modelos contra dicts: {len(names)} schemas, {args.count} instancias, {args.repeat} repeticiones")
+    all_results = {}
+    for name in names:
+        all_results[name] = bench_schema(module, document, name, args.count, args.repeat)
+        print_results(name, args.count, all_results[name])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"count": args.count, "python": sys.version.split()[0], "schemas": all_results}, f, indent=2)
+            f.write("\n")
+        print(f"\n💾 Resultados guardados en {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
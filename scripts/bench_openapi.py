@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmarks del pipeline OpenAPI sobre especificaciones sintéticas.
+
+Para cada escala (múltiplo del tamaño actual, ver synth_openapi.py) genera
+una especificación dividida en un directorio temporal y mide:
+- parse: cargar todos los archivos con posiciones (openapi_loader)
+- combine.cold / combine.warm: carga + combinación completa, sin caché y
+  con el caché ya poblado
+- fix.<regla> / check.<regla>: cada corrector y cada validador por separado
+  sobre el documento combinado sin corregir
+- analyze: analizador de duplicados sobre el documento combinado
+- validate: validador de schemas sobre el directorio generado
+
+Los resultados (mínimo y mediana en ms de --repeat ejecuciones) se guardan
+como JSON y se comparan contra un baseline guardado: una mediana que supera
+al baseline en más de --threshold se marca como regresión.
+
+Uso:
+    python3 scripts/bench_openapi.py                      # escalas 10 y 100
+    python3 scripts/bench_openapi.py --scales 10,100,1000 --repeat 5
+    python3 scripts/bench_openapi.py --save-baseline      # actualizar baseline
+    python3 scripts/bench_openapi.py --check              # exit 1 si hay regresiones
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from analyze_openapi_duplicates import OpenAPIAnalyzer
+from openapi_artifacts import render_pretty
+from openapi_engine import CHECK_RULES, FIX_RULES, SpecWorkspace, apply_rules, merge_sources
+from openapi_loader import load_json_file
+from synth_openapi import generate_split_spec
+from validate_openapi_schemas import validate_all_schemas
+
+DEFAULT_BASELINE = Path(__file__).parent / "bench_baseline.json"
+DEFAULT_SCALES = "10,100"
+DEFAULT_THRESHOLD = 0.25
+# Diferencias menores a esto (ms) se consideran ruido aunque superen el umbral
+NOISE_FLOOR_MS = 2.0
+
+
+def measure(func, repeat):
+    """Ejecutar `func` `repeat` veces y retornar {'min_ms', 'median_ms', 'repeat'}"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "repeat": repeat,
+    }
+
+
+def rule_names(registry):
+    """Nombres de las reglas registradas, en orden de registro"""
+    names = []
+    for rules in registry.values():
+        names.extend(name for name, _rule in rules if name not in names)
+    return names
+
+
+def bench_scale(scale, repeat, workdir):
+    """Correr todos los casos para una escala. Retorna {nombre: medición}"""
+    spec_dir = workdir / f"spec-{scale:g}x"
+    manifest = generate_split_spec(spec_dir, scale)
+    files = [spec_dir / "base" / "base-complete.json"] + [spec_dir / path for path in manifest]
+    results = {}
+
+    def case(name, func):
+        results[f"{name}@{scale:g}x"] = measure(func, repeat)
+
+    def load_all():
+        return [load_json_file(file_path).data for file_path in files]
+
+    def combine(cache_dir):
+        # write_fixes=False: las ejecuciones repetidas ven siempre la misma entrada
+        workspace = SpecWorkspace(spec_dir, manifest=manifest, cache_dir=cache_dir, write_fixes=False)
+        workspace.load()
+        return workspace.build()
+
+    case("parse", load_all)
+    case("combine.cold", lambda: combine(None))
+    cache_dir = workdir / f"cache-{scale:g}x"
+    combine(cache_dir)
+    case("combine.warm", lambda: combine(cache_dir))
+
+    # Correctores y validadores por separado, sobre el documento sin corregir
+    sources = load_all()
+    raw_combined = merge_sources(sources[0], sources[1:])
+    for name in rule_names(FIX_RULES):
+        case(f"fix.{name}", lambda name=name: apply_rules(raw_combined, check=False, only={name}))
+    for name in rule_names(CHECK_RULES):
+        case(f"check.{name}", lambda name=name: apply_rules(raw_combined, fix=False, only={name}))
+
+    combined_file = workdir / f"combined-{scale:g}x.json"
+    combined_file.write_bytes(render_pretty(combine(None)[0]))
+
+    def analyze():
+        analyzer = OpenAPIAnalyzer(combined_file, quiet=True)
+        analyzer.load_file()
+        analyzer.parse_json()
+        return analyzer.build_report()
+
+    case("analyze", analyze)
+
+    def validate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return validate_all_schemas(spec_dir, fix=False, cache_dir=None)
+
+    case("validate", validate)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Comparar contra el baseline. Retorna una lista de
+    (nombre, mediana actual, mediana del baseline, razón) solo para regresiones.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        ratio = current["median_ms"] / previous["median_ms"] if previous["median_ms"] else 1
+        slower_by = current["median_ms"] - previous["median_ms"]
+        if ratio > 1 + threshold and slower_by > NOISE_FLOOR_MS:
+            regressions.append((name, current["median_ms"], previous["median_ms"], ratio))
+    return regressions
+
+
+def print_results(results, baseline):
+    """Tabla de resultados con la variación respecto del baseline"""
+    width = max(len(name) for name in results)
+    for name, current in results.items():
+        line = f"   {name:<{width}}  {current['median_ms']:>10.2f} ms  (mín {current['min_ms']:.2f})"
+        previous = baseline.get(name)
+        if previous and previous["median_ms"]:
+            change = current["median_ms"] / previous["median_ms"] - 1
+            line += f"  {change:+.0%} vs baseline"
+        print(line)
+
+
+def load_baseline(path):
+    """Resultados del baseline ({} si no existe)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except FileNotFoundError:
+        return {}
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmarks del pipeline OpenAPI")
+    parser.add_argument(
+        "--scales",
+        default=DEFAULT_SCALES,
+        help=f"Escalas separadas por coma, múltiplos del tamaño actual (por defecto: {DEFAULT_SCALES})",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones por caso (por defecto: 3)")
+    parser.add_argument(
+        "--output", help="Archivo JSON donde guardar los resultados (por defecto solo se imprimen)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE),
+        help=f"Baseline contra el que comparar (por defecto: {DEFAULT_BASELINE.name})",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Guardar estos resultados como nuevo baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Fracción de empeoramiento tolerada (por defecto: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--check", action="store_true", help="Salir con código 1 si hay regresiones")
+    args = parser.parse_args(argv)
+    try:
+        args.scales = [float(scale) for scale in args.scales.split(",") if scale.strip()]
+    except ValueError:
+        parser.error("--scales debe ser una lista de números separados por coma")
+    if args.repeat < 1:
+        parser.error("--repeat debe ser >= 1")
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    baseline = load_baseline(args.baseline)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="openapi-bench-") as tmp_dir:
+        for scale in args.scales:
+            print(f"⏱️  Escala {scale:g}x...")
+            results.update(bench_scale(scale, args.repeat, Path(tmp_dir)))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": args.scales,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    print("\n📊 Resultados (mediana):")
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados en {args.output}")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Baseline actualizado: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nℹ️  Sin baseline en {args.baseline}; usa --save-baseline para crearlo")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"\n✅ Sin regresiones (umbral {args.threshold:.0%})")
+        return 0
+
+    print(f"\n⚠️  Regresiones (umbral {args.threshold:.0%}):")
+    for name, current, previous, ratio in regressions:
+        print(f"   {name}: {previous:.2f} ms -> {current:.2f} ms ({ratio:.2f}x)")
+    return 1 if args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
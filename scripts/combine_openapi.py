@@ -1,398 +1,374 @@
 #!/usr/bin/env python3
 """
 Script Python para combinar archivos OpenAPI divididos automáticamente
-Uso: python scripts/combine_openapi.py
+Uso: python scripts/combine_openapi.py [--no-cache] [--cache-dir DIR] [--jobs N]
+                                       [--strategy replace|deep] [--check]
+                                       [--trace [ARCHIVO]]
+
+La lógica de carga, corrección, validación y combinación vive en
+openapi_engine.py (SpecWorkspace); este script es la interfaz de línea de comandos.
 """
 
-import json
+import argparse
 import os
 import sys
-import re
 from pathlib import Path
-from collections import defaultdict
-
 
-def validate_and_fix_duplicate_keys(data, file_path=None):
+from openapi_engine import (
+    DEFAULT_BASE_DIR,
+    DEFAULT_BUILD_MANIFEST,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_OUTPUT,
+    MERGE_STRATEGIES,
+    SpecWorkspace,
+    print_changes,
+    print_duplicates,
+    print_structure_issues,
+    prune_cache,
+)
+from openapi_artifacts import (
+    OUTPUT_PROFILES,
+    Artifact,
+    print_size_report,
+    render_pretty,
+    write_artifacts,
+    write_build_manifest,
+)
+from openapi_shards import (
+    DEFAULT_DOCS_CONFIG,
+    DEFAULT_SHARDS_DIR,
+    SHARD_MODES,
+    build_shards,
+    load_navigation,
+    write_shards,
+)
+from openapi_dedupe import DEFAULT_MIN_BYTES, dedupe_inline_schemas, print_dedupe_report
+from openapi_refs import RefGraph, locate_refs, print_ref_report, prune_unreachable_schemas
+from openapi_trace import DEFAULT_TRACE_FILE, NULL_TRACER, Tracer
+
+# Re-exportados: antes vivían en este script y otros módulos los importan desde aquí
+from openapi_engine import (  # noqa: F401
+    apply_rules,
+    find_structure_issues,
+    load_source_file,
+    run_source_stage,
+    validate_and_fix_duplicate_keys,
+    validate_openapi_structure,
+)
+
+
+def validate_and_fix_schemas_before_combine(cache_dir=None):
+    """Corregir schemas.json en disco (se mantiene por compatibilidad; ver SpecWorkspace)"""
+    return SpecWorkspace(DEFAULT_BASE_DIR, cache_dir=cache_dir).load([DEFAULT_BASE_DIR / "schemas" / "schemas.json"])
+
+
+def combine_openapi_files(
+    cache_dir=DEFAULT_CACHE_DIR,
+    jobs=1,
+    strategy="replace",
+    check=False,
+    prune_schemas=False,
+    dedupe_schemas=None,
+    shards_dir=None,
+    shard_by="tab",
+    output_profile="pretty",
+    tracer=None,
+):
     """
-    Valida y corrige claves duplicadas en objetos JSON.
-    Especialmente útil para detectar problemas que YAML no permite pero JSON sí.
-    Corrige automáticamente:
-    - Objetos 'description' con clave 'description' interna
-    - Conflictos de 'type' en items vs properties
-    - Cualquier otra clave duplicada en el mismo objeto
+    Combinar todos los archivos OpenAPI en uno solo.
+    Con cache_dir=None se desactiva el caché de archivos fuente.
+    Con jobs > 1 la etapa por archivo corre en paralelo (ver run_source_stage).
+    `strategy` elige cómo se combinan métodos repetidos (ver MERGE_STRATEGIES).
+    Con check=True, claves duplicadas o problemas de estructura hacen fallar
+    el build (por defecto solo se reportan).
+    Con prune_schemas=True se eliminan los schemas que ninguna operación alcanza.
+    Con dedupe_schemas=N los schemas inline duplicados de al menos N bytes se
+    mueven a components/schemas (ver openapi_dedupe.py).
+    Con shards_dir se escribe además un documento por tab (o grupo, según
+    shard_by) de docs.json y su manifiesto (ver openapi_shards.py).
+    `output_profile` elige las variantes de salida (ver openapi_artifacts.py).
+    Con `tracer` (ver openapi_trace.py) se registra un span por fase, archivo
+    y regla.
     """
+    tracer = tracer or NULL_TRACER
 
-    def fix_duplicate_description(obj):
-        """Corregir objetos 'description' con clave 'description' interna duplicada"""
-        if isinstance(obj, dict):
-            fixed = {}
-            for key, value in obj.items():
-                if key == "description" and isinstance(value, dict):
-                    # Verificar si tiene una clave "description" interna
-                    if "description" in value and "type" in value:
-                        # Eliminar la clave "description" interna duplicada
-                        fixed_value = {
-                            k: v for k, v in value.items() if k != "description"
-                        }
-                        fixed[key] = fixed_value
-                    else:
-                        fixed[key] = fix_duplicate_description(value)
-                else:
-                    fixed[key] = fix_duplicate_description(value)
-            return fixed
-        elif isinstance(obj, list):
-            return [fix_duplicate_description(item) for item in obj]
-        return obj
-
-    def fix_type_conflict_in_items(obj):
-        """
-        Corregir conflictos de 'type' en items de arrays.
-        Si items tiene 'type' y también properties.type, renombrar properties.type a 'state_type'
-        (para document_states) o 'item_type' (para otros casos).
-        """
-        if isinstance(obj, dict):
-            fixed = {}
-            for key, value in obj.items():
-                if key == "items" and isinstance(value, dict):
-                    # Verificar si hay conflicto
-                    if "type" in value and "properties" in value:
-                        if (
-                            isinstance(value["properties"], dict)
-                            and "type" in value["properties"]
-                        ):
-                            # Determinar el nombre correcto según el contexto
-                            # Si es document_states, usar 'state_type', sino 'item_type'
-                            new_name = "state_type"  # Por defecto para document_states
-
-                            # Renombrar 'type' en properties
-                            fixed_props = {}
-                            for prop_key, prop_value in value["properties"].items():
-                                if prop_key == "type":
-                                    fixed_props[new_name] = prop_value
-                                    # Actualizar descripción si existe
-                                    if (
-                                        isinstance(prop_value, dict)
-                                        and "description" in prop_value
-                                    ):
-                                        fixed_props[new_name][
-                                            "description"
-                                        ] = "Tipo de estado del documento"
-                                else:
-                                    fixed_props[prop_key] = prop_value
-                            fixed_value = {**value, "properties": fixed_props}
-                            fixed[key] = fix_type_conflict_in_items(fixed_value)
-                        else:
-                            fixed[key] = fix_type_conflict_in_items(value)
-                    else:
-                        fixed[key] = fix_type_conflict_in_items(value)
-                else:
-                    fixed[key] = fix_type_conflict_in_items(value)
-            return fixed
-        elif isinstance(obj, list):
-            return [fix_type_conflict_in_items(item) for item in obj]
-        return obj
-
-    # Aplicar correcciones
-    fixed_data = fix_duplicate_description(data)
-    fixed_data = fix_type_conflict_in_items(fixed_data)
-
-    # Validar que no haya duplicados en el mismo objeto
-    def check_duplicates(obj, path="", duplicates=None):
-        if duplicates is None:
-            duplicates = []
-
-        if isinstance(obj, dict):
-            seen_keys = set()
-            for key, value in obj.items():
-                if key in seen_keys:
-                    full_path = f"{path}.{key}" if path else key
-                    duplicates.append(full_path)
-                seen_keys.add(key)
-                check_duplicates(value, f"{path}.{key}" if path else key, duplicates)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                check_duplicates(item, f"{path}[{i}]", duplicates)
-
-        return duplicates
-
-    duplicates = check_duplicates(fixed_data)
-    if duplicates:
-        file_info = f" en {file_path}" if file_path else ""
-        print(
-            f"⚠️  Advertencia: Se encontraron claves duplicadas{file_info}: {duplicates[:5]}"
-        )
-        if len(duplicates) > 5:
-            print(f"   ... y {len(duplicates) - 5} más")
-
-    return fixed_data
+    print("🔄 Combinando archivos OpenAPI con Python...")
 
+    # Cargar cada archivo una sola vez: corrige, valida y analiza en la misma pasada
+    workspace = SpecWorkspace(DEFAULT_BASE_DIR, cache_dir=cache_dir, jobs=jobs, tracer=tracer)
+    workspace.load()
 
-def validate_openapi_structure(data, file_path=None):
-    """
-    Validar estructura OpenAPI y detectar problemas comunes.
-    Retorna True si está válido, False si hay problemas.
-    """
-    issues = []
-
-    # Validar que no haya objetos "description" con clave "description" interna
-    def check_description_objects(obj, path=""):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key == "description" and isinstance(value, dict):
-                    if "description" in value:
-                        full_path = f"{path}.{key}" if path else key
-                        issues.append(
-                            f"Objeto 'description' con clave 'description' interna en {full_path}"
-                        )
-                check_description_objects(value, f"{path}.{key}" if path else key)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                check_description_objects(item, f"{path}[{i}]")
-
-    # Validar conflictos de 'type' en items
-    def check_type_conflicts(obj, path=""):
-        if isinstance(obj, dict):
-            if "items" in obj and isinstance(obj["items"], dict):
-                items_obj = obj["items"]
-                if "type" in items_obj and "properties" in items_obj:
-                    if isinstance(items_obj["properties"], dict):
-                        if "type" in items_obj["properties"]:
-                            full_path = f"{path}.items" if path else "items"
-                            issues.append(
-                                f"Conflicto de 'type' en {full_path}: items tiene 'type' y properties también tiene 'type'"
-                            )
-            for key, value in obj.items():
-                check_type_conflicts(value, f"{path}.{key}" if path else key)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                check_type_conflicts(item, f"{path}[{i}]")
-
-    check_description_objects(data)
-    check_type_conflicts(data)
-
-    if issues:
-        file_info = f" en {file_path}" if file_path else ""
-        print(f"⚠️  Problemas detectados{file_info}:")
-        for issue in issues[:5]:
-            print(f"   - {issue}")
-        if len(issues) > 5:
-            print(f"   ... y {len(issues) - 5} más")
+    if workspace.base_file in workspace.missing:
+        print(f"❌ Archivo base no encontrado: {workspace.base_file}")
         return False
 
-    return True
-
+    changes_by_file = workspace.fix()
+    issues_by_file = workspace.validate()
+    duplicates_by_file = workspace.analyze()
 
-def validate_and_fix_schemas_before_combine():
-    """
-    Validar y corregir schemas antes de combinar.
-    Corrige automáticamente problemas comunes en los archivos de origen.
-    """
-    base_dir = Path("api-reference/openapi")
-    schemas_file = base_dir / "schemas" / "schemas.json"
+    processed_count = 0
+    cached_count = 0
 
-    if not schemas_file.exists():
-        return True
+    for file_path in workspace.all_files:
+        if file_path in workspace.missing:
+            print(f"⚠️  Archivo no encontrado: {file_path}")
+            continue
 
-    try:
-        with open(schemas_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if file_path in workspace.errors:
+            error, error_traceback = workspace.errors[file_path]
+            print(f"❌ Error procesando {file_path}: {error}")
+            print(error_traceback, end="", file=sys.stderr)
+            return False
 
-        # Aplicar todas las correcciones automáticas
-        original_data = json.dumps(data, indent=2, ensure_ascii=False)
-        fixed_data = validate_and_fix_duplicate_keys(data, str(schemas_file))
+        if file_path in changes_by_file:
+            print_changes(changes_by_file[file_path], file_path)
 
-        # Verificar si hubo cambios
-        fixed_json = json.dumps(fixed_data, indent=2, ensure_ascii=False)
-        if original_data != fixed_json:
-            print(f"🔧 Corrigiendo problemas en {schemas_file.name}...")
+        # Reportar claves duplicadas (json descarta todas menos la última)
+        if file_path in duplicates_by_file:
+            print_duplicates(duplicates_by_file[file_path], str(file_path))
 
-            # Guardar archivo corregido
-            with open(schemas_file, "w", encoding="utf-8") as f:
-                json.dump(fixed_data, f, indent=2, ensure_ascii=False)
+        # Validar estructura (solo reporta, salvo con check=True)
+        if file_path in issues_by_file:
+            print_structure_issues(issues_by_file[file_path], str(file_path))
+            print(
+                f"⚠️  Advertencia: Problemas detectados en {file_path}, pero continuando..."
+            )
 
-            print(f"✅ {schemas_file.name} corregido automáticamente")
-            return True
-        else:
-            return True
+        if workspace.sources[file_path]["cached"]:
+            cached_count += 1
+        if file_path == workspace.base_file:
+            continue
+        processed_count += 1
+        print(f"✅ Procesado: {file_path}")
 
-    except json.JSONDecodeError as e:
-        print(f"❌ Error de JSON en {schemas_file}: {e}")
-        return False
-    except Exception as e:
-        print(f"⚠️  Error validando schemas: {e}")
-        import traceback
+    # Combinar y validar el resultado final
+    print("\n🔍 Validando archivo combinado final...")
+    combined, issues, changes = workspace.build(strategy)
+    if changes:
+        print_changes(changes, "archivo combinado")
+    if issues:
+        print_structure_issues(issues)
+        print(
+            "⚠️  Advertencia: Problemas detectados en archivo combinado, pero guardando..."
+        )
 
-        traceback.print_exc()
-        return True  # Continuar aunque haya error
+    # Mover a components los schemas inline duplicados (antes del grafo: agrega $ref)
+    if dedupe_schemas is not None:
+        with tracer.span("deduplicar schemas"):
+            deduped, hoisted = dedupe_inline_schemas(combined, dedupe_schemas)
+        if hoisted:
+            before = len(render_pretty(combined))
+            after = len(render_pretty(deduped))
+            print(
+                f"🧩 Schemas inline deduplicados: {len(hoisted)} "
+                f"({before - after} bytes menos, {(before - after) / before:.1%})"
+            )
+            print_dedupe_report(hoisted)
+            combined = deduped
+        else:
+            print(f"🧩 Sin schemas inline duplicados de al menos {dedupe_schemas} bytes")
 
+    # Grafo de referencias: $ref colgantes (con archivo y línea) y ciclos
+    with tracer.span("grafo de referencias"):
+        graph = RefGraph(combined)
+    locations = locate_refs(workspace.loaded_in_order(), graph.dangling) if graph.dangling else None
+    print_ref_report(graph, locations)
 
-def combine_openapi_files():
-    """Combinar todos los archivos OpenAPI en uno solo"""
+    if check and (issues_by_file or duplicates_by_file or issues or graph.dangling):
+        print("❌ Modo --check: se encontraron problemas, no se guarda el archivo combinado")
+        return False
 
-    # Validar y corregir schemas antes de combinar
-    print("🔍 Validando schemas antes de combinar...")
-    validate_and_fix_schemas_before_combine()
+    # Eliminar schemas que ninguna operación alcanza (tree-shaking)
+    if prune_schemas:
+        with tracer.span("podar schemas"):
+            pruned, removed = prune_unreachable_schemas(combined, graph)
+        if removed:
+            before = len(render_pretty(combined))
+            after = len(render_pretty(pruned))
+            print(
+                f"✂️  Schemas no alcanzables eliminados: {len(removed)} "
+                f"({before - after} bytes menos, {(before - after) / before:.1%})"
+            )
+            for name in removed:
+                print(f"   - {name}")
+            combined = pruned
+        else:
+            print("✂️  Todos los schemas son alcanzables desde alguna operación")
 
-    print("\n🔄 Combinando archivos OpenAPI con Python...")
+    # Guardar archivo combinado
+    # (escritura atómica, solo si el contenido cambió)
+    output_path = DEFAULT_OUTPUT
+    with tracer.span("escribir salida", perfil=output_profile):
+        artifacts = write_artifacts(combined, output_path, output_profile)
+
+    shard_artifacts = []
+    if shards_dir is not None:
+        with tracer.span("shards"):
+            shard_artifacts = write_navigation_shards(
+                combined, graph, Path(shards_dir), shard_by, output_path
+            )
+
+    # Manifiesto con el hash de cada archivo fuente y generado
+    with tracer.span("manifiesto"):
+        write_build_manifest(
+            DEFAULT_BUILD_MANIFEST, workspace.source_hashes, artifacts, shard_artifacts
+        )
 
-    base_dir = Path("api-reference/openapi")
+    # Descartar entradas de caché de versiones anteriores de los archivos
+    with tracer.span("limpiar caché"):
+        prune_cache(cache_dir, workspace.cache_keys)
 
-    # Cargar base completa
-    base_file = base_dir / "base" / "base-complete.json"
-    if not base_file.exists():
-        print(f"❌ Archivo base no encontrado: {base_file}")
-        return False
+    if artifacts[0].written:
+        print(f"🎯 Archivo combinado creado: {output_path}")
+    else:
+        print(f"🎯 Archivo combinado sin cambios: {output_path}")
+    print(f"📊 Archivos procesados: {processed_count}/{len(workspace.files)}")
+    if cache_dir is not None:
+        print(
+            f"📊 Archivos reutilizados del caché: {cached_count}/{len(workspace.sources)}"
+        )
+    print(f'📊 Paths encontrados: {len(combined["paths"])}')
+    print(
+        f'📊 Schemas encontrados: {len(combined.get("components", {}).get("schemas", {}))}'
+    )
+    print(f"📊 Referencias ($ref): {len(graph.uses)}, colgantes: {len(graph.dangling)}")
+    if output_profile != "pretty":
+        print_size_report(artifacts)
 
-    with open(base_file, "r", encoding="utf-8") as f:
-        combined = json.load(f)
-
-    # Archivos a combinar (solo paths y schemas, no base)
-    files = [
-        # Documents
-        base_dir / "documents" / "list.json",
-        base_dir / "documents" / "batch.json",
-        base_dir / "documents" / "get.json",
-        # Credentials
-        base_dir / "credentials" / "list.json",
-        base_dir / "credentials" / "create.json",
-        base_dir / "credentials" / "batch.json",
-        base_dir / "credentials" / "unenroll.json",
-        # Master entities
-        base_dir / "master-entities" / "master-entities.json",
-        # Scheduled documents
-        base_dir / "scheduled-documents" / "scheduled-documents-list.json",
-        base_dir / "scheduled-documents" / "scheduled-documents-create.json",
-        base_dir / "scheduled-documents" / "scheduled-documents-get.json",
-        base_dir / "scheduled-documents" / "scheduled-documents-update.json",
-        base_dir / "scheduled-documents" / "scheduled-documents-delete.json",
-        base_dir / "scheduled-documents" / "scheduled-documents-preview.json",
-        # Document states
-        base_dir / "document-states" / "document-states.json",
-        # Cessions
-        base_dir / "cessions" / "list.json",
-        base_dir / "cessions" / "get.json",
-        base_dir / "cessions" / "batch.json",
-        base_dir / "cessions" / "batch-status.json",
-        # Webhooks
-        base_dir / "webhooks" / "webhooks.json",
-        # Honorary
-        base_dir / "honorary" / "authorized-users.json",
-        # Book summaries
-        base_dir / "book-summaries" / "list.json",
-        # Sync (estado de sincronización + solicitudes a demanda)
-        base_dir / "sync" / "status.json",
-        base_dir / "sync" / "requests-create.json",
-        base_dir / "sync" / "requests-list.json",
-        base_dir / "sync" / "requests-get.json",
-        # Schemas
-        base_dir / "schemas" / "schemas.json",
-    ]
+    return True
 
-    processed_count = 0
 
-    for file_path in files:
-        if not file_path.exists():
-            print(f"⚠️  Archivo no encontrado: {file_path}")
-            continue
+def write_navigation_shards(combined, graph, shards_dir, shard_by, output_path):
+    """
+    Escribir un documento por sección de docs.json y reportar su tamaño.
+    Retorna los shards escritos como Artifact (para el manifiesto del build).
+    """
+    if not DEFAULT_DOCS_CONFIG.exists():
+        print(f"⚠️  {DEFAULT_DOCS_CONFIG} no encontrado, no se generan shards")
+        return []
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Validar y corregir antes de combinar
-            original_data_str = json.dumps(data, indent=2, ensure_ascii=False)
-            data = validate_and_fix_duplicate_keys(data, str(file_path))
-            fixed_data_str = json.dumps(data, indent=2, ensure_ascii=False)
-
-            # Si hubo correcciones, guardar el archivo corregido
-            if original_data_str != fixed_data_str:
-                print(f"🔧 Corrigiendo problemas en {file_path.name}...")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                print(f"✅ {file_path.name} corregido automáticamente")
-
-            # Validar estructura (solo reporta, no bloquea)
-            if not validate_openapi_structure(data, str(file_path)):
-                print(
-                    f"⚠️  Advertencia: Problemas detectados en {file_path}, pero continuando..."
-                )
-
-            # Combinar paths (combinar métodos si el path ya existe)
-            # Los paths se usan tal cual vienen (sin agregar /v1, ya está en el servidor base)
-            if "paths" in data:
-                for path, methods in data["paths"].items():
-                    # Remover /v1/ del path si lo tiene (el servidor base ya lo tiene)
-                    clean_path = path
-                    if path.startswith("/v1/"):
-                        clean_path = (
-                            "/" + path[4:]
-                        )  # Remover "/v1/" y agregar "/" -> queda "/documents"
-                    elif path.startswith("/v1"):
-                        clean_path = (
-                            "/" + path[3:]
-                        )  # Remover "/v1" y agregar "/" -> queda "/documents"
-                    # Si no tiene /v1, usar el path tal cual (debe empezar con /)
-                    elif not path.startswith("/"):
-                        clean_path = "/" + path
-
-                    if clean_path not in combined["paths"]:
-                        combined["paths"][clean_path] = {}
-                    combined["paths"][clean_path].update(methods)
-
-            # Combinar components
-            if "components" in data:
-                if "schemas" in data["components"]:
-                    if "components" not in combined:
-                        combined["components"] = {}
-                    if "schemas" not in combined["components"]:
-                        combined["components"]["schemas"] = {}
-                    combined["components"]["schemas"].update(
-                        data["components"]["schemas"]
-                    )
-                if "securitySchemes" in data["components"]:
-                    if "components" not in combined:
-                        combined["components"] = {}
-                    if "securitySchemes" not in combined["components"]:
-                        combined["components"]["securitySchemes"] = {}
-                    combined["components"]["securitySchemes"].update(
-                        data["components"]["securitySchemes"]
-                    )
-
-            processed_count += 1
-            print(f"✅ Procesado: {file_path}")
-
-        except Exception as e:
-            print(f"❌ Error procesando {file_path}: {e}")
-            import traceback
-
-            traceback.print_exc()
-            return False
+    sections = load_navigation(DEFAULT_DOCS_CONFIG, shard_by)
+    shards, missing = build_shards(combined, graph, sections, spec_file=str(output_path))
+    manifest = write_shards(shards, missing, shards_dir, source=output_path)
 
-    # Validar y corregir el resultado final
-    print("\n🔍 Validando archivo combinado final...")
-    combined = validate_and_fix_duplicate_keys(combined)
-    if not validate_openapi_structure(combined):
+    total_bytes = output_path.stat().st_size
+    print(f"🧩 Shards por {shard_by} en {shards_dir}: {len(manifest['shards'])}")
+    for entry in manifest["shards"]:
         print(
-            "⚠️  Advertencia: Problemas detectados en archivo combinado, pero guardando..."
+            f"   {entry['file']}: {len(entry['operations'])} operaciones, "
+            f"{entry['schemas']} schemas, {entry['bytes'] / 1024:.1f} KB "
+            f"({entry['bytes'] / total_bytes:.0%} del combinado)"
         )
+    for page, operation in missing:
+        print(f"⚠️  {page}: la operación {operation} no existe en {output_path}")
 
-    # Guardar archivo combinado
-    output_path = Path("api-reference/openapi-combined.json")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return [
+        Artifact(shards_dir / entry["file"], entry["bytes"], "shard", entry["sha256"], None)
+        for entry in manifest["shards"]
+    ]
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(combined, f, indent=2, ensure_ascii=False)
 
-    print(f"🎯 Archivo combinado creado: {output_path}")
-    print(f"📊 Archivos procesados: {processed_count}/{len(files)}")
-    print(f'📊 Paths encontrados: {len(combined["paths"])}')
-    print(
-        f'📊 Schemas encontrados: {len(combined.get("components", {}).get("schemas", {}))}'
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Combinar archivos OpenAPI divididos en api-reference/openapi-combined.json"
     )
-
-    return True
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="No usar el caché de archivos fuente ya procesados",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directorio del caché (por defecto: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Procesos para leer/corregir/validar archivos en paralelo (0 = todos los CPUs)",
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=sorted(MERGE_STRATEGIES),
+        default="replace",
+        help="Cómo combinar métodos repetidos entre archivos (por defecto: replace)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fallar si hay claves duplicadas o problemas de estructura",
+    )
+    parser.add_argument(
+        "--prune-schemas",
+        action="store_true",
+        help="Eliminar los schemas que ninguna operación referencia (directa o indirectamente)",
+    )
+    parser.add_argument(
+        "--dedupe-schemas",
+        nargs="?",
+        type=int,
+        const=DEFAULT_MIN_BYTES,
+        metavar="BYTES",
+        help="Mover a components/schemas los schemas inline repetidos de al menos BYTES "
+        f"(JSON compacto) y reemplazarlos por $ref (por defecto: {DEFAULT_MIN_BYTES})",
+    )
+    parser.add_argument(
+        "--shards",
+        nargs="?",
+        const=str(DEFAULT_SHARDS_DIR),
+        metavar="DIR",
+        help=f"Escribir un documento por sección de {DEFAULT_DOCS_CONFIG} y su manifiesto "
+        f"(por defecto en {DEFAULT_SHARDS_DIR})",
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_MODES,
+        default="tab",
+        help="Generar un shard por tab o por grupo de la navegación (por defecto: tab)",
+    )
+    parser.add_argument(
+        "--output-profile",
+        choices=OUTPUT_PROFILES,
+        default="pretty",
+        help="pretty: solo el archivo indentado; compact: además .min.json, .gz y .br "
+        "(por defecto: pretty)",
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const=str(DEFAULT_TRACE_FILE),
+        metavar="ARCHIVO",
+        help="Registrar tiempos por fase, archivo y regla en formato Chrome trace-event "
+        f"(chrome://tracing, ui.perfetto.dev) e imprimir un resumen (por defecto en {DEFAULT_TRACE_FILE})",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs debe ser >= 0")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
 
 
 if __name__ == "__main__":
-    success = combine_openapi_files()
+    args = parse_args()
+    tracer = Tracer() if args.trace else None
+    success = combine_openapi_files(
+        None if args.no_cache else Path(args.cache_dir),
+        jobs=args.jobs,
+        strategy=args.strategy,
+        check=args.check,
+        prune_schemas=args.prune_schemas,
+        dedupe_schemas=args.dedupe_schemas,
+        shards_dir=args.shards,
+        shard_by=args.shard_by,
+        output_profile=args.output_profile,
+        tracer=tracer,
+    )
+    if tracer is not None:
+        tracer.write(args.trace)
+        tracer.print_summary()
+        print(f"🧭 Trace guardado en {args.trace} (ábrelo en chrome://tracing o ui.perfetto.dev)")
     sys.exit(0 if success else 1)
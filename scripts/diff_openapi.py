@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Script para comparar dos builds del documento combinado y reportar cambios
+breaking por operación y por schema.
+
+Cada lado es un archivo o una revisión de git (`git:REV`, que lee el
+documento combinado de esa revisión). Por defecto compara el último commit
+con el archivo actual, así que se puede correr en cada commit:
+
+    python3 scripts/diff_openapi.py                          # git:HEAD vs archivo actual
+    python3 scripts/diff_openapi.py git:main                 # main vs archivo actual
+    python3 scripts/diff_openapi.py viejo.json nuevo.json --check
+
+La lógica del diff vive en openapi_diff.py.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from openapi_diff import diff_documents, has_breaking_changes, print_diff_report
+from openapi_engine import DEFAULT_OUTPUT
+
+
+def load_document(spec, path=DEFAULT_OUTPUT):
+    """Cargar un documento desde un archivo o desde `git:REV` (el combinado en esa revisión)"""
+    if spec.startswith("git:"):
+        revision = spec[len("git:"):] or "HEAD"
+        result = subprocess.run(
+            ["git", "show", f"{revision}:{path.as_posix()}"],
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise ValueError(result.stderr.decode("utf-8", "replace").strip())
+        return json.loads(result.stdout)
+    with open(spec, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Diff semántico y cambios breaking entre dos builds de la especificación"
+    )
+    parser.add_argument(
+        "old",
+        nargs="?",
+        default="git:HEAD",
+        help="Documento anterior: archivo o git:REV (por defecto: git:HEAD)",
+    )
+    parser.add_argument(
+        "new",
+        nargs="?",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento nuevo: archivo o git:REV (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Detallar también los cambios no breaking"
+    )
+    parser.add_argument("--json", action="store_true", help="Imprimir el resultado como JSON")
+    parser.add_argument(
+        "--check", action="store_true", help="Salir con código 1 si hay cambios breaking"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    try:
+        old = load_document(args.old)
+        new = load_document(args.new)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar el documento: {e}")
+        return 1
+
+    start = time.perf_counter()
+    report = diff_documents(old, new)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        result = {
+            "findings": [finding._asdict() for finding in report.findings],
+            "affected": report.affected,
+            "breaking": has_breaking_changes(report),
+        }
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔀 {args.old} -> {args.new} ({report.compared} nodos comparados, {elapsed_ms:.0f} ms)")
+        print_diff_report(report, verbose=args.verbose)
+
+    return 1 if args.check and has_breaking_changes(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
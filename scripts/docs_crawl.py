@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Recorrido concurrente del sitio de documentación.
+
+Las páginas salen de la navegación de docs.json (`navigation.tabs[].groups[]
+.pages`, con grupos anidados): cada página `user-guide/webhooks` se pide como
+`/user-guide/webhooks` e `index` como `/`. Funciona contra cualquier servidor
+local (mintlify dev, un build estático servido con `python -m http.server`, ...).
+
+- wait_until_ready: sondea una ruta hasta que el servidor responda (sin
+  esperas fijas)
+- crawl: pide todas las páginas con un pool acotado de workers, cada uno con
+  su conexión HTTP/1.1 keep-alive (openapi_load.HTTPConnection), y registra
+  el código de estado y la latencia de cada una
+
+Uso:
+    from docs_crawl import crawl, navigation_pages, wait_until_ready
+    pages = navigation_pages(json.load(open("docs.json")))
+    asyncio.run(wait_until_ready("http://127.0.0.1:3000"))
+    results = asyncio.run(crawl("http://127.0.0.1:3000", pages))
+"""
+
+import asyncio
+import time
+from collections import namedtuple
+from pathlib import Path
+from urllib.parse import quote
+
+from openapi_load import HTTPConnection, LoadRequest
+
+DEFAULT_BASE_URL = "http://127.0.0.1:3000"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_READY_TIMEOUT = 120.0
+READY_POLL_INTERVAL = 0.25
+SOURCE_EXTENSIONS = (".mdx", ".md")
+
+# Resultado de una página: nombre en docs.json, ruta pedida, código de
+# estado (None si hubo error de conexión), latencia en ms y error
+PageResult = namedtuple("PageResult", ["page", "path", "status", "latency_ms", "error"])
+
+
+def navigation_pages(config):
+    """Páginas de la navegación de docs.json, en orden y sin repetir"""
+    pages = []
+
+    def walk(node):
+        if isinstance(node, str):
+            if node not in pages:
+                pages.append(node)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+        elif isinstance(node, dict):
+            for key in ("tabs", "groups", "pages", "anchors", "versions", "languages", "dropdowns"):
+                if isinstance(node.get(key), list):
+                    walk(node[key])
+
+    walk(config.get("navigation") or {})
+    return pages
+
+
+def page_path(page):
+    """Ruta de una página: 'index' -> '/', 'user-guide/index' -> '/user-guide'"""
+    parts = [part for part in page.strip("/").split("/") if part]
+    if parts and parts[-1] == "index":
+        parts.pop()
+    return "/" + "/".join(quote(part) for part in parts)
+
+
+def missing_sources(pages, root):
+    """Páginas de la navegación sin archivo .mdx/.md en `root`"""
+    root = Path(root)
+    return [
+        page for page in pages
+        if not any((root / f"{page}{extension}").exists() for extension in SOURCE_EXTENSIONS)
+    ]
+
+
+def _get(path):
+    return LoadRequest(f"GET {path}", "GET", path, {"Accept": "text/html"}, b"", None)
+
+
+async def wait_until_ready(base_url, path="/", timeout=DEFAULT_READY_TIMEOUT, is_alive=None):
+    """
+    Sondear `path` hasta que responda con un código < 500. Retorna los
+    segundos esperados; TimeoutError si no responde en `timeout`, o
+    RuntimeError si `is_alive()` indica que el proceso del servidor terminó.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    last_error = "sin respuesta"
+    while True:
+        if is_alive is not None and not is_alive():
+            raise RuntimeError("el servidor terminó antes de estar listo")
+        connection = HTTPConnection(base_url, timeout=max(0.1, min(5.0, deadline - time.monotonic())))
+        try:
+            status = await connection.send(connection.encode(_get(path)))
+            if status < 500:
+                return time.monotonic() - start
+            last_error = f"HTTP {status}"
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            last_error = type(e).__name__
+        finally:
+            connection.close()
+        if time.monotonic() + READY_POLL_INTERVAL > deadline:
+            raise TimeoutError(f"{base_url}{path} no respondió en {timeout:.0f} s ({last_error})")
+        await asyncio.sleep(READY_POLL_INTERVAL)
+
+
+async def crawl(base_url, pages, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT, on_result=None):
+    """Pedir todas las páginas con `concurrency` workers; PageResult en el orden de `pages`"""
+    queue = asyncio.Queue()
+    for index, page in enumerate(pages):
+        queue.put_nowait((index, page))
+    results = [None] * len(pages)
+
+    async def worker():
+        connection = HTTPConnection(base_url, timeout)
+        try:
+            while not queue.empty():
+                index, page = queue.get_nowait()
+                path = page_path(page)
+                payload = connection.encode(_get(path))
+                start = time.perf_counter()
+                # Una conexión reutilizada que el servidor cerró mientras estaba ociosa se reintenta una vez
+                for _attempt in range(2):
+                    reused = connection.writer is not None
+                    try:
+                        status, error = await connection.send(payload), None
+                        break
+                    except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+                        status, error = None, type(e).__name__
+                        connection.close()
+                        if not reused or isinstance(e, asyncio.TimeoutError):
+                            break
+                result = PageResult(page, path, status, (time.perf_counter() - start) * 1000, error)
+                results[index] = result
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            connection.close()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(pages))))))
+    return results
+
+
+def is_ok(result):
+    """Página respondida con 2xx o 3xx"""
+    return result.status is not None and result.status < 400
+
+
+def slowest(results, count=5):
+    """Las `count` páginas respondidas más lentas"""
+    answered = [result for result in results if result.status is not None]
+    return sorted(answered, key=lambda result: result.latency_ms, reverse=True)[:count]
+
+
+def print_result(result):
+    """Una línea por página: estado, latencia y ruta"""
+    if result.status is None:
+        print(f"   ❌ {'ERR':>3} {result.latency_ms:>8.0f} ms  {result.path}  ({result.error})")
+    else:
+        icon = "✅" if is_ok(result) else "❌"
+        print(f"   {icon} {result.status:>3} {result.latency_ms:>8.0f} ms  {result.path}")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Script para generar el cliente Python de la API desde el documento combinado.
+
+    python3 scripts/generate_sdk.py                        # sdk/python/tupana_api
+    python3 scripts/generate_sdk.py --output /tmp/tupana_api --force
+
+El paquete no tiene dependencias (solo biblioteca estándar):
+
+    from tupana_api import Client, AsyncClient
+    with Client(api_key="...") as client:
+        document = client.get_document(document_id="...")
+        for cession in client.iter_cessions(master_entity_id=1):
+            ...
+
+La regeneración es incremental: solo se reescriben los módulos de las
+operaciones que cambiaron en la especificación. La lógica vive en openapi_sdk.py.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from openapi_engine import DEFAULT_OUTPUT
+from openapi_sdk import DEFAULT_SDK_DIR, generate_sdk
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Generar el cliente Python de la API desde la especificación OpenAPI combinada"
+    )
+    parser.add_argument(
+        "--spec",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento combinado (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(DEFAULT_SDK_DIR),
+        help=f"Directorio del paquete generado (por defecto: {DEFAULT_SDK_DIR})",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Regenerar todas las operaciones aunque no hayan cambiado"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    try:
+        with open(args.spec, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar {args.spec}: {e}")
+        return 1
+
+    start = time.perf_counter()
+    report = generate_sdk(document, args.output, force=args.force)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for module in report.written:
+        print(f"   ✏️  {module}")
+    for module in report.removed:
+        print(f"   🗑️  {module}")
+    total = len(report.written) + len(report.unchanged)
+    print(
+        f"📦 SDK en {args.output}: {total} operaciones "
+        f"({len(report.written)} regeneradas, {len(report.unchanged)} sin cambios, "
+        f"{len(report.removed)} eliminadas) en {elapsed:.0f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Script de pruebas de carga guiadas por la especificación.
+
+Arma peticiones válidas desde el documento combinado y las envía
+concurrentemente contra cualquier URL base (por defecto el mock local de
+mock_openapi.py). Reporta throughput y latencia p50/p95/p99 por operación
+y por tamaño de lote:
+
+    python3 scripts/load_openapi.py --start-mock                     # GETs contra un mock propio
+    python3 scripts/load_openapi.py -o "POST /documents/batch" -o "POST /cessions/batch" \\
+        --batch-sizes 1,10,50,100 -n 1000 -c 20 --json carga.json
+    python3 scripts/load_openapi.py --base-url https://staging.example.com/v1 \\
+        -H "Authorization: Api-Key ..." -o "GET /documents"
+    python3 scripts/load_openapi.py --list                           # operaciones disponibles
+
+Sin -o se cargan solo las operaciones GET. La lógica vive en openapi_load.py.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from openapi_engine import DEFAULT_OUTPUT
+from openapi_load import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_REQUESTS,
+    DEFAULT_TIMEOUT,
+    batch_limit,
+    build_request,
+    is_batch_operation,
+    iter_operations,
+    print_summary,
+    run_scenarios,
+    select_operations,
+    summarize,
+)
+
+MOCK_SCRIPT = Path(__file__).parent / "mock_openapi.py"
+MOCK_STARTUP_TIMEOUT = 10.0
+
+
+def parse_header(value):
+    """'Nombre: valor' -> (nombre, valor)"""
+    name, separator, header_value = value.partition(":")
+    if not separator or not name.strip():
+        raise argparse.ArgumentTypeError(f"header inválido: {value!r} (usar 'Nombre: valor')")
+    return name.strip(), header_value.strip()
+
+
+def parse_sizes(value):
+    """'1,10,100' -> [1, 10, 100]"""
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tamaños inválidos: {value!r}")
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError(f"tamaños inválidos: {value!r}")
+    return sizes
+
+
+def plan_requests(document, names, batch_sizes=None, headers=None):
+    """Un LoadRequest por operación, o uno por tamaño de lote en las operaciones por lotes"""
+    operations = {name: operation for name, _path, _method, operation in iter_operations(document)}
+    planned = []
+    for name in names:
+        if not batch_sizes or not is_batch_operation(document, name):
+            planned.append(build_request(document, name, headers=headers))
+            continue
+        limit = batch_limit(operations[name], document)
+        for size in batch_sizes:
+            if limit is not None and size > limit:
+                print(f"⚠️  {name}: lote de {size} supera maxItems ({limit}) de la especificación")
+            planned.append(build_request(document, name, batch_size=size, headers=headers))
+    return planned
+
+
+def start_mock(spec, base_url):
+    """Levantar mock_openapi.py en el host y puerto de base_url y esperar a que acepte conexiones"""
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    process = subprocess.Popen(
+        [sys.executable, str(MOCK_SCRIPT), "--spec", spec, "--host", host, "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + MOCK_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError(f"el mock no respondió en {host}:{port}")
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Pruebas de carga guiadas por la especificación OpenAPI combinada"
+    )
+    parser.add_argument(
+        "--spec",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento combinado (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--base-url", default=DEFAULT_BASE_URL, help=f"URL base de la API (por defecto: {DEFAULT_BASE_URL}, el mock local)"
+    )
+    parser.add_argument(
+        "-o",
+        "--operation",
+        action="append",
+        default=[],
+        metavar="OPERACIÓN",
+        help="Operación a cargar: 'POST /documents/batch' u operationId (repetible; por defecto: todas las GET)",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=parse_sizes,
+        metavar="N,N,...",
+        help="Tamaños de lote para las operaciones por lotes (un escenario por tamaño)",
+    )
+    parser.add_argument(
+        "-n", "--requests", type=int, default=DEFAULT_REQUESTS, help=f"Peticiones por escenario (por defecto: {DEFAULT_REQUESTS})"
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Conexiones concurrentes (por defecto: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"Timeout por petición en segundos (por defecto: {DEFAULT_TIMEOUT:.0f})"
+    )
+    parser.add_argument(
+        "-H", "--header", type=parse_header, action="append", default=[], help="Header extra: 'Nombre: valor' (repetible)"
+    )
+    parser.add_argument("--json", metavar="ARCHIVO", help="Guardar los resultados como JSON")
+    parser.add_argument(
+        "--start-mock", action="store_true", help="Levantar mock_openapi.py en --base-url durante la prueba"
+    )
+    parser.add_argument("--list", action="store_true", help="Listar las operaciones y salir")
+    args = parser.parse_args(argv)
+    if args.requests < 1 or args.concurrency < 1:
+        parser.error("--requests y --concurrency deben ser >= 1")
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    try:
+        with open(args.spec, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar {args.spec}: {e}")
+        return 1
+
+    if args.list:
+        for name, _path, _method, operation in iter_operations(document):
+            marker = " (lotes)" if is_batch_operation(document, name) else ""
+            operation_id = f"  [{operation['operationId']}]" if operation.get("operationId") else ""
+            print(f"   {name}{operation_id}{marker}")
+        return 0
+
+    try:
+        names = select_operations(document, args.operation)
+        planned = plan_requests(document, names, args.batch_sizes, dict(args.header))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    mock = None
+    if args.start_mock:
+        try:
+            mock = start_mock(args.spec, args.base_url)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+
+    print(
+        f"🚀 {len(planned)} escenarios contra {args.base_url}: "
+        f"{args.requests} peticiones, {args.concurrency} conexiones"
+    )
+    summaries = []
+
+    def on_result(result):
+        summary = summarize(result)
+        summaries.append(summary)
+        print_summary(summary)
+
+    try:
+        asyncio.run(
+            run_scenarios(planned, args.base_url, args.requests, args.concurrency, args.timeout, on_result=on_result)
+        )
+    except KeyboardInterrupt:
+        print("\n👋 Prueba interrumpida")
+    finally:
+        if mock is not None:
+            mock.terminate()
+            mock.wait()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"base_url": args.base_url, "scenarios": summaries}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"💾 Resultados guardados en {args.json}")
+
+    if not summaries or all(summary["requests"] == 0 for summary in summaries):
+        print(f"❌ Ninguna petición completada: ¿está corriendo la API en {args.base_url}? (ver --start-mock)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
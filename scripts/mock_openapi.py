@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Script para levantar un servidor mock de la API desde el documento combinado.
+
+Responde cada operación con los ejemplos de la especificación (o cuerpos
+sintetizados desde los schemas), para probar integraciones y correr
+pruebas de carga sin llamar a la API real:
+
+    python3 scripts/mock_openapi.py                         # perfil fast en :4010
+    python3 scripts/mock_openapi.py --profile flaky --seed 1
+    python3 scripts/mock_openapi.py --latency 50-200 --error-rate 0.05 --error-status 500,503
+
+Las opciones --latency, --error-rate y --error-status reemplazan los valores
+del perfil elegido. La lógica del servidor vive en openapi_mock.py.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from openapi_engine import DEFAULT_OUTPUT
+from openapi_mock import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    PROFILES,
+    STATS_PATH,
+    MockApp,
+    run_mock_server,
+    uvloop,
+)
+
+
+def parse_latency(value):
+    """'50' o '50-200' (milisegundos) -> (mínimo, máximo) en segundos"""
+    low, _, high = value.partition("-")
+    try:
+        low_ms = float(low)
+        high_ms = float(high) if high else low_ms
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"latencia inválida: {value!r} (usar MS o MIN-MAX)")
+    if low_ms < 0 or high_ms < low_ms:
+        raise argparse.ArgumentTypeError(f"latencia inválida: {value!r}")
+    return low_ms / 1000, high_ms / 1000
+
+
+def parse_statuses(value):
+    """'500,503' -> (500, 503)"""
+    try:
+        statuses = tuple(int(status) for status in value.split(",") if status.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"códigos inválidos: {value!r}")
+    if not statuses or any(not 100 <= status <= 599 for status in statuses):
+        raise argparse.ArgumentTypeError(f"códigos inválidos: {value!r}")
+    return statuses
+
+
+def build_profile(args):
+    """Perfil elegido con las opciones de la línea de comandos aplicadas encima"""
+    profile = PROFILES[args.profile]
+    if args.latency is not None:
+        profile = profile._replace(latency_min=args.latency[0], latency_max=args.latency[1])
+    if args.error_rate is not None:
+        profile = profile._replace(error_rate=args.error_rate)
+    if args.error_status is not None:
+        profile = profile._replace(error_statuses=args.error_status)
+    return profile
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Servidor mock de la API generado desde el documento OpenAPI combinado"
+    )
+    parser.add_argument(
+        "--spec",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento combinado (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interfaz (por defecto: {DEFAULT_HOST})")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Puerto (por defecto: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default="fast",
+        help="Perfil de latencia y errores (por defecto: fast, sin latencia ni errores)",
+    )
+    parser.add_argument(
+        "--latency", type=parse_latency, metavar="MS[-MS]", help="Latencia fija o rango uniforme en ms"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, metavar="FRACCIÓN", help="Fracción de peticiones con error (0 a 1)"
+    )
+    parser.add_argument(
+        "--error-status",
+        type=parse_statuses,
+        metavar="CÓDIGOS",
+        help="Códigos de los errores inyectados, separados por coma (ej.: 500,503)",
+    )
+    parser.add_argument("--seed", type=int, help="Semilla para latencias y errores reproducibles")
+    args = parser.parse_args(argv)
+    if args.error_rate is not None and not 0 <= args.error_rate <= 1:
+        parser.error("--error-rate debe estar entre 0 y 1")
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    try:
+        with open(args.spec, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar {args.spec}: {e}")
+        return 1
+
+    profile = build_profile(args)
+    app = MockApp(document, profile, seed=args.seed)
+
+    def on_ready(host, port):
+        print(f"🎭 Mock de {Path(args.spec).name} en http://{host}:{port} ({len(app.router.routes)} operaciones)")
+        print(
+            f"⏱️  Latencia {profile.latency_min * 1000:.0f}-{profile.latency_max * 1000:.0f} ms, "
+            f"errores {profile.error_rate:.0%} ({', '.join(map(str, profile.error_statuses))})"
+        )
+        print(f"📊 Estadísticas en http://{host}:{port}{STATS_PATH}")
+        if uvloop is None:
+            print("ℹ️  uvloop no está instalado: se usa el event loop de asyncio")
+
+    run_mock_server(app, args.host, args.port, on_ready=on_ready)
+    print("\n👋 Servidor detenido")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Variantes de salida del documento combinado.
+
+Perfiles:
+- "pretty": solo el archivo indentado (el que se revisa en los PRs)
+- "compact": además una variante minificada (separadores compactos) y sus
+  versiones precomprimidas junto a ella: .gz (gzip de la librería estándar)
+  y .br (solo si el paquete opcional `brotli` está instalado)
+
+Las variantes comprimidas son reproducibles: misma entrada, mismos bytes
+(gzip se escribe con mtime=0).
+
+Todas las escrituras son atómicas (archivo temporal + rename en el mismo
+directorio) y se omiten si el contenido no cambió: una reconstrucción sin
+cambios no toca ningún archivo (ni su mtime), así que no despierta a los
+watchers ni al servidor de desarrollo, y una ejecución concurrente nunca ve
+un archivo a medio escribir.
+
+Uso:
+    from openapi_artifacts import write_artifacts, print_size_report
+    artifacts = write_artifacts(combined, Path("api-reference/openapi-combined.json"), "compact")
+    print_size_report(artifacts)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Opcional: sin brotli no se genera la variante .br
+    brotli = None
+
+OUTPUT_PROFILES = ("pretty", "compact")
+
+# Archivo generado: ruta, tamaño en bytes, descripción, sha256 y si se escribió
+Artifact = namedtuple("Artifact", ["path", "size", "kind", "sha256", "written"])
+
+
+def _process_umask():
+    """
+    umask del proceso, leído una sola vez al importar: os.umask solo se puede
+    consultar cambiándolo, y hacerlo en cada escritura afectaría a los otros
+    hilos que crean archivos al mismo tiempo.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Permisos de un archivo nuevo, como los daría open(): 0o666 menos el umask
+_NEW_FILE_MODE = 0o666 & ~_process_umask()
+
+
+def _target_mode(path):
+    """Permisos para `path`: los del archivo existente, o los de un archivo nuevo"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
+
+def atomic_write(path, data):
+    """
+    Escribir bytes de forma atómica: archivo temporal en el mismo directorio + rename.
+    Se conservan los permisos del archivo existente (mkstemp crea con 0600).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = _target_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            else:
+                os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path, data):
+    """
+    Escribir `data` en `path` solo si el contenido cambió.
+    Retorna True si se escribió.
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def render_pretty(document):
+    """Serialización indentada (formato histórico del archivo combinado)"""
+    return json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def render_compact(document):
+    """Serialización minificada, sin espacios entre separadores"""
+    return json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def compact_path(output_path):
+    """openapi-combined.json -> openapi-combined.min.json"""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.min{output_path.suffix}")
+
+
+def _artifact(path, data, kind):
+    written = write_if_changed(path, data)
+    return Artifact(path, len(data), kind, hashlib.sha256(data).hexdigest(), written)
+
+
+def write_artifacts(document, output_path, profile="pretty"):
+    """
+    Escribir el documento según el perfil (solo los archivos cuyo contenido
+    cambió). Retorna la lista de Artifact en orden (primero el indentado).
+    """
+    output_path = Path(output_path)
+
+    pretty = render_pretty(document)
+    artifacts = [_artifact(output_path, pretty, "indentado")]
+    if profile == "pretty":
+        return artifacts
+
+    minified_path = compact_path(output_path)
+    minified = render_compact(document)
+    artifacts.append(_artifact(minified_path, minified, "minificado"))
+
+    gz_path = minified_path.with_name(minified_path.name + ".gz")
+    gz_data = gzip.compress(minified, compresslevel=9, mtime=0)
+    artifacts.append(_artifact(gz_path, gz_data, "minificado + gzip"))
+
+    br_path = minified_path.with_name(minified_path.name + ".br")
+    if brotli is not None:
+        br_data = brotli.compress(minified, quality=11)
+        artifacts.append(_artifact(br_path, br_data, "minificado + brotli"))
+    else:
+        # No dejar una variante .br de una generación anterior
+        br_path.unlink(missing_ok=True)
+    return artifacts
+
+
+def write_build_manifest(manifest_path, sources, artifacts, extra_outputs=()):
+    """
+    Escribir el manifiesto del build: sha256 de cada archivo fuente y de cada
+    archivo generado. `sources` es {ruta: sha256}; `extra_outputs` son
+    Artifact adicionales (p. ej. shards). Se escribe solo si cambió.
+    Retorna True si se escribió.
+    """
+    manifest = {
+        "sources": {str(path): digest for path, digest in sources.items()},
+        "outputs": {
+            str(artifact.path): {"sha256": artifact.sha256, "bytes": artifact.size}
+            for artifact in [*artifacts, *extra_outputs]
+        },
+    }
+    text = json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+    return write_if_changed(manifest_path, text.encode("utf-8"))
+
+
+def print_size_report(artifacts):
+    """Imprimir el tamaño de cada archivo generado relativo al indentado"""
+    baseline = artifacts[0].size
+    print("📦 Archivos generados:")
+    for artifact in artifacts:
+        ratio = artifact.size / baseline if baseline else 1
+        status = "" if artifact.written else ", sin cambios"
+        print(
+            f"   {artifact.path}: {artifact.size / 1024:.1f} KB "
+            f"({artifact.kind}, {ratio:.0%} del indentado{status})"
+        )
+    if len(artifacts) > 1 and brotli is None:
+        print("   ℹ️  Variante .br omitida: instala el paquete 'brotli' para generarla")
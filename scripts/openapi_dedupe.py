@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Deduplicación de schemas inline del documento combinado.
+
+Los archivos por endpoint repiten schemas inline idénticos (sobres de error,
+listas paginadas, propiedades copiadas entre schemas). Esta pasada:
+- resume cada schema inline con su hash de Merkle (openapi_diff.MerkleTree:
+  no depende del orden de las claves, salvo en `properties`, cuyo orden es
+  el que muestra la documentación)
+- agrupa los idénticos y, si el grupo ocupa al menos `min_bytes` (JSON
+  compacto) y reemplazarlo ahorra bytes, lo mueve a components/schemas con
+  un nombre estable y deja un $ref en cada aparición
+- reemplaza por un $ref los schemas inline idénticos a un schema que ya
+  existe en components
+
+Los grupos se evalúan de mayor a menor tamaño: un duplicado que solo aparece
+dentro de las copias de otro se mueve junto con él y no cuenta dos veces, y
+uno que no conviene mover no impide mover sus subesquemas. Se repite hasta
+que no queden grupos. Los nombres se derivan de la primera aparición en
+orden de documento: la propiedad, el parámetro o la operación y la
+respuesta donde está el schema, calificados con la operación o el
+component dueño cuando no alcanzan a dar contexto.
+
+Uso:
+    from openapi_dedupe import dedupe_inline_schemas
+    document, hoisted = dedupe_inline_schemas(combined)
+"""
+
+import json
+import re
+from collections import defaultdict, namedtuple
+
+from openapi_diff import MerkleTree
+from openapi_loader import escape_pointer_token, unescape_pointer_token
+from openapi_refs import HTTP_METHODS
+
+# Tamaño mínimo (JSON compacto, en bytes) de un schema para deduplicarlo
+DEFAULT_MIN_BYTES = 100
+
+# Schema movido a components: nombre, tamaño en bytes, apariciones
+# reemplazadas y si el nombre ya existía en components
+HoistedSchema = namedtuple("HoistedSchema", ["name", "size", "pointers", "existing"])
+
+_SCHEMA_MAPS = ("properties",)
+# Claves cuyo orden se conserva al comparar schemas (ver MerkleTree)
+_ORDERED_KEYS = ("properties",)
+_SCHEMA_LISTS = ("allOf", "anyOf", "oneOf")
+_SCHEMA_VALUES = ("items", "additionalProperties", "not")
+
+# Sufijo de nombre para cada posición de un subesquema dentro de su padre
+_POSITION_SUFFIX = {"items": "Item", "additionalProperties": "Value", "not": "Not"}
+
+
+def _canonical_size(schema):
+    return len(json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _ref_size(name):
+    return _canonical_size({"$ref": f"#/components/schemas/{name}"})
+
+
+def _iter_schema_tree(schema, pointer, tree, top=False):
+    """Subesquemas de `schema` (él incluido salvo con top=True), de arriba hacia abajo"""
+    stack = [(schema, pointer, top)]
+    while stack:
+        node, node_pointer, is_top = stack.pop()
+        if not isinstance(node, dict) or "$ref" in node:
+            continue
+        if not is_top:
+            yield node_pointer, node, tree.digest(node)
+        for keyword in _SCHEMA_VALUES:
+            if isinstance(node.get(keyword), dict):
+                stack.append((node[keyword], f"{node_pointer}/{keyword}", False))
+        for keyword in _SCHEMA_LISTS:
+            subschemas = node.get(keyword)
+            if isinstance(subschemas, list):
+                for index in range(len(subschemas) - 1, -1, -1):
+                    stack.append((subschemas[index], f"{node_pointer}/{keyword}/{index}", False))
+        for keyword in _SCHEMA_MAPS:
+            if isinstance(node.get(keyword), dict):
+                for name, subschema in reversed(node[keyword].items()):
+                    stack.append((subschema, f"{node_pointer}/{keyword}/{escape_pointer_token(name)}", False))
+
+
+def iter_inline_schemas(document, tree):
+    """
+    Producir (pointer, schema, hash) por cada schema inline del documento, de
+    arriba hacia abajo: los que no son una entrada de components/schemas ni
+    un $ref.
+    """
+    schemas = document.get("components", {}).get("schemas", {})
+    for name, schema in schemas.items():
+        yield from _iter_schema_tree(schema, f"/components/schemas/{escape_pointer_token(name)}", tree, top=True)
+
+    stack = [(document, "")]
+    while stack:
+        node, pointer = stack.pop()
+        if isinstance(node, list):
+            stack.extend((value, f"{pointer}/{index}") for index, value in reversed(list(enumerate(node))))
+            continue
+        if not isinstance(node, dict) or pointer == "/components/schemas":
+            continue
+        if isinstance(node.get("schema"), dict):
+            yield from _iter_schema_tree(node["schema"], f"{pointer}/schema", tree)
+        for key, value in reversed(node.items()):
+            if key in ("schema", "example", "examples"):
+                continue
+            if isinstance(value, (dict, list)):
+                stack.append((value, f"{pointer}/{escape_pointer_token(key)}"))
+
+
+def _pascal(text):
+    """'end_type' -> 'EndType', '/honorary/{rut}/' -> 'HonoraryRut'"""
+    return "".join(word[:1].upper() + word[1:] for word in re.split(r"[^0-9A-Za-z]+", str(text)) if word)
+
+
+def _name_parts(document, pointer):
+    """
+    Partes del nombre de un schema según su posición, de afuera hacia adentro:
+    [(texto, nominal)]. Las partes nominales (propiedad, parámetro, header,
+    operación, component) pueden iniciar un nombre; las posicionales
+    (Item, Response200, ...) no.
+    """
+    tokens = [unescape_pointer_token(token) for token in pointer.split("/")[1:]]
+    parts = []
+    node = document
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        parent = node
+        node = node[int(token)] if isinstance(node, list) else node[token]
+        previous = tokens[index - 1] if index else None
+
+        if previous == "paths" and index == 1:
+            parts.append((_pascal(token), True))
+        elif previous is not None and index >= 2 and tokens[index - 2] == "paths" and token in HTTP_METHODS:
+            operation_id = node.get("operationId") if isinstance(node, dict) else None
+            if operation_id:
+                parts[-1:] = [(_pascal(operation_id), True)]
+            else:
+                parts[-1] = (parts[-1][0] + _pascal(token), True)
+        elif previous == "components" and index == 1:
+            pass
+        elif index == 2 and tokens[0] == "components":
+            parts.append((_pascal(token), True))
+        elif previous == "responses" and index >= 4 and tokens[index - 4] == "paths":
+            parts.append((f"Response{_pascal(token)}", False))
+        elif token == "requestBody" and previous in HTTP_METHODS:
+            parts.append(("Request", False))
+        elif previous == "parameters" and isinstance(node, dict) and isinstance(parent, list):
+            parts.append((_pascal(node.get("name", token)), True))
+        elif previous in ("headers", "properties") and isinstance(parent, dict):
+            parts.append((_pascal(token), True))
+        elif token in _POSITION_SUFFIX and previous not in ("properties", "headers"):
+            parts.append((_POSITION_SUFFIX[token], False))
+        elif previous in _SCHEMA_LISTS:
+            parts.append((f"{_pascal(previous)}{int(token) + 1}", False))
+        index += 1
+    return parts
+
+
+def schema_name(document, pointer, digest, taken):
+    """
+    Nombre estable para un schema: el sufijo más corto de sus partes que
+    empieza con una parte nominal y no está tomado; un sufijo con una sola
+    parte nominal se antepone con la operación o el component dueño
+    ('ListCessionsStatus', 'ScheduledDocumentEndType', ...). Si todos están
+    tomados, el nombre completo con los primeros 8 caracteres del hash.
+    """
+    parts = _name_parts(document, pointer) or [("Schema", True)]
+    owner = parts[0][0]
+    for start in range(len(parts) - 1, -1, -1):
+        if not parts[start][1]:
+            continue
+        name = "".join(text for text, _nominal in parts[start:])
+        if start > 0 and sum(nominal for _text, nominal in parts[start:]) < 2:
+            name = owner + name
+        if name not in taken:
+            return name
+    return "".join(text for text, _nominal in parts) + "_" + digest.hex()[:8]
+
+
+def _replace_pointers(document, replacements):
+    """Documento nuevo con cada pointer de `replacements` reemplazado (copy-on-write)"""
+    root = dict(document)
+    copies = {"": root}
+    for pointer, value in replacements.items():
+        tokens = pointer.split("/")[1:]
+        container = root
+        prefix = ""
+        for token in tokens[:-1]:
+            prefix = f"{prefix}/{token}"
+            key = int(token) if isinstance(container, list) else unescape_pointer_token(token)
+            child = copies.get(prefix)
+            if child is None:
+                child = container[key]
+                child = dict(child) if isinstance(child, dict) else list(child)
+                container[key] = child
+                copies[prefix] = child
+            container = child
+        last = tokens[-1]
+        container[int(last) if isinstance(container, list) else unescape_pointer_token(last)] = value
+    return root
+
+
+def _inside(pointer, moved):
+    """True si `pointer` es uno de los pointers de `moved` o está dentro de alguno"""
+    index = pointer.find("/", 1)
+    while index != -1:
+        if pointer[:index] in moved:
+            return True
+        index = pointer.find("/", index + 1)
+    return pointer in moved
+
+
+def _dedupe_round(document, min_bytes):
+    """Una pasada: retorna (documento nuevo, [HoistedSchema]) o (documento, []) si no hay nada que hacer"""
+    tree = MerkleTree(document, ordered=_ORDERED_KEYS)
+    schemas = document.get("components", {}).get("schemas", {})
+    existing = {}
+    for name, schema in schemas.items():
+        if isinstance(schema, dict):
+            existing.setdefault(tree.digest(schema), name)
+
+    # Apariciones en orden de documento
+    occurrences = defaultdict(list)
+    position = {}
+    for pointer, node, digest in iter_inline_schemas(document, tree):
+        occurrences[digest].append((pointer, node))
+        position[pointer] = len(position)
+
+    candidates = {}
+    for digest, nodes in occurrences.items():
+        if len(nodes) < 2 and digest not in existing:
+            continue
+        size = _canonical_size(nodes[0][1])
+        if size >= min_bytes:
+            candidates[digest] = size
+    if not candidates:
+        return document, []
+
+    # De mayor a menor: un schema anidado es más chico que el que lo contiene,
+    # así que al evaluarlo ya se sabe cuáles de sus apariciones se movieron
+    # junto con otro. Un candidato que no ahorra bytes no oculta a sus subesquemas
+    taken = set(schemas)
+    moved = set()
+    replacements = {}
+    new_schemas = {}
+    hoisted = []
+    for digest in sorted(candidates, key=lambda digest: -candidates[digest]):
+        nodes = [(pointer, node) for pointer, node in occurrences[digest] if not _inside(pointer, moved)]
+        if not nodes:
+            continue
+        pointers = [pointer for pointer, _node in nodes]
+        size = candidates[digest]
+        if digest in existing:
+            name = existing[digest]
+            saved = len(pointers) * (size - _ref_size(name))
+        else:
+            name = schema_name(document, pointers[0], digest, taken)
+            saved = len(pointers) * (size - _ref_size(name)) - size
+        if saved <= 0:
+            continue
+        if digest not in existing:
+            taken.add(name)
+            new_schemas[name] = dict(nodes[0][1])
+        moved.update(pointers)
+        for pointer in pointers:
+            replacements[pointer] = {"$ref": f"#/components/schemas/{escape_pointer_token(name)}"}
+        hoisted.append(HoistedSchema(name, size, pointers, digest in existing))
+
+    if not replacements:
+        return document, []
+    hoisted.sort(key=lambda schema: position[schema.pointers[0]])
+    deduped = _replace_pointers(document, replacements)
+    components = dict(deduped.get("components", {}))
+    components["schemas"] = dict(sorted({**components.get("schemas", {}), **new_schemas}.items()))
+    deduped["components"] = components
+    return deduped, hoisted
+
+
+def dedupe_inline_schemas(document, min_bytes=DEFAULT_MIN_BYTES):
+    """
+    Mover a components/schemas los schemas inline duplicados de al menos
+    `min_bytes` y reemplazar cada aparición por un $ref.
+    Retorna (documento nuevo, [HoistedSchema]); `document` no se modifica.
+    """
+    hoisted = []
+    while True:
+        document, found = _dedupe_round(document, min_bytes)
+        if not found:
+            return document, hoisted
+        hoisted.extend(found)
+
+
+def print_dedupe_report(hoisted):
+    """Imprimir los schemas movidos a components"""
+    for schema in hoisted:
+        origin = "existente" if schema.existing else "nuevo"
+        print(f"   - {schema.name} ({origin}): {len(schema.pointers)} apariciones de {schema.size} bytes")
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Diff semántico entre dos builds del documento combinado.
+
+Cada subárbol de ambos documentos se resume con un hash de Merkle (el hash
+de un objeto depende de los hashes de sus hijos, sin importar el orden de
+las claves). Dos subárboles con el mismo hash son idénticos y se saltan en
+O(1): el diff solo desciende por las ramas que cambiaron.
+
+Los cambios se agrupan por operación ("POST /documents/batch") y por schema
+de components, y se clasifican como:
+- agregado / eliminado (eliminar una operación o un schema es breaking)
+- breaking: parámetro requerido nuevo o eliminado, requestBody que pasa a
+  ser requerido, respuesta o media type eliminados, propiedad requerida
+  nueva, propiedad eliminada, valor de enum eliminado, cambio de tipo o de
+  $ref, nullable que deja de serlo
+- modificado: cualquier otro cambio (descripciones, ejemplos, propiedades
+  opcionales nuevas, ...)
+
+Cuando los $ref de dos schemas difieren, los $ref locales a
+components/schemas se resuelven antes de clasificar: un schema inline
+reemplazado por un $ref a un component idéntico (lo que produce
+--dedupe-schemas) no es un cambio breaking.
+
+La clasificación es conservadora: no distingue si un schema se usa en la
+petición o en la respuesta, así que un cambio que solo rompe en una
+dirección se reporta como breaking. Para los schemas con cambios breaking
+se indican las operaciones que los alcanzan (ver openapi_refs.RefGraph).
+
+Uso:
+    from openapi_diff import diff_documents, print_diff_report
+    report = diff_documents(old_document, new_document)
+    print_diff_report(report)
+"""
+
+import hashlib
+from collections import namedtuple
+
+from openapi_loader import escape_pointer_token, unescape_pointer_token
+from openapi_refs import HTTP_METHODS, RefGraph
+
+# Cambio detectado: sujeto ("POST /documents", "schema Document", "info"),
+# tipo ("added", "removed", "breaking", "changed"), pointer y mensaje
+Finding = namedtuple("Finding", ["subject", "kind", "pointer", "message"])
+
+# Resultado del diff: hallazgos en orden, operaciones afectadas por cada
+# schema con cambios breaking y cantidad de nodos comparados
+DiffReport = namedtuple("DiffReport", ["findings", "affected", "compared"])
+
+FINDING_KINDS = ("breaking", "removed", "added", "changed")
+
+# Subesquemas por los que desciende la comparación de schemas
+_SCHEMA_CHILDREN = ("items", "additionalProperties", "not")
+_SCHEMA_LISTS = ("allOf", "anyOf", "oneOf")
+
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+
+class MerkleTree:
+    """
+    Hash de cada subárbol (objetos y listas) de un documento, calculado sin
+    recursión. Los objetos que son el valor de una clave de `ordered` (por
+    ejemplo "properties") se hashean respetando el orden de sus claves.
+    """
+
+    def __init__(self, document, ordered=()):
+        self.document = document
+        self._hashes = {}
+        ordered_nodes = set()
+        stack = [(document, False)]
+        while stack:
+            node, ready = stack.pop()
+            if id(node) in self._hashes:
+                continue
+            children = node.values() if isinstance(node, dict) else node
+            if not ready:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children if isinstance(child, (dict, list)))
+                if ordered and isinstance(node, dict):
+                    ordered_nodes.update(id(node[key]) for key in ordered if isinstance(node.get(key), dict))
+                continue
+            # Los escalares entran en el hash del padre sin un hash propio
+            hashes = self._hashes
+            if isinstance(node, dict):
+                parts = [b"{"]
+                for key in (node if id(node) in ordered_nodes else sorted(node)):
+                    value = node[key]
+                    parts.append(key.encode("utf-8") + b"\0")
+                    parts.append(hashes[id(value)] if isinstance(value, (dict, list)) else _scalar_bytes(value))
+            else:
+                parts = [b"["]
+                for value in node:
+                    parts.append(hashes[id(value)] if isinstance(value, (dict, list)) else _scalar_bytes(value))
+            hashes[id(node)] = hashlib.blake2b(b"".join(parts), digest_size=16).digest()
+
+    def digest(self, node):
+        """Hash de un nodo (los escalares se hashean al vuelo)"""
+        if isinstance(node, (dict, list)):
+            return self._hashes[id(node)]
+        return hashlib.blake2b(_scalar_bytes(node), digest_size=16).digest()
+
+
+def _scalar_bytes(value):
+    """Representación de un escalar con su tipo y largo (sin ambigüedad frente a un hash de 16 bytes)"""
+    text = f"{type(value).__name__}:{value!r}".encode("utf-8")
+    return b"\1" + len(text).to_bytes(4, "big") + text
+
+
+def operation_name(owner):
+    """'/paths/~1documents/post' -> 'POST /documents'"""
+    _, _paths, path, method = owner.split("/")
+    return f"{method.upper()} {unescape_pointer_token(path)}"
+
+
+class _Differ:
+    def __init__(self, old, new):
+        self.old_tree = MerkleTree(old)
+        self.new_tree = MerkleTree(new)
+        self.findings = []
+        self.compared = 0
+        self._graphs = {}
+
+    def graph(self, side):
+        """RefGraph del documento viejo ("old") o nuevo ("new"), construido al primer uso"""
+        if side not in self._graphs:
+            tree = self.old_tree if side == "old" else self.new_tree
+            self._graphs[side] = RefGraph(tree.document)
+        return self._graphs[side]
+
+    def resolve_refs(self, old, new):
+        """
+        Si los $ref de dos schemas difieren, reemplazar cada $ref local a
+        components/schemas por su destino para comparar contenido y no nombres.
+        """
+        if not (isinstance(old, dict) and isinstance(new, dict)) or old.get("$ref") == new.get("$ref"):
+            return old, new
+        return self._ref_target("old", old), self._ref_target("new", new)
+
+    def _ref_target(self, side, node):
+        """Destino de una cadena de $ref a components/schemas (el nodo mismo si no resuelve)"""
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            ref = node["$ref"]
+            if not ref.startswith(SCHEMA_REF_PREFIX) or ref in seen:
+                break
+            seen.add(ref)
+            found, target = self.graph(side).resolve(ref)
+            if not found:
+                break
+            node = target
+        return node
+
+    def same(self, old, new):
+        self.compared += 1
+        return self.old_tree.digest(old) == self.new_tree.digest(new)
+
+    def add(self, subject, kind, pointer, message):
+        self.findings.append(Finding(subject, kind, pointer, message))
+
+    # --- Schemas -----------------------------------------------------------
+
+    def compare_schema(self, subject, old, new, pointer, generic=True):
+        """
+        Comparar dos schemas descendiendo solo por los subárboles que cambiaron.
+        Con generic=True, si ninguna regla aplica se registra un "modificado".
+        """
+        before = len(self.findings)
+        stack = [(old, new, pointer)]
+        # Pares ya comparados: los schemas recursivos resueltos no se recorren dos veces
+        visited = set()
+        while stack:
+            old_node, new_node, node_pointer = stack.pop()
+            old_node, new_node = self.resolve_refs(old_node, new_node)
+            if self.same(old_node, new_node):
+                continue
+            if not (isinstance(old_node, dict) and isinstance(new_node, dict)):
+                self.add(subject, "breaking", node_pointer, "schema reemplazado")
+                continue
+            if (id(old_node), id(new_node)) in visited:
+                continue
+            visited.add((id(old_node), id(new_node)))
+            stack.extend(reversed(self._schema_rules(subject, old_node, new_node, node_pointer)))
+
+        if generic and len(self.findings) == before:
+            self.add(subject, "changed", pointer, "modificado")
+
+    def _schema_rules(self, subject, old, new, pointer):
+        """Aplicar las reglas a un par de schemas; retorna los pares hijos a comparar"""
+        if old.get("$ref") != new.get("$ref"):
+            self.add(subject, "breaking", pointer, f"$ref cambió: {old.get('$ref')} -> {new.get('$ref')}")
+            return []
+        if old.get("type") != new.get("type"):
+            self.add(subject, "breaking", f"{pointer}/type", f"tipo cambió: {old.get('type')} -> {new.get('type')}")
+            return []
+        if old.get("nullable") is True and new.get("nullable") is not True:
+            self.add(subject, "breaking", f"{pointer}/nullable", "dejó de ser nullable")
+
+        old_required = set(old.get("required") or [])
+        new_required = set(new.get("required") or [])
+        for name in sorted(new_required - old_required):
+            self.add(subject, "breaking", f"{pointer}/required", f"nueva propiedad requerida '{name}'")
+        for name in sorted(old_required - new_required):
+            self.add(subject, "changed", f"{pointer}/required", f"'{name}' dejó de ser requerida")
+
+        if "enum" in old or "enum" in new:
+            old_enum = old.get("enum") or []
+            new_enum = new.get("enum") or []
+            removed = [value for value in old_enum if value not in new_enum]
+            added = [value for value in new_enum if value not in old_enum]
+            if removed:
+                self.add(subject, "breaking", f"{pointer}/enum", f"valores de enum eliminados: {removed}")
+            if added:
+                self.add(subject, "changed", f"{pointer}/enum", f"valores de enum agregados: {added}")
+
+        children = []
+        old_properties = old.get("properties") or {}
+        new_properties = new.get("properties") or {}
+        for name in old_properties:
+            property_pointer = f"{pointer}/properties/{escape_pointer_token(name)}"
+            if name not in new_properties:
+                self.add(subject, "breaking", property_pointer, f"propiedad eliminada '{name}'")
+            else:
+                children.append((old_properties[name], new_properties[name], property_pointer))
+        for name in new_properties:
+            if name not in old_properties and name not in new_required:
+                property_pointer = f"{pointer}/properties/{escape_pointer_token(name)}"
+                self.add(subject, "changed", property_pointer, f"propiedad opcional nueva '{name}'")
+
+        for keyword in _SCHEMA_CHILDREN:
+            if isinstance(old.get(keyword), dict) and isinstance(new.get(keyword), dict):
+                children.append((old[keyword], new[keyword], f"{pointer}/{keyword}"))
+            elif (keyword in old) != (keyword in new):
+                self.add(subject, "breaking" if keyword != "additionalProperties" else "changed",
+                         f"{pointer}/{keyword}", f"'{keyword}' {'agregado' if keyword in new else 'eliminado'}")
+
+        for keyword in _SCHEMA_LISTS:
+            old_list = old.get(keyword) or []
+            new_list = new.get(keyword) or []
+            if len(old_list) == len(new_list):
+                children.extend(
+                    (old_item, new_item, f"{pointer}/{keyword}/{index}")
+                    for index, (old_item, new_item) in enumerate(zip(old_list, new_list))
+                )
+            else:
+                self.add(subject, "breaking", f"{pointer}/{keyword}",
+                         f"{keyword} cambió de {len(old_list)} a {len(new_list)} alternativas")
+        return children
+
+    # --- Operaciones -------------------------------------------------------
+
+    def compare_operation(self, subject, old, new, old_path_item, new_path_item, pointer):
+        before = len(self.findings)
+
+        old_parameters = _parameters(old_path_item, old)
+        new_parameters = _parameters(new_path_item, new)
+        for key, parameter in old_parameters.items():
+            label = f"'{key[0]}' ({key[1]})"
+            parameter_pointer = f"{pointer}/parameters"
+            if key not in new_parameters:
+                self.add(subject, "breaking", parameter_pointer, f"parámetro eliminado {label}")
+                continue
+            updated = new_parameters[key]
+            if updated.get("required") is True and parameter.get("required") is not True:
+                self.add(subject, "breaking", parameter_pointer, f"el parámetro {label} pasó a ser requerido")
+            if isinstance(parameter.get("schema"), dict) and isinstance(updated.get("schema"), dict):
+                if not self.same(parameter["schema"], updated["schema"]):
+                    self.compare_schema(subject, parameter["schema"], updated["schema"], parameter_pointer, generic=False)
+        for key, parameter in new_parameters.items():
+            if key not in old_parameters:
+                label = f"'{key[0]}' ({key[1]})"
+                if parameter.get("required") is True:
+                    self.add(subject, "breaking", f"{pointer}/parameters", f"nuevo parámetro requerido {label}")
+                else:
+                    self.add(subject, "changed", f"{pointer}/parameters", f"nuevo parámetro opcional {label}")
+
+        old_body = old.get("requestBody")
+        new_body = new.get("requestBody")
+        body_pointer = f"{pointer}/requestBody"
+        if isinstance(old_body, dict) and isinstance(new_body, dict):
+            if new_body.get("required") is True and old_body.get("required") is not True:
+                self.add(subject, "breaking", body_pointer, "el requestBody pasó a ser requerido")
+            self.compare_content(subject, old_body, new_body, body_pointer)
+        elif new_body is not None and old_body is None:
+            kind = "breaking" if isinstance(new_body, dict) and new_body.get("required") is True else "changed"
+            self.add(subject, kind, body_pointer, "requestBody agregado")
+        elif old_body is not None and new_body is None:
+            self.add(subject, "breaking", body_pointer, "requestBody eliminado")
+
+        old_responses = old.get("responses") or {}
+        new_responses = new.get("responses") or {}
+        for status, response in old_responses.items():
+            response_pointer = f"{pointer}/responses/{escape_pointer_token(status)}"
+            if status not in new_responses:
+                self.add(subject, "breaking", response_pointer, f"respuesta {status} eliminada")
+            elif isinstance(response, dict) and isinstance(new_responses[status], dict):
+                if not self.same(response, new_responses[status]):
+                    self.compare_content(subject, response, new_responses[status], response_pointer)
+        for status in new_responses:
+            if status not in old_responses:
+                self.add(subject, "changed", f"{pointer}/responses/{escape_pointer_token(status)}",
+                         f"respuesta {status} agregada")
+
+        if len(self.findings) == before:
+            self.add(subject, "changed", pointer, "modificada")
+
+    def compare_content(self, subject, old, new, pointer):
+        """Comparar el content (media types y sus schemas) de un requestBody o una respuesta"""
+        old_content = old.get("content") or {}
+        new_content = new.get("content") or {}
+        for media_type, media in old_content.items():
+            media_pointer = f"{pointer}/content/{escape_pointer_token(media_type)}"
+            if media_type not in new_content:
+                self.add(subject, "breaking", media_pointer, f"media type eliminado {media_type}")
+                continue
+            old_schema = media.get("schema") if isinstance(media, dict) else None
+            new_schema = new_content[media_type].get("schema") if isinstance(new_content[media_type], dict) else None
+            if isinstance(old_schema, dict) and isinstance(new_schema, dict) and not self.same(old_schema, new_schema):
+                # Sin reglas que apliquen, el "modificada" lo reporta la operación
+                self.compare_schema(subject, old_schema, new_schema, f"{media_pointer}/schema", generic=False)
+
+
+def _parameters(path_item, operation):
+    """Parámetros efectivos de una operación: {(nombre, ubicación): parámetro}"""
+    parameters = {}
+    for source in (path_item.get("parameters") or [], operation.get("parameters") or []):
+        for parameter in source:
+            if isinstance(parameter, dict) and "name" in parameter and "in" in parameter:
+                parameters[(parameter["name"], parameter["in"])] = parameter
+    return parameters
+
+
+def diff_documents(old, new):
+    """
+    Comparar dos documentos combinados.
+    Retorna un DiffReport: hallazgos agrupados por operación y schema, y las
+    operaciones que alcanzan a cada schema con cambios breaking.
+    """
+    differ = _Differ(old, new)
+    if differ.same(old, new):
+        return DiffReport([], {}, differ.compared)
+
+    # Operaciones
+    old_paths = old.get("paths") or {}
+    new_paths = new.get("paths") or {}
+    if not differ.same(old_paths, new_paths):
+        for path in sorted(set(old_paths) | set(new_paths)):
+            old_item = old_paths.get(path) or {}
+            new_item = new_paths.get(path) or {}
+            if path in old_paths and path in new_paths and differ.same(old_item, new_item):
+                continue
+            path_pointer = f"/paths/{escape_pointer_token(path)}"
+            for method in sorted(HTTP_METHODS):
+                old_operation = old_item.get(method)
+                new_operation = new_item.get(method)
+                if old_operation is None and new_operation is None:
+                    continue
+                subject = f"{method.upper()} {path}"
+                pointer = f"{path_pointer}/{method}"
+                if old_operation is None:
+                    differ.add(subject, "added", pointer, "operación agregada")
+                elif new_operation is None:
+                    differ.add(subject, "removed", pointer, "operación eliminada")
+                elif not differ.same(old_operation, new_operation) or not differ.same(
+                    old_item.get("parameters") or [], new_item.get("parameters") or []
+                ):
+                    differ.compare_operation(subject, old_operation, new_operation, old_item, new_item, pointer)
+
+    # Schemas de components
+    old_schemas = (old.get("components") or {}).get("schemas") or {}
+    new_schemas = (new.get("components") or {}).get("schemas") or {}
+    if not differ.same(old_schemas, new_schemas):
+        for name in sorted(set(old_schemas) | set(new_schemas)):
+            subject = f"schema {name}"
+            pointer = f"/components/schemas/{escape_pointer_token(name)}"
+            if name not in old_schemas:
+                differ.add(subject, "added", pointer, "schema agregado")
+            elif name not in new_schemas:
+                differ.add(subject, "removed", pointer, "schema eliminado")
+            elif not differ.same(old_schemas[name], new_schemas[name]):
+                differ.compare_schema(subject, old_schemas[name], new_schemas[name], pointer)
+
+    # Resto del documento (info, servers, security, otras secciones de components)
+    for key in sorted(set(old) | set(new)):
+        if key in ("paths", "components"):
+            continue
+        if key not in old or key not in new or not differ.same(old[key], new[key]):
+            differ.add(key, "changed", f"/{escape_pointer_token(key)}", "modificado")
+    old_components = old.get("components") or {}
+    new_components = new.get("components") or {}
+    for section in sorted((set(old_components) | set(new_components)) - {"schemas"}):
+        if section not in old_components or section not in new_components or not differ.same(
+            old_components[section], new_components[section]
+        ):
+            differ.add(f"components.{section}", "changed", f"/components/{section}", "modificado")
+
+    # Operaciones que alcanzan cada schema con cambios breaking
+    affected = {}
+    broken = {finding.subject for finding in differ.findings if finding.subject.startswith("schema ")
+              and finding.kind in ("breaking", "removed")}
+    if broken:
+        graphs = [differ.graph("new"), differ.graph("old")]
+        for subject in sorted(broken):
+            owner = f"/components/schemas/{escape_pointer_token(subject[len('schema '):])}"
+            operations = set()
+            for graph in graphs:
+                operations |= graph.operations_reaching(owner)
+            affected[subject] = sorted(operation_name(operation) for operation in operations)
+
+    return DiffReport(differ.findings, affected, differ.compared)
+
+
+def has_breaking_changes(report):
+    """True si el diff contiene cambios breaking o eliminaciones"""
+    return any(finding.kind in ("breaking", "removed") for finding in report.findings)
+
+
+def print_diff_report(report, verbose=False):
+    """
+    Imprimir un reporte compacto: breaking y eliminados con detalle, y
+    agregados y modificados agrupados por sujeto (con verbose, en detalle).
+    """
+    if not report.findings:
+        print("✅ Sin cambios semánticos")
+        return
+
+    by_kind = {kind: [finding for finding in report.findings if finding.kind == kind] for kind in FINDING_KINDS}
+    breaking = by_kind["breaking"] + by_kind["removed"]
+    if breaking:
+        print(f"❌ Cambios breaking: {len(breaking)}")
+        for finding in breaking:
+            print(f"   {finding.subject}: {finding.message}")
+            if finding.kind == "breaking" and finding.pointer:
+                print(f"      en {finding.pointer}")
+        for subject, operations in report.affected.items():
+            if operations:
+                print(f"   ↳ {subject} afecta a: {', '.join(operations)}")
+
+    for kind, icon, label in (("added", "➕", "Agregados"), ("changed", "✏️ ", "Modificados")):
+        findings = by_kind[kind]
+        if not findings:
+            continue
+        subjects = list(dict.fromkeys(finding.subject for finding in findings))
+        print(f"{icon} {label}: {len(subjects)}")
+        if verbose:
+            for finding in findings:
+                print(f"   {finding.subject}: {finding.message} ({finding.pointer})")
+        else:
+            for subject in subjects:
+                print(f"   {subject}")
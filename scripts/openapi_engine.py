@@ -0,0 +1,892 @@
+#!/usr/bin/env python3
+"""
+Motor compartido para los archivos OpenAPI divididos.
+
+Reúne en un solo módulo lo que antes hacía cada script por su cuenta:
+- Reglas de corrección y validación aplicadas en un solo recorrido (apply_rules)
+- Etapa por archivo (leer, corregir, validar) con caché por contenido
+- SpecWorkspace: carga cada archivo fuente una sola vez y expone combinar
+  (con estrategias seleccionables), corregir, validar y analizar como
+  operaciones sobre ese árbol compartido
+
+Lo usan combine_openapi.py, validate_openapi_schemas.py y
+analyze_openapi_duplicates.py (y el combinador legado de la raíz).
+"""
+
+import hashlib
+import json
+import pickle
+import time
+import traceback
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from openapi_artifacts import atomic_write, write_if_changed
+from openapi_loader import format_duplicate, loads_with_positions
+from openapi_trace import NULL_TRACER, Tracer, new_rule_stats
+
+
+# Versión de los correctores y validadores. Incrementar cuando cambie su lógica
+# para invalidar las entradas de caché generadas con la versión anterior.
+FIXER_VERSION = "4"
+
+# Directorio por defecto del caché de archivos fuente ya procesados
+DEFAULT_CACHE_DIR = Path(".openapi-cache")
+
+
+# Reglas registradas, indexadas por la clave que las dispara:
+# {clave: [(nombre, función), ...]}. Cada regla recibe el valor asociado a esa
+# clave dentro de un objeto.
+# - Reglas de corrección: retornan el valor corregido, o None si no aplica.
+# - Reglas de validación: retornan un mensaje con "{path}" (ruta del valor),
+#   o None si no hay problema.
+FIX_RULES = defaultdict(list)
+CHECK_RULES = defaultdict(list)
+
+
+def fix_rule(key, name):
+    """Registrar una regla de corrección disparada por `key`"""
+
+    def register(func):
+        FIX_RULES[key].append((name, func))
+        return func
+
+    return register
+
+
+def check_rule(key, name):
+    """Registrar una regla de validación disparada por `key`"""
+
+    def register(func):
+        CHECK_RULES[key].append((name, func))
+        return func
+
+    return register
+
+
+@fix_rule("description", "description-object")
+def fix_duplicate_description(value):
+    """Corregir objetos 'description' con clave 'description' interna duplicada"""
+    if isinstance(value, dict) and "description" in value and "type" in value:
+        # Eliminar la clave "description" interna duplicada
+        return {k: v for k, v in value.items() if k != "description"}
+    return None
+
+
+@fix_rule("items", "items-type-conflict")
+def fix_type_conflict_in_items(value):
+    """
+    Corregir conflictos de 'type' en items de arrays.
+    Si items tiene 'type' y también properties.type, renombrar properties.type a 'state_type'
+    (para document_states).
+    """
+    if not (
+        isinstance(value, dict)
+        and "type" in value
+        and isinstance(value.get("properties"), dict)
+        and "type" in value["properties"]
+    ):
+        return None
+
+    new_name = "state_type"  # Por defecto para document_states
+
+    # Renombrar 'type' en properties conservando el orden
+    fixed_props = {}
+    for prop_key, prop_value in value["properties"].items():
+        if prop_key == "type":
+            fixed_props[new_name] = prop_value
+            # Actualizar descripción si existe (sin modificar el original)
+            if isinstance(prop_value, dict) and "description" in prop_value:
+                fixed_props[new_name] = {
+                    **prop_value,
+                    "description": "Tipo de estado del documento",
+                }
+        else:
+            fixed_props[prop_key] = prop_value
+    return {**value, "properties": fixed_props}
+
+
+@check_rule("description", "description-object")
+def check_description_object(value):
+    """Detectar objetos 'description' con clave 'description' interna"""
+    if isinstance(value, dict) and "description" in value:
+        return "Objeto 'description' con clave 'description' interna en {path}"
+    return None
+
+
+@check_rule("items", "items-type-conflict")
+def check_type_conflict_in_items(value):
+    """Detectar conflictos de 'type' en items (items.type y items.properties.type)"""
+    if (
+        isinstance(value, dict)
+        and "type" in value
+        and isinstance(value.get("properties"), dict)
+        and "type" in value["properties"]
+    ):
+        return "Conflicto de 'type' en {path}: items tiene 'type' y properties también tiene 'type'"
+    return None
+
+
+# Entrada del registro de cambios: qué regla se aplicó y en qué JSON pointer
+Change = namedtuple("Change", ["rule", "pointer"])
+
+
+def _frame_keys(frame):
+    """Claves desde la raíz hasta el nodo de un frame [nodo, padre, clave, copiado]"""
+    keys = []
+    while frame[1] is not None:
+        keys.append(frame[2])
+        frame = frame[1]
+    keys.reverse()
+    return keys
+
+
+def _frame_path(frame):
+    """
+    Construir la ruta legible ("a.b[0].c") de un nodo a partir de su frame.
+    Solo se llama cuando una regla reporta algo.
+    """
+    path = ""
+    for key in _frame_keys(frame):
+        if isinstance(key, int):
+            path = f"{path}[{key}]"
+        else:
+            path = f"{path}.{key}" if path else key
+    return path
+
+
+def _frame_pointer(frame):
+    """Construir el JSON pointer (RFC 6901) de un nodo a partir de su frame"""
+    return "".join(
+        "/" + str(key).replace("~", "~0").replace("/", "~1")
+        for key in _frame_keys(frame)
+    )
+
+
+def _own(frame):
+    """
+    Copy-on-write: copiar (una sola vez) el nodo del frame y los ancestros que
+    aún no se copiaron, enlazando cada copia en su padre. Los subárboles sin
+    cambios se comparten con el árbol original.
+    """
+    pending = []
+    while frame is not None and not frame[3]:
+        pending.append(frame)
+        frame = frame[1]
+
+    for frame in reversed(pending):
+        frame[0] = dict(frame[0]) if isinstance(frame[0], dict) else list(frame[0])
+        frame[3] = True
+        if frame[1] is not None:
+            frame[1][0][frame[2]] = frame[0]
+
+
+def _select_rules(registry, only):
+    """Subconjunto del registro con las reglas nombradas en `only` (None: todas)"""
+    if only is None:
+        return registry
+    selected = {}
+    for key, rules in registry.items():
+        rules = [(name, rule) for name, rule in rules if name in only]
+        if rules:
+            selected[key] = rules
+    return selected
+
+
+def _timed_rule(stats, name, rule, value):
+    """Llamar a una regla acumulando su tiempo y aciertos en `stats`"""
+    start = time.perf_counter_ns()
+    result = rule(value)
+    entry = stats["rules"][name]
+    entry[0] += 1
+    entry[1] += time.perf_counter_ns() - start
+    if result is not None:
+        entry[2] += 1
+    return result
+
+
+def apply_rules(data, fix=True, check=True, only=None, stats=None):
+    """
+    Aplicar todas las reglas registradas en un solo recorrido del árbol.
+
+    El recorrido es iterativo (pila explícita), por lo que soporta schemas de
+    cualquier profundidad sin alcanzar el límite de recursión de Python. Las
+    rutas de los nodos solo se construyen cuando una regla reporta algo.
+
+    `data` no se modifica: las correcciones copian solo los nodos en el camino
+    hacia el cambio (copy-on-write), así que sin cambios se retorna el mismo
+    objeto.
+
+    Con `only` (conjunto de nombres de reglas) se aplican solo esas reglas.
+    Con `stats` (ver openapi_trace.new_rule_stats) se acumulan los nodos
+    visitados y el tiempo, llamadas y aciertos de cada regla.
+
+    Retorna (data, issues, changes): el árbol corregido, la lista de problemas
+    (agrupados en el orden en que se registraron las reglas) y el registro de
+    cambios (lista de Change).
+    """
+    fix_rules = _select_rules(FIX_RULES, only) if fix else {}
+    check_rules = _select_rules(CHECK_RULES, only) if check else {}
+    issues_by_rule = defaultdict(list)
+    changes = []
+
+    # Cada frame es [nodo, frame_padre, clave, copiado]
+    root = [data, None, None, False]
+    stack = [root]
+    visited = 0
+    while stack:
+        frame = stack.pop()
+        visited += 1
+        node = frame[0]
+        children = []
+
+        if isinstance(node, dict):
+            for key in node:
+                value = node[key]
+                owned = False
+                if key in fix_rules:
+                    for name, rule in fix_rules[key]:
+                        if stats is None:
+                            fixed = rule(value)
+                        else:
+                            fixed = _timed_rule(stats, name, rule, value)
+                        if fixed is not None:
+                            _own(frame)
+                            frame[0][key] = value = fixed
+                            owned = True
+                            changes.append(Change(name, _frame_pointer([value, frame, key, owned])))
+                if key in check_rules:
+                    for name, rule in check_rules[key]:
+                        if stats is None:
+                            message = rule(value)
+                        else:
+                            message = _timed_rule(stats, name, rule, value)
+                        if message is not None:
+                            path = _frame_path([value, frame, key, owned])
+                            issues_by_rule[name].append(message.format(path=path))
+                if isinstance(value, (dict, list)):
+                    children.append([value, frame, key, owned])
+        else:
+            for index, value in enumerate(node):
+                if isinstance(value, (dict, list)):
+                    children.append([value, frame, index, False])
+
+        # Apilar en orden inverso para recorrer en preorden (orden del documento)
+        children.reverse()
+        stack.extend(children)
+
+    if stats is not None:
+        stats["nodes"] += visited
+
+    issues = []
+    for rules in check_rules.values():
+        for name, _rule in rules:
+            issues.extend(issues_by_rule.pop(name, []))
+    return root[0], issues, changes
+
+
+def validate_and_fix_duplicate_keys(data, file_path=None):
+    """
+    Corregir automáticamente problemas que YAML no permite pero JSON sí:
+    - Objetos 'description' con clave 'description' interna
+    - Conflictos de 'type' en items vs properties
+    Retorna el árbol corregido; `data` no se modifica.
+    """
+    fixed_data, _issues, _changes = apply_rules(data, check=False)
+    return fixed_data
+
+
+def find_structure_issues(data):
+    """
+    Detectar problemas comunes de estructura OpenAPI.
+    Retorna la lista de problemas encontrados (vacía si está válido).
+    """
+    _data, issues, _changes = apply_rules(data, fix=False)
+    return issues
+
+
+def print_changes(changes, file_path=None):
+    """Imprimir el registro de correcciones aplicadas"""
+    file_info = f" en {file_path}" if file_path else ""
+    print(f"🔧 {len(changes)} correcciones aplicadas{file_info}:")
+    for change in changes:
+        print(f"   - {change.rule}: {change.pointer or '/'}")
+
+
+def print_structure_issues(issues, file_path=None):
+    """Imprimir los primeros problemas de estructura detectados"""
+    file_info = f" en {file_path}" if file_path else ""
+    print(f"⚠️  Problemas detectados{file_info}:")
+    for issue in issues[:5]:
+        print(f"   - {issue}")
+    if len(issues) > 5:
+        print(f"   ... y {len(issues) - 5} más")
+
+
+def print_duplicates(duplicates, file_path=None):
+    """Imprimir las primeras claves duplicadas detectadas por el cargador"""
+    file_info = f" en {file_path}" if file_path else ""
+    print(f"⚠️  Advertencia: Se encontraron claves duplicadas{file_info}:")
+    for duplicate in duplicates[:5]:
+        print(f"   - {format_duplicate(duplicate)}")
+    if len(duplicates) > 5:
+        print(f"   ... y {len(duplicates) - 5} más")
+
+
+def validate_openapi_structure(data, file_path=None):
+    """
+    Validar estructura OpenAPI y detectar problemas comunes.
+    Retorna True si está válido, False si hay problemas.
+    """
+    issues = find_structure_issues(data)
+
+    if issues:
+        print_structure_issues(issues, file_path)
+        return False
+
+    return True
+
+
+def source_cache_key(raw, record_spans=False):
+    """
+    Clave de caché de un archivo fuente: hash del contenido más la versión
+    de los correctores, para que un cambio de lógica invalide el caché.
+    Las entradas con extensiones de objetos (record_spans) se guardan aparte.
+    """
+    digest = hashlib.sha256()
+    variant = "spans" if record_spans else "tree"
+    digest.update(f"combine-openapi:{FIXER_VERSION}:{variant}\0".encode("utf-8"))
+    digest.update(raw)
+    return digest.hexdigest()
+
+
+def read_cache_entry(cache_dir, key):
+    """Leer una entrada del caché. Retorna None si no existe o está corrupta."""
+    if cache_dir is None:
+        return None
+    entry_path = Path(cache_dir) / f"{key}.pickle"
+    try:
+        with open(entry_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Entrada corrupta o de otra versión de Python: se recalcula
+        return None
+
+
+def write_cache_entry(cache_dir, key, entry):
+    """Guardar una entrada del caché de forma atómica (archivo temporal + rename)"""
+    if cache_dir is None:
+        return
+    try:
+        data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        atomic_write(Path(cache_dir) / f"{key}.pickle", data)
+    except OSError as e:
+        # El caché es una optimización: un error aquí no debe romper el build
+        print(f"⚠️  No se pudo escribir el caché ({e})")
+
+
+def prune_cache(cache_dir, keep_keys):
+    """Eliminar del caché las entradas que no se usaron en esta ejecución"""
+    if cache_dir is None or not Path(cache_dir).is_dir():
+        return
+    for entry_path in Path(cache_dir).glob("*.pickle"):
+        if entry_path.stem not in keep_keys:
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+
+
+def _process_source_text(text, record_spans=False, tracer=NULL_TRACER):
+    """Parsear, corregir y validar el texto de un archivo fuente (sin caché)"""
+    # Parsear registrando las claves duplicadas que json.loads descartaría
+    with tracer.span("parsear", "etapa"):
+        loaded = loads_with_positions(text, record_spans)
+
+    # Corregir y validar en un solo recorrido
+    stats = new_rule_stats() if tracer.enabled else None
+    with tracer.span("reglas", "etapa") as span_args:
+        start = time.perf_counter_ns()
+        data, issues, changes = apply_rules(loaded.data, stats=stats)
+        span_args.update(correcciones=len(changes), problemas=len(issues))
+    tracer.add_rule_stats(stats, start)
+    tracer.count("correcciones aplicadas", len(changes))
+
+    return {
+        "data": data,
+        "issues": issues,
+        "duplicates": loaded.duplicates,
+        "changes": changes,
+        "source_map": loaded.source_map,
+    }
+
+
+def load_source_file(file_path, cache_dir=None, write_fixes=True, record_spans=False, tracer=None):
+    """
+    Leer, corregir y validar un archivo fuente OpenAPI.
+
+    Si el contenido del archivo (y la versión de los correctores) no cambió
+    desde la última ejecución, reutiliza el árbol ya corregido y validado
+    guardado en el caché en lugar de volver a parsearlo.
+
+    Con write_fixes=True las correcciones se guardan en el archivo; si no, solo
+    se aplican al árbol en memoria y se vuelven a reportar en cada ejecución.
+
+    Retorna un dict con:
+    - 'data': árbol JSON corregido
+    - 'issues': problemas de estructura detectados
+    - 'duplicates': claves repetidas en un mismo objeto (DuplicateKey)
+    - 'changes': correcciones que las reglas aplicaron al contenido leído
+    - 'source_map': posiciones de cada nodo en el texto leído (SourceMap)
+    - 'key': clave de caché del contenido final en disco
+    - 'sha256': hash del contenido final en disco (para el manifiesto del build)
+    - 'cached': True si se obtuvo del caché
+
+    Con `tracer` (ver openapi_trace.py) se registra un span por archivo y
+    por etapa (leer, caché, parsear, reglas, serializar).
+    """
+    tracer = tracer or NULL_TRACER
+    with tracer.span(str(file_path), "archivo") as file_args:
+        with tracer.span("leer", "etapa"):
+            with open(file_path, "rb") as f:
+                raw = f.read()
+
+        key = source_cache_key(raw, record_spans)
+        with tracer.span("caché", "etapa"):
+            entry = read_cache_entry(cache_dir, key)
+        cached = entry is not None
+        if not cached:
+            entry = _process_source_text(raw.decode("utf-8"), record_spans, tracer)
+            write_cache_entry(cache_dir, key, entry)
+        tracer.count("archivos desde caché" if cached else "archivos parseados")
+
+        # Solo se vuelve a serializar si alguna regla corrigió algo
+        changes = entry["changes"]
+        if write_fixes and changes:
+            with tracer.span("serializar", "etapa"):
+                fixed_text = json.dumps(entry["data"], indent=2, ensure_ascii=False)
+                fixed_raw = fixed_text.encode("utf-8")
+                write_if_changed(file_path, fixed_raw)
+            raw = fixed_raw
+            # El caché se indexa por el contenido que quedó en disco
+            entry = _process_source_text(fixed_text, record_spans, tracer)
+            key = source_cache_key(fixed_raw, record_spans)
+            write_cache_entry(cache_dir, key, entry)
+            entry["changes"] = changes
+        file_args.update(bytes=len(raw), cache=cached)
+
+    entry["key"] = key
+    entry["sha256"] = hashlib.sha256(raw).hexdigest()
+    entry["cached"] = cached
+    return entry
+
+
+def _source_stage_job(job):
+    """
+    Ejecutar load_source_file para un archivo, capturando errores.
+    Retorna (resultado, None, tracer) o (None, (error, traceback), tracer) para
+    que un fallo en un proceso del pool se reporte igual que en la ejecución
+    serial; tracer es None salvo con la opción "trace".
+    """
+    file_path, options = job
+    options = dict(options)
+    tracer = Tracer() if options.pop("trace", False) else None
+    try:
+        return load_source_file(file_path, tracer=tracer, **options), None, tracer
+    except Exception as e:
+        return None, (e, traceback.format_exc()), tracer
+
+
+def run_source_stage(
+    files, cache_dir=None, jobs=1, write_fixes=True, record_spans=False, tracer=None
+):
+    """
+    Ejecutar la etapa por archivo (leer, corregir, validar) para todos los archivos.
+
+    Cada archivo es independiente, así que con jobs > 1 la etapa corre en un
+    pool de procesos. Los resultados se retornan siempre en el orden de `files`,
+    de modo que la combinación posterior es idéntica a la de una ejecución serial.
+    Con `tracer`, los spans de cada archivo (también los de otros procesos) se
+    incorporan a él.
+    """
+    options = {
+        "cache_dir": cache_dir,
+        "write_fixes": write_fixes,
+        "record_spans": record_spans,
+        "trace": tracer is not None and tracer.enabled,
+    }
+    job_list = [(file_path, options) for file_path in files]
+    if jobs <= 1 or len(job_list) <= 1:
+        outcomes = [_source_stage_job(job) for job in job_list]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(job_list))) as pool:
+            outcomes = list(pool.map(_source_stage_job, job_list))
+
+    results = []
+    for result, error, job_tracer in outcomes:
+        if job_tracer is not None:
+            tracer.merge(job_tracer)
+        results.append((result, error))
+    return results
+
+
+# Directorio de los archivos fuente y archivo combinado por defecto
+DEFAULT_BASE_DIR = Path("api-reference/openapi")
+DEFAULT_OUTPUT = Path("api-reference/openapi-combined.json")
+DEFAULT_BUILD_MANIFEST = Path("api-reference/openapi-build-manifest.json")
+
+# Archivo base (info, servers, security), relativo a DEFAULT_BASE_DIR
+BASE_FILE = Path("base") / "base-complete.json"
+
+# Archivos a combinar (solo paths y schemas, no base), en orden de combinación
+SOURCE_MANIFEST = [
+    # Documents
+    Path("documents") / "list.json",
+    Path("documents") / "batch.json",
+    Path("documents") / "get.json",
+    # Credentials
+    Path("credentials") / "list.json",
+    Path("credentials") / "create.json",
+    Path("credentials") / "batch.json",
+    Path("credentials") / "unenroll.json",
+    # Master entities
+    Path("master-entities") / "master-entities.json",
+    # Scheduled documents
+    Path("scheduled-documents") / "scheduled-documents-list.json",
+    Path("scheduled-documents") / "scheduled-documents-create.json",
+    Path("scheduled-documents") / "scheduled-documents-get.json",
+    Path("scheduled-documents") / "scheduled-documents-update.json",
+    Path("scheduled-documents") / "scheduled-documents-delete.json",
+    Path("scheduled-documents") / "scheduled-documents-preview.json",
+    # Document states
+    Path("document-states") / "document-states.json",
+    # Cessions
+    Path("cessions") / "list.json",
+    Path("cessions") / "get.json",
+    Path("cessions") / "batch.json",
+    Path("cessions") / "batch-status.json",
+    # Webhooks
+    Path("webhooks") / "webhooks.json",
+    # Honorary
+    Path("honorary") / "authorized-users.json",
+    # Book summaries
+    Path("book-summaries") / "list.json",
+    # Sync (estado de sincronización + solicitudes a demanda)
+    Path("sync") / "status.json",
+    Path("sync") / "requests-create.json",
+    Path("sync") / "requests-list.json",
+    Path("sync") / "requests-get.json",
+    # Schemas
+    Path("schemas") / "schemas.json",
+]
+
+
+def normalize_path(path):
+    """
+    Remover /v1 del path (el servidor base ya lo tiene) y asegurar que
+    empiece con "/": "/v1/documents" -> "/documents".
+    """
+    if path.startswith("/v1/"):
+        return "/" + path[4:]
+    if path.startswith("/v1"):
+        return "/" + path[3:]
+    if not path.startswith("/"):
+        return "/" + path
+    return path
+
+
+def merge_methods_replace(target, methods):
+    """Estrategia 'replace': cada método reemplaza al existente con el mismo nombre"""
+    target.update(methods)
+
+
+def merge_methods_deep(target, methods):
+    """
+    Estrategia 'deep': si el método ya existe, fusiona su requestBody
+    (conserva ejemplos y schemas de ambos archivos) y actualiza el resto de
+    los campos. Copia los objetos que modifica, sin tocar los árboles fuente.
+    """
+    for method_name, method_data in methods.items():
+        if method_name not in target:
+            target[method_name] = method_data
+            continue
+
+        existing = dict(target[method_name])
+        target[method_name] = existing
+        if "requestBody" in method_data and "requestBody" in existing:
+            existing_rb = dict(existing["requestBody"])
+            existing["requestBody"] = existing_rb
+            new_rb = method_data["requestBody"]
+            if "content" in new_rb and "content" in existing_rb:
+                content = dict(existing_rb["content"])
+                existing_rb["content"] = content
+                for content_type, content_data in new_rb["content"].items():
+                    if content_type not in content:
+                        content[content_type] = content_data
+                        continue
+                    merged = dict(content[content_type])
+                    # Preservar ejemplo si existe en el nuevo
+                    if "example" in content_data:
+                        merged["example"] = content_data["example"]
+                    # Preservar schema si no existe
+                    if "schema" not in merged and "schema" in content_data:
+                        merged["schema"] = content_data["schema"]
+                    content[content_type] = merged
+            elif "content" in new_rb:
+                existing_rb["content"] = new_rb["content"]
+        elif "requestBody" in method_data:
+            existing["requestBody"] = method_data["requestBody"]
+        # Actualizar otros campos
+        existing.update({k: v for k, v in method_data.items() if k != "requestBody"})
+
+
+MERGE_STRATEGIES = {
+    "replace": merge_methods_replace,
+    "deep": merge_methods_deep,
+}
+
+
+def merge_sources(base, sources, strategy="replace"):
+    """
+    Combinar los árboles fuente (en orden) sobre el documento base.
+    Retorna un documento nuevo: ni `base` ni las fuentes se modifican.
+    """
+    merge_methods = MERGE_STRATEGIES[strategy]
+
+    combined = dict(base)
+    combined["paths"] = {
+        path: dict(methods) for path, methods in base.get("paths", {}).items()
+    }
+    if "components" in base:
+        combined["components"] = {
+            section: dict(entries) if isinstance(entries, dict) else entries
+            for section, entries in base["components"].items()
+        }
+
+    for data in sources:
+        # Combinar paths (combinar métodos si el path ya existe)
+        for path, methods in data.get("paths", {}).items():
+            target = combined["paths"].setdefault(normalize_path(path), {})
+            merge_methods(target, methods)
+
+        # Combinar components
+        for section in ("schemas", "securitySchemes"):
+            if section in data.get("components", {}):
+                components = combined.setdefault("components", {})
+                components.setdefault(section, {}).update(data["components"][section])
+
+    return combined
+
+
+# Orden canónico (el del documento de la especificación OpenAPI); las claves
+# que no aparecen aquí van después, en orden alfabético
+TOP_LEVEL_ORDER = [
+    "openapi", "info", "jsonSchemaDialect", "servers", "security", "tags",
+    "paths", "webhooks", "components", "externalDocs",
+]
+PATH_ITEM_ORDER = [
+    "$ref", "summary", "description", "servers", "parameters",
+    "get", "put", "post", "patch", "delete", "options", "head", "trace",
+]
+COMPONENTS_ORDER = [
+    "schemas", "responses", "parameters", "examples", "requestBodies",
+    "headers", "securitySchemes", "links", "callbacks", "pathItems",
+]
+
+
+def _ordered(mapping, order):
+    rank = {key: index for index, key in enumerate(order)}
+    return {
+        key: mapping[key]
+        for key in sorted(mapping, key=lambda key: (rank.get(key, len(order)), key))
+    }
+
+
+def canonicalize(document):
+    """
+    Orden determinista del documento combinado, independiente del orden del
+    manifiesto: claves de primer nivel, paths, métodos y entradas de
+    components. El interior de operaciones y schemas no se reordena (el
+    orden de las propiedades es el que muestra la documentación).
+    Retorna un documento nuevo.
+    """
+    canonical = _ordered(document, TOP_LEVEL_ORDER)
+    if isinstance(canonical.get("paths"), dict):
+        canonical["paths"] = {
+            path: _ordered(item, PATH_ITEM_ORDER) if isinstance(item, dict) else item
+            for path, item in sorted(canonical["paths"].items())
+        }
+    if isinstance(canonical.get("components"), dict):
+        components = _ordered(canonical["components"], COMPONENTS_ORDER)
+        canonical["components"] = {
+            section: dict(sorted(entries.items())) if isinstance(entries, dict) else entries
+            for section, entries in components.items()
+        }
+    return canonical
+
+
+class SpecWorkspace:
+    """
+    Árbol compartido de los archivos fuente OpenAPI.
+
+    Carga cada archivo una sola vez (o lo toma del caché) con la etapa por
+    archivo, que corrige y valida en el mismo recorrido, y expone sobre ese
+    árbol las operaciones que antes cada script hacía por su cuenta:
+    - fix(): correcciones aplicadas por archivo
+    - validate(): problemas de estructura por archivo
+    - analyze(): claves duplicadas por archivo
+    - merge() / build(): documento combinado con la estrategia elegida
+
+    Uso:
+        workspace = SpecWorkspace(cache_dir=DEFAULT_CACHE_DIR)
+        workspace.load()
+        combined, issues, changes = workspace.build(strategy="replace")
+    """
+
+    def __init__(
+        self,
+        base_dir=DEFAULT_BASE_DIR,
+        manifest=None,
+        cache_dir=None,
+        jobs=1,
+        write_fixes=True,
+        record_spans=False,
+        tracer=None,
+    ):
+        self.base_dir = Path(base_dir)
+        self.base_file = self.base_dir / BASE_FILE
+        self.files = [
+            self.base_dir / relative
+            for relative in (SOURCE_MANIFEST if manifest is None else manifest)
+        ]
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self.write_fixes = write_fixes
+        self.record_spans = record_spans
+        self.tracer = tracer or NULL_TRACER
+        self.sources = {}  # Path -> resultado de load_source_file
+        self.errors = {}  # Path -> (excepción, traceback)
+        self.missing = set()
+
+    @property
+    def all_files(self):
+        """Archivo base seguido de los archivos del manifiesto"""
+        return [self.base_file] + self.files
+
+    def load(self, files=None):
+        """
+        Cargar (o recargar) archivos fuente. Sin argumentos carga la base y
+        todo el manifiesto; con `files` recarga solo esos archivos.
+        Retorna True si ningún archivo falló al parsearse.
+        """
+        targets = self.all_files if files is None else [Path(f) for f in files]
+
+        present = []
+        for file_path in targets:
+            if file_path.exists():
+                present.append(file_path)
+                self.missing.discard(file_path)
+            else:
+                self.missing.add(file_path)
+                self.sources.pop(file_path, None)
+                self.errors.pop(file_path, None)
+
+        with self.tracer.span("cargar", archivos=len(present)):
+            results = run_source_stage(
+                present,
+                self.cache_dir,
+                self.jobs,
+                write_fixes=self.write_fixes,
+                record_spans=self.record_spans,
+                tracer=self.tracer,
+            )
+        for file_path, (source, error) in zip(present, results):
+            if error is None:
+                self.sources[file_path] = source
+                self.errors.pop(file_path, None)
+            else:
+                self.errors[file_path] = error
+                self.sources.pop(file_path, None)
+
+        return not self.errors
+
+    @property
+    def source_hashes(self):
+        """{ruta: sha256} del contenido en disco de los archivos cargados, en orden"""
+        return {file_path: source["sha256"] for file_path, source in self.loaded_in_order()}
+
+    @property
+    def cache_keys(self):
+        """Claves de caché de los archivos cargados"""
+        return {source["key"] for source in self.sources.values()}
+
+    def loaded_in_order(self):
+        """Lista de (ruta, resultado) de los archivos cargados, en orden del manifiesto"""
+        return [
+            (file_path, self.sources[file_path])
+            for file_path in self.all_files
+            if file_path in self.sources
+        ]
+
+    def fix(self):
+        """Correcciones aplicadas por archivo: {Path: [Change]} (solo archivos con cambios)"""
+        return {
+            file_path: source["changes"]
+            for file_path, source in self.loaded_in_order()
+            if source["changes"]
+        }
+
+    def validate(self):
+        """Problemas de estructura por archivo: {Path: [mensaje]} (solo archivos con problemas)"""
+        return {
+            file_path: source["issues"]
+            for file_path, source in self.loaded_in_order()
+            if source["issues"]
+        }
+
+    def analyze(self):
+        """Claves duplicadas por archivo: {Path: [DuplicateKey]} (solo archivos con duplicados)"""
+        return {
+            file_path: source["duplicates"]
+            for file_path, source in self.loaded_in_order()
+            if source["duplicates"]
+        }
+
+    def merge(self, strategy="replace"):
+        """
+        Combinar la base y los archivos del manifiesto (en orden) con la
+        estrategia indicada (ver MERGE_STRATEGIES). Retorna un documento nuevo.
+        """
+        if self.base_file not in self.sources:
+            raise FileNotFoundError(f"Archivo base no cargado: {self.base_file}")
+        sources = [
+            self.sources[file_path]["data"]
+            for file_path in self.files
+            if file_path in self.sources
+        ]
+        return merge_sources(self.sources[self.base_file]["data"], sources, strategy)
+
+    def build(self, strategy="replace"):
+        """
+        Combinar, pasar las reglas sobre el documento final y dejarlo en
+        orden canónico (ver canonicalize).
+        Retorna (combined, issues, changes).
+        """
+        tracer = self.tracer
+        with tracer.span("combinar", estrategia=strategy):
+            merged = self.merge(strategy)
+
+        # Validación final del documento combinado
+        stats = new_rule_stats() if tracer.enabled else None
+        with tracer.span("reglas (combinado)") as span_args:
+            start = time.perf_counter_ns()
+            combined, issues, changes = apply_rules(merged, stats=stats)
+            span_args.update(correcciones=len(changes), problemas=len(issues))
+        tracer.add_rule_stats(stats, start)
+        tracer.count("correcciones aplicadas", len(changes))
+
+        with tracer.span("canonicalizar"):
+            return canonicalize(combined), issues, changes
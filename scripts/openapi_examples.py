@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Validación de los ejemplos de la especificación contra sus schemas.
+
+Cada schema se compila una sola vez a una función de validación,
+memoizada por el hash de su subárbol: schemas idénticos (aunque estén
+repetidos en varios lugares del documento) comparten la misma función, y
+las referencias ($ref) se compilan una vez por destino, de forma perezosa
+para soportar schemas recursivos.
+
+Se validan:
+- `example` y `examples` de media types, parámetros y headers
+- `example` de cualquier schema (componentes, propiedades, items, ...)
+
+Los errores se reportan con el JSON pointer del ejemplo en el documento y
+el pointer del valor dentro del ejemplo. Con caché, un ejemplo cuyo schema
+(incluidos los schemas que alcanza por $ref) y cuyo valor no cambiaron no
+se vuelve a validar.
+
+Subconjunto de OpenAPI 3.0 soportado: type (+ nullable), enum, properties,
+required, additionalProperties, items, minItems/maxItems, allOf/anyOf/oneOf,
+minimum/maximum (+ exclusive), minLength/maxLength, pattern y los formatos
+date y date-time. Las demás palabras clave se ignoran.
+
+Uso:
+    from openapi_examples import validate_examples
+    mismatches, stats = validate_examples(combined, jobs=4, cache_dir=Path(".openapi-cache"))
+"""
+
+import hashlib
+import json
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+from openapi_artifacts import write_if_changed
+from openapi_loader import escape_pointer_token, resolve_pointer
+from openapi_refs import ref_pointer
+
+# Incrementar cuando cambie la lógica de validación para invalidar el caché
+EXAMPLES_VERSION = "1"
+EXAMPLES_CACHE_FILE = "examples.json"
+
+# Ejemplo a validar: pointer del ejemplo en el documento, schema y valor
+ExampleCase = namedtuple("ExampleCase", ["pointer", "schema", "value"])
+
+# Ejemplo que no coincide con su schema: pointer del ejemplo, pointer dentro
+# del valor y mensaje
+Mismatch = namedtuple("Mismatch", ["pointer", "path", "message"])
+
+# Subesquemas que pueden tener su propio `example`
+_SCHEMA_MAPS = ("properties",)
+_SCHEMA_LISTS = ("allOf", "anyOf", "oneOf")
+_SCHEMA_VALUES = ("items", "additionalProperties", "not")
+
+
+def _digest(value):
+    """Hash estable de un valor JSON (claves ordenadas)"""
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _type_name(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def _matches_type(value, expected):
+    actual = _type_name(value)
+    if expected == "number":
+        return actual in ("integer", "number")
+    if expected == "integer" and actual == "number":
+        return value.is_integer()
+    return actual == expected
+
+
+def _valid_date_time(value):
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00").replace("z", "+00:00"))
+        return "T" in value or "t" in value
+    except ValueError:
+        return False
+
+
+def _valid_date(value):
+    try:
+        date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+_FORMATS = {"date-time": _valid_date_time, "date": _valid_date}
+
+
+def _accept(value, path, errors):
+    pass
+
+
+class SchemaCompiler:
+    """
+    Compila schemas de un documento a funciones validate(valor, path, errores)
+    que agregan (path, mensaje) a `errores` por cada discrepancia.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self._by_hash = {}
+        self._by_ref = {}
+        self._ref_digests = {}
+
+    def compile(self, schema):
+        """Función de validación para `schema` (memoizada por el hash del subárbol)"""
+        if not isinstance(schema, dict):
+            return _accept
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            return self._compile_ref(ref)
+        key = _digest(schema)
+        validator = self._by_hash.get(key)
+        if validator is None:
+            validator = self._by_hash[key] = self._build(schema)
+        return validator
+
+    @property
+    def compiled(self):
+        """Cantidad de schemas distintos compilados"""
+        return len(self._by_hash)
+
+    def _compile_ref(self, ref):
+        validator = self._by_ref.get(ref)
+        if validator is not None:
+            return validator
+
+        # Se registra antes de compilar el destino: un schema recursivo
+        # encuentra esta función en lugar de compilarse otra vez
+        target = []
+
+        def validate_ref(value, path, errors):
+            target[0](value, path, errors)
+
+        self._by_ref[ref] = validate_ref
+        found, node = self._resolve(ref)
+        if found:
+            target.append(self.compile(node))
+        else:
+            target.append(lambda value, path, errors: errors.append((path, f"referencia no resuelta: {ref}")))
+        return validate_ref
+
+    def _resolve(self, ref):
+        pointer = ref_pointer(ref)
+        if pointer is None:
+            return False, None
+        try:
+            return True, resolve_pointer(self.document, pointer)
+        except (KeyError, IndexError, ValueError, TypeError):
+            return False, None
+
+    def schema_digest(self, schema):
+        """
+        Hash de `schema` y de todos los schemas que alcanza por $ref: cambia
+        si cambia cualquiera de ellos (clave del caché de resultados).
+        """
+        digest = hashlib.sha256(_digest(schema).encode("ascii"))
+        seen = set()
+        pending = sorted(self._refs_in(schema))
+        while pending:
+            ref = pending.pop()
+            if ref in seen:
+                continue
+            seen.add(ref)
+            if ref not in self._ref_digests:
+                found, node = self._resolve(ref)
+                self._ref_digests[ref] = (_digest(node) if found else None, self._refs_in(node))
+            node_digest, refs = self._ref_digests[ref]
+            digest.update(f"\0{ref}\0{node_digest}".encode("utf-8"))
+            pending.extend(sorted(refs - seen))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _refs_in(node):
+        refs = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get("$ref")
+                if isinstance(ref, str):
+                    refs.add(ref)
+                stack.extend(value for value in current.values() if isinstance(value, (dict, list)))
+            elif isinstance(current, list):
+                stack.extend(value for value in current if isinstance(value, (dict, list)))
+        return refs
+
+    def _build(self, schema):
+        """Armar la función de validación de un schema (sin $ref en la raíz)"""
+        checks = []
+
+        expected = schema.get("type")
+        nullable = schema.get("nullable") is True
+
+        if "enum" in schema:
+            allowed = schema["enum"]
+
+            def check_enum(value, path, errors):
+                if value not in allowed:
+                    errors.append((path, f"{json.dumps(value, ensure_ascii=False)} no está en enum {allowed}"))
+
+            checks.append(check_enum)
+
+        properties = {
+            name: self.compile(subschema)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+        required = [name for name in schema.get("required", []) if isinstance(name, str)]
+        additional = schema.get("additionalProperties", True)
+        if properties or required or additional is not True:
+            extra = None if additional is False else self.compile(additional) if isinstance(additional, dict) else _accept
+
+            def check_object(value, path, errors):
+                if not isinstance(value, dict):
+                    return
+                for name in required:
+                    if name not in value:
+                        errors.append((path, f"falta la propiedad requerida '{name}'"))
+                for name, item in value.items():
+                    child = f"{path}/{escape_pointer_token(name)}"
+                    validator = properties.get(name)
+                    if validator is not None:
+                        validator(item, child, errors)
+                    elif extra is None:
+                        errors.append((child, f"propiedad no permitida '{name}'"))
+                    else:
+                        extra(item, child, errors)
+
+            checks.append(check_object)
+
+        if "items" in schema or "minItems" in schema or "maxItems" in schema:
+            items = self.compile(schema.get("items"))
+            min_items = schema.get("minItems")
+            max_items = schema.get("maxItems")
+
+            def check_array(value, path, errors):
+                if not isinstance(value, list):
+                    return
+                if min_items is not None and len(value) < min_items:
+                    errors.append((path, f"tiene {len(value)} elementos, mínimo {min_items}"))
+                if max_items is not None and len(value) > max_items:
+                    errors.append((path, f"tiene {len(value)} elementos, máximo {max_items}"))
+                for index, item in enumerate(value):
+                    items(item, f"{path}/{index}", errors)
+
+            checks.append(check_array)
+
+        min_length = schema.get("minLength")
+        max_length = schema.get("maxLength")
+        pattern = re.compile(schema["pattern"]) if isinstance(schema.get("pattern"), str) else None
+        format_check = _FORMATS.get(schema.get("format"))
+        if min_length is not None or max_length is not None or pattern or format_check:
+            format_name = schema.get("format")
+
+            def check_string(value, path, errors):
+                if not isinstance(value, str):
+                    return
+                if min_length is not None and len(value) < min_length:
+                    errors.append((path, f"longitud {len(value)}, mínimo {min_length}"))
+                if max_length is not None and len(value) > max_length:
+                    errors.append((path, f"longitud {len(value)}, máximo {max_length}"))
+                if pattern is not None and not pattern.search(value):
+                    errors.append((path, f"'{value}' no coincide con el patrón {pattern.pattern}"))
+                if format_check is not None and not format_check(value):
+                    errors.append((path, f"'{value}' no tiene formato {format_name}"))
+
+            checks.append(check_string)
+
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        if minimum is not None or maximum is not None:
+            exclusive_min = schema.get("exclusiveMinimum") is True
+            exclusive_max = schema.get("exclusiveMaximum") is True
+
+            def check_number(value, path, errors):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    return
+                if minimum is not None and (value < minimum or (exclusive_min and value == minimum)):
+                    errors.append((path, f"{value} es menor que el mínimo {minimum}"))
+                if maximum is not None and (value > maximum or (exclusive_max and value == maximum)):
+                    errors.append((path, f"{value} es mayor que el máximo {maximum}"))
+
+            checks.append(check_number)
+
+        for subschema in schema.get("allOf", []):
+            checks.append(self.compile(subschema))
+
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in schema:
+                checks.append(self._compile_alternatives(keyword, schema[keyword]))
+
+        def validate(value, path, errors):
+            if value is None and nullable:
+                return
+            if isinstance(expected, str) and not _matches_type(value, expected):
+                errors.append((path, f"se esperaba {expected}, se encontró {_type_name(value)}"))
+                return
+            for check in checks:
+                check(value, path, errors)
+
+        return validate
+
+    def _compile_alternatives(self, keyword, subschemas):
+        validators = [self.compile(subschema) for subschema in subschemas]
+
+        def check_alternatives(value, path, errors):
+            matches = 0
+            for validator in validators:
+                attempt = []
+                validator(value, path, attempt)
+                if not attempt:
+                    matches += 1
+            if matches == 0:
+                errors.append((path, f"no coincide con ninguna alternativa de {keyword}"))
+            elif keyword == "oneOf" and matches > 1:
+                errors.append((path, f"coincide con {matches} alternativas de oneOf (se espera una)"))
+
+        return check_alternatives
+
+
+def _schema_examples(schema, pointer):
+    """Ejemplos (`example`) de un schema y de sus subesquemas"""
+    stack = [(schema, pointer)]
+    while stack:
+        node, node_pointer = stack.pop()
+        if not isinstance(node, dict) or "$ref" in node:
+            continue
+        if "example" in node:
+            yield ExampleCase(f"{node_pointer}/example", node, node["example"])
+        for keyword in _SCHEMA_VALUES:
+            if isinstance(node.get(keyword), dict):
+                stack.append((node[keyword], f"{node_pointer}/{keyword}"))
+        for keyword in _SCHEMA_LISTS:
+            for index, subschema in enumerate(node.get(keyword, [])):
+                stack.append((subschema, f"{node_pointer}/{keyword}/{index}"))
+        for keyword in _SCHEMA_MAPS:
+            for name, subschema in node.get(keyword, {}).items():
+                stack.append((subschema, f"{node_pointer}/{keyword}/{escape_pointer_token(name)}"))
+
+
+def iter_examples(document):
+    """
+    Recorrer el documento y producir un ExampleCase por cada ejemplo con
+    schema: `example`/`examples` de media types, parámetros y headers, y
+    `example` de los schemas. Los `examples` con $ref se resuelven.
+    """
+    schemas = document.get("components", {}).get("schemas", {})
+    for name, schema in schemas.items():
+        yield from _schema_examples(schema, f"/components/schemas/{escape_pointer_token(name)}")
+
+    stack = [(document, "")]
+    while stack:
+        node, pointer = stack.pop()
+        if isinstance(node, list):
+            stack.extend((value, f"{pointer}/{index}") for index, value in enumerate(node))
+            continue
+        if not isinstance(node, dict) or pointer == "/components/schemas":
+            continue
+
+        schema = node.get("schema")
+        if isinstance(schema, dict):
+            yield from _schema_examples(schema, f"{pointer}/schema")
+            if "example" in node:
+                yield ExampleCase(f"{pointer}/example", schema, node["example"])
+            for name, example in (node.get("examples") or {}).items():
+                example_pointer = f"{pointer}/examples/{escape_pointer_token(name)}"
+                if isinstance(example, dict) and isinstance(example.get("$ref"), str):
+                    try:
+                        example = resolve_pointer(document, ref_pointer(example["$ref"]) or "")
+                    except (KeyError, IndexError, ValueError, TypeError):
+                        continue
+                if isinstance(example, dict) and "value" in example:
+                    yield ExampleCase(f"{example_pointer}/value", schema, example["value"])
+
+        for key, value in node.items():
+            # Los valores de ejemplo son datos, no parte de la especificación
+            if key in ("schema", "example", "examples"):
+                continue
+            if isinstance(value, (dict, list)):
+                stack.append((value, f"{pointer}/{escape_pointer_token(key)}"))
+
+
+def _validate_cases(compiler, cases):
+    """[(path, mensaje)] por cada caso, en orden"""
+    results = []
+    for schema, value in cases:
+        errors = []
+        compiler.compile(schema)(value, "", errors)
+        results.append(errors)
+    return results
+
+
+_worker_compiler = None
+
+
+def _init_worker(document):
+    global _worker_compiler
+    _worker_compiler = SchemaCompiler(document)
+
+
+def _validate_chunk(cases):
+    return _validate_cases(_worker_compiler, cases)
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if cache.get("version") != EXAMPLES_VERSION:
+        return {}
+    return cache.get("results", {})
+
+
+def validate_examples(document, jobs=1, cache_dir=None):
+    """
+    Validar todos los ejemplos del documento contra sus schemas.
+
+    Con jobs > 1 los ejemplos a validar se reparten en un pool de procesos
+    (cada proceso compila los schemas que usa una sola vez). Con cache_dir,
+    los resultados se guardan por (hash del schema y lo que alcanza, hash
+    del valor) y solo se validan los ejemplos nuevos o modificados.
+
+    Retorna (mismatches, stats): lista de Mismatch en orden de documento y
+    {'examples', 'validated', 'cached'}.
+    """
+    compiler = SchemaCompiler(document)
+    cases = sorted(iter_examples(document), key=lambda case: case.pointer)
+
+    cache_path = Path(cache_dir) / EXAMPLES_CACHE_FILE if cache_dir is not None else None
+    cached_results = _read_cache(cache_path) if cache_path else {}
+
+    keys = []
+    pending = {}
+    for case in cases:
+        key = hashlib.sha256(
+            f"{compiler.schema_digest(case.schema)}\0{_digest(case.value)}".encode("ascii")
+        ).hexdigest()
+        keys.append(key)
+        if key not in cached_results and key not in pending:
+            pending[key] = (case.schema, case.value)
+
+    work = list(pending.values())
+    if jobs > 1 and len(work) > 1:
+        chunk_size = max(1, len(work) // (jobs * 4))
+        chunks = [work[start:start + chunk_size] for start in range(0, len(work), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)), initializer=_init_worker, initargs=(document,)
+        ) as pool:
+            results = [errors for chunk in pool.map(_validate_chunk, chunks) for errors in chunk]
+    else:
+        results = _validate_cases(compiler, work)
+
+    fresh = dict(zip(pending, results))
+    mismatches = []
+    for case, key in zip(cases, keys):
+        errors = fresh[key] if key in fresh else cached_results[key]
+        mismatches.extend(Mismatch(case.pointer, path, message) for path, message in errors)
+
+    if cache_path is not None:
+        # Solo se conservan los resultados de los ejemplos actuales
+        results_by_key = {key: fresh.get(key, cached_results.get(key)) for key in keys}
+        text = json.dumps({"version": EXAMPLES_VERSION, "results": results_by_key}, sort_keys=True)
+        write_if_changed(cache_path, text.encode("utf-8"))
+
+    stats = {
+        "examples": len(cases),
+        "validated": len(work),
+        "cached": len(cases) - sum(1 for key in keys if key in fresh),
+    }
+    return mismatches, stats
+
+
+def print_mismatches(mismatches, limit=None):
+    """Imprimir los ejemplos que no coinciden con su schema"""
+    print(f"❌ Ejemplos que no coinciden con su schema: {len(mismatches)}")
+    for mismatch in mismatches[:limit]:
+        print(f"   {mismatch.pointer}{mismatch.path or ''}: {mismatch.message}")
+    if limit is not None and len(mismatches) > limit:
+        print(f"   ... y {len(mismatches) - limit} más")
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Generador de carga guiado por la especificación.
+
+Construye peticiones válidas para las operaciones elegidas a partir del
+documento combinado (parámetros de path, query y header requeridos, y el
+cuerpo JSON tomado de los ejemplos o sintetizado desde el schema; ver
+openapi_mock.synthesize) y las envía concurrentemente con asyncio.
+
+Las operaciones por lotes son las que tienen un segmento `batch` en su path
+(o cuyo cuerpo es un array); su lote es el primer array de primer nivel del
+cuerpo (`documents` en POST /documents/batch, `document_ids` en POST
+/cessions/batch). Cada tamaño de lote pedido es un escenario distinto: el
+array se completa repitiendo sus elementos de ejemplo hasta ese tamaño.
+
+Cada escenario corre en modo cerrado: `concurrency` workers, cada uno con
+su conexión HTTP/1.1 keep-alive, envían la siguiente petición al recibir
+la respuesta anterior, hasta completar `requests` peticiones. Se reporta
+el throughput y los percentiles p50/p95/p99 de latencia.
+
+Uso:
+    from openapi_load import build_request, run_scenarios
+    request = build_request(combined, "POST /documents/batch", batch_size=50)
+    results = asyncio.run(run_scenarios([request], "http://127.0.0.1:4010"))
+"""
+
+import asyncio
+import copy
+import json
+import ssl
+import time
+from collections import Counter, namedtuple
+from urllib.parse import quote, urlencode, urlsplit
+
+from openapi_mock import DEFAULT_HOST, DEFAULT_PORT, media_example, resolve_ref, synthesize
+from openapi_refs import HTTP_METHODS
+
+DEFAULT_BASE_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+DEFAULT_REQUESTS = 500
+DEFAULT_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 30.0
+
+PERCENTILES = (50, 95, 99)
+
+# Petición lista para enviar: operación ("POST /documents/batch"), método,
+# path con query, headers, cuerpo en bytes y tamaño de lote (None si la
+# operación no es por lotes)
+LoadRequest = namedtuple("LoadRequest", ["operation", "method", "target", "headers", "body", "batch_size"])
+
+# Resultado de un escenario: latencias en ms en orden de llegada, códigos
+# de estado, errores de conexión y duración total en segundos
+ScenarioResult = namedtuple("ScenarioResult", ["request", "latencies", "statuses", "errors", "elapsed"])
+
+
+def iter_operations(document):
+    """(nombre, path, método, operación) de cada operación, en orden del documento"""
+    for path, path_item in (document.get("paths") or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS and isinstance(operation, dict):
+                yield f"{method.upper()} {path}", path, method, operation
+
+
+def select_operations(document, selectors=()):
+    """
+    Nombres de las operaciones elegidas ("POST /documents/batch" u
+    operationId). Sin selectores se eligen las operaciones GET: las que
+    modifican datos hay que pedirlas explícitamente.
+    """
+    operations = list(iter_operations(document))
+    if not selectors:
+        return [name for name, _path, method, _operation in operations if method == "get"]
+
+    selected = []
+    for selector in selectors:
+        matches = [
+            name
+            for name, _path, _method, operation in operations
+            if selector in (name, operation.get("operationId"))
+        ]
+        if not matches:
+            raise ValueError(f"operación no encontrada en la especificación: {selector!r}")
+        selected.extend(name for name in matches if name not in selected)
+    return selected
+
+
+def _parameter_value(parameter, document):
+    """Valor de ejemplo de un parámetro: `example`, el primer `examples` o el schema sintetizado"""
+    if "example" in parameter:
+        return parameter["example"]
+    for example in (parameter.get("examples") or {}).values():
+        example = resolve_ref(example, document)
+        if isinstance(example, dict) and "value" in example:
+            return example["value"]
+    value = synthesize(parameter.get("schema"), document)
+    return "1" if value is None else value
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return str(value)
+
+
+def batch_property(body):
+    """Nombre del array de primer nivel de un cuerpo por lotes ('' si el cuerpo es un array), o None"""
+    if isinstance(body, list):
+        return ""
+    if isinstance(body, dict):
+        for name, value in body.items():
+            if isinstance(value, list):
+                return name
+    return None
+
+
+def _resize_batch(body, schema, size, document):
+    """Copia del cuerpo con su array de lote de `size` elementos (repite los de ejemplo)"""
+    name = batch_property(body)
+    items = body if name == "" else body[name]
+    if not items:
+        schema = resolve_ref(schema, document) or {}
+        if name:
+            schema = resolve_ref(schema.get("properties", {}).get(name), document) or {}
+        items = [synthesize(schema.get("items"), document)]
+    resized = [copy.deepcopy(items[index % len(items)]) for index in range(size)]
+    if name == "":
+        return resized
+    return {**body, name: resized}
+
+
+def batch_limit(operation, document):
+    """maxItems del array de lote de una operación, o None"""
+    media = (resolve_ref(operation.get("requestBody"), document) or {}).get("content", {}).get("application/json")
+    if not media:
+        return None
+    schema = resolve_ref(media.get("schema"), document) or {}
+    name = batch_property(media_example(media, document))
+    if name is None:
+        return None
+    if name:
+        schema = resolve_ref(schema.get("properties", {}).get(name), document) or {}
+    return schema.get("maxItems")
+
+
+def build_request(document, name, batch_size=None, headers=None):
+    """
+    LoadRequest para la operación `name` ("MÉTODO /path"). Los parámetros
+    requeridos (y los de path) toman su valor de ejemplo; el cuerpo JSON se
+    arma desde los ejemplos o el schema. Con batch_size, el array de lote
+    del cuerpo se lleva a ese tamaño (ValueError si la operación no es por
+    lotes). `headers` se agregan a todas las peticiones (p. ej.
+    Authorization).
+    """
+    for operation_name, path, method, operation in iter_operations(document):
+        if operation_name == name:
+            break
+    else:
+        raise ValueError(f"operación no encontrada en la especificación: {name!r}")
+
+    parameters = list(document["paths"][path].get("parameters", [])) + list(operation.get("parameters", []))
+    query = {}
+    request_headers = {"Accept": "application/json"}
+    for parameter in parameters:
+        parameter = resolve_ref(parameter, document)
+        if not isinstance(parameter, dict):
+            continue
+        location = parameter.get("in")
+        if location != "path" and not parameter.get("required"):
+            continue
+        value = _format_value(_parameter_value(parameter, document))
+        if location == "path":
+            path = path.replace(f"{{{parameter['name']}}}", quote(value, safe=""))
+        elif location == "query":
+            query[parameter["name"]] = value
+        elif location == "header":
+            request_headers[parameter["name"]] = value
+    request_headers.update(headers or {})
+
+    body = b""
+    request_body = resolve_ref(operation.get("requestBody"), document)
+    media = (request_body or {}).get("content", {}).get("application/json")
+    if media is not None:
+        value = media_example(media, document)
+        if batch_size is not None:
+            if batch_property(value) is None:
+                raise ValueError(f"{name} no es una operación por lotes")
+            value = _resize_batch(value, media.get("schema"), batch_size, document)
+        body = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        request_headers["Content-Type"] = "application/json"
+    elif batch_size is not None:
+        raise ValueError(f"{name} no es una operación por lotes")
+
+    target = path + (f"?{urlencode(query)}" if query else "")
+    return LoadRequest(name, method.upper(), target, request_headers, body, batch_size)
+
+
+def is_batch_operation(document, name):
+    """Si la operación es por lotes: path con segmento `batch` (o cuerpo array) y un array de lote"""
+    try:
+        request = build_request(document, name)
+    except ValueError:
+        return False
+    if not request.body:
+        return False
+    body = json.loads(request.body)
+    path = name.split(" ", 1)[1]
+    if not isinstance(body, list) and "batch" not in path.strip("/").split("/"):
+        return False
+    return batch_property(body) is not None
+
+
+class HTTPConnection:
+    """Conexión HTTP/1.1 keep-alive mínima sobre asyncio (se reconecta si el servidor la cierra)"""
+
+    def __init__(self, base_url, timeout=DEFAULT_TIMEOUT):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL base inválida: {base_url!r} (se espera http:// o https://)")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.prefix = parts.path.rstrip("/")
+        self.host_header = parts.netloc
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    def encode(self, request):
+        """Bytes de la petición (se arman una vez por escenario)"""
+        lines = [f"{request.method} {self.prefix}{request.target} HTTP/1.1", f"Host: {self.host_header}"]
+        lines.extend(f"{name}: {value}" for name, value in request.headers.items())
+        lines.append(f"Content-Length: {len(request.body)}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + request.body
+
+    async def send(self, payload):
+        """Enviar una petición ya codificada y retornar el código de estado (el cuerpo se descarta)"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout
+            )
+        self.writer.write(payload)
+        return await asyncio.wait_for(self._read_response(), self.timeout)
+
+    async def _read_response(self):
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            await self.reader.read()
+            self.close()
+            return status
+
+        # HTTP/1.0 cierra la conexión salvo "Connection: keep-alive" explícito
+        connection = headers.get("connection", "").lower()
+        if connection == "close" or (lines[0].startswith("HTTP/1.0") and connection != "keep-alive"):
+            self.close()
+        return status
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def run_scenario(request, base_url, requests=DEFAULT_REQUESTS, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    """Enviar `requests` copias de `request` con `concurrency` conexiones y medir cada una"""
+    latencies = []
+    statuses = Counter()
+    errors = Counter()
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        connection = HTTPConnection(base_url, timeout)
+        payload = connection.encode(request)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                try:
+                    status = await connection.send(payload)
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+                    errors[type(e).__name__] += 1
+                    connection.close()
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[status] += 1
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, requests)))))
+    return ScenarioResult(request, latencies, statuses, errors, time.perf_counter() - start)
+
+
+async def run_scenarios(load_requests, base_url, requests=DEFAULT_REQUESTS, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT, on_result=None):
+    """Correr cada escenario por separado (uno a la vez) y retornar sus ScenarioResult"""
+    results = []
+    for request in load_requests:
+        result = await run_scenario(request, base_url, requests, concurrency, timeout)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def percentile(sorted_values, percent):
+    """Percentil por rango más cercano de una lista ordenada (None si está vacía)"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def summarize(result):
+    """Resumen serializable de un escenario"""
+    latencies = sorted(result.latencies)
+    completed = len(latencies)
+    summary = {
+        "operation": result.request.operation,
+        "batch_size": result.request.batch_size,
+        "request_bytes": len(result.request.body),
+        "requests": completed,
+        "errors": sum(result.errors.values()),
+        "non_2xx": sum(count for status, count in result.statuses.items() if not 200 <= status < 300),
+        "throughput_rps": round(completed / result.elapsed, 1) if result.elapsed else 0.0,
+        "statuses": {str(status): count for status, count in sorted(result.statuses.items())},
+    }
+    for percent in PERCENTILES:
+        value = percentile(latencies, percent)
+        summary[f"p{percent}_ms"] = None if value is None else round(value, 3)
+    summary["max_ms"] = round(latencies[-1], 3) if latencies else None
+    if result.errors:
+        summary["error_types"] = dict(result.errors)
+    return summary
+
+
+def print_summary(summary):
+    """Una línea por escenario"""
+    label = summary["operation"]
+    if summary["batch_size"] is not None:
+        label += f" [lote {summary['batch_size']}]"
+
+    def ms(value):
+        return "     -" if value is None else f"{value:6.1f}"
+
+    line = (
+        f"   {label:<48} {summary['throughput_rps']:>8.1f} req/s  "
+        f"p50 {ms(summary['p50_ms'])}  p95 {ms(summary['p95_ms'])}  p99 {ms(summary['p99_ms'])} ms  "
+        f"({summary['request_bytes']} bytes)"
+    )
+    print(line)
+    if summary["errors"] or summary["non_2xx"]:
+        print(f"      ⚠️  errores de conexión: {summary['errors']}, respuestas no 2xx: {summary['non_2xx']} {summary['statuses']}")
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Cargador JSON con posiciones para los archivos OpenAPI.
+
+A diferencia de json.load, que descarta en silencio las claves repetidas
+(se queda con la última), este cargador recorre el texto una sola vez y
+registra:
+- las claves duplicadas reales dentro de un mismo objeto, con su posición
+- un mapa de fuentes: línea y columna de cada nodo, indexado por JSON pointer
+
+El parser es iterativo (pila explícita), así que soporta documentos de
+cualquier profundidad. Los strings se decodifican con el scanner en C de la
+librería estándar, por lo que el resultado es idéntico al de json.loads.
+
+Uso:
+    from openapi_loader import load_json_file
+    loaded = load_json_file("api-reference/openapi/schemas/schemas.json")
+    loaded.data, loaded.duplicates, loaded.source_map.position("/paths")
+"""
+
+import json
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from json.decoder import scanstring
+
+# Clave repetida dentro de un mismo objeto
+# - pointer: JSON pointer del objeto que contiene la clave
+# - line/column: posición de la repetición
+# - first_line/first_column: posición de la primera aparición
+DuplicateKey = namedtuple(
+    "DuplicateKey",
+    ["pointer", "key", "line", "column", "first_line", "first_column"],
+)
+
+# Extensión de un objeto en el texto: offsets [start, end), JSON pointer y
+# lista de (clave, offset) en orden de aparición (incluye repeticiones)
+ObjectSpan = namedtuple("ObjectSpan", ["start", "end", "pointer", "keys"])
+
+# Resultado de cargar un documento
+LoadedJSON = namedtuple("LoadedJSON", ["data", "duplicates", "source_map"])
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?")
+_LINE_BREAK = re.compile(r"\n")
+_CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+
+
+def escape_pointer_token(key):
+    """Escapar una clave para usarla en un JSON pointer (RFC 6901)"""
+    if "~" in key or "/" in key:
+        return key.replace("~", "~0").replace("/", "~1")
+    return key
+
+
+def unescape_pointer_token(token):
+    """Revertir escape_pointer_token"""
+    if "~" in token:
+        return token.replace("~1", "/").replace("~0", "~")
+    return token
+
+
+def resolve_pointer(data, pointer):
+    """Obtener el nodo de `data` apuntado por un JSON pointer (KeyError/IndexError si no existe)"""
+    node = data
+    for token in pointer.split("/")[1:]:
+        token = unescape_pointer_token(token)
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node
+
+
+class SourceMap:
+    """
+    Posiciones de los nodos de un documento JSON.
+
+    Guarda el offset de cada nodo y el inicio de cada línea; la línea y columna
+    se calculan bajo demanda con búsqueda binaria, sin volver a recorrer el texto.
+    """
+
+    def __init__(self, text, offsets, spans=()):
+        self.offsets = offsets
+        self.spans = [ObjectSpan(*span) for span in spans]
+        self.line_starts = [0] + [m.end() for m in _LINE_BREAK.finditer(text)]
+
+    def __contains__(self, pointer):
+        return pointer in self.offsets
+
+    def position_of_offset(self, offset):
+        """Retorna (línea, columna) 1-based de un offset del texto"""
+        line_index = bisect_right(self.line_starts, offset) - 1
+        return line_index + 1, offset - self.line_starts[line_index] + 1
+
+    def position(self, pointer):
+        """Retorna (línea, columna) 1-based del nodo, o None si no existe"""
+        offset = self.offsets.get(pointer)
+        if offset is None:
+            return None
+        return self.position_of_offset(offset)
+
+    def line(self, pointer):
+        """Retorna la línea 1-based del nodo, o None si no existe"""
+        position = self.position(pointer)
+        return position[0] if position else None
+
+
+def _error(message, text, pos):
+    return json.JSONDecodeError(message, text, pos)
+
+
+def loads_with_positions(text, record_spans=False):
+    """
+    Parsear un documento JSON en una sola pasada lineal.
+    Con record_spans=True también registra la extensión y las claves de cada
+    objeto (source_map.spans, en orden de inicio), para indexarlos con SpanIndex.
+    Retorna LoadedJSON(data, duplicates, source_map).
+    Lanza json.JSONDecodeError si el texto no es JSON válido.
+    """
+    skip = _WHITESPACE.match
+    number = _NUMBER.match
+    offsets = {}
+    duplicate_offsets = []
+    spans = []
+
+    # Cada frame: [contenedor, pointer, claves_vistas, clave_actual, span]
+    # (claves_vistas, clave_actual y span solo aplican a objetos)
+    stack = []
+    pointer = ""
+    pos = skip(text, 0).end()
+
+    while True:
+        # --- Parsear un valor que comienza en pos ---
+        offsets[pointer] = pos
+        try:
+            char = text[pos]
+        except IndexError:
+            raise _error("Expecting value", text, pos) from None
+
+        if char == "{":
+            span = None
+            if record_spans:
+                span = [pos, None, pointer, []]
+                spans.append(span)
+            pos = skip(text, pos + 1).end()
+            if text[pos : pos + 1] == "}":
+                value = {}
+                pos += 1
+                if span is not None:
+                    span[1] = pos
+            else:
+                frame = [{}, pointer, {}, None, span]
+                stack.append(frame)
+                pos, pointer = _parse_key(text, pos, frame, duplicate_offsets)
+                continue
+        elif char == "[":
+            pos = skip(text, pos + 1).end()
+            if text[pos : pos + 1] == "]":
+                value = []
+                pos += 1
+            else:
+                stack.append([[], pointer, None, None, None])
+                pointer = f"{pointer}/0"
+                continue
+        elif char == '"':
+            value, pos = scanstring(text, pos + 1)
+        else:
+            match = number(text, pos)
+            if match is not None and match.end() > pos:
+                integer, fraction, exponent = match.groups()
+                if fraction or exponent:
+                    value = float(integer + (fraction or "") + (exponent or ""))
+                else:
+                    value = int(integer)
+                pos = match.end()
+            else:
+                for literal, constant in _CONSTANTS.items():
+                    if text.startswith(literal, pos):
+                        value = constant
+                        pos += len(literal)
+                        break
+                else:
+                    raise _error("Expecting value", text, pos)
+
+        # --- Valor completo: agregarlo a su contenedor y cerrar los que terminen ---
+        while True:
+            if not stack:
+                end = skip(text, pos).end()
+                if end != len(text):
+                    raise _error("Extra data", text, end)
+                source_map = SourceMap(text, offsets, spans)
+                duplicates = _build_duplicates(duplicate_offsets, source_map)
+                return LoadedJSON(value, duplicates, source_map)
+
+            frame = stack[-1]
+            container = frame[0]
+            if frame[2] is not None:
+                container[frame[3]] = value
+            else:
+                container.append(value)
+
+            pos = skip(text, pos).end()
+            char = text[pos : pos + 1]
+            if char == ",":
+                pos = skip(text, pos + 1).end()
+                if frame[2] is not None:
+                    pos, pointer = _parse_key(text, pos, frame, duplicate_offsets)
+                else:
+                    pointer = f"{frame[1]}/{len(container)}"
+                break
+            if char == ("}" if frame[2] is not None else "]"):
+                pos += 1
+                stack.pop()
+                if frame[4] is not None:
+                    frame[4][1] = pos
+                value = container
+                continue
+            raise _error("Expecting ',' delimiter", text, pos)
+
+
+def _parse_key(text, pos, frame, duplicate_offsets):
+    """
+    Parsear '"clave" :' de un miembro de objeto, registrando repeticiones.
+    Retorna (pos del valor, pointer del valor).
+    """
+    if text[pos : pos + 1] != '"':
+        raise _error(
+            "Expecting property name enclosed in double quotes", text, pos
+        )
+    key, end = scanstring(text, pos + 1)
+
+    seen = frame[2]
+    if key in seen:
+        duplicate_offsets.append((frame[1], key, pos, seen[key]))
+    else:
+        seen[key] = pos
+    frame[3] = key
+    if frame[4] is not None:
+        frame[4][3].append((key, pos))
+
+    end = _WHITESPACE.match(text, end).end()
+    if text[end : end + 1] != ":":
+        raise _error("Expecting ':' delimiter", text, end)
+    end = _WHITESPACE.match(text, end + 1).end()
+    return end, f"{frame[1]}/{escape_pointer_token(key)}"
+
+
+def _build_duplicates(duplicate_offsets, source_map):
+    """Convertir los offsets de claves repetidas en DuplicateKey con línea y columna"""
+    duplicates = []
+    for pointer, key, offset, first_offset in duplicate_offsets:
+        line, column = source_map.position_of_offset(offset)
+        first_line, first_column = source_map.position_of_offset(first_offset)
+        duplicates.append(
+            DuplicateKey(pointer, key, line, column, first_line, first_column)
+        )
+    return duplicates
+
+
+def load_json_file(file_path, record_spans=False):
+    """Leer y parsear un archivo JSON con posiciones (ver loads_with_positions)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return loads_with_positions(f.read(), record_spans)
+
+
+class SpanIndex:
+    """
+    Índice de los objetos de un documento para consultas por posición.
+
+    Los objetos JSON están perfectamente anidados, así que un barrido lineal
+    sobre sus extensiones (ordenadas por inicio) parte el texto en tramos donde
+    el objeto más interno es constante. Es el equivalente aplanado de un árbol
+    de intervalos: "¿qué objeto contiene esta posición?" se responde con una
+    búsqueda binaria, O(log n), sin volver a recorrer el texto.
+
+    También indexa cada clave con el objeto en que vive, para agrupar
+    ocurrencias por objeto en O(k).
+    """
+
+    def __init__(self, spans):
+        self.spans = spans
+        self.breakpoints = []  # offset donde empieza cada tramo
+        self.innermost = []  # índice del objeto más interno del tramo (-1: ninguno)
+        self.key_occurrences = {}  # clave -> [(offset, índice de objeto)]
+
+        open_spans = []
+        for index, span in enumerate(spans):
+            while open_spans and spans[open_spans[-1]].end <= span.start:
+                self._close(open_spans)
+            self._mark(span.start, index)
+            open_spans.append(index)
+            for key, offset in span.keys:
+                self.key_occurrences.setdefault(key, []).append((offset, index))
+        while open_spans:
+            self._close(open_spans)
+
+    def _mark(self, offset, index):
+        if self.breakpoints and self.breakpoints[-1] == offset:
+            self.innermost[-1] = index
+        else:
+            self.breakpoints.append(offset)
+            self.innermost.append(index)
+
+    def _close(self, open_spans):
+        closed = open_spans.pop()
+        self._mark(self.spans[closed].end, open_spans[-1] if open_spans else -1)
+
+    def object_at(self, offset):
+        """Índice del objeto más interno que contiene `offset`, o None"""
+        position = bisect_right(self.breakpoints, offset) - 1
+        if position < 0 or self.innermost[position] < 0:
+            return None
+        return self.innermost[position]
+
+    def occurrences(self, key):
+        """Lista de (offset, índice de objeto) donde aparece `key` como clave"""
+        return self.key_occurrences.get(key, [])
+
+
+def format_duplicate(duplicate):
+    """Descripción legible de una clave duplicada"""
+    return (
+        f"clave '{duplicate.key}' duplicada en línea {duplicate.line}:"
+        f"{duplicate.column} (primera aparición en línea {duplicate.first_line}:"
+        f"{duplicate.first_column}, objeto {duplicate.pointer or '/'})"
+    )
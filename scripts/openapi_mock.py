@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Servidor mock de la API generado desde el documento combinado.
+
+Cada operación de `paths` se enruta y responde con el ejemplo de la
+especificación (`example`/`examples` del media type) o, si no hay, con un
+cuerpo sintetizado desde su schema. Todo lo que depende solo del documento
+se calcula al iniciar: las rutas y los bytes completos (línea de estado,
+headers y cuerpo) de cada respuesta declarada. Por petición solo se parsea
+la línea de inicio y los headers necesarios y se escribe un buffer ya
+armado, así un solo núcleo atiende miles de peticiones por segundo.
+
+El servidor es un asyncio.Protocol con HTTP/1.1 keep-alive y pipelining
+(las respuestas de una conexión salen en orden aunque tengan latencias
+distintas). Si uvloop está instalado se usa como event loop.
+
+Perfiles de latencia y errores (MockProfile): latencia uniforme entre un
+mínimo y un máximo, y una tasa de errores inyectados con los códigos a
+usar (el cuerpo es el declarado por la operación para ese código, si
+existe). Además, el header `Prefer: code=404` fuerza una respuesta
+declarada.
+
+Rutas internas:
+    GET /__mock/stats      peticiones atendidas por operación y por código
+
+Uso:
+    from openapi_mock import MockApp, PROFILES, create_mock_server
+    server = await create_mock_server(MockApp(combined, PROFILES["flaky"]), port=4010)
+"""
+
+import asyncio
+import json
+import random
+import re
+from collections import Counter, deque, namedtuple
+from http import HTTPStatus
+from urllib.parse import unquote
+
+from openapi_loader import resolve_pointer
+from openapi_refs import HTTP_METHODS, ref_pointer
+
+try:
+    import uvloop
+except ImportError:  # Opcional: sin uvloop se usa el event loop de asyncio
+    uvloop = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 4010
+
+# Profundidad máxima al sintetizar cuerpos (corta schemas recursivos)
+MAX_SYNTH_DEPTH = 8
+
+# Límite de la cabecera de una petición (línea de inicio + headers)
+MAX_HEAD_BYTES = 64 * 1024
+
+STATS_PATH = "/__mock/stats"
+
+# Latencia uniforme entre latency_min y latency_max (segundos), fracción de
+# peticiones que responden con error y códigos de error a elegir
+MockProfile = namedtuple("MockProfile", ["latency_min", "latency_max", "error_rate", "error_statuses"])
+
+PROFILES = {
+    "fast": MockProfile(0.0, 0.0, 0.0, (500,)),
+    "realistic": MockProfile(0.020, 0.120, 0.01, (500, 503)),
+    "slow": MockProfile(0.300, 1.500, 0.0, (500,)),
+    "flaky": MockProfile(0.010, 0.200, 0.10, (429, 500, 502, 503)),
+}
+
+# Formatos de string con un valor de ejemplo fijo
+_FORMAT_EXAMPLES = {
+    "date-time": "2024-01-15T10:30:00Z",
+    "date": "2024-01-15",
+    "email": "usuario@example.com",
+    "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "192.0.2.1",
+    "byte": "U3dhZ2dlcg==",
+    "binary": "",
+    "password": "********",
+}
+
+_PREFER_CODE = re.compile(rb"code=(\d{3})")
+
+
+def synthesize(schema, document, depth=0):
+    """
+    Valor de ejemplo para un schema: `example`, `default` o el primer valor
+    de `enum` si existen; si no, un valor según el tipo (objetos con todas
+    sus propiedades, arrays con un elemento). Los $ref se resuelven; la
+    profundidad se corta en MAX_SYNTH_DEPTH.
+    """
+    if not isinstance(schema, dict) or depth > MAX_SYNTH_DEPTH:
+        return None
+    if isinstance(schema.get("$ref"), str):
+        return synthesize(resolve_ref(schema, document), document, depth + 1)
+
+    for keyword in ("example", "default"):
+        if keyword in schema:
+            return schema[keyword]
+    if schema.get("enum"):
+        return schema["enum"][0]
+
+    if isinstance(schema.get("allOf"), list):
+        merged = {}
+        for subschema in schema["allOf"]:
+            value = synthesize(subschema, document, depth + 1)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+    for keyword in ("oneOf", "anyOf"):
+        if schema.get(keyword):
+            return synthesize(schema[keyword][0], document, depth + 1)
+
+    schema_type = schema.get("type")
+    if schema_type == "object" or isinstance(schema.get("properties"), dict):
+        return {
+            name: synthesize(subschema, document, depth + 1)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return [synthesize(schema.get("items", {}), document, depth + 1)]
+    if schema_type == "string":
+        return _FORMAT_EXAMPLES.get(schema.get("format"), "string")
+    if schema_type == "integer":
+        return max(1, int(schema.get("minimum", 1)))
+    if schema_type == "number":
+        return max(1.0, float(schema.get("minimum", 1.0)))
+    if schema_type == "boolean":
+        return True
+    return None
+
+
+def resolve_ref(node, document):
+    """Seguir un $ref local (componentes de respuesta, ejemplos, ...)"""
+    if isinstance(node, dict) and isinstance(node.get("$ref"), str):
+        pointer = ref_pointer(node["$ref"])
+        try:
+            return resolve_pointer(document, pointer) if pointer is not None else None
+        except (KeyError, IndexError, ValueError, TypeError):
+            return None
+    return node
+
+
+def media_example(media, document):
+    """Cuerpo de ejemplo de un media type: `example`, el primer `examples` o el schema sintetizado"""
+    if "example" in media:
+        return media["example"]
+    for example in (media.get("examples") or {}).values():
+        example = resolve_ref(example, document)
+        if isinstance(example, dict) and "value" in example:
+            return example["value"]
+    return synthesize(media.get("schema"), document)
+
+
+def render_response(status, body=None, content_type=None, extra_headers=()):
+    """
+    Bytes de una respuesta HTTP/1.1 sin la línea vacía final de los headers:
+    (cabecera, cuerpo). Ver MockResponse.
+    """
+    try:
+        reason = HTTPStatus(status).phrase
+    except ValueError:
+        reason = "Unknown"
+    lines = [f"HTTP/1.1 {status} {reason}", f"Content-Length: {len(body or b'')}"]
+    if content_type:
+        lines.append(f"Content-Type: {content_type}")
+    lines.extend(extra_headers)
+    return ("\r\n".join(lines) + "\r\n").encode("latin-1"), body or b""
+
+
+class MockResponse:
+    """Respuesta ya serializada, en sus dos variantes (keep-alive y Connection: close)"""
+
+    __slots__ = ("status", "keep_alive", "close")
+
+    def __init__(self, status, body=None, content_type=None, extra_headers=()):
+        head, payload = render_response(status, body, content_type, extra_headers)
+        self.status = status
+        self.keep_alive = head + b"\r\n" + payload
+        self.close = head + b"Connection: close\r\n\r\n" + payload
+
+    @classmethod
+    def json(cls, status, value, extra_headers=()):
+        body = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        return cls(status, body, "application/json", extra_headers)
+
+
+class MockRoute:
+    """Operación de la especificación con sus respuestas precalculadas"""
+
+    __slots__ = ("name", "responses", "success", "requests")
+
+    def __init__(self, name, responses, success):
+        self.name = name
+        self.responses = responses
+        self.success = success
+        self.requests = 0
+
+
+def _operation_responses(operation, document):
+    """{código: MockResponse} de una operación y el código de éxito por defecto"""
+    responses = {}
+    for code, response in (operation.get("responses") or {}).items():
+        response = resolve_ref(response, document)
+        if not isinstance(response, dict):
+            continue
+        status = 500 if code == "default" else int(code) if str(code).isdigit() else None
+        if status is None or status in responses:
+            continue
+        content = response.get("content") or {}
+        media_type = "application/json" if "application/json" in content else next(iter(content), None)
+        if media_type is None or status == 204:
+            responses[status] = MockResponse(status)
+        elif "json" in media_type:
+            body = json.dumps(media_example(content[media_type], document), ensure_ascii=False).encode("utf-8")
+            responses[status] = MockResponse(status, body, media_type)
+        else:
+            responses[status] = MockResponse(status, b"", media_type)
+
+    successes = sorted(status for status in responses if 200 <= status < 300)
+    if successes:
+        return responses, successes[0]
+    responses.setdefault(200, MockResponse(200))
+    return responses, 200
+
+
+def _route_key(path):
+    """Path sin la barra final (así /a/ y /a enrutan igual)"""
+    return path.rstrip("/") or "/"
+
+
+class MockRouter:
+    """
+    Rutas de todas las operaciones: los paths sin parámetros se buscan en un
+    diccionario; los que tienen {parámetros}, por cantidad de segmentos.
+    """
+
+    def __init__(self, document):
+        self.static = {}
+        self.templated = {}
+        self.routes = []
+        for path, path_item in (document.get("paths") or {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            methods = {}
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                responses, success = _operation_responses(operation, document)
+                route = MockRoute(f"{method.upper()} {path}", responses, success)
+                methods[method.upper()] = route
+                self.routes.append(route)
+            if not methods:
+                continue
+            segments = _route_key(path).split("/")
+            if any(segment.startswith("{") for segment in segments):
+                pattern = tuple(None if segment.startswith("{") else segment for segment in segments)
+                self.templated.setdefault(len(segments), []).append((pattern, methods))
+            else:
+                self.static[_route_key(path)] = methods
+
+    def match(self, path):
+        """{MÉTODO: MockRoute} del path, o None si ninguna operación lo declara"""
+        key = _route_key(path)
+        methods = self.static.get(key)
+        if methods is not None:
+            return methods
+        segments = key.split("/")
+        for pattern, methods in self.templated.get(len(segments), ()):
+            if all(expected is None or expected == actual for expected, actual in zip(pattern, segments)):
+                return methods
+        return None
+
+
+class MockApp:
+    """Decide la respuesta de cada petición: ruta, código forzado, error inyectado"""
+
+    def __init__(self, document, profile=PROFILES["fast"], seed=None):
+        self.router = MockRouter(document)
+        self.profile = profile
+        self.random = random.Random(seed)
+        self.statuses = Counter()
+        self.not_found = MockResponse.json(404, {"detail": "Ruta no declarada en la especificación"})
+        self.injected = {
+            status: MockResponse.json(status, {"detail": "Error simulado por el mock"})
+            for status in profile.error_statuses
+        }
+        self._method_not_allowed = {}
+
+    def delay(self):
+        """Latencia de una respuesta, en segundos, según el perfil"""
+        low, high = self.profile.latency_min, self.profile.latency_max
+        if high <= 0:
+            return 0.0
+        return self.random.uniform(low, high)
+
+    def respond(self, method, target, prefer=None):
+        """MockResponse para una petición (target es el path con query, en bytes)"""
+        path = target.split(b"?", 1)[0].decode("latin-1")
+        if "%" in path:
+            path = unquote(path)
+
+        methods = self.router.match(path)
+        if methods is None:
+            if path == STATS_PATH:
+                return MockResponse.json(200, self.stats())
+            response = self.not_found
+        else:
+            route = methods.get(method.decode("latin-1"))
+            if route is None:
+                response = self._not_allowed(methods)
+            else:
+                route.requests += 1
+                response = self._route_response(route, prefer)
+        self.statuses[response.status] += 1
+        return response
+
+    def _route_response(self, route, prefer):
+        if prefer:
+            match = _PREFER_CODE.search(prefer)
+            if match and int(match.group(1)) in route.responses:
+                return route.responses[int(match.group(1))]
+        profile = self.profile
+        if profile.error_rate and self.random.random() < profile.error_rate:
+            status = self.random.choice(profile.error_statuses)
+            return route.responses.get(status) or self.injected[status]
+        return route.responses[route.success]
+
+    def _not_allowed(self, methods):
+        allow = ", ".join(sorted(methods))
+        response = self._method_not_allowed.get(allow)
+        if response is None:
+            response = MockResponse.json(405, {"detail": "Método no permitido"}, [f"Allow: {allow}"])
+            self._method_not_allowed[allow] = response
+        return response
+
+    def stats(self):
+        """Peticiones atendidas por operación y por código de estado"""
+        return {
+            "requests": sum(self.statuses.values()),
+            "by_operation": {route.name: route.requests for route in self.router.routes if route.requests},
+            "by_status": {str(status): count for status, count in sorted(self.statuses.items())},
+        }
+
+
+def _header(lower_head, name):
+    """Valor de un header (en minúsculas) de la cabecera ya pasada a minúsculas, o None"""
+    start = lower_head.find(b"\r\n" + name + b":")
+    if start < 0:
+        return None
+    start += len(name) + 3
+    end = lower_head.find(b"\r\n", start)
+    return lower_head[start:].strip() if end < 0 else lower_head[start:end].strip()
+
+
+class MockProtocol(asyncio.Protocol):
+    """Una conexión HTTP/1.1: parsea peticiones (con pipelining) y escribe respuestas en orden"""
+
+    def __init__(self, app):
+        self.app = app
+        self.loop = asyncio.get_running_loop()
+        self.transport = None
+        self.buffer = bytearray()
+        self.queue = deque()
+        self.timer = None
+        self.closing = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        if self.timer is not None:
+            self.timer.cancel()
+        self.queue.clear()
+
+    def data_received(self, data):
+        buffer = self.buffer
+        buffer += data
+        while not self.closing:
+            end = buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(buffer) > MAX_HEAD_BYTES:
+                    self._send(MockResponse(431).close, close=True)
+                return
+            head = bytes(buffer[:end])
+            lower = head.lower()
+            request_line_end = head.find(b"\r\n")
+            request_line = head if request_line_end < 0 else head[:request_line_end]
+            try:
+                method, target, version = request_line.split(b" ", 2)
+            except ValueError:
+                self._send(MockResponse(400).close, close=True)
+                return
+
+            body_start = end + 4
+            if _header(lower, b"transfer-encoding") == b"chunked":
+                body_end = _chunked_end(buffer, body_start)
+                if body_end is None:
+                    return
+            else:
+                length = _header(lower, b"content-length")
+                body_end = body_start + (int(length) if length and length.isdigit() else 0)
+                if len(buffer) < body_end:
+                    return
+            del buffer[:body_end]
+
+            connection = _header(lower, b"connection")
+            if version == b"HTTP/1.0":
+                keep_alive = connection == b"keep-alive"
+            else:
+                keep_alive = connection != b"close"
+
+            response = self.app.respond(method, target, _header(lower, b"prefer"))
+            self._send(response.keep_alive if keep_alive else response.close, close=not keep_alive)
+
+    def _send(self, data, close=False):
+        """Escribir ahora o encolar tras la latencia del perfil (sin adelantar respuestas anteriores)"""
+        if close:
+            self.closing = True
+        delay = self.app.delay()
+        if not delay and not self.queue:
+            self.transport.write(data)
+            if close:
+                self.transport.close()
+            return
+        send_at = self.loop.time() + delay
+        if self.queue:
+            send_at = max(send_at, self.queue[-1][0])
+        self.queue.append((send_at, data, close))
+        if self.timer is None:
+            self.timer = self.loop.call_at(self.queue[0][0], self._flush)
+
+    def _flush(self):
+        self.timer = None
+        now = self.loop.time()
+        while self.queue and self.queue[0][0] <= now:
+            _send_at, data, close = self.queue.popleft()
+            if self.transport.is_closing():
+                self.queue.clear()
+                return
+            self.transport.write(data)
+            if close:
+                self.transport.close()
+                self.queue.clear()
+                return
+        if self.queue:
+            self.timer = self.loop.call_at(self.queue[0][0], self._flush)
+
+
+def _chunked_end(buffer, start):
+    """Fin del cuerpo chunked que empieza en `start`, o None si aún no llegó completo"""
+    position = start
+    while True:
+        line_end = buffer.find(b"\r\n", position)
+        if line_end < 0:
+            return None
+        try:
+            size = int(bytes(buffer[position:line_end]).split(b";", 1)[0], 16)
+        except ValueError:
+            size = 0
+        if size == 0:
+            # Trailers opcionales y la línea vacía final
+            trailer_end = buffer.find(b"\r\n\r\n", line_end)
+            return None if trailer_end < 0 else trailer_end + 4
+        position = line_end + 2 + size + 2
+        if len(buffer) < position:
+            return None
+
+
+async def create_mock_server(app, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Crear el servidor mock en el loop actual (port=0 elige un puerto libre)"""
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(lambda: MockProtocol(app), host, port, backlog=1024, reuse_address=True)
+
+
+def run_mock_server(app, host=DEFAULT_HOST, port=DEFAULT_PORT, on_ready=None):
+    """Servir hasta Ctrl+C (con uvloop si está instalado); on_ready recibe (host, puerto)"""
+
+    async def serve():
+        server = await create_mock_server(app, host, port)
+        if on_ready is not None:
+            on_ready(*server.sockets[0].getsockname()[:2])
+        async with server:
+            await server.serve_forever()
+
+    if uvloop is not None:
+        uvloop.install()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Generador de clases de modelo desde components/schemas.
+
+Cada schema objeto se convierte en una clase con __slots__ (sin __dict__ por
+instancia) y con `from_dict`/`to_dict` generados campo por campo: no hay
+introspección ni recorrido del schema en tiempo de ejecución, solo accesos
+directos a claves y atributos.
+
+- allOf: la clase hereda del primer $ref a otro modelo (DocumentDetailWithFiles
+  es un DocumentDetail) y agrega en sus __slots__ solo los campos nuevos;
+  from_dict/to_dict cubren todos los campos sin llamar a la clase base
+- Cadenas de $ref: un schema que es solo un $ref se emite como alias de la
+  clase final
+- Objetos inline con propiedades (p. ej. ScheduledDocument.sender) generan
+  clases anidadas (`ScheduledDocumentSender`); arrays y mapas
+  (additionalProperties) de modelos se convierten elemento por elemento
+- Los demás valores (strings, fechas, números, objetos libres, oneOf) se
+  copian tal cual
+
+Los campos ausentes quedan en UNSET y no se emiten en to_dict (distinto de
+null, que se conserva como None), así to_dict(from_dict(x)) == x para todo
+payload sin claves desconocidas.
+
+Uso:
+    from openapi_models import render_models
+    source = render_models(combined)   # código de models.py
+"""
+
+import keyword
+import re
+from collections import namedtuple
+
+from openapi_loader import unescape_pointer_token
+
+SCHEMAS_PREFIX = "#/components/schemas/"
+MAX_REF_CHAIN = 32
+
+HEADER = "# Generado por scripts/generate_sdk.py desde el documento OpenAPI combinado. No editar.\n"
+
+# Nombres que no pueden ser campos (métodos de los modelos o el parámetro self)
+_RESERVED_FIELDS = {"self", "from_dict", "to_dict"}
+
+# Un modelo a generar: campos (py, wire, conversor) de toda la jerarquía,
+# requeridos, clase base (o None) y descripción
+ModelSpec = namedtuple("ModelSpec", ["name", "fields", "required", "base", "description"])
+
+# Conversores: None (copiar el valor), ("model", clase), ("list", conversor), ("map", conversor)
+
+PRELUDE = '''class _Unset:
+    """Valor de los campos ausentes en el payload (se omiten en to_dict)"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+    def __bool__(self):
+        return False
+
+
+UNSET = _Unset()
+_new = object.__new__
+
+
+class Model:
+    """Base de los modelos: igualdad y repr sobre los campos"""
+
+    __slots__ = ()
+    FIELDS = ()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.FIELDS if getattr(self, name) is not UNSET
+        )
+        return f"{type(self).__name__}({fields})"'''
+
+
+def class_name(name):
+    """Nombre de clase válido para un schema ('document-detail' -> 'DocumentDetail')"""
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return name
+    parts = [part for part in re.split(r"[^0-9a-zA-Z]+", name) if part]
+    result = "".join(part[0].upper() + part[1:] for part in parts) or "Schema"
+    return f"Schema{result}" if result[0].isdigit() else result
+
+
+def field_name(wire, taken=()):
+    """Nombre de atributo para una propiedad: el mismo si es un identificador válido"""
+    name = wire if wire.isidentifier() else re.sub(r"\W", "_", wire)
+    if not name or name[0].isdigit():
+        name = f"field_{name}"
+    if keyword.iskeyword(name) or name in _RESERVED_FIELDS:
+        name += "_"
+    while name in taken:
+        name += "_"
+    return name
+
+
+def _camel(text):
+    return "".join(part[0].upper() + part[1:] for part in re.split(r"[^0-9a-zA-Z]+", text) if part)
+
+
+class _ModelCollector:
+    """Recorre components/schemas y arma los ModelSpec (incluidos los anidados)"""
+
+    def __init__(self, document):
+        self.schemas = (document.get("components") or {}).get("schemas") or {}
+        self.classes = {name: class_name(name) for name in self.schemas}
+        self.models = {}
+        self.aliases = {}
+        self._taken = set(self.classes.values())
+        self._building = set()
+
+    def target(self, ref):
+        """Schema final de una cadena de $ref a components/schemas: (nombre, schema) o (None, None)"""
+        for _ in range(MAX_REF_CHAIN):
+            if not isinstance(ref, str) or not ref.startswith(SCHEMAS_PREFIX):
+                return None, None
+            name = unescape_pointer_token(ref[len(SCHEMAS_PREFIX):])
+            schema = self.schemas.get(name)
+            if not isinstance(schema, dict):
+                return None, None
+            if set(schema) - {"description", "summary"} != {"$ref"}:
+                return name, schema
+            ref = schema["$ref"]
+        return None, None
+
+    @staticmethod
+    def is_model(schema):
+        return isinstance(schema, dict) and (
+            isinstance(schema.get("properties"), dict) or isinstance(schema.get("allOf"), list)
+        )
+
+    def model_for(self, name):
+        """Clase del schema `name` (se genera si hace falta)"""
+        class_ = self.classes[name]
+        if class_ not in self.models and class_ not in self._building:
+            self._building.add(class_)
+            self.models[class_] = self.build(class_, self.schemas[name])
+            self._building.discard(class_)
+        return class_
+
+    def nested_name(self, owner, wire, suffix=""):
+        name = f"{owner}{_camel(wire)}{suffix}"
+        while name in self._taken:
+            name += "_"
+        self._taken.add(name)
+        return name
+
+    def converter(self, schema, owner, wire, suffix=""):
+        """Conversor de una propiedad (None si el valor se copia tal cual)"""
+        if not isinstance(schema, dict):
+            return None
+        if "$ref" in schema:
+            name, target = self.target(schema["$ref"])
+            if name is None:
+                return None
+            if self.is_model(target):
+                return ("model", self.model_for(name))
+            return self.converter(target, owner, wire, suffix)
+        if self.is_model(schema):
+            nested = self.nested_name(owner, wire, suffix)
+            self.models[nested] = self.build(nested, schema)
+            return ("model", nested)
+        if schema.get("type") == "array":
+            inner = self.converter(schema.get("items"), owner, wire, suffix + "Item")
+            return ("list", inner) if inner else None
+        if isinstance(schema.get("additionalProperties"), dict):
+            inner = self.converter(schema["additionalProperties"], owner, wire, suffix + "Value")
+            return ("map", inner) if inner else None
+        return None
+
+    def flatten(self, schema, seen=()):
+        """(propiedades, requeridos) de un schema, combinando sus allOf en orden"""
+        properties = {}
+        required = []
+        for part in schema.get("allOf") or []:
+            if isinstance(part, dict) and "$ref" in part:
+                name, part = self.target(part["$ref"])
+                if name is None or name in seen:
+                    continue
+                seen = (*seen, name)
+            if isinstance(part, dict):
+                part_properties, part_required = self.flatten(part, seen)
+                properties.update(part_properties)
+                required.extend(part_required)
+        properties.update(schema.get("properties") or {})
+        required.extend(schema.get("required") or [])
+        return properties, required
+
+    def base_of(self, schema):
+        """Clase base de un allOf: el primer $ref a un modelo"""
+        for part in schema.get("allOf") or []:
+            if isinstance(part, dict) and "$ref" in part:
+                name, target = self.target(part["$ref"])
+                if name is not None and self.is_model(target):
+                    return self.model_for(name)
+        return None
+
+    def build(self, class_, schema):
+        base = self.base_of(schema)
+        properties, required = self.flatten(schema)
+        fields = []
+        taken = set()
+        for wire, subschema in properties.items():
+            name = field_name(wire, taken)
+            taken.add(name)
+            fields.append((name, wire, self.converter(subschema, class_, wire)))
+        required_names = [name for name, wire, _converter in fields if wire in set(required)]
+        description = (schema.get("description") or "").strip().split("\n", 1)[0]
+        return ModelSpec(class_, fields, required_names, base, description)
+
+    def collect(self):
+        for name, schema in self.schemas.items():
+            if not isinstance(schema, dict):
+                continue
+            if "$ref" in schema and not self.is_model(schema):
+                target, target_schema = self.target(schema["$ref"])
+                if target is not None and self.is_model(target_schema):
+                    self.aliases[self.classes[name]] = self.model_for(target)
+            elif self.is_model(schema):
+                self.model_for(name)
+        return self
+
+
+def collect_models(document):
+    """({clase: ModelSpec}, {alias: clase}) de components/schemas"""
+    collector = _ModelCollector(document).collect()
+    return collector.models, collector.aliases
+
+
+def _load(converter, expression, depth=0):
+    kind, inner = converter
+    if kind == "model":
+        return f"{inner}.from_dict({expression})"
+    item = f"item{depth}"
+    if kind == "list":
+        return f"[{_load(inner, item, depth + 1)} for {item} in {expression}]"
+    return f"{{key{depth}: {_load(inner, item, depth + 1)} for key{depth}, {item} in {expression}.items()}}"
+
+
+def _dump(converter, expression, depth=0):
+    kind, inner = converter
+    if kind == "model":
+        return f"{expression}.to_dict()"
+    item = f"item{depth}"
+    if kind == "list":
+        return f"[{_dump(inner, item, depth + 1)} for {item} in {expression}]"
+    return f"{{key{depth}: {_dump(inner, item, depth + 1)} for key{depth}, {item} in {expression}.items()}}"
+
+
+def render_model(spec, models):
+    """Código de una clase de modelo"""
+    base = spec.base or "Model"
+    inherited = {name for name, _wire, _converter in models[spec.base].fields} if spec.base else set()
+    own = [name for name, _wire, _converter in spec.fields if name not in inherited]
+    names = [name for name, _wire, _converter in spec.fields]
+
+    lines = [f"class {spec.name}({base}):"]
+    description = (spec.description or spec.name).replace("\\", "").replace('"', "'")
+    lines.append(f'    """{description}"""')
+    lines.append("")
+    lines.append(f"    __slots__ = {tuple(own)!r}")
+    lines.append(f"    FIELDS = {tuple(names)!r}")
+    lines.append("")
+
+    parameters = [name for name in names if name in spec.required]
+    parameters += [f"{name}=UNSET" for name in names if name not in spec.required]
+    if parameters:
+        lines.append(f"    def __init__(self, *, {', '.join(parameters)}):")
+        lines.extend(f"        self.{name} = {name}" for name in names)
+    else:
+        lines.append("    def __init__(self):")
+        lines.append("        pass")
+    lines.append("")
+
+    lines.append("    @classmethod")
+    lines.append("    def from_dict(cls, data):")
+    lines.append("        self = _new(cls)")
+    if spec.fields:
+        lines.append("        get = data.get")
+    for name, wire, converter in spec.fields:
+        if converter is None:
+            lines.append(f"        self.{name} = get({wire!r}, UNSET)")
+        else:
+            lines.append(f"        value = get({wire!r}, UNSET)")
+            lines.append(
+                f"        self.{name} = value if value is None or value is UNSET else {_load(converter, 'value')}"
+            )
+    lines.append("        return self")
+    lines.append("")
+
+    lines.append("    def to_dict(self):")
+    lines.append("        data = {}")
+    for name, wire, converter in spec.fields:
+        lines.append(f"        value = self.{name}")
+        lines.append("        if value is not UNSET:")
+        if converter is None:
+            lines.append(f"            data[{wire!r}] = value")
+        else:
+            lines.append(f"            data[{wire!r}] = None if value is None else {_dump(converter, 'value')}")
+    lines.append("        return data")
+    return "\n".join(lines)
+
+
+def _ordered(models):
+    """Clases en orden de definición: cada base antes que sus subclases"""
+    ordered = []
+    done = set()
+
+    def visit(name):
+        if name in done:
+            return
+        done.add(name)
+        if models[name].base:
+            visit(models[name].base)
+        ordered.append(name)
+
+    for name in models:
+        visit(name)
+    return ordered
+
+
+def render_models(document):
+    """Código de models.py para components/schemas del documento"""
+    models, aliases = collect_models(document)
+    parts = [HEADER + '"""Modelos con __slots__ generados desde components/schemas (ver from_dict/to_dict)"""', PRELUDE]
+    parts.extend(render_model(models[name], models) for name in _ordered(models))
+    if aliases:
+        parts.append("\n".join(f"{alias} = {target}" for alias, target in aliases.items()))
+    names = sorted({*models, *aliases})
+    parts.append("__all__ = [\n" + "".join(f"    {name!r},\n" for name in ["UNSET", "Model", *names]) + "]")
+    return "\n\n\n".join(parts) + "\n"
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Grafo de referencias ($ref) de un documento OpenAPI.
+
+Se construye en una sola pasada iterativa sobre el documento combinado:
+- aristas directas: qué nodos referencia cada operación o component
+- índice inverso: quién referencia directamente cada nodo
+- alcance transitivo: qué operaciones llegan (directa o indirectamente) a
+  cada component, precalculado para responder en O(1)
+- resolución de referencias memoizada
+- ciclos (componentes fuertemente conexos) y referencias colgantes
+
+Los nodos del grafo son JSON pointers de "dueños": una operación
+(/paths/<path>/<método>), un item de path (/paths/<path>) o una entrada de
+components (/components/<sección>/<nombre>).
+
+Uso:
+    from openapi_refs import RefGraph
+    graph = RefGraph(combined)
+    graph.dangling, graph.cycles
+    graph.operations_reaching("/components/schemas/Document")
+"""
+
+from collections import namedtuple
+
+from openapi_loader import escape_pointer_token, resolve_pointer, unescape_pointer_token
+
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# Aparición de un $ref: pointer del objeto que contiene "$ref" y su valor
+RefUse = namedtuple("RefUse", ["pointer", "ref"])
+
+# Referencia colgante ubicada en un archivo fuente (line es None si no se conoce)
+RefLocation = namedtuple("RefLocation", ["file", "line", "pointer", "ref"])
+
+
+def iter_refs(data):
+    """Recorrer `data` (sin recursión) y producir un RefUse por cada $ref local o externo"""
+    stack = [(data, "")]
+    while stack:
+        node, pointer = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                yield RefUse(pointer, ref)
+            for key, value in reversed(node.items()):
+                if isinstance(value, (dict, list)):
+                    stack.append((value, f"{pointer}/{escape_pointer_token(key)}"))
+        elif isinstance(node, list):
+            for index in range(len(node) - 1, -1, -1):
+                value = node[index]
+                if isinstance(value, (dict, list)):
+                    stack.append((value, f"{pointer}/{index}"))
+
+
+def ref_pointer(ref):
+    """JSON pointer de una referencia local ("#/a/b" -> "/a/b"), o None si es externa"""
+    if ref == "#":
+        return ""
+    if ref.startswith("#/"):
+        return ref[1:]
+    return None
+
+
+def owner_of(pointer):
+    """Dueño (operación, path o component) del nodo en `pointer`"""
+    tokens = pointer.split("/")[1:]
+    if tokens[:1] == ["paths"] and len(tokens) >= 2:
+        if len(tokens) >= 3 and unescape_pointer_token(tokens[2]) in HTTP_METHODS:
+            return "/" + "/".join(tokens[:3])
+        return "/" + "/".join(tokens[:2])
+    if tokens[:1] == ["components"] and len(tokens) >= 3:
+        return "/" + "/".join(tokens[:3])
+    return "/" + "/".join(tokens[:1]) if tokens else ""
+
+
+def is_operation(owner):
+    tokens = owner.split("/")
+    return len(tokens) == 4 and tokens[1] == "paths"
+
+
+class RefGraph:
+    """
+    Grafo de referencias de un documento.
+
+    Atributos:
+    - uses: lista de RefUse en orden de documento
+    - forward: {dueño: set(dueños referenciados)}
+    - reverse: {dueño: set(dueños que lo referencian directamente)}
+    - dangling: RefUse cuyas referencias locales no resuelven
+    - cycles: listas de dueños que forman un ciclo (incluye autorreferencias)
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.uses = list(iter_refs(document))
+        self.forward = {}
+        self.reverse = {}
+        self.dangling = []
+        self._resolved = {}
+
+        for use in self.uses:
+            source = owner_of(use.pointer)
+            self.forward.setdefault(source, set())
+            target_pointer = ref_pointer(use.ref)
+            if target_pointer is None:
+                # Las referencias externas no se verifican
+                continue
+            found, _node = self.resolve(use.ref)
+            if not found:
+                self.dangling.append(use)
+                continue
+            target = owner_of(target_pointer)
+            self.forward[source].add(target)
+            self.forward.setdefault(target, set())
+            self.reverse.setdefault(target, set()).add(source)
+
+        self.cycles = []
+        self._reachable = {}
+        self._compute_reachability()
+
+        # Índice inverso transitivo: component -> operaciones que llegan a él
+        self._operations_reaching = {}
+        for owner, reachable in self._reachable.items():
+            if is_operation(owner):
+                for target in reachable:
+                    self._operations_reaching.setdefault(target, set()).add(owner)
+
+    def resolve(self, ref):
+        """
+        Resolver una referencia local (memoizado).
+        Retorna (True, nodo) o (False, None) si no existe o es externa.
+        """
+        if ref not in self._resolved:
+            pointer = ref_pointer(ref)
+            try:
+                if pointer is None:
+                    raise KeyError(ref)
+                self._resolved[ref] = (True, resolve_pointer(self.document, pointer))
+            except (KeyError, IndexError, ValueError, TypeError):
+                self._resolved[ref] = (False, None)
+        return self._resolved[ref]
+
+    def _compute_reachability(self):
+        """
+        Tarjan iterativo: cada componente fuertemente conexo se cierra después
+        de todos los que alcanza, así que su alcance se arma con uniones de
+        resultados ya calculados (cada nodo se visita una vez).
+        """
+        index_of = {}
+        lowlink = {}
+        on_stack = set()
+        scc_stack = []
+        counter = 0
+
+        for root in self.forward:
+            if root in index_of:
+                continue
+            work = [(root, iter(sorted(self.forward[root])))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, targets = work[-1]
+                advanced = False
+                for target in targets:
+                    if target not in index_of:
+                        index_of[target] = lowlink[target] = counter
+                        counter += 1
+                        scc_stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(sorted(self.forward[target]))))
+                        advanced = True
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[target])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index_of[node]:
+                    continue
+
+                members = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.discard(member)
+                    members.append(member)
+                    if member == node:
+                        break
+                self._close_component(members)
+
+    def _close_component(self, members):
+        member_set = set(members)
+        reachable = set()
+        for member in members:
+            for target in self.forward[member]:
+                reachable.add(target)
+                if target not in member_set:
+                    reachable |= self._reachable[target]
+        for member in members:
+            self._reachable[member] = reachable
+        if len(members) > 1 or members[0] in self.forward[members[0]]:
+            self.cycles.append(sorted(members))
+
+    def referrers(self, target):
+        """Dueños que referencian directamente a `target` (O(1))"""
+        return self.reverse.get(target, set())
+
+    def reachable_from(self, owner):
+        """Dueños alcanzables desde `owner` siguiendo referencias"""
+        return self._reachable.get(owner, set())
+
+    def operations_reaching(self, target):
+        """Operaciones que llegan a `target` directa o indirectamente (O(1))"""
+        return self._operations_reaching.get(target, set())
+
+
+def locate_refs(sources, uses):
+    """
+    Ubicar en los archivos fuente las referencias de `uses` (de un documento
+    combinado). `sources` es una lista de (ruta, resultado de la etapa por
+    archivo) como los de SpecWorkspace; la línea sale del mapa de fuentes.
+    Retorna una lista de RefLocation en orden de archivo.
+    """
+    wanted = {use.ref for use in uses}
+    locations = []
+    for file_path, source in sources:
+        for use in iter_refs(source["data"]):
+            if use.ref in wanted:
+                line = source["source_map"].line(f"{use.pointer}/$ref")
+                locations.append(RefLocation(file_path, line, use.pointer, use.ref))
+    return locations
+
+
+def print_ref_report(graph, locations=None):
+    """Imprimir referencias colgantes (con ubicación en las fuentes) y ciclos"""
+    if graph.dangling:
+        print(f"❌ Referencias colgantes: {len(graph.dangling)}")
+        if locations:
+            for location in locations:
+                line = f":{location.line}" if location.line else ""
+                print(f"   {location.file}{line}: {location.ref} (en {location.pointer or '/'})")
+        else:
+            for use in graph.dangling:
+                print(f"   {use.ref} (en {use.pointer or '/'})")
+    for cycle in graph.cycles:
+        print(f"ℹ️  Referencias cíclicas entre: {', '.join(cycle)}")
+
+
+def reachable_schemas(graph):
+    """
+    Schemas alcanzables desde lo que no es un schema (operaciones, paths y
+    las demás secciones de components), siguiendo $ref a cualquier
+    profundidad (allOf, items, properties, ...).
+    """
+    prefix = "/components/schemas/"
+    reachable = set()
+    for owner in graph.forward:
+        if not owner.startswith(prefix):
+            reachable |= graph.reachable_from(owner)
+    return {owner for owner in reachable if owner.startswith(prefix)}
+
+
+def prune_unreachable_schemas(document, graph=None):
+    """
+    Quitar de components.schemas los schemas que ninguna operación alcanza.
+    Retorna (documento nuevo, nombres eliminados); `document` no se modifica.
+    """
+    graph = graph or RefGraph(document)
+    schemas = document.get("components", {}).get("schemas", {})
+    keep = reachable_schemas(graph)
+
+    kept = {}
+    removed = []
+    for name, schema in schemas.items():
+        if f"/components/schemas/{escape_pointer_token(name)}" in keep:
+            kept[name] = schema
+        else:
+            removed.append(name)
+    if not removed:
+        return document, removed
+
+    pruned = dict(document)
+    pruned["components"] = {**document["components"], "schemas": kept}
+    return pruned, removed
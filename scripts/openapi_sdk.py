@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Generador del cliente Python (SDK) desde el documento combinado.
+
+El paquete generado tiene:
+- _runtime.py: copia de sdk_runtime.py (pool keep-alive síncrono y asyncio,
+  autenticación `Authorization: Api-Key ...`, paginación, ApiError)
+- _operations/<operación>.py: un módulo por operación con `call` (síncrona),
+  `call_async` y, en las operaciones paginadas, `iterate`/`iterate_async`
+- client.py: Client y AsyncClient, que solo enlazan esas funciones como
+  métodos (cambia únicamente si se agregan o quitan operaciones)
+- models.py: clases con __slots__ de components/schemas (ver openapi_models.py)
+
+Las operaciones por lotes (ver openapi_load.is_batch_operation) reciben el
+lote como primer argumento (`client.create_documents_batch(documents)`) y
+validan su maxItems antes de enviar. Las operaciones GET con parámetro
+`page` cuya respuesta tiene `results` son paginadas: `iter_documents(...)`
+recorre todas las páginas.
+
+La regeneración es incremental: cada operación se resume en su modelo (los
+datos que usa su módulo: parámetros, cuerpo, lote, paginación, textos) y
+ese modelo se hashea. Un manifiesto en el paquete guarda el hash de cada
+módulo; las operaciones cuyo hash no cambió no se vuelven a generar.
+
+Uso:
+    from openapi_sdk import generate_sdk
+    report = generate_sdk(combined, Path("sdk/python/tupana_api"))
+"""
+
+import hashlib
+import json
+import keyword
+import re
+from collections import namedtuple
+from pathlib import Path
+
+from openapi_artifacts import write_if_changed
+from openapi_load import batch_limit, batch_property, is_batch_operation, iter_operations
+from openapi_mock import media_example, resolve_ref
+from openapi_models import render_models
+
+# Cambiar al modificar la plantilla de los módulos generados (invalida el manifiesto)
+GENERATOR_VERSION = "1"
+
+DEFAULT_SDK_DIR = Path("sdk/python/tupana_api")
+RUNTIME_SOURCE = Path(__file__).parent / "sdk_runtime.py"
+MANIFEST_NAME = "_manifest.json"
+DEFAULT_BASE_URL = "https://api.tupana.ai/v1"
+
+HEADER = "# Generado por scripts/generate_sdk.py desde el documento OpenAPI combinado. No editar.\n"
+
+# Nombres que usan las funciones generadas
+_RESERVED = {"client", "items", "body", "params", "headers", "arguments", "self"}
+
+# Resultado de una generación: módulos reescritos, sin cambios y eliminados
+SdkReport = namedtuple("SdkReport", ["written", "unchanged", "removed"])
+
+
+def _snake(text):
+    """'createDocumentsBatch' -> 'create_documents_batch', 'X-Use-Defaults' -> 'x_use_defaults'"""
+    text = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", text)
+    return re.sub(r"[^0-9a-zA-Z]+", "_", text).strip("_").lower()
+
+
+def _identifier(text, taken=()):
+    name = _snake(text) or "value"
+    if name[0].isdigit():
+        name = f"p_{name}"
+    if keyword.iskeyword(name) or name in _RESERVED:
+        name += "_"
+    while name in taken:
+        name += "_"
+    return name
+
+
+def operation_function_name(path, method, operation):
+    """
+    Nombre Python de una operación: su operationId, o el método y los
+    segmentos del path ('GET /scheduled-documents/{id}' -> 'get_scheduled_documents_by_id')
+    """
+    if operation.get("operationId"):
+        return _identifier(operation["operationId"])
+    words = [method]
+    for segment in path.strip("/").split("/"):
+        if segment.startswith("{") and segment.endswith("}"):
+            words.extend(["by", segment[1:-1]])
+        elif segment:
+            words.append(segment)
+    return _identifier("_".join(words))
+
+
+def iterator_name(function_name):
+    """'list_documents' o 'get_documents' -> 'iter_documents'"""
+    for prefix in ("list_", "get_"):
+        if function_name.startswith(prefix):
+            return "iter_" + function_name[len(prefix):]
+    return "iter_" + function_name
+
+
+def _first_paragraph(text):
+    return (text or "").strip().split("\n\n", 1)[0].strip()
+
+
+def _is_paginated(method, parameters, operation, document):
+    """GET con parámetro `page` y respuesta 200 con `results`"""
+    if method != "get" or not any(parameter["wire"] == "page" and parameter["in"] == "query" for parameter in parameters):
+        return False
+    response = resolve_ref((operation.get("responses") or {}).get("200"), document) or {}
+    media = (response.get("content") or {}).get("application/json") or {}
+    schema = resolve_ref(media.get("schema"), document) or {}
+    for subschema in [schema, *schema.get("allOf", [])]:
+        properties = (resolve_ref(subschema, document) or {}).get("properties") or {}
+        if "results" in properties:
+            return True
+    return False
+
+
+def operation_model(document, name, path, method, operation, function_name):
+    """
+    Modelo de una operación: todo lo que usa su módulo generado, ya resuelto
+    ($ref de parámetros, cuerpo y maxItems del lote). Su hash decide si el
+    módulo se regenera.
+    """
+    parameters = []
+    taken = set()
+    path_parameters = document["paths"][path].get("parameters", [])
+    for parameter in [*path_parameters, *operation.get("parameters", [])]:
+        parameter = resolve_ref(parameter, document)
+        if not isinstance(parameter, dict) or parameter.get("in") not in ("path", "query", "header"):
+            continue
+        wire = parameter.get("name", "")
+        # Parámetros con patrón (p. ej. json_param__{key}) van en `params`
+        if not wire or "{" in wire:
+            continue
+        identifier = _identifier(wire, taken)
+        taken.add(identifier)
+        parameters.append({
+            "py": identifier,
+            "wire": wire,
+            "in": parameter["in"],
+            "required": bool(parameter.get("required")) or parameter["in"] == "path",
+            "description": _first_paragraph(parameter.get("description")),
+        })
+
+    body = None
+    request_body = resolve_ref(operation.get("requestBody"), document)
+    if isinstance(request_body, dict) and request_body.get("content"):
+        body = {"required": bool(request_body.get("required")), "batch_property": None, "batch_limit": None}
+        if is_batch_operation(document, name):
+            media = request_body["content"].get("application/json") or {}
+            body["batch_property"] = batch_property(media_example(media, document))
+            body["batch_limit"] = batch_limit(operation, document)
+
+    return {
+        "function": function_name,
+        "name": name,
+        "method": method.upper(),
+        "path": path,
+        "summary": _first_paragraph(operation.get("summary")),
+        "description": _first_paragraph(operation.get("description")),
+        "parameters": parameters,
+        "body": body,
+        "paginated": _is_paginated(method, parameters, operation, document),
+        "deprecated": bool(operation.get("deprecated")),
+    }
+
+
+def model_hash(model):
+    """Hash del modelo de una operación (y de la versión del generador)"""
+    data = json.dumps([GENERATOR_VERSION, model], sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def operation_models(document):
+    """Modelos de todas las operaciones, con nombres de función únicos"""
+    models = []
+    taken = set()
+    for name, path, method, operation in iter_operations(document):
+        function_name = operation_function_name(path, method, operation)
+        while function_name in taken:
+            function_name += "_"
+        taken.add(function_name)
+        models.append(operation_model(document, name, path, method, operation, function_name))
+    return models
+
+
+def _docstring(lines, indent="    "):
+    text = "\n".join(lines).replace("\\", "\\\\").replace('"""', '\\"\\"\\"').rstrip()
+    body = text.replace("\n", f"\n{indent}").replace(f"\n{indent}\n", "\n\n")
+    return f'{indent}"""{body}\n{indent}"""\n' if "\n" in text else f'{indent}"""{text}"""\n'
+
+
+def render_operation(model):
+    """Código del módulo de una operación"""
+    parameters = model["parameters"]
+    body = model["body"]
+    batch = body is not None and body["batch_property"] is not None
+    by_location = {
+        location: {parameter["py"]: parameter["wire"] for parameter in parameters if parameter["in"] == location}
+        for location in ("path", "query", "header")
+    }
+
+    signature = ["client"]
+    if batch:
+        signature.append("items")
+    signature.append("*")
+    ordered = sorted(parameters, key=lambda parameter: not parameter["required"])
+    signature.extend(parameter["py"] if parameter["required"] else f"{parameter['py']}=None" for parameter in ordered)
+    if body is not None:
+        signature.append("body" if body["required"] and not batch else "body=None")
+    signature.extend(["params=None", "headers=None"])
+    arguments = ", ".join(f'"{parameter["py"]}": {parameter["py"]}' for parameter in parameters)
+    if batch:
+        body_argument = "batch_body(OPERATION, items, body)"
+    else:
+        body_argument = "body" if body is not None else "None"
+    request = f"client.request(OPERATION, {{{arguments}}}, body={body_argument}, params=params, headers=headers)"
+
+    doc = [model["summary"] or model["name"], ""]
+    if model["description"] and model["description"] != model["summary"]:
+        doc.extend([model["description"], ""])
+    doc.append(f"{model['name']}")
+    if model["deprecated"]:
+        doc.append("Obsoleta según la especificación.")
+    if batch:
+        limit = f" (máximo {body['batch_limit']})" if body["batch_limit"] is not None else ""
+        target = f"`{body['batch_property']}`" if body["batch_property"] else "el cuerpo"
+        doc.append(f"`items`: elementos del lote, se envían en {target}{limit}.")
+    described = [parameter for parameter in ordered if parameter["description"]]
+    if described:
+        doc.append("")
+        doc.extend(f"{parameter['py']}: {parameter['description']}" for parameter in described)
+    doc.append("`params`: parámetros de query adicionales; `headers`: headers adicionales.")
+
+    imports = ["Operation"]
+    if batch:
+        imports.append("batch_body")
+    if model["paginated"]:
+        imports.extend(["iterate_pages", "iterate_pages_async"])
+
+    operation = (
+        "OPERATION = Operation(\n"
+        f"    name={model['name']!r},\n"
+        f"    method={model['method']!r},\n"
+        f"    path={model['path']!r},\n"
+        f"    path_params={by_location['path']!r},\n"
+        f"    query_params={by_location['query']!r},\n"
+        f"    header_params={by_location['header']!r},\n"
+        f"    batch_property={body['batch_property'] if body else None!r},\n"
+        f"    batch_limit={body['batch_limit'] if body else None!r},\n"
+        ")\n"
+    )
+    signature_text = ", ".join(signature)
+    parts = [
+        HEADER,
+        f'"""{model["name"]}"""\n',
+        "\n",
+        f"from .._runtime import {', '.join(sorted(imports))}\n",
+        "\n",
+        operation,
+        "\n\n",
+        f"def call({signature_text}):\n",
+        _docstring(doc),
+        f"    return {request}\n",
+        "\n\n",
+        f"async def call_async({signature_text}):\n",
+        _docstring([f"Versión asyncio de call ({model['name']})"]),
+        f"    return await {request}\n",
+    ]
+    if model["paginated"]:
+        parts.extend([
+            "\n\n",
+            "def iterate(client, **arguments):\n",
+            _docstring(["Elementos de todas las páginas (`results`), pedidas a medida que se consumen"]),
+            "    return iterate_pages(lambda **page_arguments: call(client, **page_arguments), arguments)\n",
+            "\n\n",
+            "def iterate_async(client, **arguments):\n",
+            _docstring(["Versión asyncio de iterate (`async for item in ...`)"]),
+            "    return iterate_pages_async(lambda **page_arguments: call_async(client, **page_arguments), arguments)\n",
+        ])
+    return "".join(parts)
+
+
+def render_client(models, base_url, auth_header):
+    """Código de client.py: Client y AsyncClient con un método por operación"""
+    lines = [HEADER, '"""Clientes de la API generados desde la especificación OpenAPI"""', ""]
+    lines.append("from ._runtime import AsyncClientBase, SyncClientBase")
+    for model in sorted(models, key=lambda model: model["function"]):
+        lines.append(f"from ._operations import {model['function']} as _{model['function']}")
+    lines.extend(["", f"BASE_URL = {base_url!r}", "", ""])
+
+    for class_name, base, suffix, iterate, description in (
+        ("Client", "SyncClientBase", "call", "iterate", "Cliente síncrono con conexiones keep-alive reutilizadas"),
+        ("AsyncClient", "AsyncClientBase", "call_async", "iterate_async", "Cliente asyncio con conexiones keep-alive reutilizadas"),
+    ):
+        lines.append(f"class {class_name}({base}):")
+        lines.append(f'    """{description}"""')
+        lines.append("")
+        lines.append("    BASE_URL = BASE_URL")
+        lines.append(f"    AUTH_HEADER = {auth_header!r}")
+        lines.append("")
+        for model in models:
+            lines.append(f"    {model['function']} = _{model['function']}.{suffix}")
+            if model["paginated"]:
+                lines.append(f"    {iterator_name(model['function'])} = _{model['function']}.{iterate}")
+        lines.extend(["", ""])
+    return "\n".join(lines).rstrip() + "\n"
+
+
+INIT_SOURCE = HEADER + '''"""
+Cliente de la API generado desde la especificación OpenAPI.
+
+    from tupana_api import Client, models
+    with Client(api_key="...") as client:
+        for data in client.iter_documents(master_entity_id=1):
+            document = models.DocumentDetail.from_dict(data)
+"""
+
+from . import models
+from ._runtime import ApiError
+from .client import AsyncClient, Client
+
+__all__ = ["ApiError", "AsyncClient", "Client", "models"]
+'''
+
+
+def _server_url(document):
+    servers = document.get("servers") or []
+    if servers and isinstance(servers[0], dict) and servers[0].get("url"):
+        return servers[0]["url"]
+    return DEFAULT_BASE_URL
+
+
+def _auth_header(document):
+    """Header de la API key según securitySchemes (Authorization si no se declara)"""
+    schemes = (document.get("components") or {}).get("securitySchemes") or {}
+    for scheme in schemes.values():
+        if isinstance(scheme, dict) and scheme.get("type") == "apiKey" and scheme.get("in") == "header":
+            return scheme.get("name", "Authorization")
+    return "Authorization"
+
+
+def _read_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("generator_version") != GENERATOR_VERSION:
+        return {}
+    return manifest.get("operations", {})
+
+
+def generate_sdk(document, output_dir=DEFAULT_SDK_DIR, force=False):
+    """
+    Generar (o actualizar) el paquete en `output_dir`. Solo se reescriben los
+    módulos de operaciones cuyo hash cambió (todos con force=True) y se
+    eliminan los de operaciones que ya no existen. Retorna un SdkReport.
+    """
+    output_dir = Path(output_dir)
+    operations_dir = output_dir / "_operations"
+    manifest_path = output_dir / MANIFEST_NAME
+    previous = {} if force else _read_manifest(manifest_path)
+
+    models = operation_models(document)
+    hashes = {}
+    written = []
+    unchanged = []
+    for model in models:
+        module = model["function"]
+        digest = model_hash(model)
+        hashes[module] = digest
+        module_path = operations_dir / f"{module}.py"
+        if previous.get(module) == digest and module_path.exists():
+            unchanged.append(module)
+            continue
+        if write_if_changed(module_path, render_operation(model).encode("utf-8")):
+            written.append(module)
+        else:
+            unchanged.append(module)
+
+    removed = []
+    for module in sorted(set(previous) - set(hashes)):
+        try:
+            (operations_dir / f"{module}.py").unlink()
+            removed.append(module)
+        except FileNotFoundError:
+            pass
+
+    write_if_changed(operations_dir / "__init__.py", HEADER.encode("utf-8"))
+    write_if_changed(output_dir / "_runtime.py", RUNTIME_SOURCE.read_bytes())
+    write_if_changed(output_dir / "client.py", render_client(models, _server_url(document), _auth_header(document)).encode("utf-8"))
+    write_if_changed(output_dir / "models.py", render_models(document).encode("utf-8"))
+    write_if_changed(output_dir / "__init__.py", INIT_SOURCE.encode("utf-8"))
+    manifest = {"generator_version": GENERATOR_VERSION, "operations": dict(sorted(hashes.items()))}
+    write_if_changed(manifest_path, (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+    return SdkReport(written, unchanged, removed)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Fragmentos (shards) del documento combinado según la navegación de docs.json.
+
+Cada tab (o grupo) de `navigation.tabs` lista páginas .mdx; el frontmatter
+de cada página indica la operación que documenta (`openapi: 'GET /documents'`).
+Con eso se arma un documento por tab/grupo que contiene solo esas operaciones
+y los schemas que alcanzan (según el grafo de referencias), más un manifiesto
+para que cada sección cargue solo su parte.
+
+Las páginas que apuntan a otro archivo de especificación
+(`openapi: 'otro.json GET /x'`) no se incluyen.
+
+Uso:
+    from openapi_shards import build_shards, write_shards
+    shards, missing = build_shards(combined, graph, load_navigation("docs.json"))
+    write_shards(shards, missing, Path("api-reference/shards"))
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from collections import namedtuple
+from pathlib import Path
+
+from openapi_artifacts import write_if_changed
+from openapi_loader import escape_pointer_token
+from openapi_refs import HTTP_METHODS
+
+DEFAULT_DOCS_CONFIG = Path("docs.json")
+DEFAULT_SHARDS_DIR = Path("api-reference/shards")
+MANIFEST_FILE = "manifest.json"
+SHARD_MODES = ("tab", "group")
+
+# Sección de la navegación: nombre, grupos que incluye y páginas en orden
+NavSection = namedtuple("NavSection", ["name", "groups", "pages"])
+
+# Fragmento generado: sección, documento y operaciones ("GET /documents")
+Shard = namedtuple("Shard", ["section", "document", "operations"])
+
+_FRONTMATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*(?:\n|\Z)", re.S)
+_OPENAPI_LINE = re.compile(r"^openapi:\s*(['\"]?)(.*?)\1\s*$", re.M)
+
+
+def _group_pages(group):
+    """Páginas de un grupo, incluyendo las de subgrupos anidados"""
+    pages = []
+    stack = [iter(group.get("pages", []))]
+    while stack:
+        for page in stack[-1]:
+            if isinstance(page, str):
+                pages.append(page)
+            elif isinstance(page, dict):
+                stack.append(iter(page.get("pages", [])))
+                break
+        else:
+            stack.pop()
+    return pages
+
+
+def load_navigation(docs_config=DEFAULT_DOCS_CONFIG, mode="tab"):
+    """
+    Leer navigation.tabs de docs.json.
+    Retorna una lista de NavSection, una por tab (mode="tab") o por grupo
+    (mode="group", con nombre "Tab / Grupo").
+    """
+    with open(docs_config, "r", encoding="utf-8") as f:
+        navigation = json.load(f).get("navigation", {})
+
+    sections = []
+    for tab in navigation.get("tabs", []):
+        groups = tab.get("groups", [])
+        if mode == "group":
+            for group in groups:
+                sections.append(
+                    NavSection(f"{tab['tab']} / {group['group']}", [group["group"]], _group_pages(group))
+                )
+        else:
+            pages = [page for group in groups for page in _group_pages(group)]
+            sections.append(NavSection(tab["tab"], [group["group"] for group in groups], pages))
+    return sections
+
+
+def page_operation(page_file):
+    """
+    Operación declarada en el frontmatter de una página .mdx.
+    Retorna (archivo de spec o None, MÉTODO, path), o None si no declara una.
+    """
+    try:
+        text = Path(page_file).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    frontmatter = _FRONTMATTER.match(text)
+    if not frontmatter:
+        return None
+    declaration = _OPENAPI_LINE.search(frontmatter.group(1))
+    if not declaration:
+        return None
+
+    parts = declaration.group(2).split()
+    if len(parts) == 2:
+        spec_file, (method, path) = None, parts
+    elif len(parts) == 3:
+        spec_file, method, path = parts
+    else:
+        return None
+    if method.lower() not in HTTP_METHODS:
+        return None
+    return spec_file, method.upper(), path
+
+
+def slugify(name):
+    """Nombre de archivo estable para una sección ("API Facturación" -> "api-facturacion")"""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-") or "shard"
+
+
+def shard_document(combined, graph, operations):
+    """
+    Documento con solo `operations` ([(MÉTODO, path)]) y los schemas que
+    alcanzan. Las demás secciones de components se conservan completas.
+    """
+    paths = {}
+    reachable = set()
+    for method, path in operations:
+        path_item = combined["paths"][path]
+        target = paths.setdefault(
+            path, {key: value for key, value in path_item.items() if key not in HTTP_METHODS}
+        )
+        target[method.lower()] = path_item[method.lower()]
+
+        path_owner = f"/paths/{escape_pointer_token(path)}"
+        for owner in (path_owner, f"{path_owner}/{method.lower()}"):
+            reachable.add(owner)
+            reachable |= graph.reachable_from(owner)
+
+    document = {key: value for key, value in combined.items() if key != "paths"}
+    document["paths"] = paths
+    components = combined.get("components")
+    if components and "schemas" in components:
+        document["components"] = {
+            **components,
+            "schemas": {
+                name: schema
+                for name, schema in components["schemas"].items()
+                if f"/components/schemas/{escape_pointer_token(name)}" in reachable
+            },
+        }
+    return document
+
+
+def build_shards(combined, graph, sections, docs_root=Path("."), spec_file=None):
+    """
+    Armar un Shard por sección que use operaciones del documento combinado.
+    `spec_file` es la ruta del combinado tal como la escriben las páginas
+    (las que nombran otro archivo se ignoran).
+    Retorna (shards, faltantes), con faltantes = [(página, "MÉTODO path")]
+    para operaciones declaradas que no existen en el combinado.
+    """
+    shards = []
+    missing = []
+    for section in sections:
+        operations = []
+        for page in section.pages:
+            declared = page_operation(Path(docs_root) / f"{page}.mdx")
+            if declared is None:
+                continue
+            declared_spec, method, path = declared
+            if declared_spec is not None and declared_spec != spec_file:
+                continue
+            if method.lower() not in combined.get("paths", {}).get(path, {}):
+                missing.append((page, f"{method} {path}"))
+                continue
+            if (method, path) not in operations:
+                operations.append((method, path))
+
+        if operations:
+            document = shard_document(combined, graph, operations)
+            names = [f"{method} {path}" for method, path in operations]
+            shards.append(Shard(section, document, names))
+    return shards, missing
+
+
+def shard_file_names(shards):
+    """
+    Nombre de archivo de cada shard, en orden: secciones cuyo nombre da el
+    mismo slug ("API Facturación" y "API Facturacion") reciben un sufijo
+    ("api-facturacion-2.json") en vez de pisarse.
+    """
+    taken = {MANIFEST_FILE}
+    names = []
+    for shard in shards:
+        slug = slugify(shard.section.name)
+        file_name = f"{slug}.json"
+        suffix = 2
+        while file_name in taken:
+            file_name = f"{slug}-{suffix}.json"
+            suffix += 1
+        taken.add(file_name)
+        names.append(file_name)
+    return names
+
+
+def _is_shard_file(output_dir, file_name):
+    """True si `file_name` (leído de un manifiesto) es un shard *.json directamente dentro de `output_dir`"""
+    if not isinstance(file_name, str) or file_name == MANIFEST_FILE or not file_name.endswith(".json"):
+        return False
+    if Path(file_name).name != file_name:
+        return False
+    return (output_dir / file_name).resolve().parent == output_dir.resolve()
+
+
+def write_shards(shards, missing, output_dir=DEFAULT_SHARDS_DIR, source=None):
+    """
+    Escribir cada shard y el manifiesto (manifest.json) en `output_dir`
+    (solo los archivos cuyo contenido cambió). Retorna el manifiesto.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_FILE
+    file_names = shard_file_names(shards)
+
+    # Shards de una generación anterior que ya no corresponden a ninguna
+    # sección (solo archivos del directorio: el manifiesto podría estar editado)
+    current = set(file_names)
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f).get("shards", [])
+        for entry in previous:
+            file_name = entry.get("file") if isinstance(entry, dict) else None
+            if file_name not in current and _is_shard_file(output_dir, file_name):
+                (output_dir / file_name).unlink(missing_ok=True)
+
+    entries = []
+    for shard, file_name in zip(shards, file_names):
+        data = json.dumps(shard.document, indent=2, ensure_ascii=False).encode("utf-8")
+        write_if_changed(output_dir / file_name, data)
+        entries.append(
+            {
+                "name": shard.section.name,
+                "groups": shard.section.groups,
+                "file": file_name,
+                "operations": shard.operations,
+                "schemas": len(shard.document.get("components", {}).get("schemas", {})),
+                "bytes": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+        )
+
+    manifest = {
+        "source": str(source) if source else None,
+        "shards": entries,
+        "missing": [{"page": page, "operation": operation} for page, operation in missing],
+    }
+    text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    write_if_changed(manifest_path, text.encode("utf-8"))
+    return manifest
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Verificación estructural de documentos OpenAPI 3.0.
+
+La estructura de cada objeto de la especificación que usamos (documento,
+paths, operaciones, parámetros, requestBody, respuestas, media types,
+components, schemas, ...) se describe en la tabla OBJECTS: campos
+permitidos con su tipo, campos requeridos, campos con patrón y una
+verificación adicional opcional. La tabla se compila una sola vez (al
+importar el módulo) a una función de validación por objeto, y cada
+documento se recorre una sola vez con una pila explícita.
+
+Los archivos parciales (sin "openapi", como los de api-reference/openapi/)
+se validan igual, pero sin exigir los campos de primer nivel.
+
+Uso:
+    from openapi_structure import check_structure
+    for issue in check_structure(data):
+        print(issue.pointer, issue.message)
+"""
+
+import re
+from collections import namedtuple
+
+from openapi_loader import escape_pointer_token
+
+# Problema estructural: JSON pointer del nodo y mensaje
+StructureIssue = namedtuple("StructureIssue", ["pointer", "message"])
+
+# Descripción de un objeto de la especificación:
+# - fields: {campo: tipo}
+# - required: campos obligatorios
+# - patterned: [(regex de la clave, tipo)] para campos con nombre variable
+# - check: función(nodo) -> lista de (sufijo del pointer, mensaje), o None
+ObjectSpec = namedtuple("ObjectSpec", ["fields", "required", "patterned", "check"])
+
+# Tipos de campo: "string", "boolean", "number", "integer", "any", el nombre
+# de un objeto de OBJECTS, "Objeto|ref" (objeto o Reference),
+# ("list", tipo) y ("map", tipo)
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+SCHEMA_TYPES = {"string", "number", "integer", "boolean", "array", "object"}
+PARAMETER_LOCATIONS = {"query", "header", "path", "cookie"}
+SECURITY_SCHEME_TYPES = {"apiKey", "http", "oauth2", "openIdConnect"}
+_STATUS_CODE = r"^([1-5][0-9][0-9]|[1-5]XX|default)$"
+
+
+def _spec(fields, required=(), patterned=(), check=None):
+    return ObjectSpec(fields, tuple(required), tuple(patterned), check)
+
+
+def _check_document(node):
+    version = node.get("openapi")
+    if isinstance(version, str) and not version.startswith("3.0."):
+        return [("/openapi", f"versión '{version}' no soportada (se espera 3.0.x)")]
+    return None
+
+
+def _check_parameter(node):
+    problems = []
+    location = node.get("in")
+    if location is not None and location not in PARAMETER_LOCATIONS:
+        problems.append(("/in", f"'in' inválido: '{location}' (se espera {', '.join(sorted(PARAMETER_LOCATIONS))})"))
+    if location == "path" and node.get("required") is not True:
+        problems.append(("", "los parámetros de path deben tener required: true"))
+    problems.extend(_check_schema_or_content(node))
+    return problems
+
+
+def _check_schema_or_content(node):
+    if "$ref" in node:
+        return []
+    if ("schema" in node) == ("content" in node):
+        return [("", "debe tener 'schema' o 'content' (exactamente uno)")]
+    return []
+
+
+def _check_media_type(node):
+    if "example" in node and "examples" in node:
+        return [("", "'example' y 'examples' son mutuamente excluyentes")]
+    return None
+
+
+def _check_responses(node):
+    if not any(key == "default" or not key.startswith("x-") for key in node):
+        return [("", "debe declarar al menos una respuesta")]
+    return None
+
+
+def _check_schema(node):
+    problems = []
+    schema_type = node.get("type")
+    if schema_type is not None and schema_type not in SCHEMA_TYPES:
+        problems.append(("/type", f"tipo inválido: {schema_type!r}"))
+    if schema_type == "array" and "items" not in node:
+        problems.append(("", "los schemas de tipo array deben definir 'items'"))
+    if node.get("readOnly") is True and node.get("writeOnly") is True:
+        problems.append(("", "readOnly y writeOnly no pueden ser ambos true"))
+    enum = node.get("enum")
+    if isinstance(enum, list) and not enum:
+        problems.append(("/enum", "enum no puede estar vacío"))
+
+    # Propiedades requeridas que no están definidas (solo si el schema las
+    # define todas: sin composición ni propiedades adicionales)
+    properties = node.get("properties")
+    if (
+        isinstance(properties, dict)
+        and isinstance(node.get("required"), list)
+        and not any(keyword in node for keyword in ("allOf", "anyOf", "oneOf", "additionalProperties"))
+    ):
+        for name in node["required"]:
+            if isinstance(name, str) and name not in properties:
+                problems.append(("/required", f"'{name}' es requerida pero no está en properties"))
+    return problems
+
+
+def _check_security_scheme(node):
+    scheme_type = node.get("type")
+    if scheme_type not in SECURITY_SCHEME_TYPES:
+        return [("/type", f"tipo de security scheme inválido: {scheme_type!r}")]
+    needed = {
+        "apiKey": ("name", "in"),
+        "http": ("scheme",),
+        "oauth2": ("flows",),
+        "openIdConnect": ("openIdConnectUrl",),
+    }[scheme_type]
+    return [("", f"falta '{field}' (requerido para type {scheme_type})") for field in needed if field not in node]
+
+
+_SCHEMA_FIELDS = {
+    "title": "string",
+    "multipleOf": "number",
+    "maximum": "number",
+    "exclusiveMaximum": "boolean",
+    "minimum": "number",
+    "exclusiveMinimum": "boolean",
+    "maxLength": "integer",
+    "minLength": "integer",
+    "pattern": "string",
+    "maxItems": "integer",
+    "minItems": "integer",
+    "uniqueItems": "boolean",
+    "maxProperties": "integer",
+    "minProperties": "integer",
+    "required": ("list", "string"),
+    "enum": ("list", "any"),
+    "type": "string",
+    "allOf": ("list", "Schema|ref"),
+    "oneOf": ("list", "Schema|ref"),
+    "anyOf": ("list", "Schema|ref"),
+    "not": "Schema|ref",
+    "items": "Schema|ref",
+    "properties": ("map", "Schema|ref"),
+    "additionalProperties": "AdditionalProperties",
+    "description": "string",
+    "format": "string",
+    "default": "any",
+    "nullable": "boolean",
+    "discriminator": "Discriminator",
+    "readOnly": "boolean",
+    "writeOnly": "boolean",
+    "xml": "any",
+    "externalDocs": "ExternalDocs",
+    "example": "any",
+    "deprecated": "boolean",
+}
+
+_PARAMETER_FIELDS = {
+    "description": "string",
+    "required": "boolean",
+    "deprecated": "boolean",
+    "allowEmptyValue": "boolean",
+    "style": "string",
+    "explode": "boolean",
+    "allowReserved": "boolean",
+    "schema": "Schema|ref",
+    "example": "any",
+    "examples": ("map", "Example|ref"),
+    "content": ("map", "MediaType"),
+}
+
+OBJECTS = {
+    "Document": _spec(
+        {
+            "openapi": "string",
+            "info": "Info",
+            "servers": ("list", "Server"),
+            "paths": "Paths",
+            "components": "Components",
+            "security": ("list", "any"),
+            "tags": ("list", "Tag"),
+            "externalDocs": "ExternalDocs",
+        },
+        check=_check_document,
+    ),
+    "Info": _spec(
+        {
+            "title": "string",
+            "description": "string",
+            "termsOfService": "string",
+            "contact": "any",
+            "license": "any",
+            "version": "string",
+        },
+        required=("title", "version"),
+    ),
+    "Server": _spec(
+        {"url": "string", "description": "string", "variables": ("map", "any")},
+        required=("url",),
+    ),
+    "Tag": _spec(
+        {"name": "string", "description": "string", "externalDocs": "ExternalDocs"},
+        required=("name",),
+    ),
+    "ExternalDocs": _spec({"description": "string", "url": "string"}, required=("url",)),
+    "Paths": _spec({}, patterned=[(r"^/", "PathItem")]),
+    "PathItem": _spec(
+        {
+            "$ref": "string",
+            "summary": "string",
+            "description": "string",
+            **{method: "Operation" for method in HTTP_METHODS},
+            "servers": ("list", "Server"),
+            "parameters": ("list", "Parameter|ref"),
+        }
+    ),
+    "Operation": _spec(
+        {
+            "tags": ("list", "string"),
+            "summary": "string",
+            "description": "string",
+            "externalDocs": "ExternalDocs",
+            "operationId": "string",
+            "parameters": ("list", "Parameter|ref"),
+            "requestBody": "RequestBody|ref",
+            "responses": "Responses",
+            "callbacks": ("map", "any"),
+            "deprecated": "boolean",
+            "security": ("list", "any"),
+            "servers": ("list", "Server"),
+        },
+        required=("responses",),
+    ),
+    "Parameter": _spec(
+        {"name": "string", "in": "string", **_PARAMETER_FIELDS},
+        required=("name", "in"),
+        check=_check_parameter,
+    ),
+    "Header": _spec(_PARAMETER_FIELDS, check=_check_schema_or_content),
+    "RequestBody": _spec(
+        {"description": "string", "content": ("map", "MediaType"), "required": "boolean"},
+        required=("content",),
+    ),
+    "MediaType": _spec(
+        {
+            "schema": "Schema|ref",
+            "example": "any",
+            "examples": ("map", "Example|ref"),
+            "encoding": ("map", "any"),
+        },
+        check=_check_media_type,
+    ),
+    "Example": _spec(
+        {"summary": "string", "description": "string", "value": "any", "externalValue": "string"}
+    ),
+    "Responses": _spec(
+        {"default": "Response|ref"},
+        patterned=[(_STATUS_CODE, "Response|ref")],
+        check=_check_responses,
+    ),
+    "Response": _spec(
+        {
+            "description": "string",
+            "headers": ("map", "Header|ref"),
+            "content": ("map", "MediaType"),
+            "links": ("map", "any"),
+        },
+        required=("description",),
+    ),
+    "Components": _spec(
+        {
+            "schemas": ("map", "Schema|ref"),
+            "responses": ("map", "Response|ref"),
+            "parameters": ("map", "Parameter|ref"),
+            "examples": ("map", "Example|ref"),
+            "requestBodies": ("map", "RequestBody|ref"),
+            "headers": ("map", "Header|ref"),
+            "securitySchemes": ("map", "SecurityScheme|ref"),
+            "links": ("map", "any"),
+            "callbacks": ("map", "any"),
+        }
+    ),
+    "SecurityScheme": _spec(
+        {
+            "type": "string",
+            "description": "string",
+            "name": "string",
+            "in": "string",
+            "scheme": "string",
+            "bearerFormat": "string",
+            "flows": "any",
+            "openIdConnectUrl": "string",
+        },
+        required=("type",),
+        check=_check_security_scheme,
+    ),
+    "Schema": _spec(_SCHEMA_FIELDS, check=_check_schema),
+    "Discriminator": _spec(
+        {"propertyName": "string", "mapping": ("map", "string")}, required=("propertyName",)
+    ),
+}
+
+# Campos de primer nivel obligatorios en un documento completo
+DOCUMENT_REQUIRED = ("openapi", "info", "paths")
+
+_SCALARS = {
+    "string": (str,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+}
+
+
+def _type_label(value):
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, dict):
+        return "objeto"
+    if isinstance(value, list):
+        return "lista"
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def _compile_type(type_spec, validators):
+    """
+    Función handler(valor, pointer, push, issues) para un tipo de campo.
+    Los objetos no se validan en el momento: se apilan con push(validador,
+    valor, pointer) para que el recorrido siga siendo iterativo.
+    """
+    if type_spec == "any":
+        return None
+
+    if isinstance(type_spec, tuple):
+        container, item_spec = type_spec
+        item = _compile_type(item_spec, validators)
+        if container == "list":
+
+            def handle_list(value, pointer, push, issues):
+                if not isinstance(value, list):
+                    issues.append(StructureIssue(pointer, f"se esperaba una lista, se encontró {_type_label(value)}"))
+                    return
+                if item is not None:
+                    for index, element in enumerate(value):
+                        item(element, f"{pointer}/{index}", push, issues)
+
+            return handle_list
+
+        def handle_map(value, pointer, push, issues):
+            if not isinstance(value, dict):
+                issues.append(StructureIssue(pointer, f"se esperaba un objeto, se encontró {_type_label(value)}"))
+                return
+            if item is not None:
+                for key, element in value.items():
+                    item(element, f"{pointer}/{escape_pointer_token(key)}", push, issues)
+
+        return handle_map
+
+    if type_spec in _SCALARS:
+        accepted = _SCALARS[type_spec]
+
+        def handle_scalar(value, pointer, push, issues):
+            if (isinstance(value, bool) and bool not in accepted) or not isinstance(value, accepted):
+                issues.append(StructureIssue(pointer, f"se esperaba {type_spec}, se encontró {_type_label(value)}"))
+
+        return handle_scalar
+
+    if type_spec == "AdditionalProperties":
+        schema = _compile_type("Schema|ref", validators)
+
+        def handle_additional(value, pointer, push, issues):
+            if not isinstance(value, bool):
+                schema(value, pointer, push, issues)
+
+        return handle_additional
+
+    name, _, ref = type_spec.partition("|")
+    allows_ref = ref == "ref"
+
+    def handle_object(value, pointer, push, issues):
+        if allows_ref and isinstance(value, dict) and "$ref" in value:
+            if not isinstance(value["$ref"], str):
+                issues.append(StructureIssue(f"{pointer}/$ref", "$ref debe ser un string"))
+            return
+        push(validators[name], value, pointer)
+
+    return handle_object
+
+
+def _compile_object(name, spec, validators):
+    """Función validate(nodo, pointer, push, issues) para un objeto de OBJECTS"""
+    fields = {field: _compile_type(type_spec, validators) for field, type_spec in spec.fields.items()}
+    patterned = [(re.compile(pattern), _compile_type(type_spec, validators)) for pattern, type_spec in spec.patterned]
+    required = spec.required
+    check = spec.check
+
+    def validate(node, pointer, push, issues):
+        if not isinstance(node, dict):
+            issues.append(StructureIssue(pointer, f"{name}: se esperaba un objeto, se encontró {_type_label(node)}"))
+            return
+        for field in required:
+            if field not in node:
+                issues.append(StructureIssue(pointer, f"{name}: falta el campo requerido '{field}'"))
+        for key, value in node.items():
+            child = f"{pointer}/{escape_pointer_token(key)}"
+            if key in fields:
+                handler = fields[key]
+            else:
+                for pattern, handler in patterned:
+                    if pattern.match(key):
+                        break
+                else:
+                    if not key.startswith("x-"):
+                        issues.append(StructureIssue(child, f"{name}: campo desconocido '{key}'"))
+                    continue
+            if handler is not None:
+                handler(value, child, push, issues)
+        if check is not None:
+            for suffix, message in check(node) or ():
+                issues.append(StructureIssue(f"{pointer}{suffix}", f"{name}: {message}"))
+
+    return validate
+
+
+def compile_objects(objects=None):
+    """Compilar la tabla de objetos a {nombre: función de validación}"""
+    validators = {}
+    for name, spec in (objects or OBJECTS).items():
+        validators[name] = _compile_object(name, spec, validators)
+    return validators
+
+
+_VALIDATORS = compile_objects()
+_COMPLETE_DOCUMENT = _compile_object(
+    "Document", OBJECTS["Document"]._replace(required=DOCUMENT_REQUIRED), _VALIDATORS
+)
+
+
+def check_structure(document, partial=None):
+    """
+    Verificar la estructura de un documento OpenAPI en un solo recorrido.
+    Con partial=None se considera parcial si no declara "openapi" (archivos
+    divididos): no se exigen los campos de primer nivel.
+    Retorna una lista de StructureIssue en orden de recorrido.
+    """
+    if partial is None:
+        partial = not (isinstance(document, dict) and "openapi" in document)
+
+    issues = []
+    stack = [(_VALIDATORS["Document"] if partial else _COMPLETE_DOCUMENT, document, "")]
+    push = lambda validator, value, pointer: stack.append((validator, value, pointer))  # noqa: E731
+    while stack:
+        validator, node, pointer = stack.pop()
+        validator(node, pointer, push, issues)
+    return issues
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Instrumentación del build en formato Chrome trace-event.
+
+Un Tracer registra spans (fase, archivo, etapa, regla) y contadores
+(nodos visitados, correcciones aplicadas, ...) y los escribe como JSON de
+trace events, que se abre en chrome://tracing o https://ui.perfetto.dev.
+También imprime un resumen con las fases y archivos más lentos.
+
+Sin --trace se usa NULL_TRACER, cuyos métodos no hacen nada: el código
+instrumentado no necesita preguntar si el tracing está activo.
+
+Los tiempos son de time.perf_counter_ns (monótono y compartido entre
+procesos en Linux), así que los spans de los procesos del pool (--jobs)
+se combinan en la misma línea de tiempo.
+
+Uso:
+    from openapi_trace import Tracer
+    tracer = Tracer()
+    with tracer.span("combinar"):
+        ...
+    tracer.count("nodos visitados", 120)
+    tracer.write(Path("openapi-trace.json"))
+    tracer.print_summary()
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from openapi_artifacts import atomic_write
+
+DEFAULT_TRACE_FILE = Path("openapi-trace.json")
+
+
+def new_rule_stats():
+    """Acumulador para apply_rules(stats=...): nodos visitados y {regla: [llamadas, ns, aciertos]}"""
+    return {"nodes": 0, "rules": defaultdict(lambda: [0, 0, 0])}
+
+
+class Tracer:
+    """
+    Registro de spans y contadores.
+
+    Atributos:
+    - events: trace events completos ("ph": "X"), con ts/dur en nanosegundos
+      absolutos hasta que se exportan
+    - counters: {nombre: total}
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+        self.counters = defaultdict(int)
+        self.origin = time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name, cat="fase", **args):
+        """
+        Medir el bloque como un span. Retorna el dict de args para que el
+        bloque agregue datos que solo conoce al terminar.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            self.add_span(name, cat, start, time.perf_counter_ns() - start, args)
+
+    def add_span(self, name, cat, start_ns, duration_ns, args=None):
+        """Registrar un span ya medido (p. ej. en otro proceso)"""
+        self.events.append(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start_ns,
+                "dur": duration_ns,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args or {},
+            }
+        )
+
+    def count(self, name, value=1):
+        """Sumar `value` al contador `name`"""
+        self.counters[name] += value
+
+    def add_rule_stats(self, stats, start_ns):
+        """
+        Registrar el resultado de apply_rules(stats=...): un span por regla
+        con su tiempo acumulado (dispuestos uno tras otro desde `start_ns`,
+        ya que las reglas se intercalan en un solo recorrido) y los contadores.
+        """
+        self.count("nodos visitados", stats["nodes"])
+        offset = start_ns
+        for name, (calls, duration_ns, hits) in stats["rules"].items():
+            self.add_span(name, "regla", offset, duration_ns, {"llamadas": calls, "aciertos": hits})
+            offset += duration_ns
+
+    def merge(self, tracer):
+        """Incorporar los spans y contadores de otro Tracer (p. ej. de un proceso del pool)"""
+        self.events.extend(tracer.events)
+        for name, value in tracer.counters.items():
+            self.counters[name] += value
+
+    def chrome_trace(self):
+        """Documento JSON en formato Chrome trace-event (ts/dur en microsegundos)"""
+        origin = min([self.origin] + [event["ts"] for event in self.events])
+        events = [
+            {**event, "ts": (event["ts"] - origin) / 1000, "dur": event["dur"] / 1000}
+            for event in self.events
+        ]
+        events.sort(key=lambda event: (event["ts"], -event["dur"]))
+        if events:
+            end = max(event["ts"] + event["dur"] for event in events)
+            events.append(
+                {
+                    "name": "contadores",
+                    "ph": "C",
+                    "ts": end,
+                    "pid": os.getpid(),
+                    "args": dict(self.counters),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": dict(self.counters)}
+
+    def write(self, path):
+        """Escribir el trace en `path` (escritura atómica)"""
+        text = json.dumps(self.chrome_trace(), ensure_ascii=False)
+        atomic_write(path, text.encode("utf-8"))
+
+    def summary(self):
+        """
+        Tiempo total por span, agrupado por (categoría, nombre).
+        Retorna una lista de (categoría, nombre, veces, total_ms, máximo_ms),
+        de mayor a menor tiempo total.
+        """
+        grouped = {}
+        for event in self.events:
+            key = (event["cat"], event["name"])
+            count, total, longest = grouped.get(key, (0, 0, 0))
+            grouped[key] = (count + 1, total + event["dur"], max(longest, event["dur"]))
+        rows = [
+            (cat, name, count, total / 1e6, longest / 1e6)
+            for (cat, name), (count, total, longest) in grouped.items()
+        ]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def print_summary(self, limit=5):
+        """Imprimir las fases y, por categoría, los `limit` spans más lentos"""
+        rows = self.summary()
+        print("⏱️  Resumen del trace:")
+        for category in ("fase", "archivo", "etapa", "regla"):
+            selected = [row for row in rows if row[0] == category]
+            if category != "fase":
+                selected = selected[:limit]
+            if not selected:
+                continue
+            print(f"   [{category}]")
+            width = max(len(row[1]) for row in selected)
+            for _cat, name, count, total_ms, longest_ms in selected:
+                times = f" ({count} veces, máx {longest_ms:.2f} ms)" if count > 1 else ""
+                print(f"   {name:<{width}}  {total_ms:>9.2f} ms{times}")
+        if self.counters:
+            print("   [contadores]")
+            for name, value in self.counters.items():
+                print(f"   {name}: {value}")
+
+
+class _NullTracer:
+    """Tracer inactivo: mismos métodos que Tracer, sin efecto"""
+
+    enabled = False
+
+    @contextmanager
+    def span(self, name, cat="fase", **args):
+        yield args
+
+    def add_span(self, name, cat, start_ns, duration_ns, args=None):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+    def add_rule_stats(self, stats, start_ns):
+        pass
+
+    def merge(self, tracer):
+        pass
+
+
+NULL_TRACER = _NullTracer()
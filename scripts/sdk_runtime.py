@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Runtime del cliente Python generado por generate_sdk.py.
+
+Este módulo se copia tal cual en el paquete generado (como `_runtime.py`):
+solo usa la biblioteca estándar, así el cliente no tiene dependencias.
+
+- SyncClientBase: pool de conexiones http.client keep-alive (thread-safe);
+  una conexión que el servidor cerró mientras estaba ociosa se reemplaza y
+  la petición se reintenta una vez si su método es idempotente
+- AsyncClientBase: lo mismo sobre asyncio (HTTP/1.1 con streams)
+- Operation: descripción de una operación (método, path, parámetros) que
+  generan los módulos de _operations/
+- iterate_pages / iterate_pages_async: iteración transparente de las
+  respuestas paginadas (`results` con `next`, `total_pages` o `count`)
+- ApiError: respuestas 4xx/5xx, con el código y el cuerpo decodificado
+"""
+
+import asyncio
+import http.client
+import json
+import ssl
+import threading
+from collections import namedtuple
+from urllib.parse import quote, urlencode, urlsplit
+
+# Parámetros de una operación: {nombre en Python: nombre en la API}. El lote
+# (batch_property) es el array del cuerpo que reciben las operaciones por
+# lotes; batch_limit es su maxItems, si la especificación lo declara
+Operation = namedtuple(
+    "Operation",
+    [
+        "name", "method", "path", "path_params", "query_params", "header_params",
+        "batch_property", "batch_limit",
+    ],
+)
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_POOL_SIZE = 10
+
+# Solo estos métodos se reintentan en otra conexión: un POST (p. ej. un lote)
+# que falla después de enviarse podría haberse procesado, y repetirlo lo duplicaría
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+
+# Errores de una conexión keep-alive que el servidor cerró mientras estaba ociosa
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class ApiError(Exception):
+    """Respuesta con código 4xx o 5xx"""
+
+    def __init__(self, operation, status, body):
+        super().__init__(f"{operation}: HTTP {status}: {body!r}")
+        self.operation = operation
+        self.status = status
+        self.body = body
+
+
+def _format(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def batch_body(operation, items, body=None):
+    """Cuerpo de una operación por lotes: `body` con el lote en su propiedad (valida maxItems)"""
+    items = list(items)
+    if operation.batch_limit is not None and len(items) > operation.batch_limit:
+        raise ValueError(
+            f"{operation.name}: {len(items)} elementos superan el máximo de {operation.batch_limit} por lote"
+        )
+    if operation.batch_property == "":
+        return items
+    return {**(body or {}), operation.batch_property: items}
+
+
+def build_request(operation, arguments, body=None, params=None):
+    """(target, headers, cuerpo en bytes) de una llamada; los argumentos None se omiten"""
+    path = operation.path
+    for name, wire_name in operation.path_params.items():
+        path = path.replace(f"{{{wire_name}}}", quote(_format(arguments[name]), safe=""))
+
+    query = []
+    for name, wire_name in operation.query_params.items():
+        value = arguments.get(name)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            query.extend((wire_name, _format(item)) for item in value)
+        else:
+            query.append((wire_name, _format(value)))
+    query.extend((key, _format(value)) for key, value in (params or {}).items() if value is not None)
+    if query:
+        path += "?" + urlencode(query)
+
+    headers = {
+        wire_name: _format(arguments[name])
+        for name, wire_name in operation.header_params.items()
+        if arguments.get(name) is not None
+    }
+    payload = None
+    if body is not None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    return path, headers, payload
+
+
+def decode_response(operation, status, content_type, data):
+    """Cuerpo decodificado (JSON, bytes o None); ApiError para 4xx/5xx"""
+    if data and "json" in (content_type or ""):
+        try:
+            value = json.loads(data)
+        except ValueError:
+            value = data
+    else:
+        value = data or None
+    if status >= 400:
+        raise ApiError(operation.name, status, value)
+    return value
+
+
+def _last_page(data, page, items, seen, counted):
+    if not isinstance(data, dict) or not items:
+        return True
+    if "next" in data:
+        return data["next"] is None
+    if data.get("total_pages") is not None:
+        return page >= data["total_pages"]
+    if counted and data.get("count") is not None:
+        return seen >= data["count"]
+    return False
+
+
+def iterate_pages(fetch, arguments):
+    """Elementos (`results`) de todas las páginas desde `page` (por defecto la 1), pedidas a medida que se consumen"""
+    arguments = dict(arguments)
+    page = arguments.pop("page", None) or 1
+    counted = page == 1
+    seen = 0
+    while True:
+        data = fetch(page=page, **arguments)
+        items = (data.get("results") if isinstance(data, dict) else None) or []
+        yield from items
+        seen += len(items)
+        if _last_page(data, page, items, seen, counted):
+            return
+        page += 1
+
+
+async def iterate_pages_async(fetch, arguments):
+    """Versión asyncio de iterate_pages (`async for item in ...`)"""
+    arguments = dict(arguments)
+    page = arguments.pop("page", None) or 1
+    counted = page == 1
+    seen = 0
+    while True:
+        data = await fetch(page=page, **arguments)
+        items = (data.get("results") if isinstance(data, dict) else None) or []
+        for item in items:
+            yield item
+        seen += len(items)
+        if _last_page(data, page, items, seen, counted):
+            return
+        page += 1
+
+
+class _BaseURL:
+    """Partes de la URL base: esquema, host, puerto y prefijo de path"""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL base inválida: {base_url!r} (se espera http:// o https://)")
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.https else 80)
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+
+
+class _ClientBase:
+    """Configuración común: URL base, headers por defecto y autenticación"""
+
+    BASE_URL = None
+    AUTH_HEADER = "Authorization"
+    AUTH_PREFIX = "Api-Key "
+
+    def __init__(self, api_key=None, base_url=None, *, timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE, headers=None):
+        self.base_url = _BaseURL(base_url or self.BASE_URL)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.headers = {"Accept": "application/json", "User-Agent": "tupana-python-sdk"}
+        if api_key:
+            self.headers[self.AUTH_HEADER] = f"{self.AUTH_PREFIX}{api_key}"
+        self.headers.update(headers or {})
+
+    def _prepare(self, operation, arguments, body, params, headers):
+        target, request_headers, payload = build_request(operation, arguments, body, params)
+        return self.base_url.prefix + target, {**self.headers, **request_headers, **(headers or {})}, payload
+
+
+class SyncClientBase(_ClientBase):
+    """Cliente síncrono con un pool de conexiones keep-alive (usar como context manager o llamar close())"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+
+    def _connect(self):
+        url = self.base_url
+        if url.https:
+            return http.client.HTTPSConnection(url.host, url.port, timeout=self.timeout, context=ssl.create_default_context())
+        return http.client.HTTPConnection(url.host, url.port, timeout=self.timeout)
+
+    def request(self, operation, arguments, body=None, params=None, headers=None):
+        """Enviar una llamada y retornar el cuerpo decodificado"""
+        target, request_headers, payload = self._prepare(operation, arguments, body, params, headers)
+        retry = operation.method in IDEMPOTENT_METHODS
+        with self._slots:
+            for attempt in range(2):
+                with self._lock:
+                    connection = self._idle.pop() if self._idle else None
+                reused = connection is not None
+                connection = connection or self._connect()
+                try:
+                    connection.request(operation.method, target, body=payload, headers=request_headers)
+                    response = connection.getresponse()
+                    data = response.read()
+                except _STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if retry and reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                if response.will_close:
+                    connection.close()
+                else:
+                    with self._lock:
+                        self._idle.append(connection)
+                return decode_response(operation, response.status, response.getheader("Content-Type"), data)
+
+    def close(self):
+        """Cerrar las conexiones ociosas del pool"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncClientBase(_ClientBase):
+    """Cliente asyncio con un pool de conexiones keep-alive (usar con `async with` o llamar aclose())"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._idle = []
+        self._slots = asyncio.Semaphore(self.pool_size)
+
+    async def _connect(self):
+        url = self.base_url
+        return await asyncio.wait_for(
+            asyncio.open_connection(url.host, url.port, ssl=ssl.create_default_context() if url.https else None),
+            self.timeout,
+        )
+
+    async def request(self, operation, arguments, body=None, params=None, headers=None):
+        """Enviar una llamada y retornar el cuerpo decodificado"""
+        target, request_headers, payload = self._prepare(operation, arguments, body, params, headers)
+        lines = [f"{operation.method} {target} HTTP/1.1", f"Host: {self.base_url.netloc}"]
+        lines.extend(f"{name}: {value}" for name, value in request_headers.items())
+        lines.append(f"Content-Length: {len(payload or b'')}")
+        raw = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + (payload or b"")
+
+        retry = operation.method in IDEMPOTENT_METHODS
+        async with self._slots:
+            for attempt in range(2):
+                connection = self._idle.pop() if self._idle else None
+                reused = connection is not None
+                reader, writer = connection or await self._connect()
+                try:
+                    writer.write(raw)
+                    status, response_headers, data, keep_alive = await asyncio.wait_for(
+                        _read_response(reader), self.timeout
+                    )
+                except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if retry and reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return decode_response(operation, status, response_headers.get("content-type"), data)
+
+    async def aclose(self):
+        """Cerrar las conexiones ociosas del pool"""
+        idle, self._idle = self._idle, []
+        for _reader, writer in idle:
+            writer.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+async def _read_response(reader):
+    """(código, headers en minúsculas, cuerpo, si la conexión sigue abierta) de una respuesta HTTP/1.1"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    keep_alive = headers.get("connection", "").lower() != "close"
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+            if size == 0:
+                # Trailers opcionales hasta la línea vacía final
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return status, headers, b"".join(chunks), keep_alive
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+    if "content-length" in headers:
+        return status, headers, await reader.readexactly(int(headers["content-length"])), keep_alive
+    if status in (204, 304) or 100 <= status < 200:
+        return status, headers, b"", keep_alive
+    # Sin largo declarado: el cuerpo termina cuando el servidor cierra la conexión
+    return status, headers, await reader.read(), False
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Servidor local del documento OpenAPI combinado para previsualizaciones.
+
+Mantiene el documento combinado en memoria (se reconstruye con el watcher
+incremental de watch_openapi.py cuando cambian los archivos fuente) y lo
+sirve por HTTP con:
+- ETag fuerte (sha256 del contenido) y respuestas 304 para If-None-Match,
+  así las herramientas pueden consultar seguido sin descargar nada
+- gzip cuando el cliente lo acepta (comprimido una vez por versión)
+- fragmentos por tag: solo las operaciones de un tag, con los components
+
+Rutas:
+    GET /openapi.json          documento completo
+    GET /tags                  índice de tags con la URL de su fragmento
+    GET /tags/<tag>.json       fragmento de un tag (nombre codificado en la URL)
+
+Uso:
+    python3 scripts/serve_openapi.py
+    python3 scripts/serve_openapi.py --port 8787 --no-watch
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+from openapi_engine import (
+    DEFAULT_BASE_DIR,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_OUTPUT,
+    MERGE_STRATEGIES,
+    SpecWorkspace,
+)
+from watch_openapi import OpenAPIWatcher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+
+class Representation:
+    """
+    Cuerpo JSON de una versión del documento, con su ETag fuerte.
+    La variante gzip se comprime una sola vez, la primera vez que se pide.
+    """
+
+    def __init__(self, data):
+        self.body = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self._gzip_body = None
+        self._lock = threading.Lock()
+
+    @property
+    def gzip_body(self):
+        with self._lock:
+            if self._gzip_body is None:
+                # mtime=0: misma entrada, mismos bytes
+                self._gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+            return self._gzip_body
+
+    @property
+    def gzip_etag(self):
+        """ETag de la variante comprimida (un ETag fuerte identifica los bytes exactos)"""
+        return f'{self.etag[:-1]}-gzip"'
+
+
+def operation_tags(combined):
+    """Tags usados por las operaciones, en orden de aparición"""
+    tags = {}
+    for path_item in combined.get("paths", {}).values():
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS and isinstance(operation, dict):
+                for tag in operation.get("tags", []):
+                    tags.setdefault(tag, None)
+    return list(tags)
+
+
+def tag_fragment(combined, tag):
+    """
+    Documento con solo las operaciones de `tag`. Conserva la información
+    general y los components completos para que el fragmento sea válido
+    por sí solo.
+    """
+    paths = {}
+    for path_name, path_item in combined.get("paths", {}).items():
+        operations = {
+            method: operation
+            for method, operation in path_item.items()
+            if method in HTTP_METHODS
+            and isinstance(operation, dict)
+            and tag in operation.get("tags", [])
+        }
+        if operations:
+            shared = {
+                key: value for key, value in path_item.items() if key not in HTTP_METHODS
+            }
+            paths[path_name] = {**shared, **operations}
+
+    fragment = {key: value for key, value in combined.items() if key != "paths"}
+    if "tags" in combined:
+        fragment["tags"] = [entry for entry in combined["tags"] if entry.get("name") == tag]
+    fragment["paths"] = paths
+    return fragment
+
+
+class SpecSnapshot:
+    """
+    Una versión del documento combinado lista para servir.
+    Los fragmentos por tag se serializan bajo demanda y se guardan.
+    """
+
+    def __init__(self, combined):
+        self.combined = combined
+        self.full = Representation(combined)
+        self.tags = operation_tags(combined)
+        self.tag_index = Representation(
+            {
+                "etag": self.full.etag,
+                "tags": [
+                    {"name": tag, "url": f"/tags/{quote(tag, safe='')}.json"}
+                    for tag in self.tags
+                ],
+            }
+        )
+        self._fragments = {}
+        self._lock = threading.Lock()
+
+    def fragment(self, tag):
+        """Representación del fragmento de `tag`, o None si el tag no existe"""
+        if tag not in self.tags:
+            return None
+        with self._lock:
+            if tag not in self._fragments:
+                self._fragments[tag] = Representation(tag_fragment(self.combined, tag))
+            return self._fragments[tag]
+
+
+class SpecStore:
+    """Contenedor de la versión actual; las reconstrucciones la reemplazan completa"""
+
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def update(self, combined):
+        snapshot = SpecSnapshot(combined)
+        with self._lock:
+            changed = self._snapshot is None or self._snapshot.full.etag != snapshot.full.etag
+            if changed:
+                self._snapshot = snapshot
+        return changed
+
+    def current(self):
+        with self._lock:
+            return self._snapshot
+
+
+def etag_matches(header, etag):
+    """Comparación de If-None-Match (débil, como indica RFC 9110 para GET)"""
+    if header.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def accepts_gzip(header):
+    """True si Accept-Encoding acepta gzip (respeta q=0)"""
+    for coding in header.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            quality = params.strip().removeprefix("q=")
+            try:
+                return float(quality) > 0 if quality else True
+            except ValueError:
+                return True
+    return False
+
+
+class SpecRequestHandler(BaseHTTPRequestHandler):
+    """Handler HTTP; el servidor expone el SpecStore en `self.server.store`"""
+
+    server_version = "OpenAPISpecServer/1.0"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        snapshot = self.server.store.current()
+        if snapshot is None:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "El documento aún no está listo")
+            return
+
+        path = urlsplit(self.path).path
+        if path in ("/", "/openapi.json"):
+            representation = snapshot.full
+        elif path in ("/tags", "/tags/"):
+            representation = snapshot.tag_index
+        elif path.startswith("/tags/") and path.endswith(".json"):
+            representation = snapshot.fragment(unquote(path[len("/tags/"):-len(".json")]))
+        else:
+            representation = None
+        if representation is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"No encontrado: {path}")
+            return
+
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        etag = representation.gzip_etag if use_gzip else representation.etag
+
+        if etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(etag)
+            self.end_headers()
+            return
+
+        body = representation.gzip_body if use_gzip else representation.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self._send_cache_headers(etag)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_cache_headers(self, etag):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _send_error(self, status, message):
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(store, host=DEFAULT_HOST, port=DEFAULT_PORT, quiet=False):
+    """Crear el servidor HTTP (port=0 elige un puerto libre)"""
+    server = ThreadingHTTPServer((host, port), SpecRequestHandler)
+    server.daemon_threads = True
+    server.store = store
+    server.quiet = quiet
+    return server
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Servir el documento OpenAPI combinado desde memoria por HTTP local"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interfaz (por defecto: {DEFAULT_HOST})")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Puerto (por defecto: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=sorted(MERGE_STRATEGIES),
+        default="replace",
+        help="Cómo combinar métodos repetidos entre archivos (por defecto: replace)",
+    )
+    parser.add_argument(
+        "--no-watch",
+        action="store_true",
+        help="Servir el documento construido al iniciar, sin vigilar cambios",
+    )
+    parser.add_argument(
+        "--write-output",
+        action="store_true",
+        help=f"Escribir también {DEFAULT_OUTPUT} en cada reconstrucción",
+    )
+    parser.add_argument("--quiet", action="store_true", help="No registrar cada petición")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+
+    store = SpecStore()
+    workspace = SpecWorkspace(DEFAULT_BASE_DIR, cache_dir=DEFAULT_CACHE_DIR)
+    watcher = OpenAPIWatcher(
+        workspace,
+        output=DEFAULT_OUTPUT if args.write_output else None,
+        strategy=args.strategy,
+        on_build=store.update,
+    )
+
+    server = create_server(store, args.host, args.port, quiet=args.quiet)
+    host, port = server.server_address[:2]
+
+    if args.no_watch:
+        if not watcher.build():
+            print("❌ No se pudo construir el documento combinado")
+            return 1
+        print(f"🌐 Sirviendo OpenAPI en http://{host}:{port}/openapi.json")
+        print(f"🏷️  Fragmentos por tag en http://{host}:{port}/tags")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Servidor detenido")
+        return 0
+
+    # El servidor responde 503 hasta que termine la primera construcción
+    print(f"🌐 Sirviendo OpenAPI en http://{host}:{port}/openapi.json")
+    print(f"🏷️  Fragmentos por tag en http://{host}:{port}/tags")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    watcher.run()
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
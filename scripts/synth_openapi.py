@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Generador de especificaciones OpenAPI divididas sintéticas (para benchmarks).
+
+Genera un árbol con la misma forma que api-reference/openapi: un archivo
+base, un archivo por operación de cada recurso y un único schemas/schemas.json
+con los schemas de todos los recursos (la ruta que validate_openapi_schemas
+descubre). Con scale=1 el tamaño es parecido al actual (24 paths, 37 archivos,
+12 recursos); scale=10/100/1000 multiplica la cantidad de recursos.
+
+Cada recurso incluye lo que hace trabajar al combinador y a los
+validadores: parámetros, ejemplos, referencias entre schemas, cadenas de
+allOf, objetos anidados y, cada tantos recursos, los patrones que corrigen
+las reglas (objeto "description" con "description" interna y conflicto de
+"type" en items). La salida es determinista para un mismo `seed`.
+
+Uso:
+    python3 scripts/synth_openapi.py /tmp/spec-10x --scale 10
+    from synth_openapi import generate_split_spec
+    manifest = generate_split_spec(Path("/tmp/spec"), scale=10)
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+RESOURCES_PER_SCALE = 12
+NESTING_DEPTH = 5
+ALLOF_CHAIN = 3
+
+
+def _schema_ref(name):
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _nested_object(rng, depth):
+    """Objeto con `depth` niveles de propiedades anidadas"""
+    node = {"type": "string", "example": f"valor-{rng.randint(0, 9999)}"}
+    for level in range(depth, 0, -1):
+        node = {
+            "type": "object",
+            "description": f"Nivel {level}",
+            "properties": {
+                f"campo_{level}": node,
+                f"codigo_{level}": {"type": "integer", "example": rng.randint(1, 999)},
+            },
+        }
+    return node
+
+
+def _resource_schemas(rng, index, name):
+    """Schemas de un recurso: base, cadena allOf, detalle, listado y estado"""
+    prefix = f"Resource{index}"
+    schemas = {
+        f"{prefix}Base": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "integer", "example": rng.randint(1, 10**6)},
+                "name": {"type": "string", "example": f"{name} de ejemplo"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "metadata": _nested_object(rng, NESTING_DEPTH),
+            },
+        },
+        f"{prefix}Status": {
+            "type": "object",
+            "properties": {
+                "code": {"type": "string", "enum": ["pending", "accepted", "rejected"]},
+                "detail": {"type": "string"},
+            },
+        },
+    }
+
+    # Cadena de allOf: Level1 extiende Base, Level2 extiende Level1, ...
+    parent = f"{prefix}Base"
+    for level in range(1, ALLOF_CHAIN + 1):
+        child = f"{prefix}Level{level}"
+        schemas[child] = {
+            "allOf": [
+                _schema_ref(parent),
+                {"type": "object", "properties": {f"extra_{level}": {"type": "string"}}},
+            ]
+        }
+        parent = child
+
+    schemas[f"{prefix}Detail"] = {
+        "allOf": [
+            _schema_ref(parent),
+            {
+                "type": "object",
+                "properties": {
+                    "status": _schema_ref(f"{prefix}Status"),
+                    "history": {"type": "array", "items": _schema_ref(f"{prefix}Status")},
+                },
+            },
+        ]
+    }
+    schemas[f"{prefix}List"] = {
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer"},
+            "results": {"type": "array", "items": _schema_ref(f"{prefix}Detail")},
+        },
+    }
+
+    # Patrones que corrigen las reglas del combinador
+    if index % 5 == 0:
+        schemas[f"{prefix}Base"]["properties"]["description"] = {
+            "type": "string",
+            "description": "Descripción del recurso",
+        }
+    if index % 7 == 0:
+        schemas[f"{prefix}Status"]["properties"]["states"] = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"type": {"type": "string", "description": "Tipo"}},
+            },
+        }
+    return schemas
+
+
+def _json_response(schema, example):
+    return {
+        "description": "OK",
+        "content": {"application/json": {"schema": schema, "example": example}},
+    }
+
+
+def _operations(rng, index, name):
+    """Un documento OpenAPI parcial por operación: listar, crear y obtener"""
+    prefix = f"Resource{index}"
+    collection = f"/v1/{name}"
+    tag = f"Recurso {index}"
+    example = {"id": rng.randint(1, 10**6), "name": f"{name} de ejemplo"}
+    list_op = {
+        "operationId": f"list{prefix}",
+        "tags": [tag],
+        "summary": f"Listar {name}",
+        "parameters": [
+            {"name": "page", "in": "query", "schema": {"type": "integer", "default": 1}},
+            {"name": "search", "in": "query", "schema": {"type": "string"}},
+            {
+                "name": "status",
+                "in": "query",
+                "schema": {"type": "array", "items": {"type": "string"}},
+                "style": "form",
+                "explode": False,
+            },
+        ],
+        "responses": {"200": _json_response(_schema_ref(f"{prefix}List"), {"count": 1, "results": [example]})},
+    }
+    create_op = {
+        "operationId": f"create{prefix}",
+        "tags": [tag],
+        "summary": f"Crear {name}",
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _schema_ref(f"{prefix}Base"), "example": example}},
+        },
+        "responses": {"201": _json_response(_schema_ref(f"{prefix}Detail"), example)},
+    }
+    get_op = {
+        "operationId": f"get{prefix}",
+        "tags": [tag],
+        "summary": f"Obtener {name}",
+        "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}],
+        "responses": {
+            "200": _json_response(_schema_ref(f"{prefix}Detail"), example),
+            "404": {"description": "No encontrado"},
+        },
+    }
+    return {
+        "list": {"paths": {collection: {"get": list_op}}},
+        "create": {"paths": {collection: {"post": create_op}}},
+        "get": {"paths": {f"{collection}/{{id}}": {"get": get_op}}},
+    }
+
+
+def base_document():
+    """Archivo base con info, servers y security (como base-complete.json)"""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "API sintética", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com/v1"}],
+        "security": [{"apiKeyAuth": []}],
+        "paths": {},
+        "components": {
+            "securitySchemes": {"apiKeyAuth": {"type": "apiKey", "in": "header", "name": "Authorization"}}
+        },
+    }
+
+
+def generate_split_spec(base_dir, scale=1, seed=0):
+    """
+    Escribir una especificación dividida en `base_dir`.
+    Retorna el manifiesto: rutas relativas a `base_dir` de los archivos a
+    combinar (sin el archivo base), en orden.
+    """
+    base_dir = Path(base_dir)
+    rng = random.Random(seed)
+    (base_dir / "base").mkdir(parents=True, exist_ok=True)
+    _write(base_dir / "base" / "base-complete.json", base_document())
+
+    manifest = []
+    schemas = {}
+    for index in range(max(1, round(RESOURCES_PER_SCALE * scale))):
+        name = f"resource-{index}"
+        resource_dir = base_dir / name
+        resource_dir.mkdir(exist_ok=True)
+        for operation, document in _operations(rng, index, name).items():
+            _write(resource_dir / f"{operation}.json", document)
+            manifest.append(Path(name) / f"{operation}.json")
+        schemas.update(_resource_schemas(rng, index, name))
+
+    # Como en el árbol real, los schemas van al final del manifiesto
+    (base_dir / "schemas").mkdir(exist_ok=True)
+    _write(base_dir / "schemas" / "schemas.json", {"components": {"schemas": schemas}})
+    manifest.append(Path("schemas") / "schemas.json")
+    return manifest
+
+
+def _write(file_path, data):
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Generar una especificación OpenAPI dividida sintética")
+    parser.add_argument("output_dir", help="Directorio donde escribir los archivos")
+    parser.add_argument("--scale", type=float, default=10, help="Múltiplo del tamaño actual (por defecto: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla para los valores de ejemplo")
+    args = parser.parse_args(argv)
+
+    manifest = generate_split_spec(Path(args.output_dir), args.scale, args.seed)
+    print(f"✅ {len(manifest)} archivos generados en {args.output_dir} (escala {args.scale:g}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
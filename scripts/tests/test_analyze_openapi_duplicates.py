@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests unitarios para analyze_openapi_duplicates.py
+Valida las consultas indexadas del analizador.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyze_openapi_duplicates import OpenAPIAnalyzer, parse_query
+
+CONTENT = """{
+  "components": {
+    "schemas": {
+      "ReferenceItem": {
+        "type": "object",
+        "description": "Texto con { llaves } dentro",
+        "dte_type_code": "33",
+        "dte_type_code": "34"
+      },
+      "Other": {
+        "type": "string",
+        "dte_type_code": "61"
+      }
+    }
+  }
+}"""
+
+
+class TestOpenAPIAnalyzer(unittest.TestCase):
+    """Tests para las consultas del analizador"""
+
+    def setUp(self):
+        tmp = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8")
+        with tmp:
+            tmp.write(CONTENT)
+        self.addCleanup(Path(tmp.name).unlink)
+        self.analyzer = OpenAPIAnalyzer(tmp.name, quiet=True)
+        self.assertTrue(self.analyzer.load_file())
+        self.assertTrue(self.analyzer.parse_json())
+
+    def test_key_occurrences_find_duplicates_in_same_object(self):
+        """Test: Repeticiones de una clave en el mismo objeto se detectan"""
+        occurrences, duplicates = self.analyzer.key_occurrences("dte_type_code")
+
+        self.assertEqual([occ["line"] for occ in occurrences], [7, 8, 12])
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual((duplicates[0]["line1"], duplicates[0]["line2"]), (7, 8))
+        self.assertEqual(duplicates[0]["pointer"], "/components/schemas/ReferenceItem")
+
+    def test_same_object_and_containing_object(self):
+        """Test: Consultas de contención por línea (llaves en strings no afectan)"""
+        self.assertTrue(self.analyzer._are_in_same_object(6, 8))
+        self.assertFalse(self.analyzer._are_in_same_object(8, 12))
+
+        obj_info = self.analyzer._find_containing_object(12)
+        self.assertEqual((obj_info["start"], obj_info["end"]), (10, 13))
+        self.assertEqual(obj_info["type"], "string")
+        self.assertEqual(obj_info["keys"], ["type", "dte_type_code"])
+
+    def test_build_report_is_json_serializable(self):
+        """Test: El reporte para --json es serializable e incluye las consultas"""
+        queries = [parse_query("key:dte_type_code"), parse_query("same:7,8")]
+
+        report = json.loads(json.dumps(self.analyzer.build_report(queries)))
+
+        self.assertEqual(len(report["duplicates"]), 1)
+        self.assertEqual(report["queries"][1], {"query": "same:7,8", "same_object": True})
+
+    def test_parse_query_rejects_invalid_queries(self):
+        """Test: Consultas mal formadas se rechazan"""
+        with self.assertRaises(ValueError):
+            parse_query("line:abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests para el generador sintético (synth_openapi.py) y los benchmarks (bench_openapi.py)
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_openapi import compare, measure
+from openapi_engine import SpecWorkspace, apply_rules
+from synth_openapi import RESOURCES_PER_SCALE, generate_split_spec
+from validate_openapi_schemas import discover_sources
+
+
+class TestSynthOpenAPI(unittest.TestCase):
+    """Tests para generate_split_spec"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_manifest_has_three_operations_per_resource_and_one_schemas_file(self):
+        manifest = generate_split_spec(self.base_dir / "spec", scale=2)
+
+        self.assertEqual(len(manifest), RESOURCES_PER_SCALE * 2 * 3 + 1)
+        self.assertEqual(manifest[-1], Path("schemas") / "schemas.json")
+        for path in manifest:
+            self.assertTrue((self.base_dir / "spec" / path).exists())
+
+    def test_validator_discovers_every_generated_file(self):
+        spec_dir = self.base_dir / "spec"
+        manifest = generate_split_spec(spec_dir)
+
+        self.assertEqual(sorted(discover_sources(spec_dir)), sorted(manifest))
+
+    def test_output_is_deterministic(self):
+        generate_split_spec(self.base_dir / "a", seed=3)
+        generate_split_spec(self.base_dir / "b", seed=3)
+
+        first = (self.base_dir / "a" / "schemas" / "schemas.json").read_bytes()
+        second = (self.base_dir / "b" / "schemas" / "schemas.json").read_bytes()
+        self.assertEqual(first, second)
+
+    def test_generated_spec_combines_with_fixes_and_no_issues(self):
+        spec_dir = self.base_dir / "spec"
+        manifest = generate_split_spec(spec_dir)
+        workspace = SpecWorkspace(spec_dir, manifest=manifest, write_fixes=False)
+        workspace.load()
+        combined, issues, _changes = workspace.build()
+
+        self.assertFalse(workspace.errors)
+        self.assertEqual(issues, [])
+        self.assertEqual(len(combined["paths"]), RESOURCES_PER_SCALE * 2)
+        rules = {change.rule for source in workspace.sources.values() for change in source["changes"]}
+        self.assertEqual(rules, {"description-object", "items-type-conflict"})
+
+
+class TestApplyRulesOnly(unittest.TestCase):
+    """Tests para apply_rules(only=...)"""
+
+    def test_only_runs_selected_rule(self):
+        data = {
+            "properties": {"description": {"type": "string", "description": "x"}},
+            "items": {"type": "object", "properties": {"type": {"type": "string"}}},
+        }
+
+        _fixed, _issues, changes = apply_rules(data, check=False, only={"items-type-conflict"})
+
+        self.assertEqual({change.rule for change in changes}, {"items-type-conflict"})
+
+
+class TestCompare(unittest.TestCase):
+    """Tests para la detección de regresiones"""
+
+    def test_flags_only_slowdowns_over_threshold_and_noise(self):
+        baseline = {
+            "slow@10x": {"median_ms": 100.0},
+            "same@10x": {"median_ms": 100.0},
+            "tiny@10x": {"median_ms": 1.0},
+        }
+        results = {
+            "slow@10x": {"median_ms": 130.0},
+            "same@10x": {"median_ms": 110.0},
+            "tiny@10x": {"median_ms": 2.5},
+            "new@10x": {"median_ms": 50.0},
+        }
+
+        regressions = compare(results, baseline, threshold=0.25)
+
+        self.assertEqual([name for name, *_rest in regressions], ["slow@10x"])
+
+    def test_measure_reports_min_and_median(self):
+        timing = measure(lambda: None, repeat=3)
+
+        self.assertEqual(timing["repeat"], 3)
+        self.assertLessEqual(timing["min_ms"], timing["median_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
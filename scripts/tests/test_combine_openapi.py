@@ -5,6 +5,7 @@ Valida que el script detecte y corrija problemas comunes en schemas OpenAPI.
 """
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -14,7 +15,11 @@ import sys
 # Agregar el directorio padre al path para importar el módulo
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import openapi_engine
 from combine_openapi import (
+    apply_rules,
+    load_source_file,
+    run_source_stage,
     validate_and_fix_duplicate_keys,
     validate_openapi_structure,
     validate_and_fix_schemas_before_combine,
@@ -134,30 +139,28 @@ class TestCombineOpenAPI(unittest.TestCase):
   }
 }'''
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write(problem_content)
-            temp_path = Path(f.name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schemas_file = Path(tmp_dir) / "api-reference" / "openapi" / "schemas" / "schemas.json"
+            schemas_file.parent.mkdir(parents=True)
+            schemas_file.write_text(problem_content, encoding="utf-8")
 
-        try:
-            # Mock el path del archivo
-            with patch('combine_openapi.Path') as mock_path:
-                mock_schemas_file = mock_path.return_value / "schemas" / "schemas.json"
-                mock_schemas_file.exists.return_value = True
-                mock_schemas_file.__str__ = lambda x: str(temp_path)
-
-                # Ejecutar la función
+            # Ejecutar la función desde el directorio temporal (usa rutas relativas)
+            previous_cwd = os.getcwd()
+            os.chdir(tmp_dir)
+            try:
                 result = validate_and_fix_schemas_before_combine()
+            finally:
+                os.chdir(previous_cwd)
 
-                # Verificar que se corrigió
-                with open(temp_path, 'r') as f:
-                    fixed_data = json.load(f)
+            self.assertTrue(result)
 
-                test_schema = fixed_data["components"]["schemas"]["TestSchema"]
-                desc_prop = test_schema["properties"]["description"]
-                self.assertNotIn("description", desc_prop)
+            # Verificar que se corrigió
+            with open(schemas_file, 'r') as f:
+                fixed_data = json.load(f)
 
-        finally:
-            temp_path.unlink()
+            test_schema = fixed_data["components"]["schemas"]["TestSchema"]
+            desc_prop = test_schema["properties"]["description"]
+            self.assertNotIn("description", desc_prop)
 
     def test_no_duplicate_keys_in_valid_schema(self):
         """Test: Schema válido no debe tener problemas"""
@@ -304,6 +307,280 @@ class TestOpenAPIValidation(unittest.TestCase):
         self.assertGreater(len(issues), 0)
 
 
+class TestRuleEngine(unittest.TestCase):
+    """Tests para el motor de reglas de un solo recorrido"""
+
+    def test_fixes_and_checks_in_single_pass(self):
+        """Test: Un recorrido corrige lo corregible y reporta el resto"""
+        data = {
+            "properties": {
+                "states": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"type": {"type": "string"}},
+                    },
+                },
+                "note": {"description": {"description": "sin type"}},
+            }
+        }
+
+        fixed, issues, _changes = apply_rules(data)
+
+        items_props = fixed["properties"]["states"]["items"]["properties"]
+        self.assertEqual(list(items_props), ["state_type"])
+        self.assertEqual(
+            issues,
+            [
+                "Objeto 'description' con clave 'description' interna en "
+                "properties.note.description"
+            ],
+        )
+
+    def test_issue_paths_include_list_indexes(self):
+        """Test: Las rutas reportadas incluyen índices de listas"""
+        data = {"allOf": [{"type": "object"}, {"description": {"description": "x"}}]}
+
+        _fixed, issues, _changes = apply_rules(data, fix=False)
+
+        self.assertEqual(len(issues), 1)
+        self.assertTrue(issues[0].endswith("en allOf[1].description"))
+
+    def test_deeply_nested_schema_does_not_hit_recursion_limit(self):
+        """Test: Schemas más profundos que el límite de recursión se recorren completos"""
+        data = {}
+        node = data
+        for _ in range(sys.getrecursionlimit() * 2):
+            node["properties"] = {}
+            node = node["properties"]
+        node["description"] = {"type": "string", "description": "duplicada"}
+
+        fixed, issues, changes = apply_rules(data)
+
+        self.assertEqual(issues, [])
+        self.assertEqual(len(changes), 1)
+        node = fixed
+        while "properties" in node:
+            node = node["properties"]
+        self.assertEqual(node["description"], {"type": "string"})
+
+    def test_fixes_are_copy_on_write_with_change_log(self):
+        """Test: Las correcciones no modifican el original y se registran con su JSON pointer"""
+        untouched = {"type": "object", "properties": {"name": {"type": "string"}}}
+        data = {
+            "components": {
+                "schemas": {
+                    "Untouched": untouched,
+                    "a/b": {"properties": {"description": {"type": "string", "description": "x"}}},
+                }
+            }
+        }
+        original = json.dumps(data)
+
+        fixed, _issues, changes = apply_rules(data)
+
+        self.assertEqual(json.dumps(data), original)
+        self.assertIs(fixed["components"]["schemas"]["Untouched"], untouched)
+        self.assertEqual(
+            changes,
+            [("description-object", "/components/schemas/a~1b/properties/description")],
+        )
+
+    def test_no_changes_returns_same_tree(self):
+        """Test: Sin correcciones se retorna el mismo objeto y un registro vacío"""
+        data = {"properties": {"name": {"type": "string", "description": "Nombre"}}}
+
+        fixed, _issues, changes = apply_rules(data)
+
+        self.assertIs(fixed, data)
+        self.assertEqual(changes, [])
+
+
+class TestSourceCache(unittest.TestCase):
+    """Tests para el caché de archivos fuente ya procesados"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_dir = Path(self.tmp_dir.name) / "cache"
+        self.source = Path(self.tmp_dir.name) / "source.json"
+        self.source.write_text(
+            json.dumps({"paths": {"/documents": {"get": {"summary": "Listar"}}}}),
+            encoding="utf-8",
+        )
+
+    def test_unchanged_file_is_reused_from_cache(self):
+        """Test: Un archivo sin cambios se obtiene del caché"""
+        first = load_source_file(self.source, self.cache_dir)
+        second = load_source_file(self.source, self.cache_dir)
+
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(first["data"], second["data"])
+
+    def test_changed_file_invalidates_cache(self):
+        """Test: Un cambio en el contenido no reutiliza la entrada anterior"""
+        load_source_file(self.source, self.cache_dir)
+        self.source.write_text(
+            json.dumps({"paths": {"/cessions": {"get": {"summary": "Listar"}}}}),
+            encoding="utf-8",
+        )
+
+        result = load_source_file(self.source, self.cache_dir)
+        self.assertFalse(result["cached"])
+        self.assertIn("/cessions", result["data"]["paths"])
+
+    def test_fixer_version_invalidates_cache(self):
+        """Test: Cambiar la versión de los correctores invalida el caché"""
+        load_source_file(self.source, self.cache_dir)
+        with patch.object(openapi_engine, "FIXER_VERSION", "test"):
+            result = load_source_file(self.source, self.cache_dir)
+        self.assertFalse(result["cached"])
+
+    def test_fixed_file_is_cached_by_its_new_content(self):
+        """Test: Un archivo corregido se cachea con el contenido que quedó en disco"""
+        self.source.write_text(
+            json.dumps({"properties": {"description": {"type": "string", "description": "x"}}}),
+            encoding="utf-8",
+        )
+        first = load_source_file(self.source, self.cache_dir)
+        second = load_source_file(self.source, self.cache_dir)
+
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertNotIn("description", second["data"]["properties"]["description"])
+
+
+class TestParallelSourceStage(unittest.TestCase):
+    """Tests para la etapa por archivo en paralelo (--jobs)"""
+
+    def test_parallel_results_match_serial_order(self):
+        """Test: Con jobs > 1 los resultados llegan en el orden de entrada"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for i in range(6):
+                file_path = Path(tmp_dir) / f"source-{i}.json"
+                file_path.write_text(json.dumps({"paths": {f"/p{i}": {}}}), encoding="utf-8")
+                files.append(file_path)
+            broken = Path(tmp_dir) / "broken.json"
+            broken.write_text("{", encoding="utf-8")
+            files.append(broken)
+
+            serial = run_source_stage(files, jobs=1)
+            parallel = run_source_stage(files, jobs=3)
+
+        self.assertEqual(
+            [source["data"] for source, _error in serial[:-1]],
+            [source["data"] for source, _error in parallel[:-1]],
+        )
+        self.assertEqual(list(parallel[2][0]["data"]["paths"]), ["/p2"])
+        # Un archivo inválido se reporta como error sin detener a los demás
+        self.assertIsNone(parallel[-1][0])
+        self.assertIsInstance(parallel[-1][1][0], json.JSONDecodeError)
+
+
+class TestSpecWorkspace(unittest.TestCase):
+    """Tests para el árbol compartido (openapi_engine.SpecWorkspace)"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tmp_dir.name)
+        (self.base_dir / "base").mkdir()
+        self.write("base/base-complete.json", {"openapi": "3.0.1", "info": {"title": "API"}, "paths": {}})
+        self.write("a.json", {
+            "paths": {"/v1/items": {"post": {"requestBody": {"content": {
+                "application/json": {"schema": {"type": "object"}}
+            }}}}},
+            "components": {"schemas": {"Item": {"type": "object"}}},
+        })
+        self.write("b.json", {
+            "paths": {"/v1/items": {"post": {"summary": "Crear", "requestBody": {"content": {
+                "application/json": {"example": {"id": 1}}
+            }}}}},
+        })
+        self.manifest = [Path("a.json"), Path("b.json"), Path("missing.json")]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, relative, data):
+        (self.base_dir / relative).write_text(json.dumps(data), encoding="utf-8")
+
+    def workspace(self):
+        workspace = openapi_engine.SpecWorkspace(self.base_dir, manifest=self.manifest)
+        workspace.load()
+        return workspace
+
+    def test_merge_strategies(self):
+        """Test: "replace" reemplaza el método completo y "deep" preserva el schema y el ejemplo"""
+        workspace = self.workspace()
+        self.assertEqual(workspace.missing, {self.base_dir / "missing.json"})
+
+        replaced = workspace.merge("replace")["paths"]["/items"]["post"]
+        self.assertEqual(replaced["requestBody"]["content"]["application/json"], {"example": {"id": 1}})
+
+        deep = workspace.merge("deep")["paths"]["/items"]["post"]
+        self.assertEqual(
+            deep["requestBody"]["content"]["application/json"],
+            {"schema": {"type": "object"}, "example": {"id": 1}},
+        )
+        self.assertEqual(deep["summary"], "Crear")
+        self.assertIn("Item", workspace.merge("deep")["components"]["schemas"])
+
+    def test_merge_does_not_mutate_sources(self):
+        """Test: Combinar no modifica el árbol compartido, se puede combinar varias veces"""
+        workspace = self.workspace()
+        before = json.dumps({str(path): source["data"] for path, source in workspace.sources.items()})
+        workspace.merge("deep")
+        workspace.build("replace")
+        after = json.dumps({str(path): source["data"] for path, source in workspace.sources.items()})
+        self.assertEqual(before, after)
+
+    def test_reload_subset(self):
+        """Test: load(files) recarga solo los archivos indicados"""
+        workspace = self.workspace()
+        kept = workspace.sources[self.base_dir / "a.json"]
+
+        self.write("b.json", {"paths": {"/v1/other": {"get": {}}}, "x": 1})
+        workspace.load([self.base_dir / "b.json"])
+
+        self.assertIs(workspace.sources[self.base_dir / "a.json"], kept)
+        self.assertEqual(list(workspace.merge()["paths"]), ["/items", "/other"])
+
+    def test_build_is_canonical(self):
+        """Test: El build no depende del orden del manifiesto"""
+        self.write("c.json", {
+            "components": {"schemas": {"Zeta": {"type": "string"}, "Alpha": {"type": "object"}}},
+            "paths": {"/v1/zeta": {"post": {}, "get": {}}},
+        })
+        forward = openapi_engine.SpecWorkspace(self.base_dir, manifest=[Path("a.json"), Path("c.json")])
+        backward = openapi_engine.SpecWorkspace(self.base_dir, manifest=[Path("c.json"), Path("a.json")])
+        forward.load()
+        backward.load()
+
+        combined = forward.build()[0]
+        self.assertEqual(json.dumps(combined), json.dumps(backward.build()[0]))
+        self.assertEqual(list(combined), ["openapi", "info", "paths", "components"])
+        self.assertEqual(list(combined["paths"]), ["/items", "/zeta"])
+        self.assertEqual(list(combined["paths"]["/zeta"]), ["get", "post"])
+        self.assertEqual(list(combined["components"]["schemas"]), ["Alpha", "Item", "Zeta"])
+
+    def test_operations_report_per_file(self):
+        """Test: fix/validate/analyze agrupan los resultados por archivo"""
+        (self.base_dir / "b.json").write_text(
+            '{"paths": {}, "components": {"schemas": {"S": {"properties": {'
+            '"description": {"type": "string", "description": "d"}}}}}, "paths": {}}',
+            encoding="utf-8",
+        )
+        workspace = openapi_engine.SpecWorkspace(self.base_dir, manifest=self.manifest, write_fixes=False)
+        workspace.load()
+
+        b_file = self.base_dir / "b.json"
+        self.assertEqual(list(workspace.analyze()), [b_file])
+        self.assertEqual([change.rule for change in workspace.fix()[b_file]], ["description-object"])
+        self.assertIn("description", workspace.sources[b_file]["data"]["components"]["schemas"]["S"]["properties"])
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests para el recorrido de la documentación (docs_crawl.py y verify_docs.py)
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from docs_crawl import crawl, navigation_pages, page_path, slowest, wait_until_ready
+from verify_docs import main
+
+CONFIG = {
+    "openapi": ["openapi.json"],
+    "navigation": {
+        "tabs": [
+            {"tab": "Guía", "groups": [{"group": "Inicio", "pages": ["index", "quickstart"]}]},
+            {
+                "tab": "API",
+                "groups": [
+                    {
+                        "group": "Documentos",
+                        "pages": ["api/list", {"group": "Anidado", "pages": ["api/slow", "quickstart"]}],
+                    },
+                    {"group": "Rotas", "pages": ["api/missing"]},
+                ],
+            },
+        ]
+    },
+}
+
+SLOW_SECONDS = 0.2
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    """Sitio estático mínimo: todas las páginas existen salvo /api/missing; /api/slow tarda"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/api/slow"):
+            time.sleep(SLOW_SECONDS)
+        status = 404 if self.path == "/api/missing" else 200
+        data = f"<html>{self.path}</html>".encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestNavigation(unittest.TestCase):
+    """Tests de las páginas tomadas de docs.json"""
+
+    def test_pages_from_nested_groups_without_duplicates(self):
+        self.assertEqual(
+            navigation_pages(CONFIG), ["index", "quickstart", "api/list", "api/slow", "api/missing"]
+        )
+
+    def test_page_paths(self):
+        self.assertEqual(page_path("index"), "/")
+        self.assertEqual(page_path("user-guide/index"), "/user-guide")
+        self.assertEqual(page_path("api-reference/documents/list"), "/api-reference/documents/list")
+
+    def test_repository_navigation(self):
+        with open(Path(__file__).parent.parent.parent / "docs.json", "r", encoding="utf-8") as f:
+            pages = navigation_pages(json.load(f))
+
+        self.assertIn("index", pages)
+        self.assertIn("api-reference/documents/batch", pages)
+        self.assertEqual(len(pages), len(set(pages)))
+
+
+class TestCrawl(unittest.TestCase):
+    """Tests contra un servidor estático local"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StaticHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_crawl_reports_status_and_latency_in_page_order(self):
+        pages = navigation_pages(CONFIG)
+        results = asyncio.run(crawl(self.base_url, pages, concurrency=3))
+
+        self.assertEqual([result.page for result in results], pages)
+        self.assertEqual([result.status for result in results], [200, 200, 200, 200, 404])
+        self.assertEqual(slowest(results, 1)[0].path, "/api/slow")
+        self.assertGreaterEqual(slowest(results, 1)[0].latency_ms, SLOW_SECONDS * 1000)
+
+    def test_workers_run_concurrently(self):
+        start = time.perf_counter()
+        asyncio.run(crawl(self.base_url, [f"api/slow-{n}" for n in range(4)], concurrency=4))
+
+        self.assertLess(time.perf_counter() - start, SLOW_SECONDS * 3)
+
+    def test_http_10_server_closing_each_connection(self):
+        StaticHandler.protocol_version = "HTTP/1.0"
+        self.addCleanup(setattr, StaticHandler, "protocol_version", "HTTP/1.1")
+
+        results = asyncio.run(crawl(self.base_url, ["index", "quickstart", "api/list"], concurrency=1))
+
+        self.assertEqual([result.status for result in results], [200, 200, 200])
+
+    def test_main_against_static_server(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config = Path(tmpdir) / "docs.json"
+        config.write_text(json.dumps(CONFIG), encoding="utf-8")
+        (Path(tmpdir) / "openapi.json").write_text("{}", encoding="utf-8")
+        report = Path(tmpdir) / "resultado.json"
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = main(["--config", str(config), "--base-url", self.base_url, "--json", str(report)])
+
+        self.assertEqual(code, 1)
+        self.assertIn("4/5 páginas OK", output.getvalue())
+        saved = json.loads(report.read_text(encoding="utf-8"))
+        self.assertEqual(saved["pages"][-1]["status"], 404)
+
+
+class TestReadiness(unittest.TestCase):
+    """Tests del sondeo de disponibilidad"""
+
+    def test_waits_for_late_server(self):
+        port = free_port()
+        server = None
+
+        def start_later():
+            nonlocal server
+            time.sleep(0.3)
+            server = ThreadingHTTPServer(("127.0.0.1", port), StaticHandler)
+            server.serve_forever()
+
+        threading.Thread(target=start_later, daemon=True).start()
+        try:
+            waited = asyncio.run(wait_until_ready(f"http://127.0.0.1:{port}", timeout=10))
+        finally:
+            while server is None:
+                time.sleep(0.01)
+            server.shutdown()
+            server.server_close()
+
+        self.assertGreaterEqual(waited, 0.25)
+
+    def test_timeout_and_dead_process(self):
+        base_url = f"http://127.0.0.1:{free_port()}"
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(wait_until_ready(base_url, timeout=0.3))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(wait_until_ready(base_url, timeout=10, is_alive=lambda: False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests para las variantes de salida (openapi_artifacts.py)
+"""
+
+import gzip
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import openapi_artifacts
+from openapi_artifacts import write_artifacts, write_build_manifest, write_if_changed
+
+DOCUMENT = {"openapi": "3.0.1", "info": {"title": "Facturación"}, "paths": {"/a": {"get": {}}}}
+
+
+class FakeBrotli:
+    @staticmethod
+    def compress(data, quality=11):
+        return b"br:" + data
+
+
+class TestArtifacts(unittest.TestCase):
+    """Tests para write_artifacts"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output = Path(self.tmp_dir.name) / "openapi-combined.json"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_pretty_profile_keeps_historic_format(self):
+        """Test: El perfil pretty escribe solo el archivo indentado de siempre"""
+        artifacts = write_artifacts(DOCUMENT, self.output)
+        self.assertEqual([artifact.path for artifact in artifacts], [self.output])
+        self.assertEqual(
+            self.output.read_text(encoding="utf-8"),
+            json.dumps(DOCUMENT, indent=2, ensure_ascii=False),
+        )
+        self.assertEqual(sorted(p.name for p in self.output.parent.iterdir()), ["openapi-combined.json"])
+
+    @patch.object(openapi_artifacts, "brotli", None)
+    def test_compact_profile(self):
+        """Test: El perfil compact agrega la variante minificada y su .gz reproducible"""
+        artifacts = write_artifacts(DOCUMENT, self.output, "compact")
+        names = [artifact.path.name for artifact in artifacts]
+        self.assertEqual(
+            names, ["openapi-combined.json", "openapi-combined.min.json", "openapi-combined.min.json.gz"]
+        )
+
+        minified = (self.output.parent / "openapi-combined.min.json").read_bytes()
+        self.assertNotIn(b": ", minified)
+        self.assertEqual(json.loads(minified), DOCUMENT)
+        self.assertEqual(artifacts[1].size, len(minified))
+
+        gz_file = self.output.parent / "openapi-combined.min.json.gz"
+        first = gz_file.read_bytes()
+        self.assertEqual(gzip.decompress(first), minified)
+        write_artifacts(DOCUMENT, self.output, "compact")
+        self.assertEqual(gz_file.read_bytes(), first)
+
+    def test_brotli_when_available(self):
+        """Test: Con brotli instalado se escribe también la variante .br"""
+        with patch.object(openapi_artifacts, "brotli", FakeBrotli):
+            artifacts = write_artifacts(DOCUMENT, self.output, "compact")
+        br_file = self.output.parent / "openapi-combined.min.json.br"
+        self.assertEqual(artifacts[-1].path, br_file)
+        self.assertTrue(br_file.read_bytes().startswith(b"br:"))
+
+        # Sin brotli no queda una variante .br desactualizada
+        with patch.object(openapi_artifacts, "brotli", None):
+            write_artifacts(DOCUMENT, self.output, "compact")
+        self.assertFalse(br_file.exists())
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    """Tests para las escrituras atómicas que se omiten sin cambios"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_unchanged_content_is_not_rewritten(self):
+        """Test: Sin cambios no se escribe (el mtime no se toca) ni quedan temporales"""
+        target = self.directory / "out.json"
+        self.assertTrue(write_if_changed(target, b"{}"))
+        os.utime(target, ns=(0, 0))
+
+        self.assertFalse(write_if_changed(target, b"{}"))
+        self.assertEqual(target.stat().st_mtime_ns, 0)
+
+        self.assertTrue(write_if_changed(target, b"[]"))
+        self.assertEqual(target.read_bytes(), b"[]")
+        self.assertEqual([p.name for p in self.directory.iterdir()], ["out.json"])
+
+    @unittest.skipIf(os.name != "posix", "permisos POSIX")
+    def test_mode_follows_umask_and_existing_file(self):
+        """Test: Un archivo nuevo respeta el umask y uno reescrito conserva sus permisos"""
+        target = self.directory / "out.json"
+        reference = self.directory / "referencia.json"
+        reference.write_bytes(b"")
+        # El umask se lee al importar: escribir no lo cambia (afectaría a otros hilos)
+        with patch("os.umask", side_effect=AssertionError("os.umask no debe llamarse al escribir")):
+            write_if_changed(target, b"{}")
+            self.assertEqual(stat.S_IMODE(target.stat().st_mode), stat.S_IMODE(reference.stat().st_mode))
+
+            target.chmod(0o664)
+            write_if_changed(target, b"[]")
+            self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o664)
+
+    def test_noop_rebuild_writes_nothing(self):
+        """Test: Repetir el build con el mismo documento no escribe ningún archivo"""
+        output = self.directory / "openapi-combined.json"
+        manifest = self.directory / "build.json"
+        artifacts = write_artifacts(DOCUMENT, output, "compact")
+        self.assertTrue(write_build_manifest(manifest, {"a.json": "abc"}, artifacts))
+        self.assertTrue(all(artifact.written for artifact in artifacts))
+
+        again = write_artifacts(DOCUMENT, output, "compact")
+        self.assertFalse(any(artifact.written for artifact in again))
+        self.assertFalse(write_build_manifest(manifest, {"a.json": "abc"}, again))
+
+        recorded = json.loads(manifest.read_text(encoding="utf-8"))
+        self.assertEqual(recorded["sources"], {"a.json": "abc"})
+        self.assertEqual(recorded["outputs"][str(output)]["sha256"], again[0].sha256)
+
+
+if __name__ == "__main__":
+    unittest.main()
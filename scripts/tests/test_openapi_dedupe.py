@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests para la deduplicación de schemas inline (openapi_dedupe.py)
+"""
+
+import copy
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_dedupe import dedupe_inline_schemas
+from openapi_refs import RefGraph
+from openapi_structure import check_structure
+
+PAGE = {
+    "type": "object",
+    "properties": {
+        "count": {"type": "integer", "description": "Cantidad total de resultados"},
+        "next": {"type": "string", "nullable": True, "description": "URL de la página siguiente"},
+    },
+}
+
+ERROR = {"type": "object", "properties": {"detail": {"type": "string", "example": "No encontrado."}}}
+
+
+def json_response(schema):
+    return {"description": "OK", "content": {"application/json": {"schema": schema}}}
+
+
+def base_document():
+    return {
+        "openapi": "3.0.1",
+        "info": {"title": "API", "version": "1"},
+        "paths": {
+            "/documents": {
+                "get": {
+                    "responses": {
+                        "200": json_response({"allOf": [copy.deepcopy(PAGE), {"type": "object"}]}),
+                        "404": json_response(copy.deepcopy(ERROR)),
+                    }
+                }
+            },
+            "/cessions": {
+                "get": {
+                    "operationId": "list_cessions",
+                    "responses": {
+                        "200": json_response(copy.deepcopy(PAGE)),
+                        "404": json_response(dict(reversed(list(ERROR.items())))),
+                    },
+                }
+            },
+        },
+        "components": {
+            "schemas": {
+                "Cession": {"type": "object", "properties": {"page": copy.deepcopy(PAGE)}},
+                "Error": copy.deepcopy(ERROR),
+            }
+        },
+    }
+
+
+class TestDedupeInlineSchemas(unittest.TestCase):
+    """Tests para dedupe_inline_schemas"""
+
+    def setUp(self):
+        self.document = base_document()
+        self.original = copy.deepcopy(self.document)
+
+    def test_duplicates_are_hoisted_with_stable_names(self):
+        deduped, hoisted = dedupe_inline_schemas(self.document, min_bytes=50)
+
+        self.assertEqual(
+            [(schema.name, schema.existing, len(schema.pointers)) for schema in hoisted],
+            [("CessionPage", False, 3), ("Error", True, 2)],
+        )
+        self.assertEqual(deduped["components"]["schemas"]["CessionPage"], PAGE)
+        self.assertEqual(list(deduped["components"]["schemas"]), ["Cession", "CessionPage", "Error"])
+        cessions = deduped["paths"]["/cessions"]["get"]["responses"]
+        self.assertEqual(
+            cessions["200"]["content"]["application/json"]["schema"], {"$ref": "#/components/schemas/CessionPage"}
+        )
+        self.assertEqual(cessions["404"]["content"]["application/json"]["schema"], {"$ref": "#/components/schemas/Error"})
+        self.assertEqual(
+            deduped["paths"]["/documents"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["allOf"][0],
+            {"$ref": "#/components/schemas/CessionPage"},
+        )
+
+        self.assertEqual(self.document, self.original)
+        self.assertEqual(RefGraph(deduped).dangling, [])
+        self.assertEqual(check_structure(deduped), [])
+
+    def test_result_is_stable(self):
+        deduped, _hoisted = dedupe_inline_schemas(self.document, min_bytes=50)
+        again, hoisted = dedupe_inline_schemas(deduped, min_bytes=50)
+
+        self.assertEqual(hoisted, [])
+        self.assertEqual(again, deduped)
+
+    def test_small_schemas_are_left_inline(self):
+        deduped, hoisted = dedupe_inline_schemas(self.document, min_bytes=10_000)
+
+        self.assertEqual(hoisted, [])
+        self.assertIs(deduped, self.document)
+
+    def test_nested_duplicates_count_once(self):
+        # ERROR solo se repite dentro de las copias del sobre: se mueve con él
+        envelope = {"type": "object", "properties": {"error": copy.deepcopy(ERROR), "code": {"type": "integer"}}}
+        document = {
+            "paths": {
+                "/a": {"get": {"responses": {"400": json_response(copy.deepcopy(envelope))}}},
+                "/b": {"get": {"responses": {"400": json_response(copy.deepcopy(envelope))}}},
+            }
+        }
+
+        deduped, hoisted = dedupe_inline_schemas(document, min_bytes=20)
+
+        self.assertEqual([schema.name for schema in hoisted], ["AGetResponse400"])
+        self.assertEqual(deduped["components"]["schemas"]["AGetResponse400"], envelope)
+
+    def test_name_collisions_use_qualified_names(self):
+        self.document["components"]["schemas"]["CessionPage"] = {"type": "string"}
+
+        deduped, hoisted = dedupe_inline_schemas(self.document, min_bytes=50)
+
+        self.assertTrue(hoisted[0].name.startswith("CessionPage_"))
+        self.assertEqual(deduped["components"]["schemas"]["CessionPage"], {"type": "string"})
+
+    def test_single_part_names_are_qualified_with_their_operation(self):
+        status = {
+            "type": "string",
+            "enum": ["borrador", "emitido", "anulado", "vencido"],
+            "description": "Estado del documento en el SII",
+        }
+        document = {
+            "paths": {
+                path: {"get": {"operationId": f"list_{path[1:]}", "responses": {"200": json_response(
+                    {"type": "object", "properties": {"status": copy.deepcopy(status), "id": {"type": field}}}
+                )}}}
+                for path, field in (("/cessions", "integer"), ("/documents", "string"))
+            }
+        }
+
+        deduped, hoisted = dedupe_inline_schemas(document, min_bytes=50)
+
+        self.assertEqual([schema.name for schema in hoisted], ["ListCessionsStatus"])
+
+    def test_property_order_is_not_merged(self):
+        # Las propiedades se muestran en orden: un schema con otro orden no es un duplicado
+        properties = self.document["paths"]["/cessions"]["get"]["responses"]["200"]["content"]["application/json"]
+        properties["schema"]["properties"] = dict(reversed(list(PAGE["properties"].items())))
+
+        deduped, hoisted = dedupe_inline_schemas(self.document, min_bytes=50)
+
+        self.assertEqual([(schema.name, len(schema.pointers)) for schema in hoisted], [("CessionPage", 2), ("Error", 2)])
+        schema = deduped["paths"]["/cessions"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        self.assertEqual(list(schema["properties"]), ["next", "count"])
+
+    def test_skipped_group_does_not_hide_its_subschemas(self):
+        # El array que envuelve a `status` es muy chico para moverlo, pero
+        # `status` se repite también fuera de él
+        status = {"type": "string", "enum": ["borrador", "emitido", "anulado", "vencido"]}
+        paths = {
+            path: {"get": {"responses": {"200": json_response({"type": "array", "items": copy.deepcopy(status)})}}}
+            for path in ("/a", "/b")
+        }
+        for index, path in enumerate(("/c", "/d", "/e", "/f")):
+            schema = {"type": "array", "items": copy.deepcopy(status), "maxItems": index + 1}
+            paths[path] = {"get": {"responses": {"200": json_response(schema)}}}
+
+        deduped, hoisted = dedupe_inline_schemas({"paths": paths}, min_bytes=20)
+
+        self.assertEqual([(schema.name, len(schema.pointers)) for schema in hoisted], [("AGetResponse200Item", 6)])
+        self.assertEqual(deduped["components"]["schemas"]["AGetResponse200Item"], status)
+
+    def test_names_come_from_the_first_occurrence_in_document_order(self):
+        variant = {
+            "type": "object",
+            "properties": {"rut": {"type": "string", "description": "RUT del emisor del documento, con dígito verificador"}},
+        }
+        alternatives = [{"type": "object", "title": f"Variante {index}"} for index in range(11)]
+        alternatives[2] = copy.deepcopy(variant)
+        alternatives[10] = copy.deepcopy(variant)
+        document = {"paths": {"/a": {"get": {"responses": {"200": json_response({"oneOf": alternatives})}}}}}
+
+        _deduped, hoisted = dedupe_inline_schemas(document, min_bytes=20)
+
+        self.assertEqual(hoisted[0].name, "AGetResponse200OneOf3")
+        self.assertEqual([pointer.rsplit("/", 1)[1] for pointer in hoisted[0].pointers], ["2", "10"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests para el diff semántico entre builds (openapi_diff.py)
+"""
+
+import copy
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_diff import MerkleTree, diff_documents, has_breaking_changes
+
+
+def base_document():
+    return {
+        "openapi": "3.0.1",
+        "info": {"title": "API", "version": "1"},
+        "paths": {
+            "/documents/batch": {
+                "post": {
+                    "requestBody": {
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/DocumentBatch"}}}
+                    },
+                    "responses": {"200": {"description": "OK"}, "400": {"description": "Error"}},
+                }
+            },
+            "/documents": {
+                "get": {
+                    "summary": "Listar",
+                    "parameters": [{"name": "page", "in": "query", "schema": {"type": "integer"}}],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            },
+        },
+        "components": {
+            "schemas": {
+                "DocumentBatch": {
+                    "type": "object",
+                    "required": ["documents"],
+                    "properties": {
+                        "documents": {"type": "array", "items": {"type": "string"}},
+                        "mode": {"type": "string", "enum": ["sync", "async"]},
+                    },
+                }
+            }
+        },
+    }
+
+
+class TestMerkleTree(unittest.TestCase):
+    """Tests para MerkleTree"""
+
+    def test_key_order_does_not_change_hash(self):
+        first = {"a": 1, "b": {"c": [1, 2]}}
+        second = {"b": {"c": [1, 2]}, "a": 1}
+        self.assertEqual(MerkleTree(first).digest(first), MerkleTree(second).digest(second))
+
+    def test_ordered_keys_keep_their_order_in_the_hash(self):
+        first = {"type": "object", "properties": {"a": {"type": "string"}, "b": {"type": "integer"}}}
+        second = {"properties": dict(reversed(list(first["properties"].items()))), "type": "object"}
+        self.assertEqual(MerkleTree(first).digest(first), MerkleTree(second).digest(second))
+        self.assertNotEqual(
+            MerkleTree(first, ordered=("properties",)).digest(first),
+            MerkleTree(second, ordered=("properties",)).digest(second),
+        )
+
+    def test_scalar_types_are_distinguished(self):
+        pairs = [({"a": 1}, {"a": "1"}), ({"a": 1}, {"a": True}), ([[1]], [1])]
+        for first, second in pairs:
+            self.assertNotEqual(MerkleTree(first).digest(first), MerkleTree(second).digest(second))
+
+    def test_deep_documents_do_not_hit_recursion_limit(self):
+        document = {}
+        for _ in range(5000):
+            document = {"child": document}
+        MerkleTree(document).digest(document)
+
+
+class TestDiffDocuments(unittest.TestCase):
+    """Tests para diff_documents"""
+
+    def setUp(self):
+        self.old = base_document()
+        self.new = copy.deepcopy(self.old)
+
+    def findings(self, kind=None):
+        report = diff_documents(self.old, self.new)
+        return [(f.subject, f.message) for f in report.findings if kind is None or f.kind == kind]
+
+    def test_identical_documents_compare_only_the_root(self):
+        self.new = dict(reversed(list(self.new.items())))
+        report = diff_documents(self.old, self.new)
+
+        self.assertEqual(report.findings, [])
+        self.assertEqual(report.compared, 1)
+
+    def test_new_required_property_is_breaking_and_lists_affected_operations(self):
+        schema = self.new["components"]["schemas"]["DocumentBatch"]
+        schema["required"].append("entity_id")
+        schema["properties"]["entity_id"] = {"type": "integer"}
+
+        report = diff_documents(self.old, self.new)
+
+        self.assertEqual(
+            [(f.subject, f.kind, f.message) for f in report.findings],
+            [("schema DocumentBatch", "breaking", "nueva propiedad requerida 'entity_id'")],
+        )
+        self.assertEqual(report.affected, {"schema DocumentBatch": ["POST /documents/batch"]})
+        self.assertTrue(has_breaking_changes(report))
+
+    def test_removed_enum_value_and_property_type_change(self):
+        properties = self.new["components"]["schemas"]["DocumentBatch"]["properties"]
+        properties["mode"]["enum"] = ["sync", "batch"]
+        properties["documents"]["items"]["type"] = "integer"
+
+        self.assertEqual(
+            sorted(self.findings("breaking")),
+            [
+                ("schema DocumentBatch", "tipo cambió: string -> integer"),
+                ("schema DocumentBatch", "valores de enum eliminados: ['async']"),
+            ],
+        )
+        self.assertIn(("schema DocumentBatch", "valores de enum agregados: ['batch']"), self.findings("changed"))
+
+    def test_operation_added_removed_and_parameter_changes(self):
+        del self.new["paths"]["/documents/batch"]
+        self.new["paths"]["/webhooks"] = {"get": {"responses": {"200": {"description": "OK"}}}}
+        parameters = self.new["paths"]["/documents"]["get"]["parameters"]
+        parameters.append({"name": "entity", "in": "query", "required": True, "schema": {"type": "string"}})
+
+        self.assertEqual(self.findings("removed"), [("POST /documents/batch", "operación eliminada")])
+        self.assertEqual(self.findings("added"), [("GET /webhooks", "operación agregada")])
+        self.assertEqual(self.findings("breaking"), [("GET /documents", "nuevo parámetro requerido 'entity' (query)")])
+
+    def test_removed_response_is_breaking(self):
+        del self.new["paths"]["/documents/batch"]["post"]["responses"]["400"]
+        self.assertEqual(self.findings("breaking"), [("POST /documents/batch", "respuesta 400 eliminada")])
+
+    def test_description_change_is_not_breaking(self):
+        self.new["paths"]["/documents"]["get"]["summary"] = "Listar documentos"
+        self.new["info"]["description"] = "Nueva"
+
+        report = diff_documents(self.old, self.new)
+
+        self.assertFalse(has_breaking_changes(report))
+        self.assertEqual(self.findings(), [("GET /documents", "modificada"), ("info", "modificado")])
+
+    def test_inline_schema_replaced_by_ref_to_identical_component_is_not_breaking(self):
+        batch = self.new["components"]["schemas"]["DocumentBatch"]
+        self.new["components"]["schemas"]["Mode"] = batch["properties"]["mode"]
+        batch["properties"]["mode"] = {"$ref": "#/components/schemas/Mode"}
+        parameter = self.new["paths"]["/documents"]["get"]["parameters"][0]
+        self.new["components"]["schemas"]["Page"] = parameter["schema"]
+        parameter["schema"] = {"$ref": "#/components/schemas/Page"}
+
+        report = diff_documents(self.old, self.new)
+
+        self.assertFalse(has_breaking_changes(report))
+        self.assertEqual(
+            self.findings(),
+            [
+                ("GET /documents", "modificada"),
+                ("schema DocumentBatch", "modificado"),
+                ("schema Mode", "schema agregado"),
+                ("schema Page", "schema agregado"),
+            ],
+        )
+
+    def test_ref_to_a_different_component_compares_its_content(self):
+        self.new["components"]["schemas"]["Mode"] = {"type": "string", "enum": ["sync"]}
+        self.new["components"]["schemas"]["DocumentBatch"]["properties"]["mode"] = {"$ref": "#/components/schemas/Mode"}
+
+        self.assertEqual(self.findings("breaking"), [("schema DocumentBatch", "valores de enum eliminados: ['async']")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests para la validación de ejemplos (openapi_examples.py)
+"""
+
+import copy
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_examples import SchemaCompiler, iter_examples, validate_examples
+
+
+def document_with_examples():
+    return {
+        "openapi": "3.0.1",
+        "paths": {
+            "/documents": {
+                "post": {
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Document"},
+                                "example": {"id": 1, "status": "sent"},
+                            }
+                        }
+                    },
+                    "responses": {
+                        "400": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Error"},
+                                    "examples": {
+                                        "ok": {"value": {"error": "VALIDATION_ERROR"}},
+                                        "shared": {"$ref": "#/components/examples/BadError"},
+                                    },
+                                }
+                            }
+                        }
+                    },
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Document": {
+                    "type": "object",
+                    "required": ["id"],
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "status": {"type": "string", "enum": ["draft", "sent"], "example": "draft"},
+                    },
+                },
+                "Error": {
+                    "type": "object",
+                    "required": ["error"],
+                    "properties": {"error": {"type": "string", "enum": ["VALIDATION_ERROR"]}},
+                },
+            },
+            "examples": {"BadError": {"value": {"error": "Algo salió mal"}}},
+        },
+    }
+
+
+class TestSchemaCompiler(unittest.TestCase):
+    """Tests para SchemaCompiler"""
+
+    def errors(self, schema, value, document=None):
+        errors = []
+        SchemaCompiler(document or {}).compile(schema)(value, "", errors)
+        return errors
+
+    def test_identical_schemas_share_one_validator(self):
+        compiler = SchemaCompiler({})
+        first = compiler.compile({"type": "string", "minLength": 1})
+        second = compiler.compile({"minLength": 1, "type": "string"})
+
+        self.assertIs(first, second)
+        self.assertEqual(compiler.compiled, 1)
+
+    def test_type_required_enum_and_nested_pointers(self):
+        schema = {
+            "type": "object",
+            "required": ["id", "items"],
+            "properties": {
+                "id": {"type": "integer"},
+                "items": {"type": "array", "items": {"type": "string", "enum": ["a"]}},
+            },
+        }
+
+        errors = self.errors(schema, {"id": "1", "items": ["a", "b"]})
+
+        self.assertEqual(
+            errors,
+            [("/id", "se esperaba integer, se encontró string"), ("/items/1", "\"b\" no está en enum ['a']")],
+        )
+        self.assertEqual(self.errors(schema, {}), [
+            ("", "falta la propiedad requerida 'id'"),
+            ("", "falta la propiedad requerida 'items'"),
+        ])
+
+    def test_nullable_number_bounds_and_formats(self):
+        self.assertEqual(self.errors({"type": "integer", "nullable": True}, None), [])
+        self.assertEqual(self.errors({"type": "number"}, 3), [])
+        self.assertEqual(len(self.errors({"type": "integer", "minimum": 1}, 0)), 1)
+        self.assertEqual(self.errors({"type": "string", "format": "date-time"}, "2024-01-15T10:30:00Z"), [])
+        self.assertEqual(len(self.errors({"type": "string", "format": "date"}, "15-01-2024")), 1)
+
+    def test_one_of_requires_exactly_one_match(self):
+        schema = {"oneOf": [{"type": "integer"}, {"type": "number"}]}
+
+        self.assertEqual(self.errors(schema, 1.5), [])
+        self.assertEqual(len(self.errors(schema, 1)), 1)
+        self.assertEqual(len(self.errors(schema, "x")), 1)
+
+    def test_recursive_ref_compiles_once(self):
+        document = {
+            "components": {
+                "schemas": {
+                    "Node": {
+                        "type": "object",
+                        "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}},
+                    }
+                }
+            }
+        }
+        value = {"children": [{"children": [{"children": 1}]}]}
+
+        errors = self.errors({"$ref": "#/components/schemas/Node"}, value, document)
+
+        self.assertEqual(errors, [("/children/0/children/0/children", "se esperaba array, se encontró integer")])
+
+    def test_additional_properties_false(self):
+        schema = {"type": "object", "properties": {"a": {}}, "additionalProperties": False}
+        self.assertEqual(self.errors(schema, {"a": 1, "b": 2}), [("/b", "propiedad no permitida 'b'")])
+
+
+class TestValidateExamples(unittest.TestCase):
+    """Tests para iter_examples y validate_examples"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_iter_examples_finds_media_named_and_schema_examples(self):
+        pointers = sorted(case.pointer for case in iter_examples(document_with_examples()))
+
+        self.assertEqual(
+            pointers,
+            [
+                "/components/schemas/Document/properties/status/example",
+                "/paths/~1documents/post/requestBody/content/application~1json/example",
+                "/paths/~1documents/post/responses/400/content/application~1json/examples/ok/value",
+                "/paths/~1documents/post/responses/400/content/application~1json/examples/shared/value",
+            ],
+        )
+
+    def test_reports_mismatches_with_pointers(self):
+        mismatches, stats = validate_examples(document_with_examples())
+
+        self.assertEqual(stats["examples"], 4)
+        self.assertEqual(len(mismatches), 1)
+        mismatch = mismatches[0]
+        self.assertTrue(mismatch.pointer.endswith("/examples/shared/value"))
+        self.assertEqual(mismatch.path, "/error")
+
+    def test_rerun_skips_unchanged_and_revalidates_when_ref_target_changes(self):
+        document = document_with_examples()
+        first, stats = validate_examples(document, cache_dir=self.cache_dir)
+        self.assertEqual(stats["cached"], 0)
+
+        second, stats = validate_examples(document, cache_dir=self.cache_dir)
+        self.assertEqual((stats["validated"], stats["cached"]), (0, 4))
+        self.assertEqual(first, second)
+
+        changed = copy.deepcopy(document)
+        changed["components"]["schemas"]["Error"]["properties"]["error"]["enum"].append("Algo salió mal")
+        third, stats = validate_examples(changed, cache_dir=self.cache_dir)
+        self.assertEqual(stats["validated"], 2)
+        self.assertEqual(third, [])
+
+    def test_parallel_matches_serial(self):
+        document = document_with_examples()
+        self.assertEqual(validate_examples(document, jobs=2), validate_examples(document, jobs=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests para el generador de carga (openapi_load.py)
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_load import (
+    build_request,
+    is_batch_operation,
+    percentile,
+    run_scenario,
+    select_operations,
+    summarize,
+)
+from openapi_mock import MockApp, create_mock_server
+
+DOCUMENT = {
+    "openapi": "3.0.1",
+    "paths": {
+        "/documents": {
+            "get": {
+                "operationId": "listDocuments",
+                "parameters": [
+                    {"name": "master_entity_id", "in": "query", "required": True, "schema": {"type": "integer"}},
+                    {"name": "page", "in": "query", "schema": {"type": "integer"}},
+                    {"name": "X-Tenant", "in": "header", "required": True, "example": "acme"},
+                ],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+        "/documents/{document_id}": {
+            "parameters": [{"name": "document_id", "in": "path", "required": True, "example": "a b"}],
+            "delete": {"responses": {"204": {"description": "Eliminado"}}},
+        },
+        "/documents/batch": {
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Batch"},
+                            "example": {"master_entity_id": 1, "documents": [{"folio": 1}, {"folio": 2}]},
+                        }
+                    }
+                },
+                "responses": {"202": {"description": "Aceptado"}},
+            }
+        },
+        "/webhooks": {
+            "post": {
+                "requestBody": {
+                    "content": {"application/json": {"example": {"url": "https://x", "events": ["a"]}}}
+                },
+                "responses": {"201": {"description": "Creado"}},
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Batch": {"type": "object", "properties": {"documents": {"type": "array", "maxItems": 100}}}
+        }
+    },
+}
+
+
+class TestBuildRequest(unittest.TestCase):
+    """Tests para build_request y la selección de operaciones"""
+
+    def test_required_parameters_take_example_values(self):
+        request = build_request(DOCUMENT, "GET /documents", headers={"Authorization": "Api-Key x"})
+
+        self.assertEqual(request.target, "/documents?master_entity_id=1")
+        self.assertEqual(request.headers["X-Tenant"], "acme")
+        self.assertEqual(request.headers["Authorization"], "Api-Key x")
+        self.assertEqual(request.body, b"")
+        self.assertEqual(build_request(DOCUMENT, "DELETE /documents/{document_id}").target, "/documents/a%20b")
+
+    def test_batch_body_is_resized_by_repeating_examples(self):
+        request = build_request(DOCUMENT, "POST /documents/batch", batch_size=5)
+
+        body = json.loads(request.body)
+        self.assertEqual(request.batch_size, 5)
+        self.assertEqual(body["master_entity_id"], 1)
+        self.assertEqual([item["folio"] for item in body["documents"]], [1, 2, 1, 2, 1])
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+
+    def test_batch_operations(self):
+        self.assertTrue(is_batch_operation(DOCUMENT, "POST /documents/batch"))
+        self.assertFalse(is_batch_operation(DOCUMENT, "POST /webhooks"))
+        self.assertFalse(is_batch_operation(DOCUMENT, "GET /documents"))
+        with self.assertRaises(ValueError):
+            build_request(DOCUMENT, "GET /documents", batch_size=10)
+
+    def test_select_operations(self):
+        self.assertEqual(select_operations(DOCUMENT), ["GET /documents"])
+        self.assertEqual(
+            select_operations(DOCUMENT, ["POST /documents/batch", "listDocuments"]),
+            ["POST /documents/batch", "GET /documents"],
+        )
+        with self.assertRaises(ValueError):
+            select_operations(DOCUMENT, ["GET /nada"])
+
+
+class TestScenario(unittest.TestCase):
+    """Tests de un escenario real contra el mock en localhost"""
+
+    def test_run_scenario_against_mock(self):
+        async def run():
+            server = await create_mock_server(MockApp(DOCUMENT), port=0)
+            host, port = server.sockets[0].getsockname()[:2]
+            request = build_request(DOCUMENT, "POST /documents/batch", batch_size=3)
+            result = await run_scenario(request, f"http://{host}:{port}", requests=50, concurrency=4)
+            server.close()
+            await server.wait_closed()
+            return result
+
+        summary = summarize(asyncio.run(run()))
+
+        self.assertEqual(summary["requests"], 50)
+        self.assertEqual(summary["statuses"], {"202": 50})
+        self.assertEqual((summary["errors"], summary["non_2xx"], summary["batch_size"]), (0, 0, 3))
+        self.assertLessEqual(summary["p50_ms"], summary["p95_ms"])
+        self.assertLessEqual(summary["p95_ms"], summary["p99_ms"])
+
+    def test_connection_errors_are_counted(self):
+        async def run():
+            server = await create_mock_server(MockApp(DOCUMENT), port=0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            request = build_request(DOCUMENT, "GET /documents")
+            return await run_scenario(request, f"http://127.0.0.1:{port}", requests=3, concurrency=1, timeout=2)
+
+        summary = summarize(asyncio.run(run()))
+
+        self.assertEqual((summary["requests"], summary["errors"]), (0, 3))
+        self.assertIsNone(summary["p99_ms"])
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual([percentile(values, p) for p in (50, 95, 99, 100)], [50, 95, 99, 100])
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertIsNone(percentile([], 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
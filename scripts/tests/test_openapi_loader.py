@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests unitarios para openapi_loader.py
+Valida el parseo con posiciones y la detección de claves duplicadas reales.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_loader import SpanIndex, loads_with_positions
+
+
+class TestLoadsWithPositions(unittest.TestCase):
+    """Tests para el cargador JSON con posiciones"""
+
+    def test_same_result_as_json_loads(self):
+        """Test: El árbol resultante es idéntico al de json.loads"""
+        text = json.dumps(
+            {
+                "a": [1, -2.5, 3e2, True, False, None, "ñ \"x\" \u00e9"],
+                "b": {"c": {}, "d": [], "e": {"f": [{"g": 0}]}},
+            },
+            indent=2,
+        )
+        self.assertEqual(loads_with_positions(text).data, json.loads(text))
+
+    def test_detects_duplicate_keys_with_positions(self):
+        """Test: Detecta claves duplicadas que json.loads descarta"""
+        text = '{\n  "a": {\n    "key": 1,\n    "key": 2\n  }\n}'
+
+        loaded = loads_with_positions(text)
+
+        self.assertEqual(loaded.data, {"a": {"key": 2}})
+        self.assertEqual(len(loaded.duplicates), 1)
+        duplicate = loaded.duplicates[0]
+        self.assertEqual(duplicate.pointer, "/a")
+        self.assertEqual(duplicate.key, "key")
+        self.assertEqual((duplicate.line, duplicate.column), (4, 5))
+        self.assertEqual((duplicate.first_line, duplicate.first_column), (3, 5))
+
+    def test_braces_inside_strings_are_not_structure(self):
+        """Test: Llaves dentro de strings no afectan la detección"""
+        text = '{"a": "}{", "b": {"a": "{"}, "c": "}"}'
+
+        loaded = loads_with_positions(text)
+
+        self.assertEqual(loaded.duplicates, [])
+
+    def test_source_map_positions(self):
+        """Test: El mapa de fuentes da línea y columna de cada nodo"""
+        text = '{\n  "paths": {\n    "/documents": {"get": [1, 2]}\n  }\n}'
+
+        source_map = loads_with_positions(text).source_map
+
+        self.assertEqual(source_map.position(""), (1, 1))
+        self.assertEqual(source_map.position("/paths"), (2, 12))
+        self.assertEqual(source_map.position("/paths/~1documents/get/1"), (3, 31))
+        self.assertIsNone(source_map.position("/missing"))
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test: JSON inválido lanza json.JSONDecodeError con su posición"""
+        with self.assertRaises(json.JSONDecodeError) as context:
+            loads_with_positions('{\n  "a": 1,\n}')
+        self.assertEqual(context.exception.lineno, 3)
+
+    def test_deep_nesting(self):
+        """Test: Documentos más profundos que el límite de recursión se parsean"""
+        depth = sys.getrecursionlimit() * 2
+        text = '{"a": ' * depth + "1" + "}" * depth
+
+        loaded = loads_with_positions(text)
+
+        self.assertEqual(loaded.source_map.position("/a" * depth), (1, depth * 6 + 1))
+
+
+class TestSpanIndex(unittest.TestCase):
+    """Tests para el índice de extensiones de objetos"""
+
+    def setUp(self):
+        self.text = '{"a": {"b": {}, "c": [{"d": 1}], "b": 2}, "e": 3}'
+        spans = loads_with_positions(self.text, record_spans=True).source_map.spans
+        self.index = SpanIndex(spans)
+
+    def pointer_at(self, offset):
+        object_index = self.index.object_at(offset)
+        return None if object_index is None else self.index.spans[object_index].pointer
+
+    def test_innermost_object_at_offset(self):
+        """Test: Retorna el objeto más interno que contiene cada posición"""
+        self.assertEqual(self.pointer_at(self.text.index('"a"')), "")
+        self.assertEqual(self.pointer_at(self.text.index('"c"')), "/a")
+        self.assertEqual(self.pointer_at(self.text.index('"d"')), "/a/c/0")
+        # Después del objeto anidado se vuelve al objeto padre
+        self.assertEqual(self.pointer_at(self.text.rindex('"b"')), "/a")
+        self.assertEqual(self.pointer_at(self.text.index('"e"')), "")
+        self.assertIsNone(self.pointer_at(len(self.text)))
+
+    def test_key_occurrences_grouped_by_object(self):
+        """Test: Cada ocurrencia de una clave queda asociada a su objeto"""
+        occurrences = self.index.occurrences("b")
+        self.assertEqual(len(occurrences), 2)
+        self.assertEqual({self.index.spans[i].pointer for _offset, i in occurrences}, {"/a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests para el servidor mock de la API (openapi_mock.py)
+"""
+
+import asyncio
+import json
+import re
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_mock import MockApp, MockProfile, MockRouter, create_mock_server, synthesize
+
+DOCUMENT = {
+    "openapi": "3.0.1",
+    "paths": {
+        "/documents": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/DocumentList"}}},
+                    },
+                    "403": {
+                        "description": "Sin acceso",
+                        "content": {"application/json": {"example": {"detail": "Sin acceso"}}},
+                    },
+                }
+            }
+        },
+        "/documents/{document_id}/states/": {
+            "post": {
+                "responses": {
+                    "201": {
+                        "description": "Creado",
+                        "content": {
+                            "application/json": {
+                                "examples": {"ok": {"$ref": "#/components/examples/State"}},
+                            }
+                        },
+                    }
+                }
+            }
+        },
+        "/credentials/{id}": {"delete": {"responses": {"204": {"description": "Eliminada"}}}},
+    },
+    "components": {
+        "schemas": {
+            "DocumentList": {
+                "type": "object",
+                "properties": {
+                    "count": {"type": "integer"},
+                    "results": {"type": "array", "items": {"$ref": "#/components/schemas/Document"}},
+                },
+            },
+            "Document": {
+                "allOf": [
+                    {"type": "object", "properties": {"id": {"type": "integer", "example": 7}}},
+                    {
+                        "type": "object",
+                        "properties": {
+                            "created_at": {"type": "string", "format": "date-time"},
+                            "status": {"type": "string", "enum": ["draft", "issued"]},
+                            "parent": {"$ref": "#/components/schemas/Document"},
+                        },
+                    },
+                ]
+            },
+        },
+        "examples": {"State": {"value": {"state": "accepted"}}},
+    },
+}
+
+
+def body_of(response):
+    return json.loads(response.keep_alive.split(b"\r\n\r\n", 1)[1] or b"null")
+
+
+class TestSynthesize(unittest.TestCase):
+    """Tests para synthesize"""
+
+    def test_refs_all_of_examples_and_formats(self):
+        value = synthesize({"$ref": "#/components/schemas/DocumentList"}, DOCUMENT)
+
+        document = value["results"][0]
+        self.assertEqual(value["count"], 1)
+        self.assertEqual(document["id"], 7)
+        self.assertEqual(document["created_at"], "2024-01-15T10:30:00Z")
+        self.assertEqual(document["status"], "draft")
+
+    def test_recursive_schemas_are_cut(self):
+        value = synthesize({"$ref": "#/components/schemas/Document"}, DOCUMENT)
+
+        depth = 0
+        while isinstance(value, dict):
+            value = value["parent"]
+            depth += 1
+        self.assertGreater(depth, 1)
+        self.assertIsNone(value)
+
+
+class TestMockApp(unittest.TestCase):
+    """Tests para el enrutado y la elección de respuestas"""
+
+    def test_router_matches_templates_and_trailing_slashes(self):
+        router = MockRouter(DOCUMENT)
+
+        self.assertIn("GET", router.match("/documents/"))
+        self.assertIn("POST", router.match("/documents/42/states"))
+        self.assertIn("DELETE", router.match("/credentials/9"))
+        self.assertIsNone(router.match("/documents/42"))
+
+    def test_responses_use_examples_and_declared_statuses(self):
+        app = MockApp(DOCUMENT)
+
+        created = app.respond(b"POST", b"/documents/42/states/?x=1")
+        self.assertEqual((created.status, body_of(created)), (201, {"state": "accepted"}))
+        self.assertEqual(app.respond(b"DELETE", b"/credentials/9").status, 204)
+        self.assertEqual(app.respond(b"GET", b"/documents", prefer=b"code=403").status, 403)
+        self.assertEqual(app.respond(b"GET", b"/nada").status, 404)
+
+        not_allowed = app.respond(b"PUT", b"/documents")
+        self.assertEqual(not_allowed.status, 405)
+        self.assertIn(b"Allow: GET\r\n", not_allowed.keep_alive)
+
+        stats = app.stats()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["by_operation"]["GET /documents"], 1)
+
+    def test_error_injection_prefers_declared_bodies(self):
+        app = MockApp(DOCUMENT, MockProfile(0.0, 0.0, 1.0, (403,)), seed=1)
+
+        response = app.respond(b"GET", b"/documents")
+        self.assertEqual((response.status, body_of(response)), (403, {"detail": "Sin acceso"}))
+        injected = app.respond(b"DELETE", b"/credentials/9")
+        self.assertEqual((injected.status, body_of(injected)), (403, {"detail": "Error simulado por el mock"}))
+
+
+class TestMockServer(unittest.TestCase):
+    """Tests sobre un servidor real en localhost (puerto libre)"""
+
+    def exchange(self, app, payload, expected_responses):
+        async def run():
+            server = await create_mock_server(app, port=0)
+            host, port = server.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(payload)
+            await writer.drain()
+            data = b""
+            while data.count(b"HTTP/1.1 ") < expected_responses:
+                chunk = await asyncio.wait_for(reader.read(65536), timeout=5)
+                if not chunk:
+                    break
+                data += chunk
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return data
+
+        return asyncio.run(run())
+
+    def test_pipelined_requests_keep_order_with_random_latency(self):
+        app = MockApp(DOCUMENT, MockProfile(0.0, 0.02, 0.0, (500,)), seed=3)
+        requests = [
+            b"GET /documents HTTP/1.1\r\nHost: x\r\n\r\n",
+            b"POST /documents/1/states HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}",
+            b"DELETE /credentials/1 HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n2\r\n{}\r\n0\r\n\r\n",
+            b"GET /documents HTTP/1.1\r\nPrefer: code=403\r\n\r\n",
+        ] * 5
+
+        data = self.exchange(app, b"".join(requests), len(requests))
+
+        statuses = [int(status) for status in re.findall(rb"HTTP/1\.1 (\d{3})", data)]
+        self.assertEqual(statuses, [200, 201, 204, 403] * 5)
+
+    def test_connection_close(self):
+        data = self.exchange(MockApp(DOCUMENT), b"GET /documents HTTP/1.0\r\n\r\n", 1)
+
+        self.assertIn(b"Connection: close\r\n", data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests para el generador de modelos (openapi_models.py)
+"""
+
+import json
+import sys
+import types
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_mock import synthesize
+from openapi_models import collect_models, render_models
+
+DOCUMENT = {
+    "openapi": "3.0.1",
+    "paths": {},
+    "components": {
+        "schemas": {
+            "DocumentDetail": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "folio": {"type": "string", "nullable": True},
+                    "latest_trace_info": {"$ref": "#/components/schemas/TraceInfoAlias"},
+                },
+            },
+            "TraceInfoAlias": {"$ref": "#/components/schemas/TraceInfoAlias2"},
+            "TraceInfoAlias2": {"$ref": "#/components/schemas/LatestTraceInfo"},
+            "LatestTraceInfo": {"type": "object", "nullable": True, "properties": {"has_claims": {"type": "boolean"}}},
+            "DetailItem": {"type": "object", "properties": {"name": {"type": "string"}, "class": {"type": "integer"}}},
+            "DocumentDetailWithFiles": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/DocumentDetail"},
+                    {
+                        "type": "object",
+                        "required": ["details"],
+                        "properties": {
+                            "details": {"type": "array", "items": {"$ref": "#/components/schemas/DetailItem"}},
+                            "sender": {"type": "object", "properties": {"rut": {"type": "string"}}},
+                            "by_code": {"type": "object", "additionalProperties": {"$ref": "#/components/schemas/DetailItem"}},
+                            "json_param": {"type": "object", "additionalProperties": True},
+                        },
+                    },
+                ]
+            },
+            "Status": {"type": "string", "enum": ["ok"]},
+        }
+    },
+}
+
+
+def load_module(document):
+    module = types.ModuleType("models_prueba")
+    exec(compile(render_models(document), "models_prueba.py", "exec"), module.__dict__)
+    return module
+
+
+class TestModels(unittest.TestCase):
+    """Tests de las clases generadas"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.models = load_module(DOCUMENT)
+
+    def test_round_trip_with_allof_refs_and_nested_objects(self):
+        payload = {
+            "id": 1,
+            "folio": None,
+            "latest_trace_info": {"has_claims": True},
+            "details": [{"name": "a", "class": 1}, {"name": "b"}],
+            "sender": {"rut": "1-9"},
+            "by_code": {"33": {"name": "c"}},
+            "json_param": {"libre": [1, {"x": 2}]},
+        }
+
+        document = self.models.DocumentDetailWithFiles.from_dict(payload)
+
+        self.assertIsInstance(document, self.models.DocumentDetail)
+        self.assertIsInstance(document.latest_trace_info, self.models.LatestTraceInfo)
+        self.assertEqual(document.details[0].class_, 1)
+        self.assertEqual(document.by_code["33"].name, "c")
+        self.assertEqual(document.sender.rut, "1-9")
+        self.assertIsNone(document.folio)
+        self.assertEqual(document.to_dict(), payload)
+        self.assertEqual(self.models.DocumentDetailWithFiles.from_dict(payload), document)
+
+    def test_missing_fields_are_unset_and_omitted(self):
+        item = self.models.DetailItem.from_dict({"name": "a", "desconocida": 1})
+
+        self.assertIs(item.class_, self.models.UNSET)
+        self.assertEqual(item.to_dict(), {"name": "a"})
+        self.assertEqual(repr(item), "DetailItem(name='a')")
+
+    def test_slots_and_required_keyword_arguments(self):
+        models = self.models
+        document = models.DocumentDetailWithFiles(id=1, details=[models.DetailItem(name="x")])
+
+        self.assertFalse(hasattr(document, "__dict__"))
+        self.assertEqual(models.DocumentDetailWithFiles.__slots__, ("details", "sender", "by_code", "json_param"))
+        self.assertEqual(document.to_dict(), {"id": 1, "details": [{"name": "x"}]})
+        with self.assertRaises(TypeError):
+            models.DocumentDetailWithFiles(id=1)
+        with self.assertRaises(AttributeError):
+            document.otro = 1
+
+    def test_ref_chains_become_aliases(self):
+        models, aliases = collect_models(DOCUMENT)
+
+        self.assertEqual(aliases, {"TraceInfoAlias": "LatestTraceInfo", "TraceInfoAlias2": "LatestTraceInfo"})
+        self.assertEqual(models["DocumentDetailWithFiles"].base, "DocumentDetail")
+        self.assertIn("DocumentDetailWithFilesSender", models)
+        self.assertNotIn("Status", models)
+        self.assertIs(self.models.TraceInfoAlias, self.models.LatestTraceInfo)
+
+    def test_combined_spec_round_trips(self):
+        combined_path = Path(__file__).parent.parent.parent / "api-reference" / "openapi-combined.json"
+        with open(combined_path, "r", encoding="utf-8") as f:
+            combined = json.load(f)
+        models = load_module(combined)
+
+        for name in combined["components"]["schemas"]:
+            with self.subTest(schema=name):
+                payload = synthesize({"$ref": f"#/components/schemas/{name}"}, combined)
+                self.assertEqual(getattr(models, name).from_dict(payload).to_dict(), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests para el grafo de referencias (openapi_refs.py)
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_loader import loads_with_positions
+from openapi_refs import RefGraph, locate_refs, owner_of, prune_unreachable_schemas
+
+
+def schema_ref(name):
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+DOCUMENT = {
+    "paths": {
+        "/documents": {
+            "get": {"responses": {"200": {"content": {"application/json": {"schema": schema_ref("DocumentList")}}}}},
+            "post": {"requestBody": {"content": {"application/json": {"schema": schema_ref("Document")}}}},
+        },
+        "/credentials": {"get": {"responses": {"200": {"description": "ok"}}}},
+    },
+    "components": {
+        "schemas": {
+            "DocumentList": {"type": "array", "items": schema_ref("Document")},
+            "Document": {"properties": {"owner": schema_ref("Entity"), "status": schema_ref("Status")}},
+            "Entity": {"properties": {"parent": schema_ref("Entity")}},
+            "Node": {"properties": {"next": schema_ref("Leaf")}},
+            "Leaf": {"properties": {"back": schema_ref("Node")}},
+            "Status": {"type": "string"},
+        }
+    },
+}
+
+
+class TestRefGraph(unittest.TestCase):
+    """Tests para RefGraph"""
+
+    def setUp(self):
+        self.graph = RefGraph(DOCUMENT)
+
+    def test_forward_and_reverse_edges(self):
+        """Test: Aristas directas e índice inverso entre dueños"""
+        self.assertEqual(
+            self.graph.forward["/components/schemas/Document"],
+            {"/components/schemas/Entity", "/components/schemas/Status"},
+        )
+        self.assertEqual(
+            self.graph.referrers("/components/schemas/Document"),
+            {"/paths/~1documents/post", "/components/schemas/DocumentList"},
+        )
+
+    def test_operations_reaching_is_transitive(self):
+        """Test: Las operaciones que llegan a un schema incluyen caminos indirectos"""
+        self.assertEqual(
+            self.graph.operations_reaching("/components/schemas/Status"),
+            {"/paths/~1documents/get", "/paths/~1documents/post"},
+        )
+        self.assertEqual(self.graph.operations_reaching("/components/schemas/Node"), set())
+
+    def test_cycles(self):
+        """Test: Se detectan autorreferencias y ciclos entre varios schemas"""
+        self.assertCountEqual(
+            self.graph.cycles,
+            [
+                ["/components/schemas/Entity"],
+                ["/components/schemas/Leaf", "/components/schemas/Node"],
+            ],
+        )
+        self.assertIn("/components/schemas/Node", self.graph.reachable_from("/components/schemas/Leaf"))
+
+    def test_dangling_refs_and_resolution(self):
+        """Test: Referencias colgantes, externas y resolución memoizada"""
+        document = json.loads(json.dumps(DOCUMENT))
+        document["components"]["schemas"]["Broken"] = {
+            "allOf": [schema_ref("Missing"), {"$ref": "other.json#/Thing"}]
+        }
+        graph = RefGraph(document)
+        self.assertEqual([use.ref for use in graph.dangling], ["#/components/schemas/Missing"])
+        self.assertEqual(graph.dangling[0].pointer, "/components/schemas/Broken/allOf/0")
+
+        found, node = graph.resolve("#/components/schemas/Status")
+        self.assertTrue(found)
+        self.assertIs(graph.resolve("#/components/schemas/Status")[1], node)
+
+    def test_owner_of(self):
+        """Test: Dueño de un nodo del documento"""
+        self.assertEqual(owner_of("/paths/~1a/get/responses/200"), "/paths/~1a/get")
+        self.assertEqual(owner_of("/paths/~1a/parameters/0"), "/paths/~1a")
+        self.assertEqual(owner_of("/components/schemas/A/properties/b"), "/components/schemas/A")
+
+
+class TestLocateRefs(unittest.TestCase):
+    """Tests para ubicar referencias en los archivos fuente"""
+
+    def test_locate_dangling_ref_with_line(self):
+        """Test: Una referencia colgante se ubica con archivo y línea"""
+        text = '{\n  "paths": {\n    "/a": {\n      "get": {"$ref": "#/components/schemas/Missing"}\n    }\n  }\n}'
+        loaded = loads_with_positions(text)
+        source = {"data": loaded.data, "source_map": loaded.source_map}
+
+        graph = RefGraph(loaded.data)
+        locations = locate_refs([(Path("a.json"), source)], graph.dangling)
+
+        self.assertEqual(len(locations), 1)
+        self.assertEqual(locations[0].file, Path("a.json"))
+        self.assertEqual(locations[0].line, 4)
+
+
+class TestPruneSchemas(unittest.TestCase):
+    """Tests para la eliminación de schemas no alcanzables"""
+
+    def test_prunes_only_unreachable_schemas(self):
+        """Test: Se conservan los schemas alcanzables por allOf/items/properties"""
+        document = json.loads(json.dumps(DOCUMENT))
+        document["components"]["schemas"]["Base"] = {"type": "object"}
+        document["components"]["schemas"]["Status"] = {"allOf": [schema_ref("Base")]}
+        before = json.dumps(document)
+
+        pruned, removed = prune_unreachable_schemas(document)
+
+        self.assertEqual(removed, ["Node", "Leaf"])
+        self.assertEqual(
+            list(pruned["components"]["schemas"]),
+            ["DocumentList", "Document", "Entity", "Status", "Base"],
+        )
+        self.assertEqual(json.dumps(document), before)
+
+    def test_nothing_to_prune_returns_same_document(self):
+        """Test: Sin schemas sobrantes se retorna el mismo documento"""
+        document = {"paths": {"/a": {"get": {"schema": schema_ref("A")}}}, "components": {"schemas": {"A": {}}}}
+        pruned, removed = prune_unreachable_schemas(document)
+        self.assertIs(pruned, document)
+        self.assertEqual(removed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
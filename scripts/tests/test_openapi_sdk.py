@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Tests para el generador del cliente Python (openapi_sdk.py y sdk_runtime.py)
+"""
+
+import asyncio
+import copy
+import importlib
+import json
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_sdk import generate_sdk, operation_models
+
+PAGE_SCHEMA = {
+    "type": "object",
+    "properties": {"count": {"type": "integer"}, "next": {"type": "string"}, "results": {"type": "array"}},
+}
+
+DOCUMENT = {
+    "openapi": "3.0.1",
+    "servers": [{"url": "https://api.example.com/v1"}],
+    "paths": {
+        "/documents": {
+            "get": {
+                "operationId": "listDocuments",
+                "summary": "Listar documentos",
+                "parameters": [
+                    {"name": "master_entity_id", "in": "query", "required": True, "schema": {"type": "integer"}},
+                    {"name": "dte_type__code__in", "in": "query", "schema": {"type": "string"}},
+                    {"name": "page", "in": "query", "schema": {"type": "integer"}},
+                    {"name": "page_size", "in": "query", "schema": {"type": "integer"}},
+                ],
+                "responses": {
+                    "200": {"description": "OK", "content": {"application/json": {"schema": PAGE_SCHEMA}}}
+                },
+            }
+        },
+        "/documents/{document_id}": {
+            "parameters": [{"name": "document_id", "in": "path", "required": True, "schema": {"type": "string"}}],
+            "get": {"responses": {"200": {"description": "OK"}}},
+        },
+        "/documents/batch": {
+            "post": {
+                "operationId": "createDocumentsBatch",
+                "parameters": [{"name": "Idempotency-Key", "in": "header", "schema": {"type": "string"}}],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Batch"},
+                            "example": {"master_entity_id": 1, "documents": [{"folio": 1}]},
+                        }
+                    },
+                },
+                "responses": {"202": {"description": "Aceptado"}},
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Batch": {"type": "object", "properties": {"documents": {"type": "array", "maxItems": 3}}}
+        },
+        "securitySchemes": {"apiKeyAuth": {"type": "apiKey", "in": "header", "name": "Authorization"}},
+    },
+}
+
+TOTAL_DOCUMENTS = 7
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """API mínima: /v1/documents paginado, detalle y lote (responde el lote recibido)"""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        StubHandler.requests.append(("GET", self.path, self.headers.get("Authorization")))
+        if url.path == "/v1/documents":
+            page, size = int(query.get("page", 1)), int(query.get("page_size", 3))
+            ids = list(range(1, TOTAL_DOCUMENTS + 1))[(page - 1) * size:page * size]
+            last = page * size >= TOTAL_DOCUMENTS
+            self._send(200, {"count": TOTAL_DOCUMENTS, "next": None if last else "siguiente", "results": ids})
+        elif url.path == "/v1/documents/a%2Fb":
+            self._send(200, {"id": "a/b"})
+        else:
+            self._send(404, {"detail": "No encontrado"})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubHandler.requests.append(("POST", self.path, self.headers.get("Idempotency-Key")))
+        self._send(202, body)
+
+
+class TestGeneratedClient(unittest.TestCase):
+    """Tests del paquete generado contra un servidor local"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        generate_sdk(DOCUMENT, Path(cls.tmpdir) / "sdk_cliente_prueba")
+        sys.path.insert(0, cls.tmpdir)
+        cls.sdk = importlib.import_module("sdk_cliente_prueba")
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        sys.path.remove(cls.tmpdir)
+        for name in [name for name in sys.modules if name.startswith("sdk_cliente_prueba")]:
+            del sys.modules[name]
+        shutil.rmtree(cls.tmpdir)
+
+    def setUp(self):
+        StubHandler.requests = []
+
+    def test_iterates_all_pages_with_auth_header(self):
+        with self.sdk.Client(api_key="secreta", base_url=self.base_url) as client:
+            self.assertEqual(client.BASE_URL, "https://api.example.com/v1")
+            items = list(client.iter_documents(master_entity_id=1, page_size=3, dte_type_code_in="33,34"))
+
+        self.assertEqual(items, list(range(1, TOTAL_DOCUMENTS + 1)))
+        self.assertEqual(len(StubHandler.requests), 3)
+        self.assertIn("dte_type__code__in=33%2C34", StubHandler.requests[0][1])
+        self.assertEqual({auth for _method, _path, auth in StubHandler.requests}, {"Api-Key secreta"})
+
+    def test_path_parameters_are_escaped_and_errors_raised(self):
+        with self.sdk.Client(base_url=self.base_url) as client:
+            self.assertEqual(client.get_documents_by_document_id(document_id="a/b"), {"id": "a/b"})
+            with self.assertRaises(self.sdk.ApiError) as error:
+                client.get_documents_by_document_id(document_id="otro")
+
+        self.assertEqual(error.exception.status, 404)
+        self.assertEqual(error.exception.body, {"detail": "No encontrado"})
+
+    def test_batch_items_and_max_items(self):
+        with self.sdk.Client(base_url=self.base_url) as client:
+            response = client.create_documents_batch(
+                [{"folio": 1}, {"folio": 2}], body={"master_entity_id": 5}, idempotency_key="k1"
+            )
+            with self.assertRaises(ValueError):
+                client.create_documents_batch([{}] * 4, body={"master_entity_id": 5})
+
+        self.assertEqual(response, {"master_entity_id": 5, "documents": [{"folio": 1}, {"folio": 2}]})
+        self.assertEqual(self.sdk.models.Batch.from_dict(response).documents, [{"folio": 1}, {"folio": 2}])
+        self.assertEqual(StubHandler.requests, [("POST", "/v1/documents/batch", "k1")])
+
+    def test_async_client(self):
+        async def run():
+            async with self.sdk.AsyncClient(api_key="secreta", base_url=self.base_url, pool_size=2) as client:
+                items = [item async for item in client.iter_documents(master_entity_id=1, page_size=2)]
+                details = await asyncio.gather(
+                    *[client.get_documents_by_document_id(document_id="a/b") for _ in range(5)]
+                )
+            return items, details
+
+        items, details = asyncio.run(run())
+
+        self.assertEqual(items, list(range(1, TOTAL_DOCUMENTS + 1)))
+        self.assertEqual(details, [{"id": "a/b"}] * 5)
+
+
+class OneShotServer:
+    """Servidor que responde una petición por conexión (anunciando keep-alive) y la cierra"""
+
+    RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}"
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.requests = []
+        self.base_url = f"http://127.0.0.1:{self.sock.getsockname()[1]}/v1"
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            try:
+                connection, _address = self.sock.accept()
+            except OSError:
+                return
+            with connection:
+                data = b""
+                while b"\r\n\r\n" not in data:
+                    chunk = connection.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                if data:
+                    self.requests.append(data.split(b" ", 1)[0].decode())
+                    connection.sendall(self.RESPONSE)
+
+    def close(self):
+        self.sock.close()
+
+
+class TestStaleConnections(unittest.TestCase):
+    """Reintentos sobre conexiones keep-alive que el servidor cerró"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        generate_sdk(DOCUMENT, Path(cls.tmpdir) / "sdk_cliente_reintentos")
+        sys.path.insert(0, cls.tmpdir)
+        cls.sdk = importlib.import_module("sdk_cliente_reintentos")
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.tmpdir)
+        for name in [name for name in sys.modules if name.startswith("sdk_cliente_reintentos")]:
+            del sys.modules[name]
+        shutil.rmtree(cls.tmpdir)
+
+    def setUp(self):
+        self.server = OneShotServer()
+        self.addCleanup(self.server.close)
+
+    def test_get_is_retried_on_a_new_connection(self):
+        with self.sdk.Client(base_url=self.server.base_url, pool_size=1) as client:
+            client.get_documents_by_document_id(document_id="a")
+            self.assertEqual(client.get_documents_by_document_id(document_id="b"), {})
+
+        self.assertEqual(self.server.requests, ["GET", "GET"])
+
+    def test_batch_post_is_not_retried(self):
+        with self.sdk.Client(base_url=self.server.base_url, pool_size=1) as client:
+            client.get_documents_by_document_id(document_id="a")
+            with self.assertRaises(OSError):
+                client.create_documents_batch([{"folio": 1}])
+
+        self.assertEqual(self.server.requests, ["GET"])
+
+    def test_async_batch_post_is_not_retried(self):
+        async def run():
+            async with self.sdk.AsyncClient(base_url=self.server.base_url, pool_size=1) as client:
+                await client.get_documents_by_document_id(document_id="a")
+                await client.create_documents_batch([{"folio": 1}])
+
+        with self.assertRaises((OSError, asyncio.IncompleteReadError)):
+            asyncio.run(run())
+        self.assertEqual(self.server.requests, ["GET"])
+
+
+class TestIncrementalGeneration(unittest.TestCase):
+    """Tests de la regeneración incremental"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.output = Path(self.tmpdir) / "pkg"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_only_changed_operations_are_rewritten(self):
+        first = generate_sdk(DOCUMENT, self.output)
+        self.assertEqual(len(first.written), 3)
+        self.assertEqual(generate_sdk(DOCUMENT, self.output).written, [])
+
+        changed = copy.deepcopy(DOCUMENT)
+        changed["components"]["schemas"]["Batch"]["properties"]["documents"]["maxItems"] = 10
+        del changed["paths"]["/documents/{document_id}"]
+        report = generate_sdk(changed, self.output)
+
+        self.assertEqual(report.written, ["create_documents_batch"])
+        self.assertEqual(report.removed, ["get_documents_by_document_id"])
+        self.assertFalse((self.output / "_operations" / "get_documents_by_document_id.py").exists())
+        self.assertIn("batch_limit=10", (self.output / "_operations" / "create_documents_batch.py").read_text())
+
+        # Con force se renderizan todas y se restauran los módulos editados a mano
+        (self.output / "_operations" / "list_documents.py").write_text("# editado\n")
+        self.assertEqual(generate_sdk(changed, self.output).written, [])
+        self.assertEqual(generate_sdk(changed, self.output, force=True).written, ["list_documents"])
+
+    def test_operation_models(self):
+        models = {model["function"]: model for model in operation_models(DOCUMENT)}
+
+        self.assertTrue(models["list_documents"]["paginated"])
+        self.assertFalse(models["get_documents_by_document_id"]["paginated"])
+        self.assertEqual(models["create_documents_batch"]["body"]["batch_property"], "documents")
+        self.assertEqual(models["create_documents_batch"]["body"]["batch_limit"], 3)
+        self.assertEqual(
+            [parameter["py"] for parameter in models["create_documents_batch"]["parameters"]], ["idempotency_key"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests para los shards por sección de navegación (openapi_shards.py)
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_refs import RefGraph
+from openapi_shards import NavSection, Shard, build_shards, load_navigation, page_operation, slugify, write_shards
+
+COMBINED = {
+    "openapi": "3.0.1",
+    "paths": {
+        "/documents": {"get": {"responses": {"200": {"schema": {"$ref": "#/components/schemas/DocumentList"}}}}},
+        "/credentials": {
+            "get": {"responses": {"200": {"schema": {"$ref": "#/components/schemas/Credential"}}}},
+            "post": {"responses": {"201": {"description": "ok"}}},
+        },
+    },
+    "components": {
+        "schemas": {
+            "DocumentList": {"items": {"$ref": "#/components/schemas/Document"}},
+            "Document": {"type": "object"},
+            "Credential": {"type": "object"},
+        },
+        "securitySchemes": {"apiKey": {"type": "apiKey"}},
+    },
+}
+
+DOCS_CONFIG = {
+    "navigation": {
+        "tabs": [
+            {"tab": "Guía", "groups": [{"group": "Inicio", "pages": ["index"]}]},
+            {
+                "tab": "API Facturación",
+                "groups": [
+                    {"group": "Documentos", "pages": ["api/documents/list"]},
+                    {
+                        "group": "Credenciales",
+                        "pages": [{"group": "Anidado", "pages": ["api/credentials/list", "api/credentials/create"]}],
+                    },
+                ],
+            },
+            {"tab": "Otra API", "groups": [{"group": "Cobros", "pages": ["api/other", "api/typo"]}]},
+        ]
+    }
+}
+
+PAGES = {
+    "index": "---\ntitle: Inicio\n---\n",
+    "api/documents/list": "---\ntitle: Listar\nopenapi: 'GET /documents'\n---\n",
+    "api/credentials/list": '---\nopenapi: "GET /credentials"\n---\n',
+    "api/credentials/create": "---\nopenapi: POST /credentials\n---\n",
+    "api/other": "---\nopenapi: 'otra.json GET /payments'\n---\n",
+    "api/typo": "---\nopenapi: 'GET /documentz'\n---\n",
+}
+
+
+class TestShards(unittest.TestCase):
+    """Tests para build_shards / write_shards"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        (self.root / "docs.json").write_text(json.dumps(DOCS_CONFIG), encoding="utf-8")
+        for page, text in PAGES.items():
+            page_file = self.root / f"{page}.mdx"
+            page_file.parent.mkdir(parents=True, exist_ok=True)
+            page_file.write_text(text, encoding="utf-8")
+        self.graph = RefGraph(COMBINED)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_shard_per_tab(self):
+        """Test: Un shard por tab con sus operaciones y solo los schemas alcanzables"""
+        sections = load_navigation(self.root / "docs.json")
+        shards, missing = build_shards(COMBINED, self.graph, sections, docs_root=self.root)
+
+        self.assertEqual([shard.section.name for shard in shards], ["API Facturación"])
+        shard = shards[0]
+        self.assertEqual(shard.operations, ["GET /documents", "GET /credentials", "POST /credentials"])
+        self.assertEqual(
+            list(shard.document["components"]["schemas"]), ["DocumentList", "Document", "Credential"]
+        )
+        self.assertEqual(shard.document["components"]["securitySchemes"], COMBINED["components"]["securitySchemes"])
+        self.assertEqual(missing, [("api/typo", "GET /documentz")])
+
+    def test_shard_per_group(self):
+        """Test: Con mode="group" cada grupo tiene su shard y sus schemas"""
+        sections = load_navigation(self.root / "docs.json", mode="group")
+        shards, _missing = build_shards(COMBINED, self.graph, sections, docs_root=self.root)
+
+        by_name = {shard.section.name: shard for shard in shards}
+        self.assertEqual(list(by_name), ["API Facturación / Documentos", "API Facturación / Credenciales"])
+        credentials = by_name["API Facturación / Credenciales"].document
+        self.assertEqual(list(credentials["paths"]["/credentials"]), ["get", "post"])
+        self.assertEqual(list(credentials["components"]["schemas"]), ["Credential"])
+
+    def test_manifest_and_stale_shards(self):
+        """Test: Se escribe el manifiesto y se eliminan shards de secciones que ya no existen"""
+        output_dir = self.root / "shards"
+        output_dir.mkdir()
+        (output_dir / "vieja.json").write_text("{}", encoding="utf-8")
+        (output_dir / "manifest.json").write_text(
+            json.dumps({"shards": [{"file": "vieja.json"}]}), encoding="utf-8"
+        )
+
+        sections = load_navigation(self.root / "docs.json")
+        shards, missing = build_shards(COMBINED, self.graph, sections, docs_root=self.root)
+        manifest = write_shards(shards, missing, output_dir, source="combined.json")
+
+        self.assertFalse((output_dir / "vieja.json").exists())
+        self.assertEqual(manifest["shards"][0]["file"], "api-facturacion.json")
+        self.assertEqual(manifest["shards"][0]["schemas"], 3)
+        written = json.loads((output_dir / "api-facturacion.json").read_text(encoding="utf-8"))
+        self.assertEqual(written, shards[0].document)
+        self.assertEqual(json.loads((output_dir / "manifest.json").read_text(encoding="utf-8")), manifest)
+
+    def test_sections_with_the_same_slug_get_distinct_files(self):
+        """Test: Dos secciones con el mismo slug no se pisan"""
+        sections = load_navigation(self.root / "docs.json")
+        shards, missing = build_shards(COMBINED, self.graph, sections, docs_root=self.root)
+        twin = Shard(NavSection("API Facturacion", shards[0].section.groups, shards[0].section.pages), {}, [])
+
+        manifest = write_shards(shards + [twin], missing, self.root / "shards")
+
+        self.assertEqual(
+            [entry["file"] for entry in manifest["shards"]], ["api-facturacion.json", "api-facturacion-2.json"]
+        )
+        written = json.loads((self.root / "shards" / "api-facturacion.json").read_text(encoding="utf-8"))
+        self.assertEqual(written, shards[0].document)
+
+    def test_stale_entries_outside_the_output_dir_are_not_deleted(self):
+        """Test: Solo se eliminan shards *.json del directorio de salida"""
+        output_dir = self.root / "shards"
+        output_dir.mkdir()
+        (output_dir / "notas.txt").write_text("", encoding="utf-8")
+        entries = [{"file": "../docs.json"}, {"file": str(self.root / "index.mdx")}, {"file": "notas.txt"}, {}]
+        (output_dir / "manifest.json").write_text(json.dumps({"shards": entries}), encoding="utf-8")
+
+        write_shards([], [], output_dir)
+
+        self.assertTrue((self.root / "docs.json").exists())
+        self.assertTrue((self.root / "index.mdx").exists())
+        self.assertTrue((output_dir / "notas.txt").exists())
+
+    def test_page_operation_and_slugify(self):
+        """Test: Lectura del frontmatter y nombres de archivo"""
+        self.assertEqual(page_operation(self.root / "api/other.mdx"), ("otra.json", "GET", "/payments"))
+        self.assertIsNone(page_operation(self.root / "index.mdx"))
+        self.assertIsNone(page_operation(self.root / "no-existe.mdx"))
+        self.assertEqual(slugify("API Boleta de Honorarios / Usuarios"), "api-boleta-de-honorarios-usuarios")
+
+
+if __name__ == "__main__":
+    unittest.main()
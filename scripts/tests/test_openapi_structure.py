@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests para el verificador estructural de OpenAPI 3.0 (openapi_structure.py)
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_structure import check_structure
+from validate_openapi_schemas import validate_all_schemas
+
+
+def operation(**fields):
+    return {"responses": {"200": {"description": "OK"}}, **fields}
+
+
+class TestCheckStructure(unittest.TestCase):
+    """Tests para check_structure"""
+
+    def messages(self, document, partial=None):
+        return {(issue.pointer, issue.message) for issue in check_structure(document, partial)}
+
+    def test_valid_partial_file_has_no_issues(self):
+        document = {
+            "paths": {
+                "/documents/{id}": {
+                    "get": operation(
+                        tags=["Documentos"],
+                        parameters=[{"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}],
+                    )
+                }
+            },
+            "components": {"schemas": {"Document": {"type": "object", "properties": {"id": {"type": "integer"}}}}},
+        }
+
+        self.assertEqual(check_structure(document), [])
+
+    def test_complete_document_requires_top_level_fields(self):
+        messages = self.messages({"openapi": "3.0.1"})
+
+        self.assertIn(("", "Document: falta el campo requerido 'info'"), messages)
+        self.assertIn(("", "Document: falta el campo requerido 'paths'"), messages)
+        self.assertEqual(check_structure({"paths": {}}), [])
+
+    def test_operation_and_response_requirements(self):
+        document = {"paths": {"/a": {"get": {"summary": "x"}, "post": {"responses": {"200": {}, "20": {}}}}}}
+
+        messages = self.messages(document)
+
+        self.assertIn(("/paths/~1a/get", "Operation: falta el campo requerido 'responses'"), messages)
+        self.assertIn(("/paths/~1a/post/responses/200", "Response: falta el campo requerido 'description'"), messages)
+        self.assertIn(("/paths/~1a/post/responses/20", "Responses: campo desconocido '20'"), messages)
+
+    def test_parameter_rules(self):
+        parameters = [
+            {"name": "id", "in": "path", "schema": {"type": "string"}},
+            {"name": "q", "in": "body", "schema": {"type": "string"}},
+            {"name": "r", "in": "query"},
+        ]
+
+        messages = self.messages({"paths": {"/a": {"get": operation(parameters=parameters)}}})
+
+        prefix = "/paths/~1a/get/parameters"
+        self.assertIn((f"{prefix}/0", "Parameter: los parámetros de path deben tener required: true"), messages)
+        self.assertTrue(any(pointer == f"{prefix}/1/in" for pointer, _message in messages))
+        self.assertIn((f"{prefix}/2", "Parameter: debe tener 'schema' o 'content' (exactamente uno)"), messages)
+
+    def test_schema_keywords_and_types(self):
+        schemas = {
+            "A": {"type": "array"},
+            "B": {"type": "int", "descripton": "typo"},
+            "C": {"type": "object", "description": {"type": "string"}},
+            "D": {"type": "object", "required": ["id"], "properties": {}},
+            "E": {"$ref": "#/components/schemas/A"},
+        }
+
+        messages = self.messages({"components": {"schemas": schemas}})
+
+        self.assertIn(("/components/schemas/A", "Schema: los schemas de tipo array deben definir 'items'"), messages)
+        self.assertIn(("/components/schemas/B/type", "Schema: tipo inválido: 'int'"), messages)
+        self.assertIn(("/components/schemas/B/descripton", "Schema: campo desconocido 'descripton'"), messages)
+        self.assertIn(("/components/schemas/C/description", "se esperaba string, se encontró objeto"), messages)
+        self.assertIn(
+            ("/components/schemas/D/required", "Schema: 'id' es requerida pero no está en properties"), messages
+        )
+        self.assertEqual(len(messages), 5)
+
+    def test_extensions_are_allowed(self):
+        document = {"paths": {"/a": {"x-internal": True, "get": operation(**{"x-codeSamples": []})}}}
+        self.assertEqual(check_structure(document), [])
+
+    def test_deep_schemas_do_not_hit_recursion_limit(self):
+        schema = {"type": "string"}
+        for _ in range(3000):
+            schema = {"type": "object", "properties": {"child": schema}}
+
+        self.assertEqual(check_structure({"components": {"schemas": {"Deep": schema}}}), [])
+
+
+class TestValidateAllSchemas(unittest.TestCase):
+    """Tests para la integración con validate_openapi_schemas.py"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tmp_dir.name)
+        (self.base_dir / "base").mkdir()
+        (self.base_dir / "base" / "base-complete.json").write_text(
+            json.dumps({"openapi": "3.0.1", "info": {"title": "API", "version": "1"}, "paths": {}}),
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def validate(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            valid = validate_all_schemas(self.base_dir, cache_dir=None)
+        return valid, output.getvalue()
+
+    def test_structure_issues_fail_validation_with_line(self):
+        (self.base_dir / "a.json").write_text(
+            json.dumps({"paths": {"/a": {"get": {"summary": "x"}}}}, indent=2), encoding="utf-8"
+        )
+
+        valid, output = self.validate()
+
+        self.assertFalse(valid)
+        self.assertIn("Línea 4: /paths/~1a/get: Operation: falta el campo requerido 'responses'", output)
+
+    def test_valid_files_pass(self):
+        (self.base_dir / "a.json").write_text(
+            json.dumps({"paths": {"/a": {"get": operation()}}}), encoding="utf-8"
+        )
+
+        valid, output = self.validate()
+
+        self.assertTrue(valid)
+        self.assertIn("base-complete.json: Sin problemas", output)
+
+    def test_missing_base_file_is_reported(self):
+        (self.base_dir / "base" / "base-complete.json").unlink()
+        (self.base_dir / "a.json").write_text(
+            json.dumps({"paths": {"/a": {"get": operation()}}}), encoding="utf-8"
+        )
+
+        valid, output = self.validate()
+
+        self.assertTrue(valid)
+        self.assertIn("base-complete.json: no existe, se omite", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests para la instrumentación del build (openapi_trace.py)
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_engine import SpecWorkspace, apply_rules, run_source_stage
+from openapi_trace import NULL_TRACER, Tracer, new_rule_stats
+
+
+class TestTracer(unittest.TestCase):
+    """Tests para Tracer"""
+
+    def test_span_records_complete_event_with_args(self):
+        tracer = Tracer()
+        with tracer.span("combinar", estrategia="deep") as args:
+            args["paths"] = 3
+
+        (event,) = tracer.events
+        self.assertEqual((event["name"], event["cat"], event["ph"]), ("combinar", "fase", "X"))
+        self.assertEqual(event["args"], {"estrategia": "deep", "paths": 3})
+        self.assertGreaterEqual(event["dur"], 0)
+
+    def test_chrome_trace_uses_relative_microseconds_and_counters(self):
+        tracer = Tracer()
+        tracer.add_span("a", "fase", tracer.origin + 2000, 5000)
+        tracer.count("nodos visitados", 7)
+
+        trace = tracer.chrome_trace()
+
+        first, counters = trace["traceEvents"]
+        self.assertEqual((first["ts"], first["dur"]), (2.0, 5.0))
+        self.assertEqual(counters["ph"], "C")
+        self.assertEqual(trace["otherData"], {"nodos visitados": 7})
+        json.dumps(trace)
+
+    def test_summary_groups_by_category_and_name(self):
+        tracer = Tracer()
+        tracer.add_span("leer", "etapa", 0, 1_000_000)
+        tracer.add_span("leer", "etapa", 0, 3_000_000)
+        tracer.add_span("cargar", "fase", 0, 2_000_000)
+
+        self.assertEqual(
+            tracer.summary(),
+            [("etapa", "leer", 2, 4.0, 3.0), ("fase", "cargar", 1, 2.0, 2.0)],
+        )
+
+    def test_null_tracer_records_nothing(self):
+        with NULL_TRACER.span("x") as args:
+            args["y"] = 1
+        NULL_TRACER.count("z")
+        self.assertFalse(NULL_TRACER.enabled)
+
+
+class TestRuleStats(unittest.TestCase):
+    """Tests para apply_rules(stats=...)"""
+
+    def test_counts_nodes_calls_and_hits(self):
+        data = {"a": {"description": {"type": "string", "description": "x"}}, "b": [{"c": 1}]}
+        stats = new_rule_stats()
+
+        apply_rules(data, check=False, stats=stats)
+
+        self.assertEqual(stats["nodes"], 5)
+        calls, duration_ns, hits = stats["rules"]["description-object"]
+        self.assertEqual((calls, hits), (1, 1))
+        self.assertGreaterEqual(duration_ns, 0)
+
+    def test_stats_do_not_change_result(self):
+        data = {"description": {"type": "string", "description": "x"}}
+        self.assertEqual(apply_rules(data), apply_rules(data, stats=new_rule_stats()))
+
+
+class TestTracedBuild(unittest.TestCase):
+    """Tests para los spans de la etapa por archivo y de SpecWorkspace"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self.tmp_dir.name)
+        (self.base_dir / "base").mkdir()
+        (self.base_dir / "base" / "base-complete.json").write_text(
+            json.dumps({"openapi": "3.0.1", "paths": {}}), encoding="utf-8"
+        )
+        (self.base_dir / "a.json").write_text(
+            json.dumps({"paths": {"/a": {"get": {"description": {"type": "string", "description": "x"}}}}}),
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_source_stage_records_file_and_stage_spans(self):
+        tracer = Tracer()
+        results = run_source_stage([self.base_dir / "a.json"], write_fixes=False, tracer=tracer)
+
+        self.assertIsNone(results[0][1])
+        names = {(event["cat"], event["name"]) for event in tracer.events}
+        self.assertIn(("archivo", str(self.base_dir / "a.json")), names)
+        self.assertIn(("etapa", "parsear"), names)
+        self.assertIn(("regla", "description-object"), names)
+        self.assertEqual(tracer.counters["correcciones aplicadas"], 1)
+        self.assertEqual(tracer.counters["archivos parseados"], 1)
+
+    def test_workspace_build_records_phases(self):
+        tracer = Tracer()
+        workspace = SpecWorkspace(self.base_dir, manifest=["a.json"], write_fixes=False, tracer=tracer)
+        workspace.load()
+        workspace.build()
+
+        phases = [event["name"] for event in tracer.events if event["cat"] == "fase"]
+        self.assertEqual(phases, ["cargar", "combinar", "reglas (combinado)", "canonicalizar"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests para el servidor local del documento combinado (serve_openapi.py)
+"""
+
+import gzip
+import http.client
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from serve_openapi import SpecStore, accepts_gzip, create_server, tag_fragment
+
+COMBINED = {
+    "openapi": "3.0.1",
+    "info": {"title": "API"},
+    "paths": {
+        "/documents": {
+            "get": {"tags": ["Documentos"], "summary": "Listar"},
+            "post": {"tags": ["Envíos"], "summary": "Crear"},
+        },
+        "/credentials": {"get": {"tags": ["Credenciales"]}},
+    },
+    "components": {"schemas": {"Document": {"type": "object"}}},
+}
+
+
+class TestSpecServer(unittest.TestCase):
+    """Tests sobre un servidor real en localhost (puerto libre)"""
+
+    def setUp(self):
+        self.store = SpecStore()
+        self.store.update(COMBINED)
+        self.server = create_server(self.store, port=0, quiet=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, path, headers=None):
+        connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=5)
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+    def test_etag_and_conditional_get(self):
+        """Test: ETag fuerte y 304 cuando If-None-Match coincide"""
+        response, body = self.request("/openapi.json")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body), COMBINED)
+        etag = response.getheader("ETag")
+        self.assertTrue(etag.startswith('"'))
+
+        response, body = self.request("/openapi.json", {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+        # Una nueva versión cambia el ETag
+        self.store.update({**COMBINED, "info": {"title": "API v2"}})
+        response, _body = self.request("/openapi.json", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertNotEqual(response.getheader("ETag"), etag)
+
+    def test_gzip(self):
+        """Test: gzip cuando el cliente lo acepta, con su propio ETag"""
+        plain, _body = self.request("/openapi.json")
+        response, body = self.request("/openapi.json", {"Accept-Encoding": "gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body)), COMBINED)
+        self.assertNotEqual(response.getheader("ETag"), plain.getheader("ETag"))
+
+        response, _body = self.request("/openapi.json", {"Accept-Encoding": "gzip;q=0"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+
+    def test_tag_fragments(self):
+        """Test: Índice de tags y fragmentos con solo las operaciones del tag"""
+        response, body = self.request("/tags")
+        urls = {entry["name"]: entry["url"] for entry in json.loads(body)["tags"]}
+        self.assertEqual(list(urls), ["Documentos", "Envíos", "Credenciales"])
+
+        response, body = self.request(urls["Envíos"])
+        self.assertEqual(response.status, 200)
+        fragment = json.loads(body)
+        self.assertEqual(fragment["paths"], {"/documents": {"post": COMBINED["paths"]["/documents"]["post"]}})
+        self.assertEqual(fragment["components"], COMBINED["components"])
+
+        response, _body = self.request("/tags/Inexistente.json")
+        self.assertEqual(response.status, 404)
+
+
+class TestHelpers(unittest.TestCase):
+    """Tests para las funciones auxiliares"""
+
+    def test_tag_fragment_keeps_tag_entry(self):
+        """Test: El fragmento conserva solo la entrada de tags correspondiente"""
+        combined = {**COMBINED, "tags": [{"name": "Documentos"}, {"name": "Credenciales"}]}
+        fragment = tag_fragment(combined, "Credenciales")
+        self.assertEqual(fragment["tags"], [{"name": "Credenciales"}])
+        self.assertEqual(list(fragment["paths"]), ["/credentials"])
+
+    def test_accepts_gzip(self):
+        """Test: Interpretación de Accept-Encoding"""
+        self.assertTrue(accepts_gzip("gzip, deflate, br"))
+        self.assertTrue(accepts_gzip("*"))
+        self.assertFalse(accepts_gzip("gzip;q=0"))
+        self.assertFalse(accepts_gzip(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests para el watcher incremental (watch_openapi.py)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio scripts al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openapi_engine import SpecWorkspace
+from watch_openapi import OpenAPIWatcher
+
+
+class TestOpenAPIWatcher(unittest.TestCase):
+    """Tests para OpenAPIWatcher"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.base_dir = self.root / "openapi"
+        (self.base_dir / "base").mkdir(parents=True)
+        self.write("base/base-complete.json", {"openapi": "3.0.1", "paths": {}})
+        self.write("a.json", {"paths": {"/v1/a": {"get": {}}}})
+        self.write("b.json", {"paths": {"/v1/b": {"get": {}}}})
+
+        workspace = SpecWorkspace(self.base_dir, manifest=[Path("a.json"), Path("b.json")])
+        self.output = self.root / "combined.json"
+        self.watcher = OpenAPIWatcher(workspace, output=self.output, interval=0.001, debounce=0.01)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, relative, data):
+        file_path = self.base_dir / relative
+        file_path.write_text(json.dumps(data), encoding="utf-8")
+        # Forzar un mtime distinto aunque la escritura caiga en el mismo tick
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        return file_path
+
+    def read_output(self):
+        return json.loads(self.output.read_text(encoding="utf-8"))
+
+    def test_rebuild_reloads_only_changed_files(self):
+        """Test: Solo se vuelven a parsear los archivos modificados"""
+        self.assertTrue(self.watcher.build())
+        self.assertEqual(list(self.read_output()["paths"]), ["/a", "/b"])
+        untouched = self.watcher.workspace.sources[self.base_dir / "a.json"]
+
+        changed_file = self.write("b.json", {"paths": {"/v1/c": {"post": {}}}})
+        changed = self.watcher.poll()
+        self.assertEqual(changed, {changed_file})
+
+        self.watcher.rebuild(changed)
+        self.assertIs(self.watcher.workspace.sources[self.base_dir / "a.json"], untouched)
+        self.assertEqual(list(self.read_output()["paths"]), ["/a", "/c"])
+        self.assertEqual(self.watcher.poll(), set())
+
+    def test_burst_is_coalesced(self):
+        """Test: Varios cambios seguidos se agrupan en una sola reconstrucción"""
+        self.watcher.build()
+        first = self.write("a.json", {"paths": {"/v1/a2": {"get": {}}}})
+        changed = self.watcher.poll()
+        second = self.write("b.json", {"paths": {"/v1/b2": {"get": {}}}})
+
+        self.assertEqual(self.watcher.wait_until_quiet(changed), {first, second})
+
+    def test_invalid_file_keeps_previous_output(self):
+        """Test: Un archivo inválido no sobrescribe el archivo combinado anterior"""
+        self.watcher.build()
+        before = self.output.read_text(encoding="utf-8")
+
+        broken = self.base_dir / "a.json"
+        broken.write_text("{", encoding="utf-8")
+        self.assertFalse(self.watcher.build({broken}))
+        self.assertEqual(self.output.read_text(encoding="utf-8"), before)
+
+        self.write("a.json", {"paths": {"/v1/a": {"get": {}}}})
+        self.assertTrue(self.watcher.build({broken}))
+
+    def test_rebuild_prunes_stale_cache_entries(self):
+        """Test: El caché no crece con cada guardado, solo quedan las versiones actuales"""
+        cache_dir = self.root / "cache"
+        workspace = SpecWorkspace(self.base_dir, manifest=[Path("a.json"), Path("b.json")], cache_dir=cache_dir)
+        watcher = OpenAPIWatcher(workspace, output=self.output, interval=0.001, debounce=0.01)
+        watcher.build()
+
+        for version in range(3):
+            changed_file = self.write("a.json", {"paths": {f"/v1/a{version}": {"get": {}}}})
+            watcher.rebuild({changed_file})
+
+        self.assertEqual({entry.stem for entry in cache_dir.glob("*.pickle")}, workspace.cache_keys)
+        self.assertEqual(len(workspace.cache_keys), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
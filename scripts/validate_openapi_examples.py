@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Script para validar los ejemplos del documento combinado contra sus schemas.
+
+Uso:
+    python3 scripts/validate_openapi_examples.py                 # openapi-combined.json
+    python3 scripts/validate_openapi_examples.py -j 4 --check    # en paralelo, exit 1 si hay errores
+    python3 scripts/validate_openapi_examples.py otro.json --no-cache
+
+La compilación de schemas, el recorrido de ejemplos y el caché de
+resultados viven en openapi_examples.py.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from openapi_engine import DEFAULT_CACHE_DIR, DEFAULT_OUTPUT
+from openapi_examples import print_mismatches, validate_examples
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Validar los ejemplos (example/examples) contra sus schemas"
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Documento OpenAPI a validar (por defecto: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Procesos para validar en paralelo (0 = todos los CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validar todos los ejemplos aunque no hayan cambiado",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directorio del caché (por defecto: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Máximo de errores a imprimir (por defecto: 50)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Salir con código 1 si algún ejemplo no coincide con su schema",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs debe ser >= 0")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+
+    try:
+        with open(args.file, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Archivo no encontrado: {args.file}")
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"❌ Error de JSON en {args.file}: {e}")
+        return 1
+
+    print(f"🔍 Validando ejemplos de {args.file}...")
+    start = time.perf_counter()
+    mismatches, stats = validate_examples(
+        document, jobs=args.jobs, cache_dir=None if args.no_cache else Path(args.cache_dir)
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"📊 Ejemplos: {stats['examples']}, validados: {stats['validated']}, "
+        f"sin cambios (caché): {stats['cached']} ({elapsed_ms:.0f} ms)"
+    )
+    if not mismatches:
+        print("✅ Todos los ejemplos coinciden con su schema")
+        return 0
+
+    print_mismatches(mismatches, args.limit)
+    return 1 if args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,41 +2,88 @@
 """
 Script para validar schemas OpenAPI antes de combinarlos.
 Previene problemas de claves duplicadas y estructuras inválidas.
+
+Además de lo que reporta la etapa por archivo (claves duplicadas y
+correcciones), cada archivo pasa por el verificador estructural de
+OpenAPI 3.0 (openapi_structure.py): un solo recorrido del árbol ya parseado.
 """
 
 import json
-import re
 import sys
 from pathlib import Path
-from collections import defaultdict
+
+from openapi_artifacts import write_if_changed
+from openapi_engine import DEFAULT_CACHE_DIR, SpecWorkspace, load_source_file
+from openapi_loader import format_duplicate
+from openapi_structure import check_structure
 
 
-def find_duplicate_description_pattern(content):
+def find_duplicate_description_pattern(source):
     """
     Encuentra el patrón problemático: objetos "description" con clave "description" interna.
     Este patrón causa problemas en YAML (que usa Mintlify) porque no permite claves duplicadas.
+
+    Recibe el resultado de la etapa por archivo (openapi_engine.load_source_file),
+    que ya registró las correcciones de ese patrón con su JSON pointer, y retorna
+    una lista de (línea, pointer) usando el mapa de fuentes, sin volver a
+    escanear el texto del archivo.
     """
-    pattern = r'"description":\s*\{\s*"type":\s*"string",\s*"description":\s*"([^"]+)"'
-    matches = list(re.finditer(pattern, content, re.MULTILINE | re.DOTALL))
-    return matches
+    return [
+        (source["source_map"].line(change.pointer), change.pointer)
+        for change in source["changes"]
+        if change.rule == "description-object"
+    ]
 
 
-def fix_duplicate_description_pattern(content):
+def report_source(file_path, source, fix=False):
     """
-    Corrige el patrón problemático eliminando la clave "description" interna.
+    Reporta el resultado de la etapa por archivo y, con fix=True, se asegura
+    de que el archivo quede corregido. Retorna True si el archivo queda válido.
     """
-    # Patrón con ejemplo opcional
-    pattern = r'"description":\s*\{\s*"type":\s*"string",\s*"description":\s*"([^"]+)"(\s*,\s*"example":\s*"([^"]+)")?\s*\}'
-    
-    def replace_match(match):
-        example_value = match.group(3)
-        if example_value:
-            return f'"description": {{\n                "type": "string",\n                "example": "{example_value}"\n              }}'
-        else:
-            return f'"description": {{\n                "type": "string"\n              }}'
-    
-    fixed = re.sub(pattern, replace_match, content, flags=re.MULTILINE | re.DOTALL)
-    return fixed
+    valid = True
+
+    # Claves duplicadas reales (json.load las descarta en silencio)
+    if source["duplicates"]:
+        print(f"⚠️  {file_path.name}: {len(source['duplicates'])} claves duplicadas")
+        for duplicate in source["duplicates"][:3]:
+            print(f"   {format_duplicate(duplicate)}")
+        valid = False
+
+    # Buscar patrón problemático
+    matches = find_duplicate_description_pattern(source)
+
+    if matches:
+        print(f"⚠️  {file_path.name}: {len(matches)} casos problemáticos encontrados")
+        for line_num, pointer in matches[:3]:
+            print(f"   Línea {line_num}: {pointer}")
+        valid = False
+
+    # Estructura OpenAPI 3.0: operaciones, parámetros, respuestas, schemas, ...
+    structure_issues = check_structure(source["data"])
+    if structure_issues:
+        print(f"⚠️  {file_path.name}: {len(structure_issues)} problemas de estructura")
+        for issue in sorted(structure_issues, key=lambda issue: source["source_map"].line(issue.pointer) or 0)[:5]:
+            line = source["source_map"].line(issue.pointer)
+            location = f"Línea {line}: " if line else ""
+            print(f"   {location}{issue.pointer or '/'}: {issue.message}")
+        if len(structure_issues) > 5:
+            print(f"   ... y {len(structure_issues) - 5} más")
+
+    if valid and not structure_issues:
+        print(f"✅ {file_path.name}: Sin problemas")
+        return True
+
+    if fix and not valid:
+        # La etapa por archivo ya guardó las correcciones; si solo había claves
+        # repetidas, reescribir el árbol las elimina
+        if source["duplicates"] and not source["changes"]:
+            fixed = json.dumps(source["data"], indent=2, ensure_ascii=False)
+            write_if_changed(file_path, fixed.encode('utf-8'))
+        print(f"✅ {file_path.name} corregido")
+        valid = True
+
+    # Los problemas de estructura no se corrigen automáticamente
+    return valid and not structure_issues
 
 
 def validate_file(file_path, fix=False):
@@ -50,54 +97,36 @@ def validate_file(file_path, fix=False):
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Validar JSON
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON inválido en {file_path}: {e}")
-            return False
-        
-        # Buscar patrón problemático
-        matches = find_duplicate_description_pattern(content)
-        
-        if matches:
-            print(f"⚠️  {file_path.name}: {len(matches)} casos problemáticos encontrados")
-            for match in matches[:3]:
-                line_num = content[:match.start()].count('\n') + 1
-                print(f"   Línea {line_num}: {match.group(1)[:50]}")
-            
-            if fix:
-                print(f"🔧 Corrigiendo {file_path.name}...")
-                fixed_content = fix_duplicate_description_pattern(content)
-                
-                # Validar que el JSON sigue siendo válido
-                try:
-                    json.loads(fixed_content)
-                    # Guardar archivo corregido
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(json.loads(fixed_content), f, indent=2, ensure_ascii=False)
-                    print(f"✅ {file_path.name} corregido")
-                    return True
-                except json.JSONDecodeError as e:
-                    print(f"❌ Error al corregir {file_path.name}: {e}")
-                    return False
-            else:
-                return False
-        else:
-            print(f"✅ {file_path.name}: Sin problemas")
-            return True
-            
+        source = load_source_file(file_path, write_fixes=fix)
+    except json.JSONDecodeError as e:
+        print(f"❌ JSON inválido en {file_path}: {e}")
+        return False
     except Exception as e:
         print(f"❌ Error procesando {file_path}: {e}")
         return False
 
+    return report_source(file_path, source, fix=fix)
+
 
-def validate_all_schemas(base_dir="api-reference/openapi", fix=False):
+def discover_sources(base_path):
+    """
+    Archivos OpenAPI a validar, relativos a base_path: schemas.json primero y
+    luego el resto (sin los archivos *complete*).
+    """
+    schemas_file = Path("schemas") / "schemas.json"
+    files = [schemas_file] if (base_path / schemas_file).exists() else []
+    for json_file in sorted(base_path.rglob("*.json")):
+        if json_file.name == "schemas.json" or "complete" in json_file.name:
+            continue
+        files.append(json_file.relative_to(base_path))
+    return files
+
+
+def validate_all_schemas(base_dir="api-reference/openapi", fix=False, cache_dir=DEFAULT_CACHE_DIR):
     """
     Valida todos los archivos OpenAPI en el directorio.
+    Cada archivo se parsea una sola vez (o se toma del caché compartido con
+    combine_openapi.py) a través de SpecWorkspace.
     """
     base_path = Path(base_dir)
     all_valid = True
@@ -105,20 +134,32 @@ def validate_all_schemas(base_dir="api-reference/openapi", fix=False):
     print("=" * 70)
     print("VALIDACIÓN DE SCHEMAS OPENAPI")
     print("=" * 70)
-    
-    # Validar schemas.json específicamente
-    schemas_file = base_path / "schemas" / "schemas.json"
-    if schemas_file.exists():
-        print(f"\n📋 Validando {schemas_file.relative_to(base_path.parent)}:")
-        if not validate_file(schemas_file, fix=fix):
+
+    workspace = SpecWorkspace(
+        base_path, manifest=discover_sources(base_path), cache_dir=cache_dir, write_fixes=fix
+    )
+    workspace.load()
+
+    others_header = False
+    for file_path in workspace.files + [workspace.base_file]:
+        if file_path.name == "schemas.json":
+            # Validar schemas.json específicamente
+            print(f"\n📋 Validando {file_path.relative_to(base_path.parent)}:")
+        elif not others_header:
+            # Validar otros archivos JSON
+            print(f"\n📋 Validando otros archivos OpenAPI:")
+            others_header = True
+
+        if file_path in workspace.missing:
+            print(f"⚠️  {file_path.relative_to(base_path.parent)}: no existe, se omite")
+        elif file_path in workspace.errors:
+            error, _traceback = workspace.errors[file_path]
+            if isinstance(error, json.JSONDecodeError):
+                print(f"❌ JSON inválido en {file_path}: {error}")
+            else:
+                print(f"❌ Error procesando {file_path}: {error}")
             all_valid = False
-    
-    # Validar otros archivos JSON
-    print(f"\n📋 Validando otros archivos OpenAPI:")
-    for json_file in base_path.rglob("*.json"):
-        if json_file.name == "schemas.json" or "complete" in json_file.name:
-            continue
-        if not validate_file(json_file, fix=fix):
+        elif not report_source(file_path, workspace.sources[file_path], fix=fix):
             all_valid = False
     
     print("\n" + "=" * 70)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Script para verificar que todas las páginas de la documentación respondan.
+
+Toma las páginas de la navegación de docs.json, espera a que el servidor
+esté listo (sondeo, sin esperas fijas) y las pide concurrentemente,
+reportando el código y la latencia de cada una y las más lentas:
+
+    python3 scripts/verify_docs.py --start                        # levanta mintlify dev
+    python3 scripts/verify_docs.py --base-url http://127.0.0.1:3000  # servidor ya corriendo
+    python3 scripts/verify_docs.py --start --command "python3 -m http.server 3000 -d _site"
+
+Antes de pedir páginas valida que los documentos OpenAPI de docs.json sean
+JSON válidos. Sale con código 1 si alguna página falla. La lógica vive en
+docs_crawl.py.
+"""
+
+import argparse
+import asyncio
+import json
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from docs_crawl import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_READY_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    crawl,
+    is_ok,
+    missing_sources,
+    navigation_pages,
+    print_result,
+    slowest,
+    wait_until_ready,
+)
+from openapi_load import percentile
+
+DEFAULT_CONFIG = Path(__file__).parent.parent / "docs.json"
+DEFAULT_COMMAND = "npx mintlify dev --no-open --port {port}"
+DEFAULT_SLOWEST = 5
+
+
+def check_openapi_files(config, root):
+    """Validar que los documentos OpenAPI de docs.json existan y sean JSON válido"""
+    files = config.get("openapi") or []
+    if isinstance(files, str):
+        files = [files]
+    ok = True
+    for file in files:
+        if not isinstance(file, str) or file.startswith(("http://", "https://")):
+            continue
+        try:
+            with open(Path(root) / file, "r", encoding="utf-8") as f:
+                json.load(f)
+            print(f"✅ {file}: JSON válido")
+        except (OSError, ValueError) as e:
+            print(f"❌ {file}: {e}")
+            ok = False
+    return ok
+
+
+def start_server(command, base_url, cwd):
+    """Lanzar el servidor de documentación (`{port}` en el comando se reemplaza por el de base_url)"""
+    port = urlsplit(base_url).port or 80
+    print(f"🚀 Iniciando: {command.format(port=port)}")
+    return subprocess.Popen(
+        shlex.split(command.format(port=port)), cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def stop_server(process):
+    """Detener el servidor lanzado por start_server"""
+    print("🛑 Deteniendo el servidor...")
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def print_summary(results, count):
+    """Totales, percentiles de latencia y las páginas más lentas"""
+    failed = [result for result in results if not is_ok(result)]
+    latencies = sorted(result.latency_ms for result in results if result.status is not None)
+    print(f"\n📊 {len(results) - len(failed)}/{len(results)} páginas OK")
+    if latencies:
+        p50, p95 = percentile(latencies, 50), percentile(latencies, 95)
+        print(f"   latencia p50 {p50:.0f} ms · p95 {p95:.0f} ms · máx {latencies[-1]:.0f} ms")
+    if count and latencies:
+        print("🐢 Páginas más lentas:")
+        for result in slowest(results, count):
+            print(f"   {result.latency_ms:>8.0f} ms  {result.path}")
+    if failed:
+        print("❌ Páginas con error:")
+        for result in failed:
+            print(f"   {result.status or result.error}  {result.path}  ({result.page})")
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Verificar que todas las páginas de la documentación respondan")
+    parser.add_argument(
+        "--base-url", default=DEFAULT_BASE_URL, help=f"URL del servidor de documentación (por defecto: {DEFAULT_BASE_URL})"
+    )
+    parser.add_argument(
+        "--config", default=str(DEFAULT_CONFIG), help="docs.json con la navegación (por defecto: el del repositorio)"
+    )
+    parser.add_argument("--start", action="store_true", help="Levantar el servidor con --command durante la verificación")
+    parser.add_argument(
+        "--command",
+        default=DEFAULT_COMMAND,
+        help=f"Comando del servidor para --start; {{port}} toma el puerto de --base-url (por defecto: {DEFAULT_COMMAND!r})",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Páginas pedidas en paralelo (por defecto: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"Timeout por página en segundos (por defecto: {DEFAULT_TIMEOUT:.0f})"
+    )
+    parser.add_argument(
+        "--ready-timeout",
+        type=float,
+        default=DEFAULT_READY_TIMEOUT,
+        help=f"Espera máxima a que el servidor responda, en segundos (por defecto: {DEFAULT_READY_TIMEOUT:.0f})",
+    )
+    parser.add_argument("--ready-path", default="/", help="Ruta que se sondea para saber si el servidor está listo")
+    parser.add_argument(
+        "--slowest", type=int, default=DEFAULT_SLOWEST, help=f"Páginas más lentas a reportar (por defecto: {DEFAULT_SLOWEST})"
+    )
+    parser.add_argument("--json", metavar="ARCHIVO", help="Guardar los resultados por página como JSON")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency debe ser >= 1")
+    if urlsplit(args.base_url).scheme not in ("http", "https"):
+        parser.error(f"URL base inválida: {args.base_url!r}")
+    return args
+
+
+async def verify(args, pages, process=None):
+    """Esperar al servidor y recorrer las páginas"""
+    is_alive = (lambda: process.poll() is None) if process is not None else None
+    waited = await wait_until_ready(args.base_url, args.ready_path, args.ready_timeout, is_alive)
+    print(f"✅ Servidor listo en {args.base_url} ({waited:.1f} s)")
+    print(f"🔍 Verificando {len(pages)} páginas con {args.concurrency} workers...")
+    return await crawl(args.base_url, pages, args.concurrency, args.timeout, on_result=print_result)
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+    root = Path(args.config).parent
+    try:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo cargar {args.config}: {e}")
+        return 1
+
+    print("📋 Verificando archivos OpenAPI...")
+    if not check_openapi_files(config, root):
+        return 1
+    pages = navigation_pages(config)
+    if not pages:
+        print(f"❌ {args.config} no tiene páginas en la navegación")
+        return 1
+    for page in missing_sources(pages, root):
+        print(f"⚠️  {page}: sin archivo .mdx/.md")
+
+    process = start_server(args.command, args.base_url, root) if args.start else None
+    try:
+        results = asyncio.run(verify(args, pages, process))
+    except (TimeoutError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("\n👋 Verificación interrumpida")
+        return 1
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    print_summary(results, args.slowest)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"base_url": args.base_url, "pages": [result._asdict() for result in results]},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+            f.write("\n")
+        print(f"💾 Resultados guardados en {args.json}")
+
+    if all(is_ok(result) for result in results):
+        print("\n🎉 Todas las páginas de la documentación responden correctamente")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
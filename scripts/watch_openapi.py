@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Watcher que monitorea cambios en archivos OpenAPI y regenera automáticamente
+el archivo combinado.
+
+A diferencia del watcher anterior (que lanzaba `npm run combine-openapi`, y
+con ello un intérprete nuevo, por cada evento), este proceso queda corriendo
+con los archivos fuente ya parseados en memoria (openapi_engine.SpecWorkspace):
+- agrupa ráfagas de eventos (un guardado del editor suele generar varios)
+  y reconstruye una sola vez cuando los archivos dejan de cambiar
+- vuelve a parsear solo los archivos que cambiaron y recombina en memoria
+- reporta la latencia de cada reconstrucción
+
+Los cambios se detectan comparando mtime y tamaño de los archivos del
+manifiesto (solo librería estándar, funciona igual en macOS y Linux).
+
+Uso:
+    python3 scripts/watch_openapi.py
+    python3 scripts/watch_openapi.py --interval 0.02 --debounce 0.05
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from openapi_artifacts import write_artifacts
+from openapi_engine import (
+    DEFAULT_BASE_DIR,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_OUTPUT,
+    MERGE_STRATEGIES,
+    SpecWorkspace,
+    print_changes,
+    print_duplicates,
+    print_structure_issues,
+    prune_cache,
+)
+
+
+def file_stamp(file_path):
+    """(mtime_ns, tamaño) de un archivo, o None si no existe"""
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class OpenAPIWatcher:
+    """
+    Reconstrucción incremental del archivo combinado.
+
+    - poll(): archivos cuyo mtime/tamaño cambió desde la última revisión
+    - wait_until_quiet(changed): sigue revisando hasta que pasen `debounce`
+      segundos sin cambios nuevos, acumulando los archivos modificados
+    - rebuild(changed): recarga esos archivos y recombina; escribe la salida
+      solo si su contenido cambió
+
+    Con output=None no se escribe a disco; `on_build(combined)` se llama tras
+    cada reconstrucción exitosa (lo usa serve_openapi.py para servir el
+    documento desde memoria).
+    """
+
+    def __init__(
+        self,
+        workspace,
+        output=DEFAULT_OUTPUT,
+        strategy="replace",
+        interval=0.02,
+        debounce=0.05,
+        on_build=None,
+    ):
+        self.workspace = workspace
+        self.output = None if output is None else Path(output)
+        self.strategy = strategy
+        self.interval = interval
+        self.debounce = debounce
+        self.stamps = {}
+        self.on_build = on_build
+
+    def snapshot(self):
+        """Registrar el estado actual de todos los archivos vigilados"""
+        self.stamps = {
+            file_path: file_stamp(file_path) for file_path in self.workspace.all_files
+        }
+
+    def poll(self):
+        """Retorna el conjunto de archivos que cambiaron desde la última revisión"""
+        changed = set()
+        for file_path in self.workspace.all_files:
+            stamp = file_stamp(file_path)
+            if stamp != self.stamps.get(file_path):
+                self.stamps[file_path] = stamp
+                changed.add(file_path)
+        return changed
+
+    def wait_until_quiet(self, changed):
+        """
+        Agrupar una ráfaga de eventos: seguir revisando hasta que pasen
+        `debounce` segundos sin cambios nuevos. Retorna todos los archivos
+        modificados durante la ráfaga.
+        """
+        changed = set(changed)
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < self.debounce:
+            time.sleep(self.interval)
+            more = self.poll()
+            if more:
+                changed |= more
+                quiet_since = time.monotonic()
+        return changed
+
+    def build(self, files=None):
+        """
+        Recargar `files` (todos si es None), recombinar y escribir la salida.
+        Retorna True si se generó el archivo combinado.
+        """
+        workspace = self.workspace
+        workspace.load(files)
+        # Las correcciones automáticas reescriben archivos fuente: registrar su
+        # nuevo estado para no detectarlas como un cambio del usuario
+        self.snapshot()
+
+        targets = workspace.all_files if files is None else sorted(files)
+        for file_path in targets:
+            if file_path in workspace.missing:
+                print(f"⚠️  Archivo no encontrado: {file_path}")
+                continue
+            if file_path in workspace.errors:
+                error, _traceback = workspace.errors[file_path]
+                print(f"❌ Error procesando {file_path}: {error}")
+                continue
+            source = workspace.sources[file_path]
+            if source["changes"]:
+                print_changes(source["changes"], file_path)
+            if source["duplicates"]:
+                print_duplicates(source["duplicates"], str(file_path))
+            if source["issues"]:
+                print_structure_issues(source["issues"], str(file_path))
+
+        if workspace.errors:
+            print("⚠️  Hay archivos con errores, se mantiene el archivo combinado anterior")
+            return False
+        if workspace.base_file in workspace.missing:
+            print(f"❌ Archivo base no encontrado: {workspace.base_file}")
+            return False
+
+        combined, issues, changes = workspace.build(self.strategy)
+        if changes:
+            print_changes(changes, "archivo combinado")
+        if issues:
+            print_structure_issues(issues)
+        # Cada guardado agrega una entrada al caché: descartar las de versiones anteriores
+        prune_cache(workspace.cache_dir, workspace.cache_keys)
+
+        if self.on_build is not None:
+            self.on_build(combined)
+        if self.output is None:
+            return True
+
+        write_artifacts(combined, self.output)
+        return True
+
+    def rebuild(self, changed):
+        """Reconstrucción incremental de los archivos modificados, con métricas"""
+        names = ", ".join(str(file_path) for file_path in sorted(changed))
+        print(f"\n📝 Cambio detectado en: {names}")
+
+        # Latencia edición → salida: desde la modificación más antigua de la ráfaga
+        edited_at = min(
+            (stamp[0] / 1e9 for stamp in map(file_stamp, changed) if stamp),
+            default=None,
+        )
+        start = time.perf_counter()
+        built = self.build(changed)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if built:
+            message = f"✅ Archivo combinado actualizado en {elapsed_ms:.1f} ms"
+            if edited_at is not None:
+                message += f" (edición → salida: {(time.time() - edited_at) * 1000:.0f} ms)"
+            print(message)
+        return elapsed_ms
+
+    def run(self):
+        """Bucle principal: construir una vez y reconstruir ante cada ráfaga de cambios"""
+        start = time.perf_counter()
+        if self.build():
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"✅ Archivo combinado inicial creado en {elapsed_ms:.1f} ms")
+
+        print("🎯 Watcher activo. Presiona Ctrl+C para detener.")
+        print("💡 Los archivos se combinarán automáticamente cuando cambies algún .json")
+        try:
+            while True:
+                changed = self.poll()
+                if changed:
+                    self.rebuild(self.wait_until_quiet(changed))
+                    print("👀 Continuando monitoreo...")
+                else:
+                    time.sleep(self.interval)
+        except KeyboardInterrupt:
+            print("\n👋 Watcher detenido")
+
+
+def parse_args(argv=None):
+    """Parsear argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Regenerar api-reference/openapi-combined.json al cambiar los archivos fuente"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.02,
+        help="Segundos entre revisiones de los archivos (por defecto: 0.02)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.05,
+        help="Segundos sin cambios antes de reconstruir (por defecto: 0.05)",
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=sorted(MERGE_STRATEGIES),
+        default="replace",
+        help="Cómo combinar métodos repetidos entre archivos (por defecto: replace)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="No usar el caché de archivos fuente para la carga inicial",
+    )
+    args = parser.parse_args(argv)
+    if args.interval <= 0 or args.debounce < 0:
+        parser.error("--interval debe ser > 0 y --debounce >= 0")
+    return args
+
+
+def main(argv=None):
+    """Función principal"""
+    args = parse_args(argv)
+
+    print("👀 Iniciando watcher de archivos OpenAPI...")
+    print(f"📁 Monitoreando: archivos del manifiesto en {DEFAULT_BASE_DIR}")
+
+    workspace = SpecWorkspace(
+        DEFAULT_BASE_DIR, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
+    )
+    watcher = OpenAPIWatcher(
+        workspace,
+        strategy=args.strategy,
+        interval=args.interval,
+        debounce=args.debounce,
+    )
+    watcher.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())